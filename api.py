@@ -0,0 +1,37 @@
+"""
+Ponto de entrada da API HTTP da catraca.
+Sobe o serviço local chamado pelas câmeras de placa (em vez do CLI do index.py).
+Uso: python api.py
+"""
+import asyncio
+import os
+from dotenv import load_dotenv
+from src.utils.setup import inicializar_sistema
+from src.api.servidor_http import servir
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+def main():
+    # 1. Preparação (Setup do Banco e Classes)
+    repo, estacionamento = inicializar_sistema()
+
+    # 2. Execução (HTTP)
+    try:
+        asyncio.run(servir(
+            repo,
+            estacionamento,
+            host=os.getenv("API_HOST", "127.0.0.1"),
+            porta=int(os.getenv("API_PORTA", 8080)),
+            leitores=int(os.getenv("API_LEITORES", 4)),
+            tamanho_fila=int(os.getenv("API_FILA_MAX", 1000)),
+            exigir_token=os.getenv("API_EXIGIR_TOKEN", "0") == "1",
+        ))
+    except KeyboardInterrupt:
+        print("\nAPI encerrada.")
+
+    # 3. Encerramento (fecha o pool e para o checkpoint do WAL)
+    repo.fechar()
+
+if __name__ == "__main__":
+    main()
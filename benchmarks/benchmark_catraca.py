@@ -0,0 +1,135 @@
+"""
+Benchmark: Vazão do Motor da Catraca (decisões por segundo).
+Responsabilidade: Medir o GateEngine em modo headless contra um banco EM DISCO
+(WAL + synchronous NORMAL, o perfil padrão do .env), simulando a leitura de uma
+câmera de placas: moradores e funcionários alternando entrada/saída e rotativos
+entrando e saindo da Zona A.
+Uso (da raiz do projeto):
+    python -m benchmarks.benchmark_catraca --placas 5000
+Localização: benchmarks/benchmark_catraca.py
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import Estacionamento
+from src.classes.Apartamento import Apartamento
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Veiculo import Veiculo
+from src.functions.catraca.motor_catraca import GateEngine
+from src.functions.catraca.ocupacao import sincronizar_ocupacao
+
+# Mesmo perfil padrão de src/utils/setup.py (carregar_perfil_banco)
+PERFIL_PADRAO = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,
+    "mmap_size": 134217728,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+    "wal_autocheckpoint": 1000,
+}
+
+CPFS_VALIDOS = ["52998224725", "11144477735", "39053344705", "15350946056", "71428793860"]
+
+def _placa(prefixo, n):
+    """Gera placas no padrão antigo (AAA9999) a partir de um contador."""
+    return f"{prefixo}{n:04d}"
+
+def popular_banco(repo, moradores, funcionarios):
+    """Cria apartamentos, moradores e funcionários com um carro cada."""
+    placas = []
+    with repo:
+        for i in range(moradores):
+            repo.criar_apartamento(Apartamento(numero=str(100 + i), bloco="A"))
+            apto = repo.buscar_apartamento_por_rotulo(str(100 + i), "A")
+            id_mor = repo.adicionar_morador(Morador(nome="Morador Teste", cnh=f"{i:011d}", id_apartamento=apto.id))
+            placa = _placa("MOR", i)
+            repo.adicionar_veiculo(Veiculo(placa=placa, modelo="GOL", cor="PRATA", morador_id=id_mor))
+            placas.append(placa)
+
+        for i, cpf in enumerate(CPFS_VALIDOS[:funcionarios]):
+            id_func = repo.adicionar_funcionario(Funcionario(nome="Funcionario Teste", cpf=cpf, cargo="Porteiro"))
+            placa = _placa("FUN", i)
+            repo.adicionar_veiculo(Veiculo(placa=placa, modelo="UNO", cor="BRANCO", funcionario_id=id_func))
+            placas.append(placa)
+    return placas
+
+def gerar_fluxo(placas_cadastradas, total, rotativos, semente=42):
+    """Sequência de leituras: cadastrados e rotativos misturados (cada rotativo passa 2x)."""
+    aleatorio = random.Random(semente)
+    fluxo = [aleatorio.choice(placas_cadastradas) for _ in range(total - 2 * rotativos)]
+    for i in range(rotativos):
+        placa = _placa("ROT", i)
+        fluxo.insert(aleatorio.randrange(len(fluxo) + 1), placa)
+        fluxo.append(placa)
+    return fluxo
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do GateEngine (decisões/s) em banco em disco.")
+    parser.add_argument("--placas", type=int, default=5000, help="Total de leituras de placa.")
+    parser.add_argument("--moradores", type=int, default=200)
+    parser.add_argument("--funcionarios", type=int, default=5)
+    parser.add_argument("--rotativos", type=int, default=500)
+    parser.add_argument("--lote", action="store_true", help="Uma conexão para o lote todo (processar_lote).")
+    parser.add_argument("--sem-wal", action="store_true", help="Usa o journal padrão (DELETE) para comparação.")
+    parser.add_argument("--historico-vazao", type=int, default=0, metavar="LOTE",
+                        help="Liga o buffer de histórico (modo VAZAO) com este tamanho de lote.")
+    parser.add_argument("--instrumentacao", action="store_true",
+                        help="Liga a instrumentação e mostra as consultas/chamadas que dominam a latência.")
+    args = parser.parse_args()
+
+    pragmas = dict(PERFIL_PADRAO)
+    if args.sem_wal:
+        pragmas.update(journal_mode="DELETE", synchronous="FULL")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_path = os.path.join(pasta, "benchmark.db")
+        repo = EstacionamentoRepository(db_path, pragmas=pragmas)
+        if args.historico_vazao:
+            repo.ativar_buffer_historico(tamanho_lote=args.historico_vazao, intervalo_segundos=60)
+        estacionamento = Estacionamento(
+            nome="Benchmark",
+            capacidade_visitantes=args.rotativos,
+            capacidade_moradores=args.moradores,
+            tempo_limite_minutos=120,
+            capacidade_funcionarios=args.funcionarios,
+        )
+
+        placas = popular_banco(repo, args.moradores, args.funcionarios)
+        with repo:
+            sincronizar_ocupacao(repo, estacionamento)
+
+        fluxo = gerar_fluxo(placas, args.placas, args.rotativos)
+        motor = GateEngine(repo, estacionamento)
+        if args.instrumentacao:
+            repo.ligar_instrumentacao()
+
+        inicio = time.perf_counter()
+        if args.lote:
+            decisoes = motor.processar_lote(fluxo)
+        else:
+            decisoes = [motor.processar(placa) for placa in fluxo]
+        decorrido = time.perf_counter() - inicio
+
+        relatorio = repo.relatorio_consultas() if args.instrumentacao else None
+        repo.fechar()
+
+    por_acao = {}
+    for decisao in decisoes:
+        por_acao[decisao.acao] = por_acao.get(decisao.acao, 0) + 1
+
+    modo = "lote (1 conexão)" if args.lote else "uma decisão por vez"
+    historico = f"VAZAO (lote {args.historico_vazao})" if args.historico_vazao else "ESTRITO"
+    print(f"Banco: {'DELETE/FULL' if args.sem_wal else 'WAL/NORMAL'} | Modo: {modo} | Histórico: {historico}")
+    print(f"Decisões: {len(decisoes)} em {decorrido:.3f}s -> {len(decisoes) / decorrido:,.0f} decisões/s")
+    print(f"Latência média: {decorrido / len(decisoes) * 1000:.3f} ms | Ações: {por_acao}")
+    if relatorio:
+        print("\n" + relatorio)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: Hidratação de Objetos de Domínio.
+Responsabilidade: Medir objetos/s e bytes/objeto ao montar entidades a partir
+de linhas do banco, antes e depois de __slots__ + do_banco.
+- Antes: a mesma classe sem __slots__ (com __dict__), montada pelo construtor
+  (setters: validate_placa, upper/strip, etc.), como os repositórios faziam.
+- Depois: a classe atual (__slots__), montada por Classe.do_banco(*row).
+Bytes/objeto via tracemalloc (objeto + __dict__, sem contar as strings da linha).
+Uso (da raiz do projeto):
+    python -m benchmarks.benchmark_hidratacao --objetos 50000
+Localização: benchmarks/benchmark_hidratacao.py
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.classes.Veiculo import Veiculo
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Apartamento import Apartamento
+
+def _sem_slots(cls):
+    """Cópia da classe com __dict__ por objeto (o layout de antes desta mudança)."""
+    ignorar = set(cls.__slots__) | {"__slots__", "__dict__", "__weakref__"}
+    corpo = {k: v for k, v in vars(cls).items() if k not in ignorar}
+    return type(cls.__name__ + "ComDict", cls.__bases__, corpo)
+
+# Por entidade: (classe, linha como vem do SELECT, montagem antiga pelo construtor)
+CENARIOS = {
+    "Veiculo": (Veiculo, (1, "ABC1D23", "GOL", "PRATA", 1, 7, None, None),
+                lambda c, r: c(id=r[0], placa=r[1], modelo=r[2], cor=r[3], estacionado=bool(r[4]),
+                               morador_id=r[5], visitante_id=r[6], funcionario_id=r[7])),
+    "TicketVisitante": (TicketVisitante, (1, "ABC1D23", 3, 1717430400.0, 9),
+                        lambda c, r: c(id=r[0], placa=r[1], numero_vaga=r[2], entrada=r[3], id_visitante=r[4])),
+    "Morador": (Morador, (1, "Maria Souza", "12345678901", 4),
+                lambda c, r: c(id=r[0], nome=r[1], cnh=r[2], id_apartamento=r[3])),
+    "Funcionario": (Funcionario, (1, "Joao Lima", "52998224725", "Porteiro", None, None, 1),
+                    lambda c, r: c(id=r[0], nome=r[1], cpf=r[2], cargo=r[3], cnh=r[4], id_usuario=r[5], ativo=bool(r[6]))),
+    "Apartamento": (Apartamento, (1, "102", "A", 2),
+                    lambda c, r: c(id=r[0], numero=r[1], bloco=r[2], vagas=r[3])),
+}
+
+def objetos_por_segundo(montar, row, objetos):
+    inicio = time.perf_counter()
+    for _ in range(objetos):
+        montar(row)
+    return objetos / (time.perf_counter() - inicio)
+
+def bytes_por_objeto(montar, row, objetos):
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    vivos = [montar(row) for _ in range(objetos)]
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Desconta a própria lista de referências
+    return (depois - antes) / len(vivos) - 8
+
+def main():
+    parser = argparse.ArgumentParser(description="Hidratação: construtor com validação vs do_banco + __slots__.")
+    parser.add_argument("--objetos", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{'Entidade':<16} | {'antes obj/s':>12} | {'depois obj/s':>12} | {'ganho':>6} | "
+          f"{'antes B/obj':>11} | {'depois B/obj':>12}")
+    for nome, (cls, row, construtor) in CENARIOS.items():
+        antiga = _sem_slots(cls)
+        montar_antes = lambda r, c=antiga, f=construtor: f(c, r)
+        montar_depois = lambda r, c=cls: c.do_banco(*r)
+
+        vel_antes = objetos_por_segundo(montar_antes, row, args.objetos)
+        vel_depois = objetos_por_segundo(montar_depois, row, args.objetos)
+        mem_antes = bytes_por_objeto(montar_antes, row, args.objetos)
+        mem_depois = bytes_por_objeto(montar_depois, row, args.objetos)
+        print(f"{nome:<16} | {vel_antes:12,.0f} | {vel_depois:12,.0f} | {vel_depois / vel_antes:5.1f}x | "
+              f"{mem_antes:11.0f} | {mem_depois:12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: Partida a Frio (tempo até o prompt de login).
+Responsabilidade: Medir quanto custa subir o sistema.
+- Processo: 'python index.py' em um processo novo, cronometrado até o
+  prompt "Usuário:" aparecer (imports + .env + banco + ocupação).
+- Construção: EstacionamentoRepository em banco novo (migrações), em banco
+  em dia (só o cabeçalho) e no modo antigo (DDL do esquema a cada partida).
+O banco vai para uma pasta temporária (DB_FILENAME absoluto), nunca para src/db.
+Uso (da raiz do projeto):
+    python -m benchmarks.benchmark_partida --execucoes 10
+Localização: benchmarks/benchmark_partida.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import migracoes
+from benchmarks.benchmark_catraca import PERFIL_PADRAO
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT_LOGIN = "Usuário:".encode()
+
+def tempo_ate_login(db_path, limite_segundos=30):
+    """Sobe 'index.py' e devolve os segundos até o prompt de login (o processo é encerrado em seguida)."""
+    ambiente = dict(os.environ, DB_FILENAME=db_path, PYTHONIOENCODING="utf-8", TERM="dumb")
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, "index.py"], cwd=RAIZ, env=ambiente,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        lido = b""
+        while PROMPT_LOGIN not in lido:
+            pedaco = processo.stdout.read1(4096)
+            if not pedaco or time.perf_counter() - inicio > limite_segundos:
+                erro = processo.stderr.read().decode(errors="replace").strip().splitlines()
+                raise RuntimeError(f"index.py não chegou ao login: {erro[-1] if erro else 'sem saída'}")
+            lido += pedaco
+        return time.perf_counter() - inicio
+    finally:
+        processo.kill()
+        processo.wait()
+
+def _mediana_ms(funcao, execucoes):
+    tempos = []
+    for _ in range(execucoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos) * 1000
+
+def medir_construcao(pasta, execucoes):
+    """Mediana (ms) de construir + fechar o repositório nos três cenários."""
+    contador = iter(range(10 ** 9))
+
+    def banco_novo():
+        EstacionamentoRepository(os.path.join(pasta, f"novo_{next(contador)}.db"), pragmas=dict(PERFIL_PADRAO)).fechar()
+
+    em_dia = os.path.join(pasta, "em_dia.db")
+    EstacionamentoRepository(em_dia, pragmas=dict(PERFIL_PADRAO)).fechar()
+
+    def banco_em_dia():
+        EstacionamentoRepository(em_dia, pragmas=dict(PERFIL_PADRAO)).fechar()
+
+    def modo_antigo():
+        # Antes das migrações: conexão + todas as CREATE ... IF NOT EXISTS a cada partida
+        repo = EstacionamentoRepository(em_dia, pragmas=dict(PERFIL_PADRAO))
+        with repo:
+            migracoes._esquema_base(repo.conn)
+        repo.fechar()
+
+    return {
+        "banco novo (migrações)": _mediana_ms(banco_novo, execucoes),
+        "banco em dia (cabeçalho)": _mediana_ms(banco_em_dia, execucoes),
+        "modo antigo (DDL sempre)": _mediana_ms(modo_antigo, execucoes),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de partida: index.py até o login e construção do repositório.")
+    parser.add_argument("--execucoes", type=int, default=10)
+    parser.add_argument("--sem-processo", action="store_true", help="Mede só a construção (sem subir o index.py).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for cenario, ms in medir_construcao(pasta, args.execucoes).items():
+            print(f"Construção | {cenario:<26} | mediana {ms:7.2f} ms")
+
+        if not args.sem_processo:
+            db_path = os.path.join(pasta, "partida.db")
+            primeira = tempo_ate_login(db_path)  # Cria o banco (migrações)
+            demais = [tempo_ate_login(db_path) for _ in range(args.execucoes)]
+            print(f"index.py   | {'primeira partida':<26} | {primeira * 1000:7.1f} ms")
+            print(f"index.py   | {'partidas seguintes':<26} | mediana {statistics.median(demais) * 1000:7.1f} ms "
+                  f"(min {min(demais) * 1000:.1f}, max {max(demais) * 1000:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: Análise de Permanência (sessões por segundo).
+Responsabilidade: Popular 'sessoes_visitantes' com milhões de sessões
+sintéticas (banco em disco, perfil WAL padrão) e medir analisar_permanencia
+com NumPy e com o caminho em Python puro.
+Uso (da raiz do projeto):
+    python -m benchmarks.benchmark_permanencia --sessoes 1000000
+Localização: benchmarks/benchmark_permanencia.py
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.functions.relatorios import analise_permanencia
+from src.functions.relatorios.analise_permanencia import analisar_permanencia
+from src.db import queries
+from benchmarks.benchmark_catraca import PERFIL_PADRAO
+
+def popular_sessoes(repo, total, lote=100000):
+    """Sessões com duração log-normal (maioria curta, cauda longa), limite de 120 min."""
+    gerador = random.Random(42)
+    inicio = int(time.time()) - 365 * 86400
+    gravadas = 0
+    while gravadas < total:
+        n = min(lote, total - gravadas)
+        linhas = [
+            (inicio + gerador.randrange(365 * 86400), int(gerador.lognormvariate(8.3, 0.9)),
+             120, gerador.random() < 0.3)
+            for _ in range(n)
+        ]
+        with repo:
+            repo.conn.executemany(queries.INSERT_SESSAO_VISITANTE, linhas)
+        gravadas += n
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de analisar_permanencia sobre N sessões encerradas.")
+    parser.add_argument("--sessoes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        repo = EstacionamentoRepository(os.path.join(pasta, "permanencia.db"), pragmas=dict(PERFIL_PADRAO))
+        popular_sessoes(repo, args.sessoes)
+
+        motores = [False] + ([True] if analise_permanencia.np is not None else [])
+        for usar_numpy in motores:
+            with repo:
+                analise = analisar_permanencia(repo, usar_numpy=usar_numpy)
+            print(f"Motor: {analise['motor']:<6} | {analise['sessoes']:,} sessões em {analise['segundos']:.3f}s "
+                  f"-> {analise['sessoes'] / analise['segundos']:,.0f} sessões/s | "
+                  f"p95 {analise['percentis'][95]:.0f} min | excesso {analise['taxa_excesso']:.1%}")
+        if analise_permanencia.np is None:
+            print("NumPy não instalado: só o caminho em Python puro foi medido.")
+
+        repo.fechar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Teste de Carga: API HTTP da Catraca.
+Responsabilidade: Reproduzir milhares de leituras de placa contra o localhost,
+várias "catracas" em paralelo (conexões keep-alive), e reportar a latência
+p50/p95/p99 e a vazão. Cada placa rotativa faz ENTRADA e depois SAIDA.
+Uso (da raiz do projeto):
+    python api.py                                   # em outro terminal
+    python -m benchmarks.carga_api --eventos 5000 --catracas 20
+    python -m benchmarks.carga_api --embutido       # sobe a API num banco temporário
+Localização: benchmarks/carga_api.py
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import Estacionamento
+from src.api.servidor_http import ServidorCatraca
+from benchmarks.benchmark_catraca import PERFIL_PADRAO
+
+async def _requisicao(reader, writer, host, caminho, payload):
+    """POST keep-alive e leitura da resposta. Retorna o status HTTP."""
+    corpo = json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"POST {caminho} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(corpo)}\r\n\r\n".encode("latin-1") + corpo
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    tamanho = 0
+    while True:
+        linha = await reader.readline()
+        if linha in (b"\r\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        if nome.lower() == "content-length":
+            tamanho = int(valor)
+    await reader.readexactly(tamanho)
+    return status
+
+async def _catraca(host, porta, placas, latencias, status):
+    """Uma câmera: conexão própria, cada placa entra e sai em sequência."""
+    reader, writer = await asyncio.open_connection(host, porta)
+    try:
+        for placa in placas:
+            for caminho in ("/catraca/entrada", "/catraca/saida"):
+                inicio = time.perf_counter()
+                codigo = await _requisicao(reader, writer, host, caminho, {"placa": placa})
+                latencias.append(time.perf_counter() - inicio)
+                status[codigo] = status.get(codigo, 0) + 1
+    finally:
+        writer.close()
+
+def _percentil(valores_ordenados, p):
+    indice = min(len(valores_ordenados) - 1, int(round(p / 100 * (len(valores_ordenados) - 1))))
+    return valores_ordenados[indice]
+
+async def executar_carga(host, porta, eventos, catracas):
+    placas = [f"ROT{i:04d}" for i in range(eventos // 2)]
+    fatias = [placas[i::catracas] for i in range(catracas)]
+    latencias, status = [], {}
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_catraca(host, porta, fatia, latencias, status) for fatia in fatias if fatia))
+    decorrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    print(f"Eventos: {len(latencias)} | Catracas: {catracas} | Tempo: {decorrido:.2f}s "
+          f"-> {len(latencias) / decorrido:,.0f} req/s")
+    print("Latência: " + " | ".join(
+        f"p{p}={_percentil(latencias, p) * 1000:.2f}ms" for p in (50, 95, 99)
+    ) + f" | máx={latencias[-1] * 1000:.2f}ms")
+    print(f"Status HTTP: {status}")
+
+async def _com_servidor_embutido(args):
+    """Sobe a API num banco temporário em disco (WAL) só durante o teste."""
+    with tempfile.TemporaryDirectory() as pasta:
+        repo = EstacionamentoRepository(os.path.join(pasta, "carga.db"), pragmas=PERFIL_PADRAO)
+        estacionamento = Estacionamento(
+            nome="Carga",
+            capacidade_visitantes=max(args.catracas, 1),
+            capacidade_moradores=0,
+            tempo_limite_minutos=120,
+            capacidade_funcionarios=0,
+        )
+        servidor = ServidorCatraca(repo, estacionamento)
+        await servidor.iniciar(args.host, 0)
+        try:
+            await executar_carga(args.host, servidor.porta, args.eventos, args.catracas)
+        finally:
+            await servidor.parar()
+            repo.fechar()
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga da API da catraca (p50/p95/p99).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=int(os.getenv("API_PORTA", 8080)))
+    parser.add_argument("--eventos", type=int, default=5000, help="Total de requisições (entrada + saída).")
+    parser.add_argument("--catracas", type=int, default=20, help="Conexões simultâneas.")
+    parser.add_argument("--embutido", action="store_true", help="Sobe a API num banco temporário.")
+    args = parser.parse_args()
+
+    if args.embutido:
+        asyncio.run(_com_servidor_embutido(args))
+    else:
+        asyncio.run(executar_carga(args.host, args.porta, args.eventos, args.catracas))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Exportação completa do histórico de movimentação ou da ocupação atual.
+Uso: python exportar.py historico.csv [--inicio 2024-01-01] [--fim 2024-01-31] [--lote 5000]
+     python exportar.py ocupacao.jsonl --ocupacao
+Formatos (pela extensão ou --formato): csv, jsonl, hcol (colunar compacto)
+"""
+import argparse
+from dotenv import load_dotenv
+from src.utils.setup import inicializar_sistema
+from src.functions.exportacao.exportacao import exportar_historico, exportar_ocupacao, FORMATOS
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta o histórico (ou a ocupação atual) sem limite de linhas.")
+    parser.add_argument("arquivo", help="Arquivo de saída (.csv, .jsonl ou .hcol)")
+    parser.add_argument("--formato", choices=FORMATOS, help="Força o formato (padrão: pela extensão).")
+    parser.add_argument("--inicio", help="Data inicial AAAA-MM-DD (inclusiva).")
+    parser.add_argument("--fim", help="Data final AAAA-MM-DD (inclusiva).")
+    parser.add_argument("--lote", type=int, default=5000, help="Linhas por fetchmany.")
+    parser.add_argument("--ocupacao", action="store_true", help="Exporta a ocupação atual em vez do histórico.")
+    args = parser.parse_args()
+
+    repo, _ = inicializar_sistema()
+    try:
+        if args.ocupacao:
+            resumo = exportar_ocupacao(repo, args.arquivo, args.formato, tamanho_lote=args.lote)
+        else:
+            resumo = exportar_historico(repo, args.arquivo, args.formato, args.inicio, args.fim, tamanho_lote=args.lote)
+    finally:
+        repo.fechar()
+
+    print(f"✅ {resumo['linhas']} linhas exportadas para {resumo['caminho']} ({resumo['formato']}, {resumo['bytes']} bytes)")
+    print(f"   ⏱️  {resumo['segundos']}s -> {resumo['linhas_por_segundo']:,} linhas/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Importação em lote de apartamentos, moradores e veículos (CSV ou JSONL).
+Uso: python importar.py moradores.csv [--lote 5000] [--rejeitados caminho]
+Colunas: numero, bloco, vagas, nome, cnh, placa, modelo, cor
+"""
+import argparse
+from dotenv import load_dotenv
+from src.utils.setup import inicializar_sistema
+from src.functions.importacao.importacao_lote import importar_cadastros
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa apartamentos, moradores e veículos em lote.")
+    parser.add_argument("arquivo", help="Arquivo .csv (',' ou ';') ou .jsonl")
+    parser.add_argument("--lote", type=int, default=5000, help="Linhas por transação.")
+    parser.add_argument("--rejeitados", help="Arquivo das linhas recusadas (padrão: ao lado do original).")
+    args = parser.parse_args()
+
+    repo, _ = inicializar_sistema()
+    try:
+        resumo = importar_cadastros(repo, args.arquivo, tamanho_lote=args.lote, caminho_rejeitados=args.rejeitados)
+    finally:
+        repo.fechar()
+
+    print(f"✅ Importação concluída em {resumo['segundos']}s ({resumo['lidas']} linhas lidas)")
+    print(f"   🏠 Apartamentos criados: {resumo['apartamentos']}")
+    print(f"   👤 Moradores:            {resumo['moradores']}")
+    print(f"   🚗 Veículos:             {resumo['veiculos']}")
+    if resumo["rejeitadas"]:
+        print(f"   ⚠️  Rejeitadas:           {resumo['rejeitadas']} -> {resumo['arquivo_rejeitados']}")
+
+if __name__ == "__main__":
+    main()
@@ -20,5 +20,8 @@ def main():
     # 3. Execução (UI)
     executar_menu_principal(repo, estacionamento, usuario_logado)
 
+    # 4. Encerramento (fecha o pool e para o checkpoint do WAL)
+    repo.fechar()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -19,8 +19,8 @@ def realizar_login(repo: EstacionamentoRepository):
         user = input("👤 Usuário: ").strip()
         senha = getpass.getpass("🔑 Senha:   ").strip()
         
-        with repo:
-            usuario_logado = repo.usuarios.autenticar(user, senha)
+        # bcrypt no pool de senhas, sem segurar conexão do banco
+        usuario_logado = repo.autenticar_usuario(user, senha)
         
         if usuario_logado:
             print(f"\n✅ Bem-vindo, {usuario_logado.username}!")
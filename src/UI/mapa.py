@@ -1,5 +1,7 @@
+from itertools import chain
 from src.utils.input_handler import clear_screen
 from src.ui.colors import Colors
+from src.ui.components import show_error
 from rich.console import Console
 from rich.table import Table
 from rich import box
@@ -10,68 +12,76 @@ def exibir_mapa_estacionamento(repositorio):
 
     console.print("\n[bold cyan]--- 🗺️  MAPA GERAL DO ESTACIONAMENTO ---[/bold cyan]\n")
     
-    ocupacao = repositorio.listar_ocupacao_completa()
+    try:
+        # Cursor preguiçoso: as linhas vão direto para a tabela, sem lista intermediária
+        ocupacao = repositorio.iterar_ocupacao()
+        primeira = next(ocupacao, None)
     
-    if not ocupacao:
-        console.print("[bold yellow]📭 O estacionamento está completamente vazio.[/bold yellow]")
-        input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
-        return
+        if primeira is None:
+            console.print("[bold yellow]📭 O estacionamento está completamente vazio.[/bold yellow]")
+            input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+            return
 
-    table = Table(box=box.ROUNDED, title="Veículos no Pátio", title_justify="left")
+        table = Table(box=box.ROUNDED, title="Veículos no Pátio", title_justify="left")
 
-    table.add_column("Local/Vaga", justify="center", style="cyan", no_wrap=True)
-    table.add_column("Tipo", style="magenta")
-    table.add_column("Motorista", style="white")
-    table.add_column("Placa", justify="center", style="green")
-    table.add_column("Modelo / Cor", style="dim")
+        table.add_column("Local/Vaga", justify="center", style="cyan", no_wrap=True)
+        table.add_column("Tipo", style="magenta")
+        table.add_column("Motorista", style="white")
+        table.add_column("Placa", justify="center", style="green")
+        table.add_column("Modelo / Cor", style="dim")
 
-    count_visitantes = 0
-    count_moradores = 0
-    count_funcionarios = 0 
+        count_visitantes = 0
+        count_moradores = 0
+        count_funcionarios = 0 
 
-    for row in ocupacao: 
-        tipo_db = row['tipo']      # 'MORADOR', 'VISITANTE' ou 'FUNCIONARIO'
-        apto_num = row['apto_num']
-        apto_bloco = row['apto_bloco']
-        vaga_atual = row['vaga_atual'] # <--- Atualizado para a variável abstrata
-        nome = row['proprietario']
-        placa = row['placa']
-        modelo = row['modelo']
-        cor = row['cor']
+        for row in chain((primeira,), ocupacao): 
+            tipo_db = row.tipo      # 'MORADOR', 'VISITANTE' ou 'FUNCIONARIO'
+            apto_num = row.apto_num
+            apto_bloco = row.apto_bloco
+            vaga_atual = row.vaga_atual # <--- Atualizado para a variável abstrata
+            nome = row.proprietario
+            placa = row.placa
+            modelo = row.modelo
+            cor = row.cor
         
-        # Formatação Visual
-        detalhes = f"{modelo} - {cor}"
+            # Formatação Visual
+            detalhes = f"{modelo} - {cor}"
 
-        if tipo_db == 'MORADOR':
-            count_moradores += 1
-            local_fmt = f"{apto_num}-{apto_bloco}" if apto_bloco else f"{apto_num}"
-            tipo_fmt = "[bold blue]Morador 🏠[/bold blue]"
-            nome_fmt = f"[bold]{nome}[/bold]"
+            if tipo_db == 'MORADOR':
+                count_moradores += 1
+                local_fmt = f"{apto_num}-{apto_bloco}" if apto_bloco else f"{apto_num}"
+                tipo_fmt = "[bold blue]Morador 🏠[/bold blue]"
+                nome_fmt = f"[bold]{nome}[/bold]"
         
-        elif tipo_db == 'VISITANTE':
-            count_visitantes += 1
-            local_fmt = f"Vaga {vaga_atual}" # <--- Usa a variável abstrata
-            tipo_fmt = "[bold yellow]Visitante 🚗[/bold yellow]"
-            nome_fmt = nome
+            elif tipo_db == 'VISITANTE':
+                count_visitantes += 1
+                local_fmt = f"Vaga {vaga_atual}" # <--- Usa a variável abstrata
+                tipo_fmt = "[bold yellow]Visitante 🚗[/bold yellow]"
+                nome_fmt = nome
 
-        elif tipo_db == 'FUNCIONARIO':
-            count_funcionarios += 1
-            local_fmt = f"Zona C - Vaga {vaga_atual}" # <--- Usa a mesma variável abstrata!
-            tipo_fmt = "[bold green]Funcionário 💼[/bold green]"
-            nome_fmt = f"[bold]{nome}[/bold]"
+            elif tipo_db == 'FUNCIONARIO':
+                count_funcionarios += 1
+                local_fmt = f"Zona C - Vaga {vaga_atual}" # <--- Usa a mesma variável abstrata!
+                tipo_fmt = "[bold green]Funcionário 💼[/bold green]"
+                nome_fmt = f"[bold]{nome}[/bold]"
             
-        else:
-            local_fmt = "???"
-            tipo_fmt = "[red]Desconhecido[/red]"
-            nome_fmt = str(nome)
+            else:
+                local_fmt = "???"
+                tipo_fmt = "[red]Desconhecido[/red]"
+                nome_fmt = str(nome)
 
-        table.add_row(
-            str(local_fmt),
-            tipo_fmt,
-            str(nome_fmt),
-            str(placa),
-            str(detalhes)
-        )
+            table.add_row(
+                str(local_fmt),
+                tipo_fmt,
+                str(nome_fmt),
+                str(placa),
+                str(detalhes)
+            )
+    except Exception as e:
+        # Erro de banco no meio da leitura: avisa e volta ao menu, sem tabela pela metade
+        show_error(f"Erro ao gerar mapa: {e}")
+        input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+        return
 
     console.print(table)
 
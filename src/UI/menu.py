@@ -4,25 +4,34 @@ Ponto central que integra todos os módulos do sistema.
 Localização: src/ui/menu.py
 """
 import getpass
+import importlib
 from src.ui.components import header, menu_option, show_warning, clear_screen, Colors
-from src.ui.mapa import exibir_mapa_estacionamento
 from src.classes.Usuario import Usuario
-
-# --- Imports dos Módulos Especialistas ---
-from src.functions.catraca.controle_acesso import registrar_acesso_unificado
-from src.functions.visitantes.catraca.listar_ativos import listar_visitantes_ativos
-from src.functions.visitantes.menu_visitante import executar_menu_visitantes
-from src.functions.moradores.menu_morador import executar_menu_moradores
-from src.functions.funcionarios.menu_funcionario import executar_menu_funcionarios
-from src.functions.relatorios.exibir_relatorios import menu_relatorios 
+from src.functions.catraca.ocupacao import reconciliar_se_vencido
+
+# --- Módulos Especialistas (importados só quando a opção é escolhida) ---
+# Cada um arrasta dependências pesadas (rich, os seis módulos da catraca...),
+# que não precisam pesar na partida nem no tempo até o login.
+REGISTRAR_ACESSO = ("src.functions.catraca.controle_acesso", "registrar_acesso_unificado")
+LISTAR_VISITANTES_ATIVOS = ("src.functions.visitantes.catraca.listar_ativos", "listar_visitantes_ativos")
+MAPA_ESTACIONAMENTO = ("src.ui.mapa", "exibir_mapa_estacionamento")
+MENU_MORADORES = ("src.functions.moradores.menu_morador", "executar_menu_moradores")
+MENU_VISITANTES = ("src.functions.visitantes.menu_visitante", "executar_menu_visitantes")
+MENU_FUNCIONARIOS = ("src.functions.funcionarios.menu_funcionario", "executar_menu_funcionarios")
+MENU_RELATORIOS = ("src.functions.relatorios.exibir_relatorios", "menu_relatorios")
+
+def _carregar(modulo, funcao):
+    """Importa o módulo na primeira escolha da opção (depois vem do cache do sys.modules)."""
+    return getattr(importlib.import_module(modulo), funcao)
 
 def exibir_dashboard_topo(estacionamento, repo, usuario):
     """Monta o cabeçalho dinâmico com estatísticas e nome do usuário."""
     
-    tickets_ativos = len(repo.listar_tickets_ativos())
-    livres = estacionamento.capacidade_visitantes - tickets_ativos
+    # Contadores em memória (O(1)); conferidos com COUNT(*) de tempos em tempos
+    reconciliar_se_vencido(repo, estacionamento)
+    livres = estacionamento.vagas_visitantes_disponiveis
 
-    if livres <= 0:
+    if estacionamento.visitante_esta_lotado:
         cor_status = Colors.RED
         texto_status = "LOTADO (Visitantes) ⛔"
     else:
@@ -100,45 +109,47 @@ def executar_menu_principal(repo, estacionamento, usuario):
             opcao = input(f"\n{Colors.CYAN}➤  Navegar para: {Colors.RESET}").strip()
 
             # 4. Roteamento (Lógica de Segurança)
-
-            if opcao == '1':
-                # Aberto para todos
-                registrar_acesso_unificado(repo, estacionamento)
+            # Cada opção é uma transação: cadastros feitos aqui são confirmados ao
+            # voltar ao menu, e a catraca (que confirma sozinha) não herda escrita alheia.
+            with repo.operacao():
+                if opcao == '1':
+                    # Aberto para todos
+                    _carregar(*REGISTRAR_ACESSO)(repo, estacionamento)
             
-            elif opcao == '2':
-                # Aberto para todos
-                listar_visitantes_ativos(repo)
+                elif opcao == '2':
+                    # Aberto para todos
+                    _carregar(*LISTAR_VISITANTES_ATIVOS)(repo)
 
-            elif opcao == '3':
-                 # <--- AGORA ABERTO PARA TODOS (Porteiro pode ver o mapa)
-                exibir_mapa_estacionamento(repo)
+                elif opcao == '3':
+                     # <--- AGORA ABERTO PARA TODOS (Porteiro pode ver o mapa)
+                    _carregar(*MAPA_ESTACIONAMENTO)(repo)
             
-            # --- BLOQUEIOS ABAIXO ---
+                # --- BLOQUEIOS ABAIXO ---
 
-            elif opcao == '4':
-                if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
-                executar_menu_moradores(repo)
+                elif opcao == '4':
+                    if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
+                    _carregar(*MENU_MORADORES)(repo)
 
-            elif opcao == '5':
-                if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
-                executar_menu_visitantes(repo) 
+                elif opcao == '5':
+                    if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
+                    _carregar(*MENU_VISITANTES)(repo) 
 
-            elif opcao == '6':
-                if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
-                executar_menu_funcionarios(repo)
+                elif opcao == '6':
+                    if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
+                    _carregar(*MENU_FUNCIONARIOS)(repo)
                 
-            elif opcao == '7':
-                if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
-                menu_relatorios(repo)
+                elif opcao == '7':
+                    if usuario.perfil == 'portaria': show_warning("Acesso Negado!"); continue
+                    _carregar(*MENU_RELATORIOS)(repo)
             
-            elif opcao == '8':
-                if usuario.perfil != 'gerencia': show_warning("Acesso Negado!"); continue
-                criar_novo_usuario_sistema(repo)
-
-            elif opcao == '0':
-                clear_screen()
-                print(f"\n{Colors.GREEN}👋 Sistema finalizado.{Colors.RESET}")
-                break
+                elif opcao == '8':
+                    if usuario.perfil != 'gerencia': show_warning("Acesso Negado!"); continue
+                    criar_novo_usuario_sistema(repo)
+
+                elif opcao == '0':
+                    clear_screen()
+                    print(f"\n{Colors.GREEN}👋 Sistema finalizado.{Colors.RESET}")
+                    break
             
-            else:
-                show_warning("Opção desconhecida.")
\ No newline at end of file
+                else:
+                    show_warning("Opção desconhecida.")
\ No newline at end of file
@@ -0,0 +1,364 @@
+"""
+Módulo: API HTTP/JSON da Catraca (asyncio).
+Responsabilidade: Permitir que várias catracas físicas (câmeras de placa)
+chamem um serviço local em vez de cada uma rodar o CLI do index.py.
+Rotas:
+    POST /catraca           {"placa": "ABC1234"}  -> o motor decide ENTRADA ou SAIDA
+    POST /catraca/entrada   {"placa": "ABC1234"}  -> só efetiva se a decisão for ENTRADA
+    POST /catraca/saida     {"placa": "ABC1234"}  -> só efetiva se a decisão for SAIDA
+    POST /sessao            {"usuario": "...", "senha": "..."} -> token de sessão
+    GET  /ocupacao                                -> vagas livres/ocupadas por zona
+    GET  /historico/<placa>                       -> movimentações da placa
+Concorrência:
+- Escritas passam por UMA fila (escritor único): uma thread dedicada consome
+  a fila em lotes, então catracas simultâneas nunca disputam o lock do SQLite
+  ("database is locked") nem a mesma vaga do índice em memória.
+- Leituras (histórico) rodam num executor limitado, cada thread com a sua
+  própria conexão (WAL permite ler enquanto o escritor grava).
+- Ocupação vem do índice de vagas em memória, que só o escritor altera:
+  também é lida na thread do escritor, entre dois lotes (nunca no meio de
+  um heappop).
+- Login (POST /sessao): o bcrypt roda no pool de senhas, aguardado sem travar
+  o loop. Com exigir_token, as rotas /catraca pedem "Authorization: Bearer
+  <token>": validar é um HMAC, sem banco e sem bcrypt. O rehash por mudança
+  de custo fica para o login do CLI (a API não escreve fora do escritor único).
+- Requisição malformada (linha inicial ou Content-Length) recebe 400 e corpo
+  acima de 'corpo_max' recebe 413 antes de ser lido; nos dois casos a conexão fecha.
+Localização: src/api/servidor_http.py
+"""
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, unquote
+
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import ZONA_VISITANTES, ZONA_FUNCIONARIOS
+from src.classes.DecisaoCatraca import ENTRADA, SAIDA
+from src.classes.Usuario import Usuario
+from src.functions.catraca.motor_catraca import GateEngine
+from src.functions.catraca.ocupacao import reconciliar_se_vencido
+
+STATUS_HTTP = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+# Maior corpo aceito (bytes): acima disso, 413 antes de ler o corpo
+CORPO_MAX = 64 * 1024
+
+class ServidorCatraca:
+    def __init__(self, repositorio, estacionamento, leitores=4, tamanho_fila=1000, lote_max=64, exigir_token=False,
+                 corpo_max=CORPO_MAX):
+        # O repositório recebido é exclusivo do escritor (a fachada guarda UMA conexão ativa)
+        self.repositorio = repositorio
+        self.estacionamento = estacionamento
+        self.motor = GateEngine(repositorio, estacionamento)
+
+        self.tamanho_fila = tamanho_fila
+        self.lote_max = lote_max
+        self.exigir_token = exigir_token
+        self.corpo_max = corpo_max
+        self._fila = None
+        self._tarefa_escritor = None
+        self._servidor = None
+
+        self._executor_escrita = ThreadPoolExecutor(max_workers=1, thread_name_prefix="catraca-escrita")
+        self._executor_leitura = ThreadPoolExecutor(max_workers=leitores, thread_name_prefix="catraca-leitura")
+        self._local = threading.local()
+        self._repositorios_leitura = []
+
+    # =========================================================================
+    # CICLO DE VIDA
+    # =========================================================================
+
+    async def iniciar(self, host="127.0.0.1", porta=8080):
+        self._fila = asyncio.Queue(maxsize=self.tamanho_fila)
+        self._tarefa_escritor = asyncio.create_task(self._escritor())
+        self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self._servidor
+
+    @property
+    def porta(self):
+        """Porta efetivamente aberta (útil quando iniciado com porta 0)."""
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def parar(self):
+        if self._servidor:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._tarefa_escritor:
+            # Esvazia a fila antes de encerrar: nenhuma placa aceita fica sem resposta
+            await self._fila.join()
+            self._tarefa_escritor.cancel()
+        self._executor_escrita.shutdown(wait=True)
+        self._executor_leitura.shutdown(wait=True)
+        for repo in self._repositorios_leitura:
+            repo.fechar()
+
+    # =========================================================================
+    # ESCRITOR ÚNICO
+    # =========================================================================
+
+    async def _escritor(self):
+        """Consome a fila em lotes e executa as decisões na thread de escrita."""
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._fila.get()]
+            while len(lote) < self.lote_max and not self._fila.empty():
+                lote.append(self._fila.get_nowait())
+
+            pedidos = [(placa, sentido) for placa, sentido, _ in lote]
+            try:
+                resultados = await loop.run_in_executor(self._executor_escrita, self._processar_lote, pedidos)
+            except Exception as e:
+                resultados = [e] * len(lote)
+
+            for (_, _, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():
+                    if isinstance(resultado, Exception):
+                        futuro.set_exception(resultado)
+                    else:
+                        futuro.set_result(resultado)
+                self._fila.task_done()
+
+    def _processar_lote(self, pedidos):
+        """
+        Roda na thread de escrita: uma conexão para o lote, uma transação por placa.
+        Um erro numa placa não derruba as demais.
+        """
+        resultados = []
+        with self.repositorio:
+            for placa, sentido in pedidos:
+                try:
+                    decisao = self.motor.avaliar(placa)
+                    # Sentido forçado pela catraca: não efetiva se o motor discordar
+                    if sentido is None or decisao.acao == sentido:
+                        self.motor.efetivar(decisao)
+                    resultados.append(decisao)
+                except Exception as e:
+                    resultados.append(e)
+
+            # Outras fontes (CLI, outro processo) podem ter mexido nas vagas
+            reconciliar_se_vencido(self.repositorio, self.estacionamento)
+        return resultados
+
+    async def _enfileirar(self, placa, sentido):
+        futuro = asyncio.get_running_loop().create_future()
+        self._fila.put_nowait((placa, sentido, futuro))
+        return await futuro
+
+    # =========================================================================
+    # LEITURAS (executor limitado)
+    # =========================================================================
+
+    def _repositorio_leitura(self):
+        """Cada thread leitora tem a sua fachada (e conexão); nunca a do escritor."""
+        repo = getattr(self._local, "repositorio", None)
+        if repo is None:
+            manager = self.repositorio.db_manager
+            repo = EstacionamentoRepository(manager.db_path, pool_size=1, pragmas=manager.pragmas)
+            # Métricas das leituras somam nas do escritor (um relatório só para a API)
+            repo.compartilhar_medicoes(self.repositorio)
+            # Mesmo arquivo frio do escritor: sem ele, /historico perderia os meses arquivados
+            arquivo = self.repositorio.common.arquivo_historico
+            if arquivo is not None:
+                repo.configurar_arquivo_historico(arquivo.pasta, arquivo.horizonte_dias)
+            self._local.repositorio = repo
+            self._repositorios_leitura.append(repo)
+        return repo
+
+    def _ler_historico(self, placa):
+        repo = self._repositorio_leitura()
+        with repo:
+            linhas = repo.buscar_historico_por_placa(placa)
+        return [
+            {"data_hora": data_hora, "placa": placa_log, "tipo_veiculo": tipo, "tipo_evento": evento}
+            for data_hora, placa_log, tipo, evento in linhas
+        ]
+
+    def _ler_credenciais(self, usuario):
+        repo = self._repositorio_leitura()
+        with repo:
+            return repo.usuarios.buscar_credenciais(usuario)
+
+    async def _abrir_sessao(self, corpo):
+        """Retorna: (status, payload). Tokens sempre emitidos pela fachada do escritor."""
+        try:
+            dados = json.loads(corpo or b"{}")
+            usuario, senha = dados["usuario"], dados["senha"]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"erro": 'Corpo deve ser JSON: {"usuario": "...", "senha": "..."}'}
+
+        row = await self._em_leitura(self._ler_credenciais, usuario)
+        senha_hash = row[2] if row else None
+        # Future do pool de senhas: o loop segue atendendo as catracas enquanto o bcrypt roda
+        if not await asyncio.wrap_future(self.repositorio.senhas.verificar_async(senha, senha_hash)):
+            return 401, {"erro": "Usuário ou senha incorretos."}
+
+        logado = Usuario(id=row[0], username=row[1], perfil=row[3])
+        return 200, {"token": self.repositorio.emitir_token_sessao(logado),
+                     "expira_em_segundos": self.repositorio.tokens.validade_segundos}
+
+    def _autorizado(self, cabecalhos):
+        tipo, _, token = cabecalhos.get("authorization", "").partition(" ")
+        return tipo.lower() == "bearer" and self.repositorio.validar_token_sessao(token.strip()) is not None
+
+    async def _em_leitura(self, funcao, *args):
+        loop = asyncio.get_running_loop()
+        # Banco em memória não é compartilhável entre conexões: lê pela thread do escritor
+        if self.repositorio.db_manager.db_path == ":memory:":
+            return await loop.run_in_executor(self._executor_escrita, self._ler_no_escritor, funcao, args)
+        return await loop.run_in_executor(self._executor_leitura, funcao, *args)
+
+    def _ler_no_escritor(self, funcao, args):
+        self._local.repositorio = self.repositorio
+        return funcao(*args)
+
+    def _ocupacao(self):
+        """
+        Vem do índice em memória mantido pelo escritor: não toca o banco.
+        Roda na thread do escritor (ver _rotear): consultar_vaga_livre mexe no heap.
+        """
+        est = self.estacionamento
+        return {
+            "estacionamento": est.nome,
+            "zonas": {
+                ZONA_VISITANTES: {
+                    "capacidade": est.capacidade_visitantes,
+                    "livres": est.vagas_livres(ZONA_VISITANTES),
+                    "proxima_vaga": est.consultar_vaga_livre(ZONA_VISITANTES),
+                },
+                ZONA_FUNCIONARIOS: {
+                    "capacidade": est.capacidade_funcionarios,
+                    "livres": est.vagas_livres(ZONA_FUNCIONARIOS),
+                    "proxima_vaga": est.consultar_vaga_livre(ZONA_FUNCIONARIOS),
+                },
+            },
+        }
+
+    # =========================================================================
+    # HTTP
+    # =========================================================================
+
+    async def _rotear(self, metodo, caminho, corpo, cabecalhos=None):
+        """Retorna: (status, payload dict)."""
+        partes = [p for p in urlsplit(caminho).path.split("/") if p]
+
+        if partes == ["sessao"]:
+            if metodo != "POST":
+                return 405, {"erro": "Use POST."}
+            return await self._abrir_sessao(corpo)
+
+        if partes and partes[0] == "catraca" and len(partes) <= 2:
+            if metodo != "POST":
+                return 405, {"erro": "Use POST."}
+            if self.exigir_token and not self._autorizado(cabecalhos or {}):
+                return 401, {"erro": "Token de sessão ausente, inválido ou vencido (POST /sessao)."}
+            sentido = {None: None, "entrada": ENTRADA, "saida": SAIDA}.get(partes[1] if len(partes) == 2 else None, "?")
+            if sentido == "?":
+                return 404, {"erro": "Rota não encontrada."}
+            try:
+                placa = json.loads(corpo or b"{}")["placa"]
+            except (ValueError, KeyError, TypeError):
+                return 400, {"erro": 'Corpo deve ser JSON: {"placa": "ABC1234"}'}
+            try:
+                decisao = await self._enfileirar(placa, sentido)
+            except asyncio.QueueFull:
+                return 503, {"erro": "Fila de escrita cheia, tente novamente."}
+            if sentido and decisao.liberada and not decisao.efetivada:
+                return 409, decisao.to_dict()
+            return 200, decisao.to_dict()
+
+        if metodo != "GET":
+            return 405, {"erro": "Use GET."}
+        if partes == ["ocupacao"]:
+            return 200, await asyncio.get_running_loop().run_in_executor(self._executor_escrita, self._ocupacao)
+        if len(partes) == 2 and partes[0] == "historico":
+            placa = unquote(partes[1]).upper()
+            return 200, {"placa": placa, "eventos": await self._em_leitura(self._ler_historico, placa)}
+
+        return 404, {"erro": "Rota não encontrada."}
+
+    async def _atender(self, reader, writer):
+        """Uma conexão HTTP/1.1 (com keep-alive)."""
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                requisicao = linha.decode("latin-1").split()
+                if len(requisicao) != 3:
+                    await self._recusar(writer, 400, "Linha de requisição inválida.")
+                    break
+                metodo, caminho, versao = requisicao
+
+                cabecalhos = {}
+                while True:
+                    cabecalho = await reader.readline()
+                    if cabecalho in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = cabecalho.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+
+                try:
+                    tamanho = int(cabecalhos.get("content-length") or 0)
+                except ValueError:
+                    tamanho = -1
+                if tamanho < 0:
+                    await self._recusar(writer, 400, "Content-Length inválido.")
+                    break
+                if tamanho > self.corpo_max:
+                    # Recusa sem ler: o resto da conexão é descartado
+                    await self._recusar(writer, 413, f"Corpo maior que {self.corpo_max} bytes.")
+                    break
+                corpo = await reader.readexactly(tamanho)
+
+                try:
+                    status, payload = await self._rotear(metodo, caminho, corpo, cabecalhos)
+                except Exception as e:
+                    status, payload = 500, {"erro": str(e)}
+
+                manter = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                self._responder(writer, status, payload, manter)
+                await writer.drain()
+                if not manter:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _recusar(self, writer, status, mensagem):
+        """Requisição malformada: responde e fecha (não dá para achar o início da próxima)."""
+        self._responder(writer, status, {"erro": mensagem}, False)
+        await writer.drain()
+
+    def _responder(self, writer, status, payload, manter):
+        corpo = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        cabecalho = (
+            f"HTTP/1.1 {status} {STATUS_HTTP[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n"
+        )
+        writer.write(cabecalho.encode("latin-1") + corpo)
+
+async def servir(repositorio, estacionamento, host="127.0.0.1", porta=8080, leitores=4, tamanho_fila=1000,
+                 exigir_token=False):
+    """Sobe a API e atende até Ctrl+C."""
+    servidor = ServidorCatraca(repositorio, estacionamento, leitores=leitores, tamanho_fila=tamanho_fila,
+                               exigir_token=exigir_token)
+    await servidor.iniciar(host, porta)
+    print(f"🚧 API da catraca ouvindo em http://{host}:{servidor.porta}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servidor.parar()
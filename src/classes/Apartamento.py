@@ -2,16 +2,29 @@
 Classe Apartamento (Entidade).
 Responsabilidade: Representar a unidade física.
 Contém a lógica matemática das vagas baseada no número da porta.
+Memória: __slots__; linhas do banco entram por Apartamento.do_banco.
 Localização: src/classes/Apartamento.py
 """
 
 class Apartamento:
+    __slots__ = ("_id", "numero", "bloco", "vagas")
+
     def __init__(self, id=None, numero="", bloco="", vagas=2):
         self._id = id
         self.numero = str(numero) # Ex: "102"
         self.bloco = str(bloco).upper() if bloco else "" 
         self.vagas = int(vagas) # Limite físico de vagas
 
+    @classmethod
+    def do_banco(cls, id, numero, bloco, vagas):
+        """Hidratação confiável (ordem de SELECT_APARTAMENTO_BY_ID)."""
+        a = cls.__new__(cls)
+        a._id = id
+        a.numero = numero
+        a.bloco = bloco or ""
+        a.vagas = vagas
+        return a
+
     @property
     def id(self):
         return self._id
@@ -0,0 +1,40 @@
+"""
+Classe ContextoCatraca
+Responsabilidade: Reunir tudo que a catraca precisa saber sobre uma placa
+(veículo, dono, unidade, ticket ativo e vaga da Zona C) vindo de UMA consulta.
+Evita que o wrapper e as funções de entrada/saída repitam as mesmas buscas.
+Localização: src/classes/ContextoCatraca.py
+"""
+
+class ContextoCatraca:
+    def __init__(self, placa, veiculo=None, tipo_dono=None, nome_dono=None,
+                 cargo=None, rotulo_apto=None, ticket=None, vaga_funcionario=None):
+        self.placa = placa
+
+        # Veículo cadastrado (objeto Veiculo) ou None se avulso/desconhecido
+        self.veiculo = veiculo
+
+        # 'MORADOR', 'VISITANTE', 'FUNCIONARIO' ou None (placa desconhecida)
+        self.tipo_dono = tipo_dono
+        self.nome_dono = nome_dono
+        self.cargo = cargo              # Só para funcionários
+        self.rotulo_apto = rotulo_apto  # Só para moradores (Ex: 102-A)
+
+        # Estado atual no pátio
+        self.ticket = ticket                      # TicketVisitante aberto (Zona A)
+        self.vaga_funcionario = vaga_funcionario  # Vaga ocupada na Zona C
+
+    @property
+    def cadastrado(self):
+        return self.veiculo is not None
+
+    @property
+    def dentro(self):
+        """True se o veículo consta no pátio (status, ticket aberto ou vaga da Zona C)."""
+        if self.ticket or self.vaga_funcionario:
+            return True
+        return bool(self.veiculo and self.veiculo.estacionado)
+
+    def __repr__(self):
+        status = "DENTRO" if self.dentro else "FORA"
+        return f"<Contexto {self.placa} | {self.tipo_dono or 'DESCONHECIDO'} | {status}>"
@@ -0,0 +1,60 @@
+"""
+Classe DecisaoCatraca
+Responsabilidade: Resultado estruturado do motor da catraca para uma placa
+(o que fazer, para qual vaga e se houve excesso de permanência).
+Não imprime nada: quem exibe é o menu (ou a API / câmera de placas).
+Localização: src/classes/DecisaoCatraca.py
+"""
+
+ENTRADA = "ENTRADA"
+SAIDA = "SAIDA"
+BLOQUEADO = "BLOQUEADO"
+
+class DecisaoCatraca:
+    def __init__(self, acao, placa, tipo=None, zona=None, vaga=None, nome=None,
+                 motivo=None, entrada=None, permanencia_minutos=None, excedeu=False, contexto=None):
+        # ENTRADA, SAIDA ou BLOQUEADO
+        self.acao = acao
+        self.placa = placa
+
+        # 'MORADOR', 'VISITANTE', 'FUNCIONARIO' ou 'ROTATIVO' (placa sem cadastro)
+        self.tipo = tipo
+        self.zona = zona          # 'A', 'B' ou 'C'
+        self.vaga = vaga          # Vaga alocada (entrada) ou liberada (saída)
+        self.nome = nome
+        self.motivo = motivo      # Só para BLOQUEADO
+
+        # Permanência (só saídas com ticket)
+        self.entrada = entrada
+        self.permanencia_minutos = permanencia_minutos
+        self.excedeu = excedeu
+
+        # ContextoCatraca usado na decisão (evita nova consulta na efetivação)
+        self.contexto = contexto
+
+        # True depois que o motor gravou no banco
+        self.efetivada = False
+
+    @property
+    def liberada(self):
+        return self.acao != BLOQUEADO
+
+    def to_dict(self):
+        """Serializa para JSON (API / integração com câmeras)."""
+        return {
+            "acao": self.acao,
+            "placa": self.placa,
+            "tipo": self.tipo,
+            "zona": self.zona,
+            "vaga": self.vaga,
+            "nome": self.nome,
+            "motivo": self.motivo,
+            "entrada": self.entrada.isoformat() if self.entrada else None,
+            "permanencia_minutos": self.permanencia_minutos,
+            "excedeu": self.excedeu,
+            "efetivada": self.efetivada,
+        }
+
+    def __repr__(self):
+        destino = f"Zona {self.zona} / Vaga {self.vaga}" if self.vaga else (self.motivo or self.zona)
+        return f"<Decisao {self.acao} {self.placa} | {self.tipo} | {destino}>"
@@ -3,10 +3,72 @@ Classe Estacionamento
 Responsabilidade: Gerenciar limites físicos, regras de tempo e zonas.
 Não acessa banco de dados.
 """
+import heapq
 from datetime import datetime
 
+# Identificadores das zonas rotativas (com numeração de vagas)
+ZONA_VISITANTES = "A"
+ZONA_FUNCIONARIOS = "C"
+
+
+class ZonaVagas:
+    """
+    Índice de ocupação de uma zona rotativa (A ou C).
+    Min-heap com as vagas livres + set com as ocupadas:
+    alocar a menor vaga livre e contar vagas livres não tocam o banco.
+    """
+
+    def __init__(self, capacidade, ocupadas=()):
+        self.capacidade = int(capacidade)
+        self.carregar(ocupadas)
+
+    def carregar(self, ocupadas):
+        """(Re)constrói o índice a partir das vagas ocupadas no banco."""
+        self._ocupadas = set(ocupadas)
+        # Lista já ordenada = heap válido (sem precisar de heapify)
+        self._livres = [i for i in range(1, self.capacidade + 1) if i not in self._ocupadas]
+        self.divergente = False
+
+    def _limpar_topo(self):
+        # Remoção preguiçosa: vagas ocupadas "por fora" (ocupar) ficam no heap até chegarem ao topo
+        while self._livres and self._livres[0] in self._ocupadas:
+            heapq.heappop(self._livres)
+
+    def proxima_livre(self):
+        """Consulta (sem reservar) a menor vaga livre. Retorna int ou None se lotado."""
+        self._limpar_topo()
+        return self._livres[0] if self._livres else None
+
+    def ocupar(self, numero):
+        """Marca uma vaga como ocupada. Retorna False (e marca deriva) se já estava."""
+        if numero in self._ocupadas:
+            self.divergente = True
+            return False
+        self._ocupadas.add(numero)
+        return True
+
+    def liberar(self, numero):
+        """Devolve a vaga ao heap. Retorna False (e marca deriva) se ela não estava ocupada."""
+        if numero not in self._ocupadas:
+            self.divergente = True
+            return False
+        self._ocupadas.remove(numero)
+        if 1 <= numero <= self.capacidade:
+            heapq.heappush(self._livres, numero)
+        return True
+
+    @property
+    def ocupadas(self):
+        return frozenset(self._ocupadas)
+
+    @property
+    def livres(self):
+        return max(0, self.capacidade - len(self._ocupadas))
+
+
 class Estacionamento:
-    def __init__(self, nome, capacidade_visitantes, capacidade_moradores, tempo_limite_minutos, capacidade_funcionarios):
+    def __init__(self, nome, capacidade_visitantes, capacidade_moradores, tempo_limite_minutos, capacidade_funcionarios,
+                 intervalo_reconciliacao_segundos=60):
         self.nome = nome
         
         # --- ZONAS E CAPACIDADES ---
@@ -26,9 +88,17 @@ class Estacionamento:
         # Regras de Tempo
         self.tempo_limite_visitante_minutos = int(tempo_limite_minutos)
         
-        # Cache de estado
+        # Cache de estado (mantido pelas entradas/saídas e conferido com COUNT(*) periodicamente)
         self._ocupacao_visitantes = 0
         self._ocupacao_funcionarios = 0
+        self.intervalo_reconciliacao_segundos = int(intervalo_reconciliacao_segundos)
+        self.ultima_reconciliacao = 0.0
+
+        # Índice de ocupação das zonas rotativas (carregado do banco no setup)
+        self.zonas = {
+            ZONA_VISITANTES: ZonaVagas(self.capacidade_visitantes),
+            ZONA_FUNCIONARIOS: ZonaVagas(self.capacidade_funcionarios),
+        }
 
     # --- PROPRIEDADES (Visitantes) ---
 
@@ -54,6 +124,69 @@ class Estacionamento:
         """Booleano para travar catraca de funcionário."""
         return self.vagas_funcionarios_disponiveis <= 0
 
+    # --- ÍNDICE DE OCUPAÇÃO (Zonas A e C) ---
+
+    def sincronizar_vagas(self, zona, vagas_ocupadas):
+        """
+        Recarrega o índice de uma zona com as vagas ocupadas vindas do banco.
+        Aceita números ou strings (ex: {'1', '5'}); ignora valores inválidos.
+        Retorna: True se o índice estava divergente do banco (deriva corrigida).
+        """
+        ocupadas = {int(v) for v in vagas_ocupadas if str(v).isdigit()}
+        indice = self.zonas[zona]
+        houve_deriva = indice.divergente or indice.ocupadas != ocupadas
+        indice.carregar(ocupadas)
+        self._atualizar_contadores()
+        return houve_deriva
+
+    @property
+    def precisa_sincronizar(self):
+        """True se alguma zona detectou operação incoerente com o índice."""
+        return any(z.divergente for z in self.zonas.values())
+
+    def consultar_vaga_livre(self, zona):
+        """Menor vaga livre da zona (sem reservar). Retorna int ou None se lotado."""
+        return self.zonas[zona].proxima_livre()
+
+    def ocupar_vaga(self, zona, numero):
+        """Marca a vaga como ocupada após o registro da entrada no banco."""
+        ok = self.zonas[zona].ocupar(int(numero))
+        self._atualizar_contadores()
+        return ok
+
+    def liberar_vaga(self, zona, numero):
+        """Devolve a vaga ao índice após o registro da saída no banco."""
+        if numero is None:
+            self.zonas[zona].divergente = True
+            return False
+        ok = self.zonas[zona].liberar(int(numero))
+        self._atualizar_contadores()
+        return ok
+
+    def vagas_livres(self, zona):
+        """Quantidade de vagas livres na zona, lida do índice (O(1))."""
+        return self.zonas[zona].livres
+
+    def _atualizar_contadores(self):
+        """Mantém o cache de estado (_ocupacao_*) igual ao índice das zonas."""
+        self._ocupacao_visitantes = len(self.zonas[ZONA_VISITANTES].ocupadas)
+        self._ocupacao_funcionarios = len(self.zonas[ZONA_FUNCIONARIOS].ocupadas)
+
+    def reconciliar_contadores(self, total_visitantes, total_funcionarios):
+        """
+        Compara os contadores com os totais reais do banco (COUNT(*)).
+        Se divergirem, marca as zonas para ressincronizar.
+        Retorna: True se havia divergência.
+        """
+        divergiu = False
+        if total_visitantes != self._ocupacao_visitantes:
+            self.zonas[ZONA_VISITANTES].divergente = True
+            divergiu = True
+        if total_funcionarios != self._ocupacao_funcionarios:
+            self.zonas[ZONA_FUNCIONARIOS].divergente = True
+            divergiu = True
+        return divergiu
+
     # --- MÉTODOS DE REGRA DE NEGÓCIO ---
 
     def alocar_vaga_livre(self, capacidade_da_zona, vagas_ocupadas_set):
@@ -61,6 +194,8 @@ class Estacionamento:
         Descobre qual vaga (1 ao limite da zona solicitada) está livre.
         Funciona de forma abstrata (Polimórfica) para Visitantes e Funcionários.
         Retorna: int (ex: 5) ou None se lotado.
+        Nota: A catraca usa o índice (consultar_vaga_livre); este método
+        continua disponível para quem já tem o set de vagas em mãos.
         """
         for i in range(1, capacidade_da_zona + 1):
             if str(i) not in vagas_ocupadas_set:
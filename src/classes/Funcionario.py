@@ -1,6 +1,9 @@
 from src.utils.validations import validate_cpf, validate_cnh
 
 class Funcionario:
+    # Memória: __slots__; linhas do banco entram por Funcionario.do_banco (sem validar CPF/CNH de novo)
+    __slots__ = ("id", "nome", "_cpf", "cargo", "_cnh", "ativo", "id_usuario")
+
     def __init__(self, nome, cpf, cargo, cnh=None, id=None, ativo=True, id_usuario=None):
         """
         Representa um colaborador do condomínio.
@@ -14,6 +17,19 @@ class Funcionario:
         self.ativo = ativo
         self.id_usuario = id_usuario 
 
+    @classmethod
+    def do_banco(cls, id, nome, cpf, cargo, cnh, id_usuario, ativo=1):
+        """Hidratação confiável (colunas de SELECT_ALL_FUNCIONARIOS, na ordem)."""
+        f = cls.__new__(cls)
+        f.id = id
+        f.nome = nome
+        f._cpf = cpf
+        f.cargo = cargo
+        f._cnh = cnh or None
+        f.id_usuario = id_usuario
+        f.ativo = bool(ativo)
+        return f
+
     # --- Getter e Setter do CPF (Obrigatório) ---
     @property
     def cpf(self):
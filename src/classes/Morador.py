@@ -1,11 +1,14 @@
 """
 Classe Morador (Entidade).
 Responsabilidade: Representar a Pessoa e seu Vínculo (Foreign Key) com o Apartamento.
+Memória: __slots__; linhas do banco entram por Morador.do_banco (sem validar de novo).
 Localização: src/classes/Morador.py
 """
 from src.utils.validations import validate_names, validate_cnh
 
 class Morador:
+    __slots__ = ("_id", "_nome", "_cnh", "_id_apartamento")
+
     def __init__(self, id=None, nome="", cnh="", id_apartamento=None):
         self._id = id
         # Usamos os setters para validar desde a criação
@@ -15,6 +18,16 @@ class Morador:
         # VÍNCULO: Agora guardamos apenas o ID (Chave Estrangeira)
         self.id_apartamento = int(id_apartamento) if id_apartamento else None
 
+    @classmethod
+    def do_banco(cls, id, nome, cnh, id_apartamento):
+        """Hidratação confiável (ordem de SELECT_MORADOR_BY_ID)."""
+        m = cls.__new__(cls)
+        m._id = id
+        m._nome = nome
+        m._cnh = cnh
+        m._id_apartamento = id_apartamento
+        return m
+
     # --- ID (Leitura) ---
     @property
     def id(self):
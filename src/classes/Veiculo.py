@@ -2,10 +2,14 @@
 Classe Veiculo (Entidade Relacional Universal)
 Responsabilidade: Representar o automóvel físico.
 Vínculo: Possui campos explícitos para ligar a diferentes tipos de proprietários (Morador, Visitante, etc).
+Memória: __slots__ (sem __dict__ por objeto). Linhas do banco entram por
+Veiculo.do_banco, sem repassar pelos setters (já foram validadas na gravação).
 """
 from src.utils.validations import validate_placa
 
 class Veiculo:
+    __slots__ = ("_id", "_placa", "_modelo", "_cor", "_morador_id", "_visitante_id", "funcionario_id", "_estacionado")
+
     def __init__(self, id=None, placa="", modelo="", cor="", morador_id=None, visitante_id=None, funcionario_id=None, estacionado=False):
         self._id = id
         
@@ -23,6 +27,23 @@ class Veiculo:
         # --- Estado ---
         self.estacionado = estacionado
 
+    @classmethod
+    def do_banco(cls, id, placa, modelo, cor, estacionado, morador_id, visitante_id, funcionario_id):
+        """
+        Hidratação confiável (mesma ordem das colunas de SELECT_VEICULO_BY_PLACA).
+        Só para linhas lidas do banco: pula validate_placa e as formatações.
+        """
+        v = cls.__new__(cls)
+        v._id = id
+        v._placa = placa or ""
+        v._modelo = modelo or ""
+        v._cor = cor or ""
+        v._estacionado = bool(estacionado)
+        v._morador_id = morador_id
+        v._visitante_id = visitante_id
+        v.funcionario_id = funcionario_id
+        return v
+
     # --- ID (Leitura) ---
     @property
     def id(self):
@@ -1,12 +1,16 @@
 """
 Classe TicketVisitante (Antigo VisitanteCatraca)
 Responsabilidade: Controlar o evento de ocupação de vaga (Entrada/Saída).
+Memória: __slots__; linhas do banco entram por TicketVisitante.do_banco
+(sem validar a placa de novo).
 Localização: src/classes/visitantes/TicketVisitante.py
 """
 from datetime import datetime
 from src.utils.validations import validate_placa
 
 class TicketVisitante:
+    __slots__ = ("_id", "_placa", "numero_vaga", "id_visitante", "entrada")
+
     def __init__(self, id=None, placa="", numero_vaga=None, entrada=None, id_visitante=None):
         self._id = id
         self.placa = placa 
@@ -15,12 +19,25 @@ class TicketVisitante:
         # Link opcional: Se for visitante cadastrado, guardamos o ID dele aqui
         self.id_visitante = id_visitante
 
-        # Tratamento da Data de Entrada
-        if isinstance(entrada, str):
+        # Tratamento da Data de Entrada (o banco devolve epoch: int, sem parse)
+        if isinstance(entrada, (int, float)):
+            self.entrada = datetime.fromtimestamp(entrada)
+        elif isinstance(entrada, str):
             self.entrada = datetime.fromisoformat(entrada)
         else:
             self.entrada = entrada if entrada else datetime.now()
 
+    @classmethod
+    def do_banco(cls, id, placa, numero_vaga, entrada_epoch, id_visitante):
+        """Hidratação confiável (ordem de SELECT_TICKET_ATIVO): entrada já vem em epoch."""
+        t = cls.__new__(cls)
+        t._id = id
+        t._placa = placa
+        t.numero_vaga = numero_vaga
+        t.id_visitante = id_visitante
+        t.entrada = datetime.fromtimestamp(entrada_epoch) if entrada_epoch is not None else datetime.now()
+        return t
+
     # --- ID (Leitura) ---
     @property
     def id(self):
@@ -0,0 +1,255 @@
+"""
+Instrumentação de Consultas (latência, linhas e consultas lentas).
+Responsabilidade:
+- Histograma de latência por consulta nomeada (registro.py), com baldes fixos
+  no formato cumulativo do Prometheus, mais execuções e linhas.
+- Atribuição à chamada da Fachada (EstacionamentoRepository) que disparou a
+  consulta: mostra quais métodos públicos dominam o tempo de banco.
+- Log de consultas lentas (>= limite_lento_ms): as últimas em memória e,
+  opcionalmente, uma linha por ocorrência num arquivo (só nome, nunca parâmetros).
+- Liga/desliga em tempo de execução. Desligada, _get_cursor volta ao
+  CursorRegistrado (só os contadores do registro) e não há custo extra.
+- Exporta relatório em texto (relatorio) ou arquivo de métricas no formato
+  texto do Prometheus (exportar_prometheus), gravado de forma atômica.
+Latência = tempo do execute (preparo + primeiro passo; DML inteiro).
+Linhas = rowcount do DML ou linhas lidas do SELECT (fetch/iteração).
+Localização: src/db/instrumentacao.py
+"""
+import bisect
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from src.db.registro import nome_da_consulta
+
+# Limites superiores dos baldes (segundos): 50 µs a 1 s, depois +Inf
+BALDES_SEGUNDOS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+LIMITE_LENTO_MS = 50.0
+SEM_FACHADA = "(fora da fachada)"
+
+_ARQUIVO_FACHADA = os.path.join("repositories", "estacionamento_repository.py")
+
+def _chamada_da_fachada():
+    """Nome do método da Fachada mais próximo na pilha (quem pediu a consulta)."""
+    quadro = sys._getframe(3)
+    while quadro is not None:
+        if quadro.f_code.co_filename.endswith(_ARQUIVO_FACHADA):
+            return quadro.f_code.co_name
+        quadro = quadro.f_back
+    return SEM_FACHADA
+
+def _percentil(baldes, total, fracao):
+    """Estimativa pelo limite superior do balde onde o percentil cai (ms)."""
+    alvo = fracao * total
+    acumulado = 0
+    for limite, quantidade in zip(BALDES_SEGUNDOS + (float("inf"),), baldes):
+        acumulado += quantidade
+        if acumulado >= alvo:
+            return limite * 1000
+    return float("inf")
+
+def _rotulo(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class Instrumentacao:
+    def __init__(self, ativa=False, limite_lento_ms=LIMITE_LENTO_MS, arquivo_lento=None, guardar_lentas=100):
+        self.ativa = ativa
+        self.limite_lento_ms = limite_lento_ms
+        self.arquivo_lento = arquivo_lento
+        self._trava = threading.Lock()
+        self._consultas = {}   # nome -> [execucoes, segundos, linhas, baldes]
+        self._fachada = {}     # chamada -> [consultas, segundos]
+        self.lentas = deque(maxlen=guardar_lentas)
+        self.total_lentas = 0
+
+    # --- Liga / desliga (vale para os próximos cursores) ---
+
+    def ligar(self, limite_lento_ms=None, arquivo_lento=None):
+        if limite_lento_ms is not None:
+            self.limite_lento_ms = limite_lento_ms
+        if arquivo_lento is not None:
+            self.arquivo_lento = arquivo_lento or None
+        self.ativa = True
+
+    def desligar(self):
+        self.ativa = False
+
+    def zerar(self):
+        with self._trava:
+            self._consultas.clear()
+            self._fachada.clear()
+            self.lentas.clear()
+            self.total_lentas = 0
+
+    # --- Coleta (chamada pelo CursorInstrumentado) ---
+
+    def observar(self, nome, segundos, linhas):
+        chamada = _chamada_da_fachada()
+        lenta = segundos * 1000 >= self.limite_lento_ms
+        with self._trava:
+            dados = self._consultas.get(nome)
+            if dados is None:
+                dados = self._consultas[nome] = [0, 0.0, 0, [0] * (len(BALDES_SEGUNDOS) + 1)]
+            dados[0] += 1
+            dados[1] += segundos
+            dados[2] += linhas
+            dados[3][bisect.bisect_left(BALDES_SEGUNDOS, segundos)] += 1
+
+            fachada = self._fachada.get(chamada)
+            if fachada is None:
+                fachada = self._fachada[chamada] = [0, 0.0]
+            fachada[0] += 1
+            fachada[1] += segundos
+
+            if lenta:
+                self.total_lentas += 1
+                self.lentas.append((time.time(), nome, segundos * 1000, chamada))
+        if lenta and self.arquivo_lento:
+            self._gravar_lenta(nome, segundos * 1000, chamada)
+
+    def somar_linhas(self, nome, linhas):
+        with self._trava:
+            dados = self._consultas.get(nome)
+            if dados is not None:
+                dados[2] += linhas
+
+    def _gravar_lenta(self, nome, ms, chamada):
+        instante = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with open(self.arquivo_lento, "a", encoding="utf-8") as arquivo:
+                arquivo.write(f"{instante} {ms:.2f}ms {nome} via {chamada}\n")
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar o log de consultas lentas: {e}")
+
+    # --- Leitura ---
+
+    def estatisticas(self):
+        """
+        Retorna: {"consultas": {nome: {...}}, "fachada": {chamada: {...}}, "lentas": total},
+        cada parte ordenada do maior tempo acumulado para o menor.
+        """
+        with self._trava:
+            consultas = [(nome, n, s, linhas, list(baldes)) for nome, (n, s, linhas, baldes) in self._consultas.items()]
+            fachada = [(chamada, n, s) for chamada, (n, s) in self._fachada.items()]
+            total_lentas = self.total_lentas
+        consultas.sort(key=lambda item: item[2], reverse=True)
+        fachada.sort(key=lambda item: item[2], reverse=True)
+        return {
+            "consultas": {
+                nome: {"execucoes": n, "segundos": round(s, 6), "linhas": linhas, "baldes": baldes,
+                       "media_ms": round(s / n * 1000, 4),
+                       "p50_ms": _percentil(baldes, n, 0.50), "p95_ms": _percentil(baldes, n, 0.95),
+                       "p99_ms": _percentil(baldes, n, 0.99)}
+                for nome, n, s, linhas, baldes in consultas
+            },
+            "fachada": {chamada: {"consultas": n, "segundos": round(s, 6)} for chamada, n, s in fachada},
+            "lentas": total_lentas,
+        }
+
+    def relatorio(self, limite=15):
+        """Relatório em texto: consultas e chamadas da Fachada que mais custam, e as últimas lentas."""
+        dados = self.estatisticas()
+        linhas = [f"Instrumentação: {'ligada' if self.ativa else 'desligada'} | "
+                  f"consultas lentas (>= {self.limite_lento_ms:g} ms): {dados['lentas']}", "",
+                  f"{'Consulta':<40} {'exec':>8} {'total ms':>10} {'média ms':>9} "
+                  f"{'p95 ≤ ms':>9} {'p99 ≤ ms':>9} {'linhas':>9}"]
+        for nome, c in list(dados["consultas"].items())[:limite]:
+            linhas.append(f"{nome[:40]:<40} {c['execucoes']:>8} {c['segundos'] * 1000:>10.2f} {c['media_ms']:>9.3f} "
+                          f"{c['p95_ms']:>9g} {c['p99_ms']:>9g} {c['linhas']:>9}")
+        linhas += ["", f"{'Chamada da fachada':<40} {'consultas':>9} {'total ms':>10}"]
+        for chamada, f in list(dados["fachada"].items())[:limite]:
+            linhas.append(f"{chamada[:40]:<40} {f['consultas']:>9} {f['segundos'] * 1000:>10.2f}")
+        if self.lentas:
+            linhas += ["", "Últimas consultas lentas:"]
+            for instante, nome, ms, chamada in list(self.lentas)[-limite:]:
+                linhas.append(f"  {datetime.fromtimestamp(instante):%H:%M:%S} {ms:8.2f} ms  {nome} via {chamada}")
+        return "\n".join(linhas)
+
+    def prometheus(self, prefixo="estacionamento"):
+        """Métricas no formato texto do Prometheus (histograma cumulativo por consulta)."""
+        dados = self.estatisticas()
+        saida = [f"# HELP {prefixo}_consulta_segundos Latência do execute por consulta nomeada.",
+                 f"# TYPE {prefixo}_consulta_segundos histogram"]
+        for nome, c in dados["consultas"].items():
+            rotulo = f'consulta="{_rotulo(nome)}"'
+            acumulado = 0
+            for limite, quantidade in zip(BALDES_SEGUNDOS, c["baldes"]):
+                acumulado += quantidade
+                saida.append(f'{prefixo}_consulta_segundos_bucket{{{rotulo},le="{limite:g}"}} {acumulado}')
+            saida.append(f'{prefixo}_consulta_segundos_bucket{{{rotulo},le="+Inf"}} {c["execucoes"]}')
+            saida.append(f"{prefixo}_consulta_segundos_sum{{{rotulo}}} {c['segundos']}")
+            saida.append(f"{prefixo}_consulta_segundos_count{{{rotulo}}} {c['execucoes']}")
+        saida += [f"# HELP {prefixo}_consulta_linhas_total Linhas lidas ou alteradas por consulta.",
+                  f"# TYPE {prefixo}_consulta_linhas_total counter"]
+        saida += [f'{prefixo}_consulta_linhas_total{{consulta="{_rotulo(nome)}"}} {c["linhas"]}'
+                  for nome, c in dados["consultas"].items()]
+        saida += [f"# HELP {prefixo}_fachada_segundos_total Tempo de banco por chamada da fachada.",
+                  f"# TYPE {prefixo}_fachada_segundos_total counter"]
+        saida += [f'{prefixo}_fachada_segundos_total{{chamada="{_rotulo(chamada)}"}} {f["segundos"]}'
+                  for chamada, f in dados["fachada"].items()]
+        saida += [f"# HELP {prefixo}_consultas_lentas_total Consultas acima do limite de lentidão.",
+                  f"# TYPE {prefixo}_consultas_lentas_total counter",
+                  f"{prefixo}_consultas_lentas_total {dados['lentas']}"]
+        return "\n".join(saida) + "\n"
+
+    def exportar_prometheus(self, caminho):
+        """Grava o arquivo de métricas (temporário + rename: o coletor nunca lê pela metade)."""
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(self.prometheus())
+        os.replace(temporario, caminho)
+        return caminho
+
+class CursorInstrumentado(sqlite3.Cursor):
+    """
+    Cursor da instrumentação ligada: mede cada execute (contadores do
+    registro + histograma) e conta as linhas lidas depois, no fetch.
+    """
+    contadores = None
+    instrumentacao = None
+    _nome = None
+
+    def _medir(self, sql, segundos):
+        self._nome = nome_da_consulta(sql)
+        if self.contadores is not None:
+            self.contadores.registrar(self._nome, segundos)
+        self.instrumentacao.observar(self._nome, segundos, max(self.rowcount, 0))
+
+    def execute(self, sql, parametros=()):
+        inicio = time.perf_counter()
+        try:
+            return super().execute(sql, parametros)
+        finally:
+            self._medir(sql, time.perf_counter() - inicio)
+
+    def executemany(self, sql, sequencia):
+        inicio = time.perf_counter()
+        try:
+            return super().executemany(sql, sequencia)
+        finally:
+            self._medir(sql, time.perf_counter() - inicio)
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            self.instrumentacao.somar_linhas(self._nome, 1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = super().fetchmany(*args, **kwargs)
+        self.instrumentacao.somar_linhas(self._nome, len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        self.instrumentacao.somar_linhas(self._nome, len(rows))
+        return rows
+
+    def __next__(self):
+        row = super().__next__()
+        self.instrumentacao.somar_linhas(self._nome, 1)
+        return row
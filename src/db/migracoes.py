@@ -0,0 +1,201 @@
+"""
+Migrações Versionadas do Esquema.
+Responsabilidade: Levar qualquer banco (novo ou antigo) até VERSAO_ATUAL,
+uma versão por vez, com a versão gravada em PRAGMA user_version.
+- Passo transacional: DDL + nova versão no mesmo commit (tudo ou nada).
+- Passo em lotes: preenchimentos longos em transações curtas, uma por lote,
+  para a catraca continuar gravando entre eles. A versão só avança no fim;
+  se o processo cair no meio, a próxima inicialização retoma do ponto em
+  que parou (cada lote só toca linhas ainda vazias).
+Banco em dia: uma leitura do user_version e nenhuma DDL (na partida, nem
+conexão: esquema_em_dia lê o cabeçalho do arquivo).
+Regra: migração publicada não muda; mudança nova = versão nova no fim da lista.
+Localização: src/db/migracoes.py
+"""
+import sqlite3
+import time
+from collections import namedtuple
+
+from src.db import queries
+
+TAMANHO_LOTE = 5000
+
+# Cabeçalho do arquivo SQLite: assinatura + user_version em 60..63 (big-endian)
+_ASSINATURA_SQLITE = b"SQLite format 3\x00"
+_TAMANHO_CABECALHO = 100
+
+# em_lotes=False: aplicar(conn) roda numa transação só, junto com a nova versão
+# em_lotes=True : aplicar(conn, tamanho_lote, pausa_segundos) confirma lote a lote
+Migracao = namedtuple("Migracao", "versao descricao aplicar em_lotes")
+
+# --- PASSOS ---
+
+def _esquema_base(conn):
+    """
+    v1: o esquema completo anterior às migrações versionadas.
+    Tudo é idempotente (IF NOT EXISTS / coluna só se faltar): bancos criados
+    antes desta versão (user_version = 0) passam por aqui sem perder nada.
+    """
+    # 1. Tabelas Independentes (Ordem Importa!)
+    conn.execute(queries.CREATE_TABLE_APARTAMENTOS)
+    conn.execute(queries.CREATE_TABLE_VISITANTES_CADASTRO)
+
+    # 2. Tabelas Dependentes (Com Foreign Keys)
+    conn.execute(queries.CREATE_TABLE_MORADORES)
+    conn.execute(queries.CREATE_TABLE_VEICULOS)
+    conn.execute(queries.CREATE_TABLE_FUNCIONARIOS)
+
+    #  conn.execute(queries.CREATE_TABLE_CONTROLE_VAGAS_MORADORES) PENSAR EM COMO RESOLVER O CODESMELL DE .vaga_atual = None PARA MORADOR, RESPEITANDO A REGRA DE NEGOCIO DE 2 VAGAS POR APTO - VER
+
+    conn.execute(queries.CREATE_TABLE_CONTROLE_VAGAS_FUNCIONARIOS)
+    conn.execute(queries.CREATE_TABLE_TICKETS)
+    conn.execute(queries.CREATE_TABLE_HISTORICO)
+
+    # 3. Tabela de Usuários (Independente)
+    conn.execute(queries.CREATE_TABLE_USUARIOS)
+
+    # 3B. Bancos antigos: colunas epoch (o preenchimento é a v2, em lotes)
+    for tabela, coluna, alter, _ in queries.MIGRACOES_EPOCH:
+        if coluna not in {row[1] for row in conn.execute(f"PRAGMA table_info({tabela});")}:
+            conn.execute(alter)
+
+    # 4. Índices secundários (buscas quentes da catraca)
+    for ddl in queries.CREATE_INDICES:
+        conn.execute(ddl)
+
+    # 5. Registro de documentos (CNH/CPF/Placa únicos entre tabelas)
+    conn.execute(queries.CREATE_TABLE_DOCUMENTOS)
+    if conn.execute(queries.SELECT_DOCUMENTOS_VAZIO).fetchone()[0]:
+        for carga in queries.BACKFILL_DOCUMENTOS:
+            conn.execute(carga)
+    for ddl in queries.CREATE_TRIGGERS_DOCUMENTOS:
+        conn.execute(ddl)
+
+    # 6. Resumos do histórico (por hora / por dia) e sua marca d'água
+    conn.execute(queries.CREATE_TABLE_RESUMO_HORA)
+    conn.execute(queries.CREATE_TABLE_RESUMO_DIA)
+    conn.execute(queries.CREATE_TABLE_RESUMO_CONTROLE)
+
+    # 7. Sessões encerradas de visitantes (análise de permanência)
+    conn.execute(queries.CREATE_TABLE_SESSOES_VISITANTES)
+    conn.execute(queries.CREATE_INDEX_SESSOES_ENTRADA)
+
+    # 8. Catálogo do arquivo frio do histórico (meses movidos para fora)
+    conn.execute(queries.CREATE_TABLE_HISTORICO_ARQUIVOS)
+
+def _preencher_epoch(conn, tamanho_lote, pausa_segundos):
+    """v2: preenche data_hora_epoch / entrada_epoch de bancos antigos, em lotes."""
+    total = 0
+    for tabela, _, _, preenchimento in queries.MIGRACOES_EPOCH:
+        total += preencher_em_lotes(conn, tabela, preenchimento, tamanho_lote, pausa_segundos)
+    return total
+
+def _funcionarios_ativo(conn):
+    """
+    v3: coluna 'ativo' para a exclusão lógica de funcionários.
+    Só se faltar: banco com user_version atrasado pode já ter a coluna.
+    """
+    if "ativo" not in {row[1] for row in conn.execute("PRAGMA table_info(funcionarios);")}:
+        conn.execute(queries.ALTER_FUNCIONARIOS_ATIVO)
+
+def _vagas_unicas(conn):
+    """
+    v4: índice único em numero_vaga (tickets e vagas de funcionários).
+    Vaga já alocada em dobro não é resolvida sozinha: a migração para com
+    a lista das vagas, para o operador encerrar o registro errado.
+    """
+    for tabela, ddl in queries.VAGAS_UNICAS:
+        em_dobro = [row[0] for row in conn.execute(queries.SELECT_VAGAS_EM_DOBRO.format(tabela=tabela))]
+        if em_dobro:
+            raise sqlite3.IntegrityError(f"Vagas alocadas em dobro em {tabela}: {em_dobro}.")
+        conn.execute(ddl)
+
+MIGRACOES = (
+    Migracao(1, "Esquema base", _esquema_base, False),
+    Migracao(2, "Preencher colunas epoch (lotes)", _preencher_epoch, True),
+    Migracao(3, "Funcionários: coluna ativo", _funcionarios_ativo, False),
+    Migracao(4, "Vagas únicas (tickets e funcionários)", _vagas_unicas, False),
+)
+VERSAO_ATUAL = MIGRACOES[-1].versao
+
+# --- EXECUÇÃO ---
+
+def preencher_em_lotes(conn, tabela, update, tamanho_lote=TAMANHO_LOTE, pausa_segundos=0.0):
+    """
+    Roda 'update' (parâmetros: id > ? AND id <= ?) em faixas de 'tamanho_lote'
+    ids, com um commit por faixa. A faixa seguinte começa do fim da anterior
+    (keyset), então o progresso é garantido mesmo se alguma linha não puder
+    ser preenchida.
+    pausa_segundos: folga entre lotes para outros escritores pegarem o lock.
+    Retorna: total de linhas alteradas.
+    """
+    sql_fim = queries.SELECT_FIM_LOTE.format(tabela=tabela)
+    ultimo_id, alteradas = 0, 0
+    while True:
+        fim = conn.execute(sql_fim, (ultimo_id, tamanho_lote)).fetchone()[0]
+        if fim is None:
+            return alteradas
+        alteradas += conn.execute(update, (ultimo_id, fim)).rowcount
+        conn.commit()
+        ultimo_id = fim
+        if pausa_segundos:
+            time.sleep(pausa_segundos)
+
+def versao_do_banco(conn):
+    return conn.execute(queries.SELECT_VERSAO_ESQUEMA).fetchone()[0]
+
+def versao_no_arquivo(caminho):
+    """
+    Lê o user_version direto do cabeçalho do arquivo (bytes 60-63), sem
+    abrir conexão nem aplicar PRAGMAs.
+    Com WAL, o cabeçalho pode estar atrasado até o próximo checkpoint: o
+    valor lido nunca é MAIOR que o real, então na dúvida o chamador só cai
+    no caminho normal (migrar).
+    Retorna: a versão, ou None (arquivo inexistente, vazio ou não-SQLite).
+    """
+    try:
+        with open(caminho, "rb") as arquivo:
+            cabecalho = arquivo.read(_TAMANHO_CABECALHO)
+    except OSError:
+        return None
+    if len(cabecalho) < _TAMANHO_CABECALHO or not cabecalho.startswith(_ASSINATURA_SQLITE):
+        return None
+    return int.from_bytes(cabecalho[60:64], "big")
+
+def esquema_em_dia(caminho):
+    """True se o arquivo já está em VERSAO_ATUAL (nenhuma DDL necessária)."""
+    if caminho == ":memory:":
+        return False
+    versao = versao_no_arquivo(caminho)
+    return versao is not None and versao >= VERSAO_ATUAL
+
+def migrar(conn, tamanho_lote=TAMANHO_LOTE, pausa_segundos=0.0):
+    """
+    Aplica, em ordem, as migrações com versão maior que a do banco.
+    Retorna: lista das versões aplicadas (vazia = banco já estava em dia).
+    """
+    versao = versao_do_banco(conn)
+    if versao >= VERSAO_ATUAL:
+        return []
+
+    conn.commit()  # Cada passo define a própria fronteira de transação
+    aplicadas = []
+    for migracao in MIGRACOES:
+        if migracao.versao <= versao:
+            continue
+
+        if migracao.em_lotes:
+            migracao.aplicar(conn, tamanho_lote, pausa_segundos)
+
+        # BEGIN explícito: no modo legado do sqlite3, DDL não abre transação sozinha
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            if not migracao.em_lotes:
+                migracao.aplicar(conn)
+            conn.execute(queries.DEFINIR_VERSAO_ESQUEMA.format(versao=migracao.versao))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        aplicadas.append(migracao.versao)
+    return aplicadas
@@ -1,6 +1,8 @@
 """
 Módulo de Queries SQL (Refatorado v3 - Imutabilidade e Exclusão Física).
 Reflete a arquitetura Relacional: Apartamento -> Morador -> Veículo.
+Cada constante é uma consulta nomeada (catálogo em src/db/registro.py):
+todo SQL dos repositórios mora aqui, com lista explícita de colunas.
 """
 
 # ==============================================================================
@@ -77,6 +79,7 @@ CREATE TABLE IF NOT EXISTS tickets_visitantes (
     numero_vaga INTEGER,
     entrada TEXT NOT NULL,
     id_visitante INTEGER,
+    entrada_epoch INTEGER,  -- Mesmo instante de 'entrada', em segundos (epoch)
     FOREIGN KEY(id_visitante) REFERENCES visitantes_cadastrados(id)
 );
 """
@@ -100,7 +103,8 @@ CREATE TABLE IF NOT EXISTS historico_movimentacao (
     data_hora TEXT NOT NULL,
     placa TEXT NOT NULL,
     tipo_veiculo TEXT,  
-    tipo_evento TEXT    
+    tipo_evento TEXT,
+    data_hora_epoch INTEGER  -- Mesmo instante de 'data_hora', em segundos (epoch)
 );
 """
 
@@ -115,26 +119,258 @@ CREATE TABLE IF NOT EXISTS usuarios (
 """
 
 
+# ==============================================================================
+# 0B. ÍNDICES SECUNDÁRIOS (Consultas quentes da catraca)
+# ==============================================================================
+# Sem eles, cada busca por placa/dono é um SCAN da tabela inteira.
+# 'historico_movimentacao' cresce para sempre, então o índice dele é COBRINDO:
+# contém todas as colunas do SELECT (e o id para o ORDER BY), a consulta
+# não precisa nem tocar a tabela.
+
+# SELECT_TICKET_ATIVO (placa na catraca)
+CREATE_INDEX_TICKETS_PLACA = "CREATE INDEX IF NOT EXISTS idx_tickets_placa ON tickets_visitantes(placa);"
+
+# SELECT_HISTORICO_BY_PLACA (cobrindo: placa + id DESC + colunas exibidas)
+CREATE_INDEX_HISTORICO_PLACA = """
+CREATE INDEX IF NOT EXISTS idx_historico_placa
+ON historico_movimentacao(placa, id, data_hora, tipo_veiculo, tipo_evento);
+"""
+
+# Navegador do histórico filtrado por tipo (ex.: só FUNCIONARIO): página em ordem de id
+CREATE_INDEX_HISTORICO_TIPO = "CREATE INDEX IF NOT EXISTS idx_historico_tipo ON historico_movimentacao(tipo_veiculo, id);"
+
+# Intervalos de tempo (SELECT_HISTORICO_ENTRE / exportação): busca no índice inteiro
+CREATE_INDEX_HISTORICO_EPOCH = "CREATE INDEX IF NOT EXISTS idx_historico_epoch ON historico_movimentacao(data_hora_epoch);"
+
+# SELECT_VEICULOS_BY_MORADOR_ID / _VISITANTE_ID / funcionario_id
+CREATE_INDEX_VEICULOS_MORADOR = "CREATE INDEX IF NOT EXISTS idx_veiculos_morador ON veiculos(morador_id);"
+CREATE_INDEX_VEICULOS_VISITANTE = "CREATE INDEX IF NOT EXISTS idx_veiculos_visitante ON veiculos(visitante_id);"
+CREATE_INDEX_VEICULOS_FUNCIONARIO = "CREATE INDEX IF NOT EXISTS idx_veiculos_funcionario ON veiculos(funcionario_id);"
+
+# SELECT_MORADORES_BY_APTO_ID (e o JOIN de SELECT_COUNT_VEICULOS_BY_APTO_ID)
+CREATE_INDEX_MORADORES_APTO = "CREATE INDEX IF NOT EXISTS idx_moradores_apto ON moradores(id_apartamento);"
+
+# SELECT_VAGA_FUNCIONARIO_ATIVA / DELETE_VAGA_FUNCIONARIO
+CREATE_INDEX_VAGAS_FUNC_PLACA = "CREATE INDEX IF NOT EXISTS idx_vagas_func_placa ON controle_vagas_funcionarios(placa);"
+
+# Bancos antigos: colunas epoch adicionadas e preenchidas a partir do texto.
+# strftime('%s', texto, 'utc') interpreta o texto como hora LOCAL (como foi
+# gravado) e devolve o epoch: a mesma expressão usada nos INSERTs.
+# O preenchimento roda em lotes de ids (id > ? AND id <= ?), ver src/db/migracoes.py.
+# (tabela, coluna, ALTER, preenchimento)
+MIGRACOES_EPOCH = (
+    ("historico_movimentacao", "data_hora_epoch",
+     "ALTER TABLE historico_movimentacao ADD COLUMN data_hora_epoch INTEGER;",
+     "UPDATE historico_movimentacao SET data_hora_epoch = CAST(strftime('%s', data_hora, 'utc') AS INTEGER) "
+     "WHERE id > ? AND id <= ? AND data_hora_epoch IS NULL;"),
+    ("tickets_visitantes", "entrada_epoch",
+     "ALTER TABLE tickets_visitantes ADD COLUMN entrada_epoch INTEGER;",
+     "UPDATE tickets_visitantes SET entrada_epoch = CAST(strftime('%s', entrada, 'utc') AS INTEGER) "
+     "WHERE id > ? AND id <= ? AND entrada_epoch IS NULL;"),
+)
+
+# Ordem de criação (usada pelo CommonRepository.criar_tabelas)
+CREATE_INDICES = (
+    CREATE_INDEX_TICKETS_PLACA,
+    CREATE_INDEX_HISTORICO_PLACA,
+    CREATE_INDEX_HISTORICO_TIPO,
+    CREATE_INDEX_HISTORICO_EPOCH,
+    CREATE_INDEX_VEICULOS_MORADOR,
+    CREATE_INDEX_VEICULOS_VISITANTE,
+    CREATE_INDEX_VEICULOS_FUNCIONARIO,
+    CREATE_INDEX_MORADORES_APTO,
+    CREATE_INDEX_VAGAS_FUNC_PLACA,
+)
+
+# ==============================================================================
+# 0C. REGISTRO DE DOCUMENTOS (Unicidade de CNH / CPF / Placa entre tabelas)
+# ==============================================================================
+# Uma linha por documento, com chave única (tipo, valor). Mantido por TRIGGERS,
+# na mesma transação do INSERT/UPDATE/DELETE de origem (inclusive exclusões em
+# cascata e importação em lote). Checar se uma CNH existe vira uma busca na
+# chave primária, em vez de carregar as três tabelas de pessoas num set.
+
+CREATE_TABLE_DOCUMENTOS = """
+CREATE TABLE IF NOT EXISTS documentos (
+    tipo TEXT NOT NULL,         -- 'CNH', 'CPF' ou 'PLACA'
+    valor TEXT NOT NULL,
+    origem TEXT NOT NULL,       -- 'MORADOR', 'VISITANTE', 'FUNCIONARIO' ou 'VEICULO'
+    origem_id INTEGER NOT NULL,
+    PRIMARY KEY (tipo, valor)
+) WITHOUT ROWID;
+"""
+
+CREATE_TRIGGER_DOC_MORADORES_CNH_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_moradores_cnh_insert AFTER INSERT ON moradores
+BEGIN
+    INSERT INTO documentos (tipo, valor, origem, origem_id) VALUES ('CNH', NEW.cnh, 'MORADOR', NEW.id);
+END;
+"""
+CREATE_TRIGGER_DOC_MORADORES_CNH_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_moradores_cnh_update AFTER UPDATE OF cnh ON moradores
+WHEN OLD.cnh IS NOT NEW.cnh
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'MORADOR' AND origem_id = OLD.id;
+    INSERT INTO documentos (tipo, valor, origem, origem_id)
+    SELECT 'CNH', NEW.cnh, 'MORADOR', NEW.id WHERE NEW.cnh IS NOT NULL AND NEW.cnh <> '';
+END;
+"""
+CREATE_TRIGGER_DOC_MORADORES_CNH_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_moradores_cnh_delete AFTER DELETE ON moradores
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'MORADOR' AND origem_id = OLD.id;
+END;
+"""
+
+CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_visitantes_cadastrados_cnh_insert AFTER INSERT ON visitantes_cadastrados
+BEGIN
+    INSERT INTO documentos (tipo, valor, origem, origem_id) VALUES ('CNH', NEW.cnh, 'VISITANTE', NEW.id);
+END;
+"""
+CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_visitantes_cadastrados_cnh_update AFTER UPDATE OF cnh ON visitantes_cadastrados
+WHEN OLD.cnh IS NOT NEW.cnh
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'VISITANTE' AND origem_id = OLD.id;
+    INSERT INTO documentos (tipo, valor, origem, origem_id)
+    SELECT 'CNH', NEW.cnh, 'VISITANTE', NEW.id WHERE NEW.cnh IS NOT NULL AND NEW.cnh <> '';
+END;
+"""
+CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_visitantes_cadastrados_cnh_delete AFTER DELETE ON visitantes_cadastrados
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'VISITANTE' AND origem_id = OLD.id;
+END;
+"""
+
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cnh_insert AFTER INSERT ON funcionarios
+WHEN NEW.cnh IS NOT NULL AND NEW.cnh <> ''
+BEGIN
+    INSERT INTO documentos (tipo, valor, origem, origem_id) VALUES ('CNH', NEW.cnh, 'FUNCIONARIO', NEW.id);
+END;
+"""
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cnh_update AFTER UPDATE OF cnh ON funcionarios
+WHEN OLD.cnh IS NOT NEW.cnh
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'FUNCIONARIO' AND origem_id = OLD.id;
+    INSERT INTO documentos (tipo, valor, origem, origem_id)
+    SELECT 'CNH', NEW.cnh, 'FUNCIONARIO', NEW.id WHERE NEW.cnh IS NOT NULL AND NEW.cnh <> '';
+END;
+"""
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cnh_delete AFTER DELETE ON funcionarios
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CNH' AND valor = OLD.cnh AND origem = 'FUNCIONARIO' AND origem_id = OLD.id;
+END;
+"""
+
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cpf_insert AFTER INSERT ON funcionarios
+BEGIN
+    INSERT INTO documentos (tipo, valor, origem, origem_id) VALUES ('CPF', NEW.cpf, 'FUNCIONARIO', NEW.id);
+END;
+"""
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cpf_update AFTER UPDATE OF cpf ON funcionarios
+WHEN OLD.cpf IS NOT NEW.cpf
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CPF' AND valor = OLD.cpf AND origem = 'FUNCIONARIO' AND origem_id = OLD.id;
+    INSERT INTO documentos (tipo, valor, origem, origem_id)
+    SELECT 'CPF', NEW.cpf, 'FUNCIONARIO', NEW.id WHERE NEW.cpf IS NOT NULL AND NEW.cpf <> '';
+END;
+"""
+CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_funcionarios_cpf_delete AFTER DELETE ON funcionarios
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'CPF' AND valor = OLD.cpf AND origem = 'FUNCIONARIO' AND origem_id = OLD.id;
+END;
+"""
+
+CREATE_TRIGGER_DOC_VEICULOS_PLACA_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_veiculos_placa_insert AFTER INSERT ON veiculos
+BEGIN
+    INSERT INTO documentos (tipo, valor, origem, origem_id) VALUES ('PLACA', NEW.placa, 'VEICULO', NEW.id);
+END;
+"""
+CREATE_TRIGGER_DOC_VEICULOS_PLACA_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_veiculos_placa_update AFTER UPDATE OF placa ON veiculos
+WHEN OLD.placa IS NOT NEW.placa
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'PLACA' AND valor = OLD.placa AND origem = 'VEICULO' AND origem_id = OLD.id;
+    INSERT INTO documentos (tipo, valor, origem, origem_id)
+    SELECT 'PLACA', NEW.placa, 'VEICULO', NEW.id WHERE NEW.placa IS NOT NULL AND NEW.placa <> '';
+END;
+"""
+CREATE_TRIGGER_DOC_VEICULOS_PLACA_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_doc_veiculos_placa_delete AFTER DELETE ON veiculos
+BEGIN
+    DELETE FROM documentos WHERE tipo = 'PLACA' AND valor = OLD.placa AND origem = 'VEICULO' AND origem_id = OLD.id;
+END;
+"""
+
+# Ordem de criação (usada pelo CommonRepository.criar_tabelas)
+CREATE_TRIGGERS_DOCUMENTOS = (
+    CREATE_TRIGGER_DOC_MORADORES_CNH_INSERT,
+    CREATE_TRIGGER_DOC_MORADORES_CNH_UPDATE,
+    CREATE_TRIGGER_DOC_MORADORES_CNH_DELETE,
+    CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_INSERT,
+    CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_UPDATE,
+    CREATE_TRIGGER_DOC_VISITANTES_CADASTRADOS_CNH_DELETE,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_INSERT,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_UPDATE,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CNH_DELETE,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_INSERT,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_UPDATE,
+    CREATE_TRIGGER_DOC_FUNCIONARIOS_CPF_DELETE,
+    CREATE_TRIGGER_DOC_VEICULOS_PLACA_INSERT,
+    CREATE_TRIGGER_DOC_VEICULOS_PLACA_UPDATE,
+    CREATE_TRIGGER_DOC_VEICULOS_PLACA_DELETE,
+)
+
+# Carga inicial para bancos que já tinham dados antes do registro existir.
+# OR IGNORE: duplicidades antigas não impedem a subida do sistema.
+SELECT_DOCUMENTOS_VAZIO = "SELECT NOT EXISTS (SELECT 1 FROM documentos);"
+BACKFILL_DOCUMENTOS = (
+    "INSERT OR IGNORE INTO documentos SELECT 'CNH', cnh, 'MORADOR', id FROM moradores;",
+    "INSERT OR IGNORE INTO documentos SELECT 'CNH', cnh, 'VISITANTE', id FROM visitantes_cadastrados;",
+    "INSERT OR IGNORE INTO documentos SELECT 'CNH', cnh, 'FUNCIONARIO', id FROM funcionarios WHERE cnh IS NOT NULL AND cnh <> '';",
+    "INSERT OR IGNORE INTO documentos SELECT 'CPF', cpf, 'FUNCIONARIO', id FROM funcionarios;",
+    "INSERT OR IGNORE INTO documentos SELECT 'PLACA', placa, 'VEICULO', id FROM veiculos;",
+)
+
+# Consultas pontuais (busca na chave primária)
+SELECT_DOCUMENTO_EXISTE = "SELECT EXISTS (SELECT 1 FROM documentos WHERE tipo = ? AND valor = ?);"
+SELECT_DOCUMENTOS_POR_TIPO = "SELECT valor FROM documentos WHERE tipo = ?;"
+
 # ==============================================================================
 # 1. APARTAMENTOS (NOVO CRUD)
 # ==============================================================================
 
+# Colunas explícitas (nunca SELECT *): a ordem é a de Apartamento.do_banco (ver src/repositories/mapeadores.py)
+COLUNAS_APARTAMENTO = "id, numero, bloco, vagas"
+
 INSERT_APARTAMENTO = "INSERT INTO apartamentos (numero, bloco, vagas) VALUES (?, ?, ?);"
-SELECT_ALL_APARTAMENTOS = "SELECT * FROM apartamentos ORDER BY numero, bloco;"
-SELECT_APARTAMENTO_BY_ID = "SELECT * FROM apartamentos WHERE id=?;"
-SELECT_APARTAMENTO_BY_NUM_BLOCO = "SELECT * FROM apartamentos WHERE numero=? AND bloco=?;"
+SELECT_ALL_APARTAMENTOS = f"SELECT {COLUNAS_APARTAMENTO} FROM apartamentos ORDER BY numero, bloco;"
+SELECT_APARTAMENTO_BY_ID = f"SELECT {COLUNAS_APARTAMENTO} FROM apartamentos WHERE id=?;"
+SELECT_APARTAMENTO_BY_NUM_BLOCO = f"SELECT {COLUNAS_APARTAMENTO} FROM apartamentos WHERE numero=? AND bloco=?;"
 
 
 # ==============================================================================
 # 2. MORADORES (CRUD Atualizado)
 # ==============================================================================
 
+COLUNAS_MORADOR = "id, nome, cnh, id_apartamento"
+
 INSERT_MORADOR = "INSERT INTO moradores (nome, cnh, id_apartamento) VALUES (?, ?, ?);"
-SELECT_ALL_MORADORES = "SELECT * FROM moradores;"
-SELECT_MORADOR_BY_ID = "SELECT * FROM moradores WHERE id = ?;"
-SELECT_MORADORES_BY_APTO_ID = "SELECT * FROM moradores WHERE id_apartamento = ?;"
+SELECT_ALL_MORADORES = f"SELECT {COLUNAS_MORADOR} FROM moradores;"
+SELECT_MORADOR_BY_ID = f"SELECT {COLUNAS_MORADOR} FROM moradores WHERE id = ?;"
+SELECT_MORADORES_BY_APTO_ID = f"SELECT {COLUNAS_MORADOR} FROM moradores WHERE id_apartamento = ?;"
+SELECT_IDS_APARTAMENTOS_OCUPADOS = "SELECT DISTINCT id_apartamento FROM moradores;"
 
-UPDATE_MORADOR = "UPDATE moradores SET nome=?, id_apartamento=? WHERE id=?;" 
+UPDATE_MORADOR = "UPDATE moradores SET nome=?, cnh=?, id_apartamento=? WHERE id=?;" 
 
 DELETE_MORADOR = "DELETE FROM moradores WHERE id=?;"
 
@@ -143,14 +379,18 @@ DELETE_MORADOR = "DELETE FROM moradores WHERE id=?;"
 # 3. GESTÃO DE RH (FUNCIONÁRIOS)
 # ==============================================================================
 
+COLUNAS_FUNCIONARIO = "id, nome, cpf, cargo, cnh, id_usuario, ativo"
+
 INSERT_FUNCIONARIO = """
 INSERT INTO funcionarios (nome, cpf, cargo, cnh, id_usuario) 
 VALUES (?, ?, ?, ?, ?);
 """
 
-SELECT_ALL_FUNCIONARIOS = "SELECT * FROM funcionarios;"
+SELECT_ALL_FUNCIONARIOS = f"SELECT {COLUNAS_FUNCIONARIO} FROM funcionarios;"
 
-SELECT_FUNCIONARIO_BY_CPF = "SELECT * FROM funcionarios WHERE cpf = ?;"
+SELECT_FUNCIONARIO_BY_ID = f"SELECT {COLUNAS_FUNCIONARIO} FROM funcionarios WHERE id = ?;"
+
+SELECT_FUNCIONARIO_BY_CPF = f"SELECT {COLUNAS_FUNCIONARIO} FROM funcionarios WHERE cpf = ?;"
 
 UPDATE_FUNCIONARIO = """
 UPDATE funcionarios 
@@ -165,9 +405,11 @@ DELETE_FUNCIONARIO = "DELETE FROM funcionarios WHERE id = ?;"
 # 4. VISITANTES (CADASTRO PESSOA)
 # ==============================================================================
 
+COLUNAS_VISITANTE = "id, nome, cnh, data_cadastro"
+
 INSERT_VISITANTE_CADASTRO = "INSERT INTO visitantes_cadastrados (nome, cnh, data_cadastro) VALUES (?, ?, ?);"
-SELECT_ALL_VISITANTES = "SELECT * FROM visitantes_cadastrados ORDER BY nome;"
-SELECT_VISITANTE_BY_ID = "SELECT * FROM visitantes_cadastrados WHERE id = ?;"
+SELECT_ALL_VISITANTES = f"SELECT {COLUNAS_VISITANTE} FROM visitantes_cadastrados ORDER BY nome;"
+SELECT_VISITANTE_BY_ID = f"SELECT {COLUNAS_VISITANTE} FROM visitantes_cadastrados WHERE id = ?;"
 
 UPDATE_VISITANTE = "UPDATE visitantes_cadastrados SET nome=? WHERE id=?;" 
 
@@ -178,6 +420,8 @@ DELETE_VISITANTE = "DELETE FROM visitantes_cadastrados WHERE id=?;"
 # 5. VEÍCULOS (CRUD + OPERAÇÃO)
 # ==============================================================================
 
+COLUNAS_VEICULO = "id, placa, modelo, cor, estacionado, morador_id, visitante_id, funcionario_id"
+
 INSERT_VEICULO = """
 INSERT INTO veiculos (placa, modelo, cor, morador_id, visitante_id, funcionario_id, estacionado)
 VALUES (?, ?, ?, ?, ?, ?, ?);
@@ -189,10 +433,10 @@ FROM veiculos v
 JOIN moradores m ON v.morador_id = m.id
 WHERE m.id_apartamento = ?;
 """
-SELECT_VEICULO_BY_PLACA = "SELECT * FROM veiculos WHERE placa = ?;"
-SELECT_VEICULOS_BY_MORADOR_ID = "SELECT * FROM veiculos WHERE morador_id = ?;"
-#SELECT_VEICULOS_BY_FUNCIONARIO_ID = "SELECT * FROM veiculos WHERE funcionario_id = ?;"
-SELECT_VEICULOS_BY_VISITANTE_ID = "SELECT * FROM veiculos WHERE visitante_id = ?;"
+SELECT_VEICULO_BY_PLACA = f"SELECT {COLUNAS_VEICULO} FROM veiculos WHERE placa = ?;"
+SELECT_VEICULOS_BY_MORADOR_ID = f"SELECT {COLUNAS_VEICULO} FROM veiculos WHERE morador_id = ?;"
+SELECT_VEICULOS_BY_FUNCIONARIO_ID = f"SELECT {COLUNAS_VEICULO} FROM veiculos WHERE funcionario_id = ?;"
+SELECT_VEICULOS_BY_VISITANTE_ID = f"SELECT {COLUNAS_VEICULO} FROM veiculos WHERE visitante_id = ?;"
 SELECT_ALL_PLACAS = "SELECT placa FROM veiculos;"
 
 UPDATE_VEICULO = "UPDATE veiculos SET modelo=?, cor=?, morador_id=?, visitante_id=?, funcionario_id=? WHERE placa=?;"
@@ -207,10 +451,18 @@ SET_VEICULO_SAIDA = "UPDATE veiculos SET estacionado = 0 WHERE placa = ?;"
 # 6. TICKETS E ROTATIVOS (CATRACA)
 # ==============================================================================
 
-INSERT_TICKET = "INSERT INTO tickets_visitantes (placa, numero_vaga, entrada, id_visitante) VALUES (?, ?, ?, ?);"
-SELECT_TICKET_ATIVO = "SELECT * FROM tickets_visitantes WHERE placa = ?;"
-SELECT_ALL_TICKETS = "SELECT * FROM tickets_visitantes;"
+# entrada_epoch é derivado do próprio texto de 'entrada' pelo SQLite (?3), sem parse no Python
+INSERT_TICKET = """
+INSERT INTO tickets_visitantes (placa, numero_vaga, entrada, id_visitante, entrada_epoch)
+VALUES (?1, ?2, ?3, ?4, CAST(strftime('%s', ?3, 'utc') AS INTEGER));
+"""
+# Leitura devolve o epoch (int) no lugar do texto: TicketVisitante não precisa de fromisoformat
+COLUNAS_TICKET = "id, placa, numero_vaga, entrada_epoch, id_visitante"
+SELECT_TICKET_ATIVO = f"SELECT {COLUNAS_TICKET} FROM tickets_visitantes WHERE placa = ?;"
+SELECT_ALL_TICKETS = f"SELECT {COLUNAS_TICKET} FROM tickets_visitantes ORDER BY entrada_epoch;"
 SELECT_VAGAS_OCUPADAS_VISITANTES = "SELECT numero_vaga FROM tickets_visitantes;"
+SELECT_COUNT_TICKETS_ATIVOS = "SELECT COUNT(*) FROM tickets_visitantes;"
+UPDATE_TICKET_VINCULAR_VISITANTE = "UPDATE tickets_visitantes SET id_visitante = ? WHERE placa = ?;"
 DELETE_TICKET = "DELETE FROM tickets_visitantes WHERE id=?;"
 
 # ==============================================================================
@@ -218,8 +470,9 @@ DELETE_TICKET = "DELETE FROM tickets_visitantes WHERE id=?;"
 # ==============================================================================
 
 INSERT_VAGA_FUNCIONARIO = "INSERT INTO controle_vagas_funcionarios (placa, numero_vaga, entrada, id_funcionario) VALUES (?, ?, ?, ?);"
-SELECT_VAGA_FUNCIONARIO_ATIVA = "SELECT * FROM controle_vagas_funcionarios WHERE placa = ?;"
+SELECT_VAGA_FUNCIONARIO_ATIVA = "SELECT numero_vaga FROM controle_vagas_funcionarios WHERE placa = ?;"
 SELECT_VAGAS_OCUPADAS_FUNCIONARIOS = "SELECT numero_vaga FROM controle_vagas_funcionarios;"
+SELECT_COUNT_VAGAS_FUNCIONARIOS = "SELECT COUNT(*) FROM controle_vagas_funcionarios;"
 DELETE_VAGA_FUNCIONARIO = "DELETE FROM controle_vagas_funcionarios WHERE placa=?;"
 
 
@@ -278,11 +531,44 @@ WHERE v.estacionado = 1
 ;
 """
 
+# ==============================================================================
+# 7B. CATRACA: RESOLUÇÃO DA PLACA EM UMA ÚNICA CONSULTA
+# ==============================================================================
+# Parte da placa digitada (mesmo sem cadastro) e traz veículo, dono,
+# unidade, ticket ativo e vaga da Zona C. Todos os JOINs usam PK ou os
+# índices de placa (ver 0B).
+
+SELECT_CONTEXTO_CATRACA = """
+SELECT
+    p.placa,                                        -- 0
+    v.id, v.modelo, v.cor, v.estacionado,           -- 1..4
+    v.morador_id, v.visitante_id, v.funcionario_id, -- 5..7
+    COALESCE(m.nome, vc.nome, f.nome, tv.nome),     -- 8  Nome do dono
+    f.cargo,                                        -- 9
+    a.numero, a.bloco,                              -- 10, 11
+    t.id, t.numero_vaga, t.entrada_epoch, t.id_visitante, -- 12..15 Ticket ativo
+    cvf.numero_vaga                                 -- 16 Vaga Zona C
+FROM (SELECT ? AS placa) p
+LEFT JOIN veiculos v ON v.placa = p.placa
+LEFT JOIN moradores m ON m.id = v.morador_id
+LEFT JOIN apartamentos a ON a.id = m.id_apartamento
+LEFT JOIN visitantes_cadastrados vc ON vc.id = v.visitante_id
+LEFT JOIN funcionarios f ON f.id = v.funcionario_id
+LEFT JOIN tickets_visitantes t ON t.placa = p.placa
+LEFT JOIN visitantes_cadastrados tv ON tv.id = t.id_visitante
+LEFT JOIN controle_vagas_funcionarios cvf ON cvf.placa = p.placa
+LIMIT 1;
+"""
+
 # ==============================================================================
 # 8. HISTÓRICO
 # ==============================================================================
 
-INSERT_HISTORICO = "INSERT INTO historico_movimentacao (data_hora, placa, tipo_veiculo, tipo_evento) VALUES (?, ?, ?, ?);"
+# data_hora_epoch é derivado do próprio texto (?1) pelo SQLite: os chamadores continuam com 4 parâmetros
+INSERT_HISTORICO = """
+INSERT INTO historico_movimentacao (data_hora, placa, tipo_veiculo, tipo_evento, data_hora_epoch)
+VALUES (?1, ?2, ?3, ?4, CAST(strftime('%s', ?1, 'utc') AS INTEGER));
+"""
 
 SELECT_HISTORICO_RECENTE = """
     SELECT data_hora, placa, tipo_veiculo, tipo_evento 
@@ -298,12 +584,336 @@ SELECT_HISTORICO_BY_PLACA = """
     ORDER BY id DESC;
 """
 
+# Navegador paginado (keyset no id): cada página é uma busca no índice + LIMIT,
+# nunca OFFSET. {filtros} recebe só fragmentos de FILTROS_HISTORICO / CURSORES_HISTORICO.
+SELECT_HISTORICO_PAGINA = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM historico_movimentacao
+    WHERE {filtros}
+    ORDER BY id {ordem}
+    LIMIT ?;
+"""
+FILTROS_HISTORICO = {
+    "placa": "placa = ?",               # idx_historico_placa (cobrindo)
+    "tipo_veiculo": "tipo_veiculo = ?", # idx_historico_tipo
+    "tipo_evento": "tipo_evento = ?",
+}
+CURSORES_HISTORICO = {
+    "antes_de": ("id < ?", "DESC"),     # próxima página (mais antigos)
+    "depois_de": ("id > ?", "ASC"),     # página anterior (mais recentes)
+}
+
+# Ir para data: último evento antes do instante (idx_historico_epoch, uma busca)
+SELECT_HISTORICO_ULTIMO_ID_ANTES = """
+    SELECT id FROM historico_movimentacao
+    WHERE data_hora_epoch < ?
+    ORDER BY data_hora_epoch DESC, id DESC
+    LIMIT 1;
+"""
+
+# Eventos entre T1 e T2 ([inicio, fim) em epoch), pelo idx_historico_epoch
+SELECT_HISTORICO_ENTRE = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM historico_movimentacao
+    WHERE data_hora_epoch >= ? AND data_hora_epoch < ?
+    ORDER BY data_hora_epoch, id
+    LIMIT ?;
+"""
+SELECT_COUNT_HISTORICO_ENTRE = "SELECT COUNT(*) FROM historico_movimentacao WHERE data_hora_epoch >= ? AND data_hora_epoch < ?;"
+
+# Exportação completa (auditoria): intervalo [inicio, fim) em data_hora, na ordem de gravação
+SELECT_HISTORICO_INTERVALO = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM historico_movimentacao
+    WHERE data_hora_epoch >= ? AND data_hora_epoch < ?
+    ORDER BY data_hora_epoch, id;
+"""
+
 # ==============================================================================
 # 9. USUÁRIOS E AUTENTICAÇÃO
 # ==============================================================================
 
 INSERT_USUARIO = "INSERT INTO usuarios (username, senha_hash, perfil) VALUES (?, ?, ?);"
-SELECT_USUARIO_BY_USERNAME = "SELECT * FROM usuarios WHERE username = ?;"
+SELECT_USUARIO_BY_USERNAME = "SELECT id, username, senha_hash, perfil FROM usuarios WHERE username = ?;"
 SELECT_ALL_USUARIOS = "SELECT id, username, perfil FROM usuarios;" 
 DELETE_USUARIO = "DELETE FROM usuarios WHERE id = ?;"
-UPDATE_SENHA_USUARIO = "UPDATE usuarios SET senha_hash = ? WHERE id = ?;"
\ No newline at end of file
+UPDATE_SENHA_USUARIO = "UPDATE usuarios SET senha_hash = ? WHERE id = ?;"
+# ==============================================================================
+# 10. IMPORTAÇÃO EM LOTE (executemany + recuperação dos IDs gerados)
+# ==============================================================================
+
+# Apartamento repetido é ignorado (UNIQUE numero+bloco); o ID é lido depois
+INSERT_APARTAMENTO_IGNORE = "INSERT OR IGNORE INTO apartamentos (numero, bloco, vagas) VALUES (?, ?, ?);"
+SELECT_APARTAMENTOS_CHAVES = "SELECT id, numero, bloco, vagas FROM apartamentos;"
+SELECT_APARTAMENTOS_APOS_ID = "SELECT id, numero, bloco, vagas FROM apartamentos WHERE id > ?;"
+SELECT_MAX_ID_APARTAMENTOS = "SELECT COALESCE(MAX(id), 0) FROM apartamentos;"
+
+SELECT_MORADORES_APOS_ID = "SELECT id, cnh FROM moradores WHERE id > ?;"
+SELECT_MAX_ID_MORADORES = "SELECT COALESCE(MAX(id), 0) FROM moradores;"
+
+# Cota de vagas de todas as unidades numa consulta só
+SELECT_COUNT_VEICULOS_POR_APTO = """
+SELECT m.id_apartamento, COUNT(*)
+FROM veiculos v
+JOIN moradores m ON v.morador_id = m.id
+GROUP BY m.id_apartamento;
+"""
+
+# ==============================================================================
+# 11. RESUMOS DO HISTÓRICO (Contagens por hora e por dia)
+# ==============================================================================
+# 'historico_movimentacao' só cresce; perguntas como "horário de pico por dia
+# da semana" fariam SCAN do log inteiro. Os resumos guardam contagens já
+# agregadas por (período, tipo_veiculo, tipo_evento) e são atualizados por
+# recuperação incremental: só as linhas com id > último id processado.
+# Funciona igual para gravação estrita, buffer (VAZAO) e importação em lote.
+
+CREATE_TABLE_RESUMO_HORA = """
+CREATE TABLE IF NOT EXISTS historico_resumo_hora (
+    dia TEXT NOT NULL,              -- 'YYYY-MM-DD'
+    hora INTEGER NOT NULL,          -- 0..23
+    dia_semana INTEGER NOT NULL,    -- 0 = domingo (strftime '%w')
+    tipo_veiculo TEXT NOT NULL,
+    tipo_evento TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (dia, hora, tipo_veiculo, tipo_evento)
+) WITHOUT ROWID;
+"""
+
+CREATE_TABLE_RESUMO_DIA = """
+CREATE TABLE IF NOT EXISTS historico_resumo_dia (
+    dia TEXT NOT NULL,
+    dia_semana INTEGER NOT NULL,
+    tipo_veiculo TEXT NOT NULL,
+    tipo_evento TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (dia, tipo_veiculo, tipo_evento)
+) WITHOUT ROWID;
+"""
+
+# Marca d'água: último id do histórico já somado aos resumos
+CREATE_TABLE_RESUMO_CONTROLE = """
+CREATE TABLE IF NOT EXISTS historico_resumo_controle (
+    nome TEXT PRIMARY KEY,
+    ultimo_id INTEGER NOT NULL
+);
+"""
+
+SELECT_RESUMO_ULTIMO_ID = "SELECT ultimo_id FROM historico_resumo_controle WHERE nome = 'historico';"
+UPSERT_RESUMO_ULTIMO_ID = """
+INSERT INTO historico_resumo_controle (nome, ultimo_id) VALUES ('historico', ?)
+ON CONFLICT(nome) DO UPDATE SET ultimo_id = excluded.ultimo_id;
+"""
+SELECT_MAX_ID_HISTORICO = "SELECT COALESCE(MAX(id), 0) FROM historico_movimentacao;"
+
+# Intervalo (ultimo_id, max_id]: o PK do histórico limita a leitura às linhas novas
+ACUMULAR_RESUMO_HORA = """
+INSERT INTO historico_resumo_hora (dia, hora, dia_semana, tipo_veiculo, tipo_evento, total)
+SELECT substr(data_hora, 1, 10),
+       CAST(substr(data_hora, 12, 2) AS INTEGER),
+       CAST(strftime('%w', substr(data_hora, 1, 10)) AS INTEGER),
+       COALESCE(tipo_veiculo, 'DESCONHECIDO'),
+       COALESCE(tipo_evento, 'DESCONHECIDO'),
+       COUNT(*)
+FROM historico_movimentacao
+WHERE id > ? AND id <= ?
+GROUP BY 1, 2, 4, 5
+ON CONFLICT(dia, hora, tipo_veiculo, tipo_evento) DO UPDATE SET total = total + excluded.total;
+"""
+
+ACUMULAR_RESUMO_DIA = """
+INSERT INTO historico_resumo_dia (dia, dia_semana, tipo_veiculo, tipo_evento, total)
+SELECT substr(data_hora, 1, 10),
+       CAST(strftime('%w', substr(data_hora, 1, 10)) AS INTEGER),
+       COALESCE(tipo_veiculo, 'DESCONHECIDO'),
+       COALESCE(tipo_evento, 'DESCONHECIDO'),
+       COUNT(*)
+FROM historico_movimentacao
+WHERE id > ? AND id <= ?
+GROUP BY 1, 3, 4
+ON CONFLICT(dia, tipo_veiculo, tipo_evento) DO UPDATE SET total = total + excluded.total;
+"""
+
+# Relatórios (leem SÓ os resumos)
+SELECT_RESUMO_DIARIO = """
+SELECT dia, tipo_veiculo, tipo_evento, total
+FROM historico_resumo_dia
+WHERE dia >= ?
+ORDER BY dia DESC;
+"""
+
+# Média de entradas por (dia da semana, hora) = soma / nº de dias daquele dia da semana
+SELECT_RESUMO_PICO_SEMANAL = """
+SELECT h.dia_semana, h.hora, SUM(h.total) * 1.0 / d.dias AS media
+FROM historico_resumo_hora h
+JOIN (SELECT dia_semana, COUNT(DISTINCT dia) AS dias
+      FROM historico_resumo_dia GROUP BY dia_semana) d ON d.dia_semana = h.dia_semana
+WHERE h.tipo_evento = 'ENTRADA'
+GROUP BY h.dia_semana, h.hora
+ORDER BY h.dia_semana, media DESC, h.hora;
+"""
+
+# ==============================================================================
+# 12. SESSÕES ENCERRADAS DE VISITANTES (Permanência)
+# ==============================================================================
+# O ticket é apagado na saída; antes disso, a sessão vira UMA linha compacta,
+# só com inteiros: entrada (epoch), duração (segundos), limite vigente
+# (minutos) e se era cadastrado. A análise lê tudo em colunas numa consulta.
+
+CREATE_TABLE_SESSOES_VISITANTES = """
+CREATE TABLE IF NOT EXISTS sessoes_visitantes (
+    id INTEGER PRIMARY KEY,
+    entrada INTEGER NOT NULL,       -- epoch (segundos)
+    duracao INTEGER NOT NULL,       -- segundos
+    limite INTEGER NOT NULL,        -- tempo limite vigente na saída (minutos)
+    cadastrado INTEGER NOT NULL     -- 1 = visitante cadastrado, 0 = rotativo
+);
+"""
+
+CREATE_INDEX_SESSOES_ENTRADA = "CREATE INDEX IF NOT EXISTS idx_sessoes_entrada ON sessoes_visitantes(entrada);"
+
+INSERT_SESSAO_VISITANTE = "INSERT INTO sessoes_visitantes (entrada, duracao, limite, cadastrado) VALUES (?, ?, ?, ?);"
+
+SELECT_COLUNAS_SESSOES = "SELECT entrada, duracao, limite, cadastrado FROM sessoes_visitantes WHERE entrada >= ?;"
+SELECT_COUNT_SESSOES = "SELECT COUNT(*) FROM sessoes_visitantes WHERE entrada >= ?;"
+
+# ==============================================================================
+# 13. ARQUIVO FRIO DO HISTÓRICO (Um arquivo SQLite por mês, via ATTACH)
+# ==============================================================================
+# Eventos mais antigos que o horizonte saem do banco operacional e vão para
+# <pasta>/historico_AAAA_MM.db. O banco quente fica pequeno (cabe no cache);
+# os arquivos só são anexados (ATTACH) quando a consulta pede aquele período.
+# {esquema} = apelido do ATTACH (validado: arq_AAAA_MM).
+
+# Catálogo dos meses arquivados (no banco quente): período coberto e total de linhas
+CREATE_TABLE_HISTORICO_ARQUIVOS = """
+CREATE TABLE IF NOT EXISTS historico_arquivos (
+    mes TEXT PRIMARY KEY,           -- 'AAAA-MM'
+    inicio_epoch INTEGER NOT NULL,  -- primeiro evento arquivado
+    fim_epoch INTEGER NOT NULL,     -- último evento arquivado
+    linhas INTEGER NOT NULL
+);
+"""
+
+SELECT_BANCOS_ANEXADOS = "PRAGMA database_list;"
+ATTACH_ARQUIVO = "ATTACH DATABASE ? AS {esquema};"
+DETACH_ARQUIVO = "DETACH DATABASE {esquema};"
+
+CREATE_TABLE_ARQUIVO_HISTORICO = """
+CREATE TABLE IF NOT EXISTS {esquema}.historico_movimentacao (
+    id INTEGER PRIMARY KEY,
+    data_hora TEXT NOT NULL,
+    placa TEXT NOT NULL,
+    tipo_veiculo TEXT,
+    tipo_evento TEXT,
+    data_hora_epoch INTEGER
+);
+"""
+CREATE_INDEX_ARQUIVO_PLACA = """
+CREATE INDEX IF NOT EXISTS {esquema}.idx_historico_placa
+ON historico_movimentacao(placa, id, data_hora, tipo_veiculo, tipo_evento);
+"""
+CREATE_INDEX_ARQUIVO_EPOCH = "CREATE INDEX IF NOT EXISTS {esquema}.idx_historico_epoch ON historico_movimentacao(data_hora_epoch);"
+
+# Mais antigo evento ainda no banco quente em [desde, corte) (define o próximo mês a mover)
+SELECT_HISTORICO_MAIS_ANTIGO_ENTRE = """
+SELECT MIN(data_hora_epoch) FROM historico_movimentacao
+WHERE data_hora_epoch >= ? AND data_hora_epoch < ?;
+"""
+
+# Cópia idempotente (INSERT OR IGNORE pelo id): repetir após uma falha não duplica
+COPIAR_HISTORICO_PARA_ARQUIVO = """
+INSERT OR IGNORE INTO {esquema}.historico_movimentacao
+    (id, data_hora, placa, tipo_veiculo, tipo_evento, data_hora_epoch)
+SELECT id, data_hora, placa, tipo_veiculo, tipo_evento, data_hora_epoch
+FROM main.historico_movimentacao
+WHERE data_hora_epoch >= ? AND data_hora_epoch < ?;
+"""
+DELETE_HISTORICO_INTERVALO = "DELETE FROM main.historico_movimentacao WHERE data_hora_epoch >= ? AND data_hora_epoch < ?;"
+
+SELECT_RESUMO_ARQUIVO = "SELECT MIN(data_hora_epoch), MAX(data_hora_epoch), COUNT(*) FROM {esquema}.historico_movimentacao;"
+UPSERT_HISTORICO_ARQUIVO = """
+INSERT INTO historico_arquivos (mes, inicio_epoch, fim_epoch, linhas) VALUES (?, ?, ?, ?)
+ON CONFLICT(mes) DO UPDATE SET
+    inicio_epoch = excluded.inicio_epoch, fim_epoch = excluded.fim_epoch, linhas = excluded.linhas;
+"""
+
+# Meses arquivados que cruzam o intervalo [inicio, fim] pedido
+SELECT_ARQUIVOS_NO_INTERVALO = """
+SELECT mes FROM historico_arquivos
+WHERE fim_epoch >= ? AND inicio_epoch < ?
+ORDER BY mes;
+"""
+
+# Leitores do histórico com o arquivo frio ativo: cada mês arquivado é anexado
+# e consultado um por vez (o SQLite aceita no máximo 10 ATTACH por conexão),
+# depois o banco quente. Os ids são preservados no arquivo, então a ordem por
+# id (ou por instante) continua valendo de um trecho para o outro.
+
+# buscar_historico_por_placa com intervalo e/ou num mês anexado ({esquema} = main ou arq_AAAA_MM)
+SELECT_HISTORICO_PLACA_TRECHO = """
+    SELECT data_hora, placa, tipo_veiculo, tipo_evento
+    FROM {esquema}.historico_movimentacao
+    WHERE placa = ?{intervalo}
+    ORDER BY id DESC;
+"""
+FILTRO_INTERVALO_EPOCH = " AND data_hora_epoch >= ? AND data_hora_epoch < ?"
+
+# Variantes de SELECT_HISTORICO_ENTRE / _INTERVALO / _PAGINA / _ULTIMO_ID_ANTES num mês anexado
+SELECT_HISTORICO_ENTRE_ARQUIVO = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM {esquema}.historico_movimentacao
+    WHERE data_hora_epoch >= ? AND data_hora_epoch < ?
+    ORDER BY data_hora_epoch, id
+    LIMIT ?;
+"""
+SELECT_COUNT_HISTORICO_ENTRE_ARQUIVO = "SELECT COUNT(*) FROM {esquema}.historico_movimentacao WHERE data_hora_epoch >= ? AND data_hora_epoch < ?;"
+SELECT_HISTORICO_INTERVALO_ARQUIVO = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM {esquema}.historico_movimentacao
+    WHERE data_hora_epoch >= ? AND data_hora_epoch < ?
+    ORDER BY data_hora_epoch, id;
+"""
+SELECT_HISTORICO_PAGINA_ARQUIVO = """
+    SELECT id, data_hora, placa, tipo_veiculo, tipo_evento
+    FROM {esquema}.historico_movimentacao
+    WHERE {filtros}
+    ORDER BY id {ordem}
+    LIMIT ?;
+"""
+SELECT_HISTORICO_ULTIMO_ID_ANTES_ARQUIVO = """
+    SELECT id FROM {esquema}.historico_movimentacao
+    WHERE data_hora_epoch < ?
+    ORDER BY data_hora_epoch DESC, id DESC
+    LIMIT 1;
+"""
+
+# ==============================================================================
+# 14. MIGRAÇÕES VERSIONADAS (PRAGMA user_version)
+# ==============================================================================
+# A versão do esquema fica no cabeçalho do arquivo: ler é uma leitura de página,
+# sem tocar nenhuma tabela. Os passos de cada versão estão em src/db/migracoes.py.
+
+SELECT_VERSAO_ESQUEMA = "PRAGMA user_version;"
+# PRAGMA não aceita parâmetro: a versão é sempre um int vindo de MIGRACOES
+DEFINIR_VERSAO_ESQUEMA = "PRAGMA user_version = {versao:d};"
+
+# Fim do próximo lote de um preenchimento: o id da N-ésima linha após 'id > ?'
+# (keyset pela PK: cada lote custa o mesmo, com ou sem buracos nos ids)
+SELECT_FIM_LOTE = "SELECT MAX(id) FROM (SELECT id FROM {tabela} WHERE id > ? ORDER BY id LIMIT ?);"
+
+# Exclusão lógica de funcionários (notes.txt, item 4). DEFAULT constante:
+# o SQLite só altera o esquema, sem reescrever as linhas existentes.
+ALTER_FUNCIONARIOS_ATIVO = "ALTER TABLE funcionarios ADD COLUMN ativo INTEGER NOT NULL DEFAULT 1;"
+
+# Uma vaga, um carro: o banco barra a alocação em dobro quando dois processos
+# (ex.: CLI e api.py no mesmo arquivo) têm índices de vagas diferentes em memória.
+# numero_vaga NULL (ticket sem vaga) não conflita.
+CREATE_UNIQUE_VAGA_TICKETS = "CREATE UNIQUE INDEX IF NOT EXISTS ux_tickets_vaga ON tickets_visitantes(numero_vaga);"
+CREATE_UNIQUE_VAGA_FUNCIONARIOS = "CREATE UNIQUE INDEX IF NOT EXISTS ux_vagas_func_numero ON controle_vagas_funcionarios(numero_vaga);"
+SELECT_VAGAS_EM_DOBRO = "SELECT numero_vaga FROM {tabela} WHERE numero_vaga IS NOT NULL GROUP BY numero_vaga HAVING COUNT(*) > 1;"
+# (tabela, índice único)
+VAGAS_UNICAS = (
+    ("tickets_visitantes", CREATE_UNIQUE_VAGA_TICKETS),
+    ("controle_vagas_funcionarios", CREATE_UNIQUE_VAGA_FUNCIONARIOS),
+)
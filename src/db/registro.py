@@ -0,0 +1,102 @@
+"""
+Registro de Consultas (catálogo nomeado de src/db/queries.py).
+Responsabilidade:
+- Dar nome a todo SQL de queries.py: o nome é o da própria constante
+  (SELECT_VEICULO_BY_PLACA, INSERT_TICKET...). Nada de SQL avulso nos repositórios.
+- Contar execuções e tempo acumulado por consulta (ContadoresConsultas),
+  via o cursor entregue por BaseRepository._get_cursor (CursorRegistrado).
+- Dimensionar o cache de statements do sqlite3 (TAMANHO_CACHE_STATEMENTS):
+  com ele maior que o catálogo, cada consulta é preparada uma única vez por
+  conexão do pool e depois só reaproveitada.
+Consultas montadas a partir de um modelo (.format) entram com o nome do
+modelo via nomear(); SQL fora do catálogo aparece como NAO_REGISTRADA.
+Localização: src/db/registro.py
+"""
+import sqlite3
+import threading
+import time
+from src.db import queries
+
+NAO_REGISTRADA = "(não registrada)"
+
+# Catálogo: nome da constante -> SQL (COLUNAS_* são pedaços de SQL, não consultas)
+CONSULTAS = {
+    nome: sql for nome, sql in vars(queries).items()
+    if nome.isupper() and isinstance(sql, str) and not nome.startswith("COLUNAS_")
+}
+
+# Busca reversa SQL -> nome (o hash da string fica guardado nela: lookup O(1))
+_NOMES = {}
+for _nome, _sql in CONSULTAS.items():
+    _NOMES.setdefault(_sql, _nome)
+
+# Folga para as variantes dos modelos (filtros da paginação, UNION dos meses arquivados)
+TAMANHO_CACHE_STATEMENTS = max(128, len(CONSULTAS) + 64)
+
+def nome_da_consulta(sql):
+    return _NOMES.get(sql, NAO_REGISTRADA)
+
+def nomear(nome, sql):
+    """
+    Registra uma variante montada de um modelo (ex.: SELECT_HISTORICO_PAGINA
+    com filtros) sob o nome do modelo. Retorna o próprio SQL.
+    As variantes são finitas (combinações de filtros), nunca dados do usuário.
+    """
+    if nome not in CONSULTAS:
+        raise KeyError(f"Consulta não registrada em queries.py: {nome}")
+    _NOMES.setdefault(sql, nome)
+    return sql
+
+class ContadoresConsultas:
+    """Execuções e tempo acumulado por consulta nomeada (seguro entre threads)."""
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._por_nome = {}
+
+    def registrar(self, nome, segundos):
+        with self._trava:
+            contador = self._por_nome.get(nome)
+            if contador is None:
+                self._por_nome[nome] = [1, segundos]
+            else:
+                contador[0] += 1
+                contador[1] += segundos
+
+    def estatisticas(self):
+        """
+        Retorna: dict {nome: {execucoes, segundos, media_ms}}, da consulta que
+        mais tempo acumulou para a que menos acumulou.
+        """
+        with self._trava:
+            itens = [(nome, n, s) for nome, (n, s) in self._por_nome.items()]
+        itens.sort(key=lambda item: item[2], reverse=True)
+        return {
+            nome: {"execucoes": n, "segundos": round(s, 6), "media_ms": round(s / n * 1000, 4)}
+            for nome, n, s in itens
+        }
+
+    def zerar(self):
+        with self._trava:
+            self._por_nome.clear()
+
+class CursorRegistrado(sqlite3.Cursor):
+    """
+    Cursor que cronometra cada execute/executemany e soma no contador da consulta.
+    O tempo é o do execute (preparo + primeiro passo); fetch fica de fora.
+    """
+    contadores = None
+
+    def execute(self, sql, parametros=()):
+        inicio = time.perf_counter()
+        try:
+            return super().execute(sql, parametros)
+        finally:
+            self.contadores.registrar(nome_da_consulta(sql), time.perf_counter() - inicio)
+
+    def executemany(self, sql, sequencia):
+        inicio = time.perf_counter()
+        try:
+            return super().executemany(sql, sequencia)
+        finally:
+            self.contadores.registrar(nome_da_consulta(sql), time.perf_counter() - inicio)
@@ -4,11 +4,14 @@ Responsabilidade: Receber uma placa e direcionar automaticamente para:
 - Entrada/Saída de Morador
 - Entrada/Saída de Visitante
 - Entrada/Saída de Funcionário
+A decisão vem do motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/catraca/controle_acesso.py
 """
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa
-from src.ui.components import header, show_warning, Colors
+from src.ui.components import header, show_error, Colors
+from src.classes.DecisaoCatraca import SAIDA
+from src.functions.catraca.motor_catraca import GateEngine
 
 from src.functions.moradores.catraca.entrada_morador import registrar_entrada_morador
 from src.functions.moradores.catraca.saida_morador import registrar_saida_morador
@@ -17,6 +20,18 @@ from src.functions.visitantes.catraca.saida_visitante import registrar_saida_vis
 from src.functions.funcionarios.catraca.entrada_funcionario import registrar_entrada_funcionario
 from src.functions.funcionarios.catraca.saida_funcionario import registrar_saida_funcionario
 
+# (tipo, ação) -> tela que exibe e confirma a decisão
+TELAS = {
+    ("MORADOR", "ENTRADA"): registrar_entrada_morador,
+    ("MORADOR", "SAIDA"): registrar_saida_morador,
+    ("VISITANTE", "ENTRADA"): registrar_entrada_visitante,
+    ("VISITANTE", "SAIDA"): registrar_saida_visitante,
+    ("ROTATIVO", "ENTRADA"): registrar_entrada_visitante,
+    ("ROTATIVO", "SAIDA"): registrar_saida_visitante,
+    ("FUNCIONARIO", "ENTRADA"): registrar_entrada_funcionario,
+    ("FUNCIONARIO", "SAIDA"): registrar_saida_funcionario,
+}
+
 def registrar_acesso_unificado(repositorio, estacionamento):
     """
     Hub Central da Catraca.
@@ -29,71 +44,32 @@ def registrar_acesso_unificado(repositorio, estacionamento):
     
     print(f"\n{Colors.DIM}🔍 Analisando placa {placa}...{Colors.RESET}")
     
-    # 2. Busca Inteligente: Quem é esse carro?
-    # (O repositório já sabe buscar na tabela de veiculos)
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
-    
-    # --- CENÁRIO A: Veículo NÃO Cadastrado (Provável Visitante Avulso) ---
-    if not veiculo:
-        # Se não achou na tabela fixa, verifica se tem um TICKET ABERTO (Visitante saindo)
-        ticket = repositorio.buscar_ticket_ativo(placa)
-        
-        if ticket:
+    # 2. Decisão: o motor resolve a placa (uma consulta) e escolhe a vaga.
+    # A decisão é repassada às telas de entrada/saída, que não buscam de novo.
+    motor = GateEngine(repositorio, estacionamento)
+    decisao = motor.avaliar(placa)
+
+    if not decisao.liberada:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
+        return
+
+    # 3. Feedback de identificação
+    if decisao.tipo == "ROTATIVO":
+        if decisao.acao == SAIDA:
             print(f"🎫 Ticket de Visitante encontrado. Direcionando para SAÍDA...")
-            registrar_saida_visitante(repositorio, estacionamento, placa_pre_validada=placa)
         else:
             print(f"🆕 Veículo desconhecido. Direcionando para ENTRADA DE VISITANTE...")
-            registrar_entrada_visitante(repositorio, estacionamento, placa_pre_validada=placa)
-        return
+    else:
+        rotulo = {"MORADOR": "MORADOR", "VISITANTE": "VISITANTE FREQUENTE", "FUNCIONARIO": "FUNCIONÁRIO"}[decisao.tipo]
+        cargo = f" ({decisao.contexto.cargo})" if decisao.tipo == "FUNCIONARIO" else ""
+        print(f"✅ Identificado: {rotulo} - {decisao.nome}{cargo}")
 
-    # --- CENÁRIO B: Veículo de MORADOR ---
-    if veiculo.morador_id:
-        morador = repositorio.buscar_morador_por_id(veiculo.morador_id)
-        if not morador:
-            print(f"{Colors.RED}Erro de inconsistência: Veículo sem dono válido.{Colors.RESET}")
-            return
-            
-        print(f"✅ Identificado: MORADOR - {morador.nome}")
-        
         # Lógica de status: Se já está dentro, sai. Se está fora, entra.
-        if veiculo.estacionado:
+        if decisao.acao == SAIDA:
             print("Status Atual: [DENTRO] ➡ Registrando SAÍDA...")
-            registrar_saida_morador(repositorio, placa_pre_validada=placa)
         else:
             print("Status Atual: [FORA] ➡ Registrando ENTRADA...")
-            registrar_entrada_morador(repositorio, estacionamento, placa_pre_validada=placa)
-        return
 
-    # --- CENÁRIO C: Veículo de VISITANTE FREQUENTE (Prestador/Parente) ---
-    if veiculo.visitante_id:
-        visitante = repositorio.buscar_visitante_por_id(veiculo.visitante_id)
-        print(f"✅ Identificado: VISITANTE FREQUENTE - {visitante.nome}")
-        
-        # Visitantes frequentes também geram tickets para controlar tempo
-        # Então verificamos se tem ticket aberto
-        ticket = repositorio.buscar_ticket_ativo(placa)
-        
-        if ticket:
-            print("Status Atual: [DENTRO] ➡ Registrando SAÍDA...")
-            registrar_saida_visitante(repositorio, estacionamento, placa_pre_validada=placa)
-        else:
-            print("Status Atual: [FORA] ➡ Registrando ENTRADA...")
-            registrar_entrada_visitante(repositorio, estacionamento, placa_pre_validada=placa)
-        return
-
-    # --- CENÁRIO D: Veículo de FUNCIONÁRIO (Zona C) ---
-    if veiculo.funcionario_id:
-        funcionario = repositorio.buscar_funcionario_por_id(veiculo.funcionario_id)
-        if not funcionario:
-            print(f"{Colors.RED}Erro de inconsistência: Veículo de funcionário sem dono válido.{Colors.RESET}")
-            return
-            
-        print(f"✅ Identificado: FUNCIONÁRIO - {funcionario.nome} ({funcionario.cargo})")
-        
-        if veiculo.estacionado:
-            print("Status Atual: [DENTRO] ➡ Registrando SAÍDA...")
-            registrar_saida_funcionario(repositorio, placa_pre_validada=placa)
-        else:
-            print("Status Atual: [FORA] ➡ Registrando ENTRADA...")
-            registrar_entrada_funcionario(repositorio, estacionamento, placa_pre_validada=placa)
-        return
\ No newline at end of file
+    # 4. Tela específica (exibe, confirma quando preciso e efetiva)
+    tela = TELAS[(decisao.tipo, decisao.acao)]
+    tela(repositorio, estacionamento, decisao=decisao)
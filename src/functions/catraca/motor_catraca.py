@@ -0,0 +1,215 @@
+"""
+Módulo: Motor da Catraca (GateEngine).
+Responsabilidade: Decidir e gravar entradas/saídas a partir de uma placa,
+sem input() nem print. É a mesma regra de negócio dos menus da catraca,
+mas utilizável por câmera de placas (ANPR), lote ou API.
+Fluxo:
+1. avaliar(placa)   -> DecisaoCatraca (só leitura: contexto + vaga livre)
+2. efetivar(decisao) -> grava tudo numa única transação e atualiza o índice de vagas
+3. processar(placa) = avaliar + efetivar (modo headless)
+Localização: src/functions/catraca/motor_catraca.py
+"""
+import sqlite3
+from contextlib import nullcontext
+from datetime import datetime
+
+from src.classes.DecisaoCatraca import DecisaoCatraca, ENTRADA, SAIDA, BLOQUEADO
+from src.classes.Estacionamento import ZONA_VISITANTES, ZONA_FUNCIONARIOS
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.functions.catraca.ocupacao import buscar_vaga_livre, sincronizar_ocupacao
+from src.utils.validations import validate_placa
+
+ZONA_MORADORES = "B"
+MOTIVO_LOTADA = {
+    ZONA_VISITANTES: "Zona A (Visitantes) LOTADA.",
+    ZONA_FUNCIONARIOS: "Zona C (Funcionários) LOTADA.",
+}
+# Vaga tomada por outro processo entre a decisão e o INSERT: ressincroniza e tenta outra
+TENTATIVAS_VAGA = 3
+
+def _vaga_em_dobro(erro):
+    """IntegrityError dos índices únicos de numero_vaga (ver queries.VAGAS_UNICAS)."""
+    return "numero_vaga" in str(erro)
+
+class GateEngine:
+    def __init__(self, repositorio, estacionamento):
+        self.repositorio = repositorio
+        self.estacionamento = estacionamento
+
+    def _conexao(self):
+        """Reaproveita a conexão aberta pelo chamador (menu) ou abre uma só para esta operação."""
+        if self.repositorio.conn is None:
+            return self.repositorio
+        return nullcontext(self.repositorio)
+
+    # =========================================================================
+    # 1. DECISÃO (somente leitura)
+    # =========================================================================
+
+    def avaliar(self, placa):
+        """
+        Decide o que fazer com a placa, sem gravar nada.
+        Retorna: DecisaoCatraca (ENTRADA, SAIDA ou BLOQUEADO).
+        """
+        placa_valida, erro = validate_placa(placa)
+        if erro:
+            return DecisaoCatraca(BLOQUEADO, placa, motivo=erro)
+
+        with self._conexao():
+            contexto = self.repositorio.resolver_placa(placa_valida)
+
+            if contexto.veiculo is None or contexto.tipo_dono == "VISITANTE":
+                return self._avaliar_visitante(contexto)
+            if contexto.tipo_dono == "MORADOR":
+                return self._avaliar_morador(contexto)
+            if contexto.tipo_dono == "FUNCIONARIO":
+                return self._avaliar_funcionario(contexto)
+
+        return DecisaoCatraca(BLOQUEADO, contexto.placa, motivo="Veículo sem dono válido.", contexto=contexto)
+
+    def _avaliar_visitante(self, contexto):
+        """Zona A: ticket aberto = saída; sem ticket = entrada (cadastrado ou rotativo)."""
+        tipo = "VISITANTE" if contexto.veiculo else "ROTATIVO"
+        ticket = contexto.ticket
+        nome = contexto.nome_dono or "Rotativo"
+
+        if ticket:
+            permanencia = int((datetime.now() - ticket.entrada).total_seconds() / 60)
+            return DecisaoCatraca(
+                SAIDA, contexto.placa, tipo=tipo, zona=ZONA_VISITANTES, vaga=ticket.numero_vaga,
+                nome=nome, entrada=ticket.entrada, permanencia_minutos=permanencia,
+                excedeu=self.estacionamento.verificar_ticket_vencido(ticket.entrada), contexto=contexto,
+            )
+
+        vaga = buscar_vaga_livre(self.repositorio, self.estacionamento, ZONA_VISITANTES)
+        if vaga is None:
+            return DecisaoCatraca(BLOQUEADO, contexto.placa, tipo=tipo, zona=ZONA_VISITANTES,
+                                  motivo=MOTIVO_LOTADA[ZONA_VISITANTES], contexto=contexto)
+
+        return DecisaoCatraca(ENTRADA, contexto.placa, tipo=tipo, zona=ZONA_VISITANTES, vaga=vaga,
+                              nome=nome, contexto=contexto)
+
+    def _avaliar_morador(self, contexto):
+        """Zona B: vaga garantida, só alterna o status do veículo."""
+        if not contexto.nome_dono:
+            return DecisaoCatraca(BLOQUEADO, contexto.placa, tipo="MORADOR",
+                                  motivo="Veículo sem dono válido.", contexto=contexto)
+
+        acao = SAIDA if contexto.veiculo.estacionado else ENTRADA
+        return DecisaoCatraca(acao, contexto.placa, tipo="MORADOR", zona=ZONA_MORADORES,
+                              nome=contexto.nome_dono, contexto=contexto)
+
+    def _avaliar_funcionario(self, contexto):
+        """Zona C: entrada aloca a menor vaga livre; saída devolve a vaga ocupada."""
+        if not contexto.nome_dono:
+            return DecisaoCatraca(BLOQUEADO, contexto.placa, tipo="FUNCIONARIO",
+                                  motivo="Funcionário não encontrado no banco de dados.", contexto=contexto)
+
+        if contexto.veiculo.estacionado:
+            return DecisaoCatraca(SAIDA, contexto.placa, tipo="FUNCIONARIO", zona=ZONA_FUNCIONARIOS,
+                                  vaga=contexto.vaga_funcionario, nome=contexto.nome_dono, contexto=contexto)
+
+        vaga = buscar_vaga_livre(self.repositorio, self.estacionamento, ZONA_FUNCIONARIOS)
+        if vaga is None:
+            return DecisaoCatraca(BLOQUEADO, contexto.placa, tipo="FUNCIONARIO", zona=ZONA_FUNCIONARIOS,
+                                  nome=contexto.nome_dono, motivo=MOTIVO_LOTADA[ZONA_FUNCIONARIOS], contexto=contexto)
+
+        return DecisaoCatraca(ENTRADA, contexto.placa, tipo="FUNCIONARIO", zona=ZONA_FUNCIONARIOS,
+                              vaga=vaga, nome=contexto.nome_dono, contexto=contexto)
+
+    # =========================================================================
+    # 2. EFETIVAÇÃO (uma transação por decisão)
+    # =========================================================================
+
+    def efetivar(self, decisao):
+        """
+        Grava a decisão no banco numa única transação (commit ou rollback de tudo).
+        O índice de vagas em memória só muda depois do commit.
+        Se a vaga já foi tomada por outro processo (índice único do banco),
+        desfaz, ressincroniza o índice e tenta a próxima vaga livre; sem
+        vaga, a decisão vira BLOQUEADO (zona lotada).
+        Exige a conexão sem transação aberta: confirmar antes levaria junto
+        escritas do chamador que ele talvez ainda quisesse desfazer.
+        Retorna: a própria decisão, com efetivada=True.
+        Lança: RuntimeError se o chamador tem escritas pendentes (sem commit).
+        """
+        if not decisao.liberada or decisao.efetivada:
+            return decisao
+
+        with self._conexao():
+            if self.repositorio.conn.in_transaction:
+                raise RuntimeError("Transação aberta na conexão: confirme ou desfaça antes de efetivar a catraca.")
+            for tentativa in range(1, TENTATIVAS_VAGA + 1):
+                try:
+                    self._gravar(decisao)
+                    self.repositorio.confirmar()
+                    break
+                except sqlite3.IntegrityError as e:
+                    self.repositorio.desfazer()
+                    if not _vaga_em_dobro(e) or tentativa == TENTATIVAS_VAGA:
+                        raise
+                    if not self._realocar_vaga(decisao):
+                        return decisao
+                except Exception:
+                    self.repositorio.desfazer()
+                    raise
+
+        self._atualizar_indice(decisao)
+        decisao.efetivada = True
+        return decisao
+
+    def _realocar_vaga(self, decisao):
+        """Recarrega o índice do banco e troca a vaga da decisão. Retorna False se lotou."""
+        sincronizar_ocupacao(self.repositorio, self.estacionamento)
+        decisao.vaga = buscar_vaga_livre(self.repositorio, self.estacionamento, decisao.zona)
+        if decisao.vaga is None:
+            decisao.acao = BLOQUEADO
+            decisao.motivo = MOTIVO_LOTADA[decisao.zona]
+            return False
+        return True
+
+    def processar(self, placa):
+        """Modo headless: decide e grava (ex: câmera de placas)."""
+        with self._conexao():
+            return self.efetivar(self.avaliar(placa))
+
+    def processar_lote(self, placas):
+        """Processa várias placas reaproveitando uma única conexão."""
+        with self._conexao():
+            return [self.processar(placa) for placa in placas]
+
+    def _gravar(self, decisao):
+        repo = self.repositorio
+        placa = decisao.placa
+
+        if decisao.zona == ZONA_VISITANTES:
+            if decisao.acao == ENTRADA:
+                veiculo = decisao.contexto.veiculo if decisao.contexto else None
+                id_visitante = veiculo.visitante_id if veiculo else None
+                repo.criar_ticket(TicketVisitante(placa=placa, numero_vaga=decisao.vaga, id_visitante=id_visitante))
+            else:
+                repo.encerrar_ticket(decisao.contexto.ticket, self.estacionamento.tempo_limite_visitante_minutos)
+            repo.registrar_log_visitante(placa, decisao.acao)
+
+        elif decisao.zona == ZONA_FUNCIONARIOS:
+            if decisao.acao == ENTRADA:
+                repo.registrar_entrada_veiculo(placa, tipo_dono="FUNCIONARIO")
+                repo.registrar_vaga_funcionario(placa, decisao.vaga, decisao.contexto.veiculo.funcionario_id)
+            else:
+                # A vaga efetivamente liberada no banco prevalece sobre a do contexto
+                decisao.vaga = repo.liberar_vaga_funcionario(placa)
+                repo.registrar_saida_veiculo(placa, tipo_dono="FUNCIONARIO")
+
+        elif decisao.acao == ENTRADA:
+            repo.registrar_entrada_veiculo(placa, tipo_dono="MORADOR")
+        else:
+            repo.registrar_saida_veiculo(placa, tipo_dono="MORADOR")
+
+    def _atualizar_indice(self, decisao):
+        if decisao.zona not in (ZONA_VISITANTES, ZONA_FUNCIONARIOS):
+            return
+        if decisao.acao == ENTRADA:
+            self.estacionamento.ocupar_vaga(decisao.zona, decisao.vaga)
+        else:
+            # None = deriva (vaga não constava no banco), ressincroniza na próxima busca
+            self.estacionamento.liberar_vaga(decisao.zona, decisao.vaga)
@@ -0,0 +1,70 @@
+"""
+Módulo: Sincronização do Índice de Ocupação (Zonas A e C).
+Responsabilidade: Carregar do banco o índice de vagas mantido em memória
+pela classe Estacionamento e corrigir deriva quando ele discorda de
+'tickets_visitantes' / 'controle_vagas_funcionarios'.
+Também faz a reconciliação periódica dos contadores de ocupação
+(_ocupacao_visitantes / _ocupacao_funcionarios) contra COUNT(*) no banco.
+Localização: src/functions/catraca/ocupacao.py
+"""
+import time
+from src.classes.Estacionamento import ZONA_VISITANTES, ZONA_FUNCIONARIOS
+
+def sincronizar_ocupacao(repositorio, estacionamento):
+    """
+    (Re)constrói o índice das duas zonas a partir do banco.
+    Chamado no setup e sempre que uma deriva for detectada.
+    Retorna: True se alguma zona estava divergente.
+    """
+    deriva_a = estacionamento.sincronizar_vagas(ZONA_VISITANTES, repositorio.listar_vagas_ocupadas_tickets())
+    deriva_c = estacionamento.sincronizar_vagas(ZONA_FUNCIONARIOS, repositorio.listar_vagas_ocupadas_funcionarios())
+    estacionamento.ultima_reconciliacao = time.monotonic()
+    return deriva_a or deriva_c
+
+def garantir_sincronia(repositorio, estacionamento):
+    """
+    Ressincroniza apenas se o índice marcou deriva
+    (ex: saída de vaga que não constava ocupada, exclusão em cascata de funcionário).
+    """
+    if estacionamento.precisa_sincronizar:
+        sincronizar_ocupacao(repositorio, estacionamento)
+
+def buscar_vaga_livre(repositorio, estacionamento, zona):
+    """
+    Consulta a menor vaga livre da zona pelo índice em memória.
+    Se o índice diz LOTADO, confere no banco antes de barrar o carro
+    (única situação em que a alocação toca o banco).
+    Retorna: int ou None se realmente lotado.
+    """
+    garantir_sincronia(repositorio, estacionamento)
+
+    vaga = estacionamento.consultar_vaga_livre(zona)
+    if vaga is None and sincronizar_ocupacao(repositorio, estacionamento):
+        vaga = estacionamento.consultar_vaga_livre(zona)
+    return vaga
+
+def reconciliar_ocupacao(repositorio, estacionamento):
+    """
+    Confere os contadores em memória com dois COUNT(*) baratos.
+    Só recarrega as vagas (SELECT completo) se houver divergência.
+    Retorna: True se havia divergência.
+    """
+    divergiu = estacionamento.reconciliar_contadores(
+        repositorio.contar_tickets_ativos(),
+        repositorio.contar_vagas_ocupadas_funcionarios(),
+    )
+    if divergiu:
+        sincronizar_ocupacao(repositorio, estacionamento)
+    estacionamento.ultima_reconciliacao = time.monotonic()
+    return divergiu
+
+def reconciliar_se_vencido(repositorio, estacionamento):
+    """
+    Job periódico: roda a reconciliação quando o intervalo configurado
+    (OCUPACAO_RECONCILIAR_SEGUNDOS) já passou desde a última.
+    Retorna: True se rodou e havia divergência.
+    """
+    decorrido = time.monotonic() - estacionamento.ultima_reconciliacao
+    if decorrido < estacionamento.intervalo_reconciliacao_segundos:
+        return False
+    return reconciliar_ocupacao(repositorio, estacionamento)
@@ -0,0 +1,162 @@
+"""
+Módulo: Exportação Completa (Auditoria).
+Responsabilidade: Exportar o histórico de movimentação (com filtro de datas)
+e a ocupação atual sem os limites dos relatórios de tela (LIMIT 25, fetchall).
+Formatos (pela extensão do arquivo ou pelo parâmetro 'formato'):
+- csv   : cabeçalho + uma linha por registro.
+- jsonl : um objeto JSON por linha.
+- hcol  : colunar compacto (binário). Cada bloco de linhas é gravado coluna
+          a coluna, com zlib: colunas repetitivas (tipo, evento) quase somem.
+Memória constante: o cursor é consumido com fetchmany, um lote por vez;
+nenhum formato acumula linhas além do lote atual.
+Localização: src/functions/exportacao/exportacao.py
+"""
+import csv
+import json
+import os
+import struct
+import time
+import zlib
+from datetime import date, timedelta
+
+from src.utils.tempo import para_epoch
+
+FORMATOS = ("csv", "jsonl", "hcol")
+TAMANHO_LOTE = 5000
+
+# Formato 'hcol': MAGICO, uma linha JSON com as colunas e os blocos.
+# Bloco = <uint32 linhas> + por coluna <uint32 bytes> + zlib(JSON da coluna).
+# Um bloco com 0 linhas marca o fim do arquivo.
+MAGICO_COLUNAR = b"HCOL1\n"
+_UINT32 = struct.Struct("<I")
+
+class _EscritorCSV:
+    def __init__(self, arquivo, colunas):
+        self._csv = csv.writer(arquivo)
+        self._csv.writerow(colunas)
+
+    def escrever(self, linhas):
+        self._csv.writerows(linhas)
+
+    def fechar(self):
+        pass
+
+class _EscritorJSONL:
+    def __init__(self, arquivo, colunas):
+        self._arquivo = arquivo
+        self._colunas = colunas
+
+    def escrever(self, linhas):
+        colunas = self._colunas
+        self._arquivo.write("".join(
+            json.dumps(dict(zip(colunas, linha)), ensure_ascii=False) + "\n" for linha in linhas
+        ))
+
+    def fechar(self):
+        pass
+
+class _EscritorColunar:
+    def __init__(self, arquivo, colunas):
+        self._arquivo = arquivo
+        self._total_colunas = len(colunas)
+        arquivo.write(MAGICO_COLUNAR)
+        arquivo.write(json.dumps({"colunas": list(colunas)}).encode() + b"\n")
+
+    def escrever(self, linhas):
+        self._arquivo.write(_UINT32.pack(len(linhas)))
+        for coluna in zip(*linhas):
+            comprimido = zlib.compress(json.dumps(coluna, ensure_ascii=False).encode(), 6)
+            self._arquivo.write(_UINT32.pack(len(comprimido)))
+            self._arquivo.write(comprimido)
+
+    def fechar(self):
+        self._arquivo.write(_UINT32.pack(0))
+
+ESCRITORES = {"csv": _EscritorCSV, "jsonl": _EscritorJSONL, "hcol": _EscritorColunar}
+
+def ler_colunar(caminho):
+    """
+    Lê um arquivo 'hcol' bloco a bloco.
+    Gera: dicts {coluna: valor}, um por registro.
+    """
+    with open(caminho, "rb") as arquivo:
+        if arquivo.readline() != MAGICO_COLUNAR:
+            raise ValueError("Arquivo não está no formato colunar (hcol).")
+        colunas = json.loads(arquivo.readline())["colunas"]
+        while True:
+            (total,) = _UINT32.unpack(arquivo.read(4))
+            if not total:
+                return
+            valores = []
+            for _ in colunas:
+                (tamanho,) = _UINT32.unpack(arquivo.read(4))
+                valores.append(json.loads(zlib.decompress(arquivo.read(tamanho))))
+            for linha in zip(*valores):
+                yield dict(zip(colunas, linha))
+
+def _formato(caminho, formato):
+    formato = (formato or os.path.splitext(caminho)[1].lstrip(".")).lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato '{formato}' inválido. Use: {', '.join(FORMATOS)}.")
+    return formato
+
+def _intervalo(inicio, fim):
+    """
+    Converte datas 'YYYY-MM-DD' (ambas inclusivas) no intervalo [inicio, fim)
+    em epoch, comparável com data_hora_epoch (índice).
+    """
+    limite_inicio = para_epoch(date.fromisoformat(inicio)) if inicio else 0
+    limite_fim = para_epoch(date.fromisoformat(fim) + timedelta(days=1)) if fim else 2 ** 62
+    return limite_inicio, limite_fim
+
+def _gravar(cursores, caminho, formato, tamanho_lote):
+    """
+    Consome os cursores em sequência, cada um em lotes (fetchmany), e grava
+    no formato pedido. As colunas vêm do primeiro cursor.
+    """
+    binario = formato == "hcol"
+    escritor = None
+    total = 0
+    inicio = time.perf_counter()
+
+    with open(caminho, "wb" if binario else "w", encoding=None if binario else "utf-8",
+              newline=None if binario else "") as arquivo:
+        for cursor in cursores:
+            if escritor is None:
+                escritor = ESCRITORES[formato](arquivo, [d[0] for d in cursor.description])
+            while True:
+                linhas = cursor.fetchmany(tamanho_lote)
+                if not linhas:
+                    break
+                escritor.escrever(linhas)
+                total += len(linhas)
+        escritor.fechar()
+
+    segundos = time.perf_counter() - inicio
+    return {
+        "linhas": total,
+        "segundos": round(segundos, 3),
+        "linhas_por_segundo": round(total / segundos) if segundos > 0 else total,
+        "bytes": os.path.getsize(caminho),
+        "caminho": caminho,
+        "formato": formato,
+    }
+
+def exportar_historico(repositorio, caminho, formato=None, inicio=None, fim=None, tamanho_lote=TAMANHO_LOTE):
+    """
+    Exporta 'historico_movimentacao' (inicio/fim: 'YYYY-MM-DD', inclusivos, opcionais),
+    inclusive os meses já movidos para o arquivo frio.
+    Retorna: dict com linhas, segundos, linhas_por_segundo, bytes, caminho e formato.
+    """
+    formato = _formato(caminho, formato)
+    limite_inicio, limite_fim = _intervalo(inicio, fim)
+    with repositorio:
+        cursores = repositorio.iterar_historico_intervalo(limite_inicio, limite_fim)
+        return _gravar(cursores, caminho, formato, tamanho_lote)
+
+def exportar_ocupacao(repositorio, caminho, formato=None, tamanho_lote=TAMANHO_LOTE):
+    """Exporta a ocupação atual (moradores, visitantes e funcionários no pátio)."""
+    formato = _formato(caminho, formato)
+    with repositorio:
+        cursor = repositorio.iterar_ocupacao()
+        return _gravar([cursor], caminho, formato, tamanho_lote)
@@ -5,84 +5,78 @@ Fluxo:
 2. Validações de Segurança.
 3. Verifica Vagas na Zona C.
 4. Registra Entrada e Ocupação da Vaga.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/funcionarios/catraca/entrada_funcionario.py
 """
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa
 from src.ui.components import header, show_success, show_error, show_warning, Colors
+from src.classes.Estacionamento import ZONA_FUNCIONARIOS
+from src.classes.DecisaoCatraca import SAIDA, BLOQUEADO
+from src.functions.catraca.motor_catraca import GateEngine
 
-def registrar_entrada_funcionario(repositorio, estacionamento, placa_pre_validada=None):
+def registrar_entrada_funcionario(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
     """
     Registra a entrada de um funcionário na Zona C via placa.
+    Se o wrapper já decidiu, recebe a DecisaoCatraca e não consulta o banco de novo.
     """
     header("ENTRADA DE FUNCIONÁRIO (CATRACA)")
+    motor = GateEngine(repositorio, estacionamento)
 
     # =========================================================================
     # 1. IDENTIFICAÇÃO (Wrapper vs Manual)
     # =========================================================================
-    if placa_pre_validada:
+    if decisao:
+        placa = decisao.placa
+        print(f"Placa identificada: {Colors.BOLD}{placa}{Colors.RESET}")
+    elif placa_pre_validada:
         placa = placa_pre_validada
         print(f"Placa identificada: {Colors.BOLD}{placa}{Colors.RESET}")
     else:
         placa, _ = get_valid_input("Digite a PLACA do veículo: ", validate_placa)
 
     # =========================================================================
-    # 2. BUSCA E VALIDAÇÕES DE SEGURANÇA
+    # 2. DECISÃO E VALIDAÇÕES DE SEGURANÇA
     # =========================================================================
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
+    if decisao is None:
+        decisao = motor.avaliar(placa)
+    veiculo = decisao.contexto.veiculo if decisao.contexto else None
 
     if not veiculo:
         show_error(f"BLOQUEADO: Veículo {placa} não cadastrado!")
         print(f"{Colors.DIM}Funcionários devem ter o carro previamente cadastrado no RH.{Colors.RESET}")
         return
 
-    if not veiculo.funcionario_id:
+    if decisao.tipo != "FUNCIONARIO":
         show_warning(f"ALERTA: O veículo {placa} não pertence a um Funcionário.")
         return
 
-    if veiculo.estacionado:
+    if decisao.acao == SAIDA:
         show_warning(f"O sistema indica que o veículo {placa} JÁ ESTÁ no pátio.")
         return
 
-    # =========================================================================
-    # 3. RECUPERAÇÃO DE DADOS PARA MENSAGEM
-    # =========================================================================
-    funcionario = repositorio.buscar_funcionario_por_id(veiculo.funcionario_id)
-    
-    if not funcionario:
-        show_error("Erro de integridade: Funcionário não encontrado no banco de dados.")
+    # Funcionário inexistente ou Zona C lotada
+    if decisao.acao == BLOQUEADO:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
         return
 
     # =========================================================================
-    # 4. GESTÃO DE VAGAS (ZONA C)
+    # 3. EXIBIÇÃO RÁPIDA E REGISTRO
     # =========================================================================
-    vagas_ocupadas = repositorio.listar_vagas_ocupadas_funcionarios()
-    vaga_livre = estacionamento.alocar_vaga_livre(estacionamento.capacidade_funcionarios, vagas_ocupadas)
-
-    if vaga_livre is None:
-        show_error("BLOQUEADO: A Zona C (Funcionários) está LOTADA!")
-        return
+    livres = estacionamento.vagas_livres(ZONA_FUNCIONARIOS)
 
-    livres = estacionamento.capacidade_funcionarios - len(vagas_ocupadas)
-
-    # =========================================================================
-    # 5. EXIBIÇÃO RÁPIDA E REGISTRO
-    # =========================================================================
     print("-" * 40)
     print(f"🚘 Veículo: {veiculo.modelo} ({veiculo.cor})")
-    print(f"💼 Func.:   {funcionario.nome} - {funcionario.cargo}")
-    print(f"📍 Destino: Zona C (Vaga {vaga_livre}) | Livres: {livres}")
+    print(f"💼 Func.:   {decisao.nome} - {decisao.contexto.cargo}")
+    print(f"📍 Destino: Zona C (Vaga {decisao.vaga}) | Livres: {livres}")
     print("-" * 40)
 
     try:
-        # 1. Altera status para estacionado e grava no Histórico (Log)
-        repositorio.registrar_entrada_veiculo(veiculo.placa, tipo_dono='FUNCIONARIO')
-        
-        # 2. Grava a vaga ocupada na tabela de controle do RH
-        repositorio.registrar_vaga_funcionario(veiculo.placa, vaga_livre, funcionario.id)
+        # Status, histórico e vaga da Zona C numa única transação
+        motor.efetivar(decisao)
         
         print(f"\n{Colors.GREEN}✔ ACESSO LIBERADO PARA A ZONA C{Colors.RESET}")
         input(f"\n{Colors.DIM}Pressione Enter para continuar...{Colors.RESET}")
         
     except Exception as e:
-        show_error(f"Erro crítico ao registrar entrada do funcionário: {e}")
\ No newline at end of file
+        show_error(f"Erro crítico ao registrar entrada do funcionário: {e}")
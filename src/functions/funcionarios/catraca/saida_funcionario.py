@@ -4,31 +4,39 @@ Fluxo:
 1. Busca Veículo e Vínculo RH.
 2. Libera a vaga na Zona C.
 3. Registra Saída no Log.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/funcionarios/catraca/saida_funcionario.py
 """
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa
 from src.ui.components import header, show_success, show_error, show_warning, Colors
+from src.classes.DecisaoCatraca import SAIDA
+from src.functions.catraca.motor_catraca import GateEngine
 
-def registrar_saida_funcionario(repositorio, placa_pre_validada=None):
+def registrar_saida_funcionario(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
     header("SAÍDA DE FUNCIONÁRIO 🛫")
+    motor = GateEngine(repositorio, estacionamento)
     
     # 1. Definição da Placa
-    if placa_pre_validada:
+    if decisao:
+        placa = decisao.placa
+    elif placa_pre_validada:
         placa = placa_pre_validada
         # Removido o print redundante para respeitar o wrapper
     else:
         placa, _ = get_valid_input("Digite a PLACA do veículo: ", validate_placa)
     
-    # 2. Busca Direta
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
+    # 2. Decisão do motor (ou reaproveita a do wrapper)
+    if decisao is None:
+        decisao = motor.avaliar(placa)
+    veiculo = decisao.contexto.veiculo if decisao.contexto else None
     
     if not veiculo:
         show_warning("❌ Veículo não encontrado no cadastro.")
         return
 
     # 3. Verifica Vínculo
-    if not veiculo.funcionario_id:
+    if decisao.tipo != "FUNCIONARIO":
         show_warning("Este veículo não está vinculado a um funcionário.")
         return
 
@@ -37,19 +45,16 @@ def registrar_saida_funcionario(repositorio, placa_pre_validada=None):
         show_warning(f"O veículo {placa} já consta como FORA do pátio.")
         return
 
-    # 5. Recupera dono para mensagem amigável
-    funcionario = repositorio.buscar_funcionario_por_id(veiculo.funcionario_id)
-    nome_dono = funcionario.nome if funcionario else "Desconhecido"
+    if decisao.acao != SAIDA:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
+        return
 
     try:
-        # Passo A: Remove o registro de ocupação da Zona C (Libera a Vaga)
-        repositorio.liberar_vaga_funcionario(veiculo.placa)
-        
-        # Passo B: Altera o status para fora (0) e grava Log de Auditoria
-        repositorio.registrar_saida_veiculo(veiculo.placa, tipo_dono='FUNCIONARIO') 
+        # Libera a vaga da Zona C, altera o status e grava o log (uma transação)
+        motor.efetivar(decisao)
         
         show_success(f"Vaga da Zona C liberada com sucesso.")
-        print(f"👋 Bom descanso, {nome_dono}!\n")
+        print(f"👋 Bom descanso, {decisao.nome}!\n")
         
     except Exception as e:
-        show_error(f"❌ Erro ao registrar saída do funcionário: {e}")
\ No newline at end of file
+        show_error(f"❌ Erro ao registrar saída do funcionário: {e}")
@@ -7,7 +7,7 @@ from src.classes.Funcionario import Funcionario
 from src.classes.Veiculo import Veiculo
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import (
-    validate_names, validate_cpf, validate_cnh_unica, validate_cargo, 
+    validate_names, validate_cpf, validate_cnh, validate_cargo, 
     validate_placa, validate_yes_no
 )
 from src.ui.colors import Colors
@@ -64,15 +64,15 @@ def cadastrar_novo_funcionario(repo):
     # 4. CNH (Opcional + Verificação de Duplicidade)
     print(f"{Colors.DIM}(Pressione ENTER se não dirigir){Colors.RESET}")
     
-    # Busca a lista no banco uma vez só
-    cnhs_existentes = [f.cnh for f in repo.funcionarios.listar() if f.cnh]
-    
     def validador_cnh_opcional(val):
         if not val.strip(): 
             return None, None # Regra 1: Se vazio, passa direto
         
-        # Regra 2: Se tem texto, joga pra a função validate_cnh_unica()
-        return validate_cnh_unica(val, cnhs_existentes)
+        # Regra 2: Formato + duplicidade em QUALQUER cadastro (morador, visitante ou funcionário)
+        cnh_valida, erro = validate_cnh(val)
+        if erro: return None, erro
+        if repo.cnh_existe(cnh_valida): return None, f"A CNH {cnh_valida} já pertence a outro cadastro."
+        return cnh_valida, None
 
     cnh, _ = get_valid_input("CNH (Opcional): ", validador_cnh_opcional)
 
@@ -85,11 +85,10 @@ def cadastrar_novo_funcionario(repo):
     placa, modelo, cor = None, None, None
     
     if tem_carro == 's':
-        placas_existentes = repo.veiculos.listar_todas_placas()
         def validador_placa_unica(valor):
             val, erro = validate_placa(valor)
             if erro: return None, erro
-            if val in placas_existentes: return None, "Placa já cadastrada."
+            if repo.placa_existe(val): return None, "Placa já cadastrada."
             return val, None
 
         placa, _ = get_valid_input("Placa: ", validador_placa_unica)
@@ -0,0 +1,274 @@
+"""
+Módulo: Importação em Lote (Apartamentos, Moradores e Veículos).
+Responsabilidade: Implantar um condomínio novo a partir de um arquivo CSV ou
+JSONL, sem digitar cada unidade no cadastro_morador.py.
+Formato (uma linha por morador; repita a CNH para um segundo carro):
+    numero, bloco, vagas, nome, cnh, placa, modelo, cor
+    (bloco, vagas, placa, modelo e cor são opcionais)
+Fluxo:
+1. Lê o arquivo em streaming (nunca carrega tudo na memória).
+2. Valida cada linha com as mesmas regras do cadastro manual.
+3. Grava em lotes: apartamentos, moradores e veículos via executemany,
+   uma transação por lote.
+4. Linhas recusadas vão para um arquivo ao lado (<arquivo>.rejeitados.csv/.jsonl)
+   com o número da linha e o motivo.
+Localização: src/functions/importacao/importacao_lote.py
+"""
+import csv
+import json
+import os
+import time
+
+from src.utils.validations import (
+    validate_apartamento, validate_names, validate_cnh, validate_placa
+)
+
+CAMPOS = ["numero", "bloco", "vagas", "nome", "cnh", "placa", "modelo", "cor"]
+VAGAS_PADRAO = 2
+
+def ler_registros(caminho):
+    """
+    Gera (numero_da_linha, dict) a partir de um .csv (',' ou ';') ou .jsonl.
+    A linha 1 do CSV é o cabeçalho.
+    """
+    if caminho.lower().endswith(".jsonl"):
+        with open(caminho, encoding="utf-8") as arquivo:
+            for numero, linha in enumerate(arquivo, start=1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    registro = None
+                # [1, 2], null ou "x" também não são um cadastro
+                if not isinstance(registro, dict):
+                    registro = {"_erro": "JSON inválido.", "_bruto": linha.rstrip("\n")}
+                yield numero, registro
+        return
+
+    with open(caminho, encoding="utf-8-sig", newline="") as arquivo:
+        cabecalho = arquivo.readline()
+        delimitador = ";" if cabecalho.count(";") > cabecalho.count(",") else ","
+        colunas = [c.strip().lower() for c in next(csv.reader([cabecalho], delimiter=delimitador))]
+        for numero, valores in enumerate(csv.reader(arquivo, delimiter=delimitador), start=2):
+            if not any(v.strip() for v in valores):
+                continue
+            yield numero, dict(zip(colunas, valores))
+
+class _Rejeitados:
+    """Arquivo lateral com as linhas recusadas (aberto só na primeira recusa)."""
+
+    def __init__(self, caminho, jsonl):
+        self.caminho = caminho
+        self.jsonl = jsonl
+        self.total = 0
+        self._arquivo = None
+        self._csv = None
+
+    def registrar(self, numero, motivo, registro):
+        self.total += 1
+        if self._arquivo is None:
+            self._arquivo = open(self.caminho, "w", encoding="utf-8", newline="")
+            if not self.jsonl:
+                self._csv = csv.writer(self._arquivo)
+                self._csv.writerow(["linha", "motivo"] + CAMPOS)
+
+        if self.jsonl:
+            self._arquivo.write(json.dumps({"linha": numero, "motivo": motivo, "registro": registro},
+                                           ensure_ascii=False) + "\n")
+        else:
+            self._csv.writerow([numero, motivo] + [registro.get(c, "") for c in CAMPOS])
+
+    def fechar(self):
+        if self._arquivo:
+            self._arquivo.close()
+
+def _texto(registro, campo):
+    valor = registro.get(campo)
+    return "" if valor is None else str(valor).strip()
+
+def _validar(registro):
+    """
+    Aplica as validações do cadastro manual.
+    Retorna: (linha normalizada, None) ou (None, motivo).
+    """
+    if "_erro" in registro:
+        return None, registro["_erro"]
+
+    numero, erro = validate_apartamento(_texto(registro, "numero"))
+    if erro:
+        return None, f"Apartamento: {erro}"
+
+    vagas = _texto(registro, "vagas") or VAGAS_PADRAO
+    try:
+        vagas = int(vagas)
+    except ValueError:
+        return None, "Vagas deve ser um número inteiro."
+    if vagas < 1:
+        return None, "Vagas deve ser pelo menos 1."
+
+    nome, erro = validate_names(_texto(registro, "nome"))
+    if erro:
+        return None, f"Nome: {erro}"
+
+    cnh, erro = validate_cnh(_texto(registro, "cnh"))
+    if erro:
+        return None, f"CNH: {erro}"
+
+    placa = None
+    if _texto(registro, "placa"):
+        placa, erro = validate_placa(_texto(registro, "placa"))
+        if erro:
+            return None, f"Placa: {erro}"
+
+    return {
+        "apto": (numero, _texto(registro, "bloco").upper()),
+        "vagas": vagas,
+        "nome": nome,
+        "cnh": cnh,
+        "placa": placa,
+        "modelo": _texto(registro, "modelo").upper(),
+        "cor": _texto(registro, "cor").upper(),
+    }, None
+
+class ImportadorCadastros:
+    """
+    Estado da importação: o que já existe no banco (carregado UMA vez)
+    e o que já foi aceito do arquivo, para checar duplicidade e cota de vagas
+    sem consultar o banco a cada linha.
+    """
+
+    def __init__(self, repositorio, tamanho_lote=5000):
+        self.repositorio = repositorio
+        self.tamanho_lote = tamanho_lote
+
+        self.apartamentos = {}    # (numero, bloco) -> (id, vagas)
+        self.novos_aptos = {}     # (numero, bloco) -> vagas (ainda sem ID)
+        self.carros_por_apto = {} # (numero, bloco) -> total (banco + arquivo)
+        self.cnhs_banco = set()
+        self.moradores = {}       # cnh -> (apto, id ou None) dos moradores do arquivo
+        self.placas = set()
+
+        self.resumo = {"lidas": 0, "apartamentos": 0, "moradores": 0, "veiculos": 0, "rejeitadas": 0}
+
+    def carregar_estado(self):
+        """Três consultas no início, em vez de listar CNHs/placas a cada cadastro."""
+        repo = self.repositorio
+        self.apartamentos = repo.mapear_apartamentos_por_rotulo()
+        chave_por_id = {id_apto: chave for chave, (id_apto, _) in self.apartamentos.items()}
+        self.carros_por_apto = {
+            chave_por_id[id_apto]: total
+            for id_apto, total in repo.contar_veiculos_por_apartamento().items()
+            if id_apto in chave_por_id
+        }
+        self.cnhs_banco = set(repo.listar_todas_cnhs())
+        self.placas = set(repo.listar_todas_placas())
+
+    def aceitar(self, linha):
+        """
+        Confere unicidade e cota de vagas contra o banco + o que já foi aceito.
+        Retorna: motivo da recusa ou None (e reserva CNH/placa/vaga).
+        """
+        apto, cnh, placa = linha["apto"], linha["cnh"], linha["placa"]
+
+        if cnh in self.cnhs_banco:
+            return "Esta CNH já está cadastrada no sistema."
+        if cnh in self.moradores and self.moradores[cnh][0] != apto:
+            return "CNH repetida no arquivo para outra unidade."
+
+        if placa:
+            if placa in self.placas:
+                return f"A placa {placa} já pertence a outro cadastro."
+            vagas = self.apartamentos[apto][1] if apto in self.apartamentos \
+                else self.novos_aptos.get(apto, linha["vagas"])
+            if self.carros_por_apto.get(apto, 0) >= vagas:
+                return f"O Apartamento atingiu o limite de {vagas} veículos."
+
+        # Reservas
+        if apto not in self.apartamentos and apto not in self.novos_aptos:
+            self.novos_aptos[apto] = linha["vagas"]
+        if cnh not in self.moradores:
+            self.moradores[cnh] = (apto, None)
+        if placa:
+            self.placas.add(placa)
+            self.carros_por_apto[apto] = self.carros_por_apto.get(apto, 0) + 1
+        return None
+
+    def gravar_lote(self, lote):
+        """Apartamentos -> moradores -> veículos, cada etapa com um executemany, numa transação."""
+        repo = self.repositorio
+        try:
+            # 1. Unidades novas deste lote
+            faltantes = [(num, bloco, self.novos_aptos[(num, bloco)])
+                         for num, bloco in {l["apto"] for l in lote} if (num, bloco) not in self.apartamentos]
+            if faltantes:
+                criados = repo.adicionar_apartamentos_em_lote(faltantes)
+                self.apartamentos.update(criados)
+                self.resumo["apartamentos"] += len(criados)
+
+            # 2. Moradores novos (primeira aparição da CNH)
+            novos = {}
+            for l in lote:
+                if self.moradores[l["cnh"]][1] is None and l["cnh"] not in novos:
+                    novos[l["cnh"]] = (l["nome"], l["cnh"], self.apartamentos[l["apto"]][0])
+            if novos:
+                ids = repo.adicionar_moradores_em_lote(list(novos.values()))
+                for cnh, id_morador in ids.items():
+                    self.moradores[cnh] = (self.moradores[cnh][0], id_morador)
+                self.resumo["moradores"] += len(ids)
+
+            # 3. Veículos
+            veiculos = [(l["placa"], l["modelo"], l["cor"], self.moradores[l["cnh"]][1]) for l in lote if l["placa"]]
+            if veiculos:
+                repo.adicionar_veiculos_em_lote(veiculos)
+                self.resumo["veiculos"] += len(veiculos)
+
+            repo.confirmar()
+        except Exception:
+            repo.desfazer()
+            raise
+
+def importar_cadastros(repositorio, caminho, tamanho_lote=5000, caminho_rejeitados=None):
+    """
+    Importa o arquivo inteiro.
+    Retorna: dict com lidas, apartamentos, moradores, veiculos, rejeitadas,
+    segundos e o caminho do arquivo de rejeitados (ou None).
+    """
+    jsonl = caminho.lower().endswith(".jsonl")
+    if caminho_rejeitados is None:
+        base, _ = os.path.splitext(caminho)
+        caminho_rejeitados = base + (".rejeitados.jsonl" if jsonl else ".rejeitados.csv")
+
+    importador = ImportadorCadastros(repositorio, tamanho_lote)
+    rejeitados = _Rejeitados(caminho_rejeitados, jsonl)
+    inicio = time.perf_counter()
+
+    try:
+        with repositorio:
+            importador.carregar_estado()
+            lote = []
+            for numero, registro in ler_registros(caminho):
+                importador.resumo["lidas"] += 1
+
+                linha, motivo = _validar(registro)
+                if linha is not None:
+                    motivo = importador.aceitar(linha)
+                if motivo:
+                    rejeitados.registrar(numero, motivo, registro)
+                    continue
+
+                lote.append(linha)
+                if len(lote) >= tamanho_lote:
+                    importador.gravar_lote(lote)
+                    lote = []
+
+            if lote:
+                importador.gravar_lote(lote)
+    finally:
+        rejeitados.fechar()
+
+    resumo = importador.resumo
+    resumo["rejeitadas"] = rejeitados.total
+    resumo["segundos"] = round(time.perf_counter() - inicio, 3)
+    resumo["arquivo_rejeitados"] = caminho_rejeitados if rejeitados.total else None
+    return resumo
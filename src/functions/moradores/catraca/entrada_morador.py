@@ -1,29 +1,39 @@
 """
 Módulo de Entrada de Moradores (Catraca).
 Fluxo: Identificação Automática -> Registro de Log -> Liberação.
-Aceita placa vinda do Wrapper ou pede manual.
+Aceita a decisão vinda do Wrapper ou pede a placa manual.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/moradores/catraca/entrada_morador.py
 """
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa
 from src.ui.components import header, show_success, show_error, show_warning, Colors
+from src.classes.DecisaoCatraca import ENTRADA, BLOQUEADO
+from src.functions.catraca.motor_catraca import GateEngine
 
-def registrar_entrada_morador(repositorio, estacionamento, placa_pre_validada=None):
+def registrar_entrada_morador(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
     """
     Registra a entrada de um morador via placa.
+    Se o wrapper já decidiu, recebe a DecisaoCatraca e não consulta o banco de novo.
     """
     header("ENTRADA DE MORADOR (CATRACA)")
+    motor = GateEngine(repositorio, estacionamento)
 
     # 1. Definição da Placa (Wrapper vs Manual)
-    if placa_pre_validada:
+    if decisao:
+        placa = decisao.placa
+        print(f"Placa identificada: {Colors.BOLD}{placa}{Colors.RESET}")
+    elif placa_pre_validada:
         placa = placa_pre_validada
         # Feedback visual para confirmar o que veio do wrapper
         print(f"Placa identificada: {Colors.BOLD}{placa}{Colors.RESET}")
     else:
         placa, _ = get_valid_input("Digite a PLACA do veículo: ", validate_placa)
 
-    # 2. Busca o VEÍCULO
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
+    # 2. Decisão do motor (veículo, dono e unidade numa consulta só)
+    if decisao is None:
+        decisao = motor.avaliar(placa)
+    veiculo = decisao.contexto.veiculo if decisao.contexto else None
 
     # --- VALIDAÇÕES DE SEGURANÇA ---
     
@@ -32,35 +42,32 @@ def registrar_entrada_morador(repositorio, estacionamento, placa_pre_validada=No
         print(f"{Colors.DIM}Verifique se a placa está correta.{Colors.RESET}")
         return
 
-    if not veiculo.morador_id:
+    if decisao.tipo != "MORADOR":
         show_warning(f"ALERTA: O veículo {placa} não pertence a um Morador.")
         print(f"{Colors.DIM}Use o menu de Visitantes para este veículo.{Colors.RESET}")
         return
 
-    if veiculo.estacionado:
-        show_warning(f"O sistema indica que o veículo {placa} JÁ ESTÁ no pátio.")
+    if decisao.acao == BLOQUEADO:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
         return
 
-    # 3. Recupera dados para Log e Display
-    morador = repositorio.buscar_morador_por_id(veiculo.morador_id)
-    
-    # Recupera o Apto
-    apto_obj = repositorio.buscar_apartamento_por_id(morador.id_apartamento)
-    rotulo_apto = apto_obj.rotulo if apto_obj else "Indefinido"
+    if decisao.acao != ENTRADA:
+        show_warning(f"O sistema indica que o veículo {placa} JÁ ESTÁ no pátio.")
+        return
 
-    # 4. EXIBIÇÃO RÁPIDA
+    # 3. EXIBIÇÃO RÁPIDA
     print("-" * 40)
     print(f"🚘 Veículo: {veiculo.modelo} ({veiculo.cor})")
-    print(f"👤 Dono:    {morador.nome}")
-    print(f"🏠 Unidade: {rotulo_apto}")
+    print(f"👤 Dono:    {decisao.nome}")
+    print(f"🏠 Unidade: {decisao.contexto.rotulo_apto or 'Indefinido'}")
     print("-" * 40)
 
-    # 5. REGISTRO AUTOMÁTICO
+    # 4. REGISTRO AUTOMÁTICO
     try:
-        repositorio.registrar_entrada_veiculo(veiculo.placa, tipo_dono='MORADOR')
+        motor.efetivar(decisao)
         
         print(f"\n{Colors.GREEN}✔ ACESSO LIBERADO{Colors.RESET}")
         input(f"\n{Colors.DIM}Pressione Enter para continuar...{Colors.RESET}")
         
     except Exception as e:
-        show_error(f"Erro crítico ao registrar log: {e}")
\ No newline at end of file
+        show_error(f"Erro crítico ao registrar log: {e}")
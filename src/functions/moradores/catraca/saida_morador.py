@@ -1,45 +1,53 @@
 """
 Módulo de Saída de Moradores.
 Fluxo: Busca Veículo -> Registra Saída.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/moradores/catraca/saida_morador.py
 """
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa
 from src.ui.components import header, show_success, show_error, show_warning, Colors
+from src.classes.DecisaoCatraca import SAIDA, BLOQUEADO
+from src.functions.catraca.motor_catraca import GateEngine
 
-def registrar_saida_morador(repositorio, placa_pre_validada=None):
+def registrar_saida_morador(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
     header("SAÍDA DE MORADOR 🛫")
+    motor = GateEngine(repositorio, estacionamento)
     
     # 1. Definição da Placa
-    if placa_pre_validada:
+    if decisao:
+        placa = decisao.placa
+    elif placa_pre_validada:
         placa = placa_pre_validada
     else:
         placa, _ = get_valid_input("Digite a PLACA do veículo: ", validate_placa)
     
-    # 2. Busca Direta
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
+    # 2. Decisão do motor (ou reaproveita a do wrapper)
+    if decisao is None:
+        decisao = motor.avaliar(placa)
+    veiculo = decisao.contexto.veiculo if decisao.contexto else None
     
     if not veiculo:
         show_warning("❌ Veículo não encontrado no cadastro.")
         return
 
     # 3. Verifica Vínculo
-    if not veiculo.morador_id:
+    if decisao.tipo != "MORADOR":
         show_warning("Este veículo não está vinculado a um morador.")
         return
 
+    if decisao.acao == BLOQUEADO:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
+        return
+
     # 4. Verifica Status
-    if not veiculo.estacionado:
+    if decisao.acao != SAIDA:
         show_warning(f"O veículo {placa} já consta como FORA do pátio.")
         return
 
-    # 5. Recupera dono para mensagem amigável
-    morador = repositorio.buscar_morador_por_id(veiculo.morador_id)
-    nome_dono = morador.nome if morador else "Desconhecido"
-
     try:
-        repositorio.registrar_saida_veiculo(veiculo.placa, tipo_dono='MORADOR') 
-        show_success(f"👋 Até logo, {nome_dono}!")
+        motor.efetivar(decisao)
+        show_success(f"👋 Até logo, {decisao.nome}!")
         
     except Exception as e:
-        show_error(f"❌ Erro ao registrar saída: {e}")
\ No newline at end of file
+        show_error(f"❌ Erro ao registrar saída: {e}")
@@ -64,15 +64,13 @@ def cadastrar_morador_form(repositorio):
     # =========================================================================
     print(f"\n{Colors.BOLD}2. Dados Pessoais{Colors.RESET}")
     
-    # Validação de CNH Duplicada
-    cnhs_existentes = repositorio.listar_todas_cnhs()
-    
     nome, _ = get_valid_input("Nome Completo: ", validate_names)
     
     def validador_cnh_unica(valor):
         val, erro = validate_cnh(valor)
         if erro: return None, erro
-        if val in cnhs_existentes: return None, "Esta CNH já está cadastrada no sistema."
+        # Validação de CNH Duplicada (busca pontual no registro de documentos)
+        if repositorio.cnh_existe(val): return None, "Esta CNH já está cadastrada no sistema."
         return val, None
 
     cnh, _ = get_valid_input("CNH: ", validador_cnh_unica)
@@ -101,12 +99,10 @@ def cadastrar_morador_form(repositorio):
         print(f"{Colors.BLUE}ℹ Ocupação do Apto: {qtd_carros_atual}/{limite_vagas} vagas.{Colors.RESET}")
         cadastrar_carro = True
         
-        placas_existentes = repositorio.listar_todas_placas()
-        
         def validador_placa_unica(valor):
             val, erro = validate_placa(valor)
             if erro: return None, erro
-            if val in placas_existentes: return None, f"A placa {val} já pertence a outro cadastro."
+            if repositorio.placa_existe(val): return None, f"A placa {val} já pertence a outro cadastro."
             return val, None
 
         placa, _ = get_valid_input("Placa do Veículo: ", validador_placa_unica)
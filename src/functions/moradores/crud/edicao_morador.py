@@ -85,12 +85,11 @@ def _alterar_nome(repositorio, morador):
     show_success("Nome atualizado!")
 
 def _alterar_cnh(repositorio, morador):
-    cnhs = repositorio.listar_todas_cnhs()
     def validador_cnh_edit(valor):
         val, erro = validate_cnh(valor)
         if erro: return None, erro
         # Permite manter a própria CNH atual, bloqueia duplicatas de outros
-        if val in cnhs and val != morador.cnh: return None, "CNH já existente."
+        if val != morador.cnh and repositorio.cnh_existe(val): return None, "CNH já existente."
         return val, None
     
     nova_cnh, _ = get_valid_input(f"Nova CNH ({morador.cnh}): ", validador_cnh_edit)
@@ -148,11 +147,10 @@ def _adicionar_veiculo_extra(repositorio, morador, apto_obj):
         return
 
     # 2. Fluxo Normal
-    placas_existentes = repositorio.listar_todas_placas()
     def validador_placa(valor):
         val, erro = validate_placa(valor)
         if erro: return None, erro
-        if val in placas_existentes: return None, "Placa já cadastrada."
+        if repositorio.placa_existe(val): return None, "Placa já cadastrada."
         return val, None
 
     placa, _ = get_valid_input("Placa: ", validador_placa)
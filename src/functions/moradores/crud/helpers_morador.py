@@ -24,8 +24,7 @@ def selecionar_morador(repositorio, apenas_listar=False):
         return None
 
     # --- 1. Preparação dos Dados (Mapa de Apartamentos) ---
-    lista_aptos = repositorio.listar_apartamentos()
-    mapa_aptos = {a.id: a for a in lista_aptos}
+    mapa_aptos = {a.id: a for a in repositorio.iterar_apartamentos()}
 
     # Criamos uma lista de tuplas (Morador, Apartamento) para facilitar a ordenação
     dados_completos = []
@@ -0,0 +1,149 @@
+"""
+Módulo: Análise de Permanência de Visitantes.
+Responsabilidade: Distribuição do tempo de permanência, percentis e taxa de
+excesso (tempo acima do limite) sobre as sessões encerradas
+('sessoes_visitantes').
+Desempenho: as sessões saem do banco numa única consulta, direto para
+colunas de inteiros, e o cálculo é vetorizado com NumPy (milhões de linhas
+sem laço Python por sessão).
+NumPy é opcional: sem ele, o mesmo cálculo roda em Python puro
+(array('q') + ordenação), mais lento e com os mesmos resultados.
+Localização: src/functions/relatorios/analise_permanencia.py
+"""
+import time
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUNAS = ("entrada", "duracao", "limite", "cadastrado")
+PERCENTIS = (50, 90, 95, 99)
+
+# Faixas do histograma: limites superiores em minutos (a última faixa é aberta)
+FAIXAS_MINUTOS = (30, 60, 120, 240, 480, 1440)
+
+def _rotulos_faixas():
+    rotulos, anterior = [], 0
+    for limite in FAIXAS_MINUTOS:
+        rotulos.append(f"{_fmt_minutos(anterior)} - {_fmt_minutos(limite)}")
+        anterior = limite
+    rotulos.append(f"+ {_fmt_minutos(anterior)}")
+    return rotulos
+
+def _fmt_minutos(minutos):
+    return f"{minutos // 60}h" if minutos >= 60 else f"{minutos}m"
+
+def carregar_colunas(repositorio, desde_epoch=0, usar_numpy=True):
+    """
+    Lê (entrada, duracao, limite, cadastrado) numa consulta só.
+    Retorna: dict coluna -> numpy.ndarray (int64) ou array('q') sem NumPy.
+    """
+    cursor = repositorio.iterar_sessoes_visitantes(desde_epoch)
+
+    if usar_numpy and np is not None:
+        matriz = np.fromiter(chain.from_iterable(cursor), dtype=np.int64).reshape(-1, len(COLUNAS))
+        return {nome: matriz[:, i] for i, nome in enumerate(COLUNAS)}
+
+    colunas = {nome: array("q") for nome in COLUNAS}
+    destinos = [colunas[nome].append for nome in COLUNAS]
+    for linha in cursor:
+        for anexar, valor in zip(destinos, linha):
+            anexar(valor)
+    return colunas
+
+def _analisar_numpy(duracao, limite, cadastrado):
+    n = len(duracao)
+    limite_seg = limite * 60
+    excedeu = duracao > limite_seg
+    qtd_excedeu = int(excedeu.sum())
+
+    faixas = np.bincount(
+        np.searchsorted(np.array(FAIXAS_MINUTOS) * 60, duracao, side="left"),
+        minlength=len(FAIXAS_MINUTOS) + 1
+    )
+
+    por_grupo = {}
+    for rotulo, valor in (("CADASTRADO", 1), ("ROTATIVO", 0)):
+        grupo = cadastrado == valor
+        total = int(grupo.sum())
+        if total:
+            por_grupo[rotulo] = (total, float(excedeu[grupo].mean()))
+
+    return {
+        "sessoes": n,
+        "media_minutos": float(duracao.mean()) / 60,
+        "maximo_minutos": float(duracao.max()) / 60,
+        "percentis": {p: float(v) / 60 for p, v in zip(PERCENTIS, np.percentile(duracao, PERCENTIS))},
+        "taxa_excesso": qtd_excedeu / n,
+        "excesso_medio_minutos": float((duracao - limite_seg)[excedeu].mean()) / 60 if qtd_excedeu else 0.0,
+        "faixas": [int(q) for q in faixas],
+        "por_grupo": por_grupo,
+    }
+
+def _percentil(ordenado, p):
+    """Interpolação linear entre vizinhos (mesmo método padrão do NumPy)."""
+    posicao = (len(ordenado) - 1) * p / 100
+    base = int(posicao)
+    if base + 1 >= len(ordenado):
+        return float(ordenado[-1])
+    return ordenado[base] + (ordenado[base + 1] - ordenado[base]) * (posicao - base)
+
+def _analisar_python(duracao, limite, cadastrado):
+    n = len(duracao)
+    ordenado = sorted(duracao)
+    faixas_seg = [m * 60 for m in FAIXAS_MINUTOS]
+
+    faixas = [0] * (len(FAIXAS_MINUTOS) + 1)
+    qtd_excedeu = soma_excesso = 0
+    grupos = {1: [0, 0], 0: [0, 0]}  # cadastrado -> [total, excederam]
+    for d, lim, cad in zip(duracao, limite, cadastrado):
+        faixas[bisect_left(faixas_seg, d)] += 1
+        grupo = grupos[1 if cad else 0]
+        grupo[0] += 1
+        if d > lim * 60:
+            qtd_excedeu += 1
+            soma_excesso += d - lim * 60
+            grupo[1] += 1
+
+    por_grupo = {
+        rotulo: (grupos[valor][0], grupos[valor][1] / grupos[valor][0])
+        for rotulo, valor in (("CADASTRADO", 1), ("ROTATIVO", 0)) if grupos[valor][0]
+    }
+
+    return {
+        "sessoes": n,
+        "media_minutos": sum(duracao) / n / 60,
+        "maximo_minutos": ordenado[-1] / 60,
+        "percentis": {p: _percentil(ordenado, p) / 60 for p in PERCENTIS},
+        "taxa_excesso": qtd_excedeu / n,
+        "excesso_medio_minutos": soma_excesso / qtd_excedeu / 60 if qtd_excedeu else 0.0,
+        "faixas": faixas,
+        "por_grupo": por_grupo,
+    }
+
+def analisar_permanencia(repositorio, desde_epoch=0, usar_numpy=True):
+    """
+    Calcula as estatísticas de permanência das sessões com entrada >= desde_epoch.
+    Retorna: dict com sessoes, media/maximo/percentis (minutos), taxa_excesso,
+    excesso_medio_minutos, faixas (contagem por FAIXAS_MINUTOS), por_grupo
+    {CADASTRADO/ROTATIVO: (total, taxa_excesso)}, motor e segundos.
+    """
+    inicio = time.perf_counter()
+    colunas = carregar_colunas(repositorio, desde_epoch, usar_numpy)
+    motor = "numpy" if isinstance(colunas["duracao"], getattr(np, "ndarray", ())) else "python"
+
+    if not len(colunas["duracao"]):
+        resultado = {"sessoes": 0}
+    elif motor == "numpy":
+        resultado = _analisar_numpy(colunas["duracao"], colunas["limite"], colunas["cadastrado"])
+    else:
+        resultado = _analisar_python(colunas["duracao"], colunas["limite"], colunas["cadastrado"])
+
+    resultado["rotulos_faixas"] = _rotulos_faixas()
+    resultado["motor"] = motor
+    resultado["segundos"] = round(time.perf_counter() - inicio, 4)
+    return resultado
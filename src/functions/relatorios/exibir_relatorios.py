@@ -3,16 +3,24 @@ Módulo de Exibição de Relatórios.
 Responsabilidade: Gerar extratos visuais de movimentação.
 Localização: src/functions/relatorios/exibir_relatorios.py
 """
-from datetime import datetime
+from datetime import date, timedelta
 from src.ui.tables import criar_tabela
 from src.ui.colors import Colors
-from src.ui.components import header, show_warning, menu_option, show_error
+from src.ui.components import header, show_warning, menu_option, show_error, show_success
 from src.utils.input_handler import get_valid_input
-from src.utils.validations import validate_placa
+from src.utils.validations import validate_placa, validate_data
+from src.utils.tempo import formatar_data_hora
+from src.functions.relatorios.analise_permanencia import analisar_permanencia, PERCENTIS
 
-def _renderizar_tabela_historico(dados, titulo="HISTÓRICO"):
+TAMANHO_PAGINA = 20
+
+def _renderizar_tabela_historico(dados, titulo="HISTÓRICO", rodape=None, aguardar=True):
     """
     Função auxiliar para desenhar a tabela de histórico (Rich).
+    Aceita linhas (data_hora, placa, tipo, evento) ou, nas páginas do
+    navegador, (id, data_hora, placa, tipo, evento).
+    rodape: texto exibido abaixo da tabela (ex.: posição da página).
+    aguardar: False quando quem chama controla o próximo input (navegador).
     """
     if not dados:
         show_warning("Nenhum registro encontrado para este filtro.")
@@ -22,15 +30,10 @@ def _renderizar_tabela_historico(dados, titulo="HISTÓRICO"):
     
     for row in dados:
         
-        data_iso, placa, tipo, evento = row
+        data_iso, placa, tipo, evento = row[-4:]
         
-        # Formatação de Data
-        try:
-            # Tenta converter ISO (YYYY-MM-DD HH:MM:SS) para BR
-            dt = datetime.fromisoformat(data_iso)
-            data_fmt = dt.strftime("%d/%m/%Y %H:%M")
-        except ValueError:
-            data_fmt = data_iso # Fallback se der erro na data
+        # Formatação de Data: ISO (YYYY-MM-DD HH:MM:SS) para BR, por fatiamento (sem parse)
+        data_fmt = formatar_data_hora(data_iso)
 
         # Formatação Colorida
         evento_fmt = f"[green]{evento}[/green]" if evento == "ENTRADA" else f"[red]{evento}[/red]"
@@ -49,7 +52,85 @@ def _renderizar_tabela_historico(dados, titulo="HISTÓRICO"):
         colunas=["Data/Hora", "Placa", "Tipo", "Evento"],
         linhas=linhas_formatadas
     )
-    input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+    if rodape:
+        print(f"{Colors.DIM}{rodape}{Colors.RESET}")
+    if aguardar:
+        input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+
+def _escolher(prompt, opcoes):
+    """Pergunta até receber uma das opções (ENTER = None, remove o filtro)."""
+    while True:
+        valor = input(prompt).strip().upper()
+        if not valor:
+            return None
+        if valor in opcoes:
+            return valor
+        show_warning(f"Use: {', '.join(opcoes)} (ou ENTER para todos).")
+
+def navegar_historico(repositorio, placa=None):
+    """
+    Navegador paginado do histórico (keyset no id: cada página custa
+    O(TAMANHO_PAGINA) pelo índice, em qualquer ponto do histórico).
+    Comandos: [N] mais antigos, [P] mais recentes, [D] ir para data,
+    [E] filtrar evento, [T] filtrar tipo, [L] limpar filtros, [0] voltar.
+    """
+    filtros = {"placa": placa, "tipo_evento": None, "tipo_veiculo": None}
+    pagina = repositorio.paginar_historico(TAMANHO_PAGINA, **filtros)
+    aviso = None
+
+    while True:
+        ativos = [f"{campo}={valor}" for campo, valor in filtros.items() if valor]
+        titulo = f"EXTRATO: {placa}" if placa else "HISTÓRICO COMPLETO"
+        if pagina:
+            rodape = (f"Exibindo {pagina[-1][1]} até {pagina[0][1]}"
+                      f" | Filtros: {', '.join(ativos) or 'nenhum'}")
+            _renderizar_tabela_historico(pagina, titulo=titulo, rodape=rodape, aguardar=False)
+        else:
+            header(titulo)
+            show_warning(f"Nenhum registro encontrado (filtros: {', '.join(ativos) or 'nenhum'}).")
+        if aviso:
+            show_warning(aviso)
+            aviso = None
+
+        print(f"{Colors.CYAN}[N]{Colors.RESET} Mais antigos  {Colors.CYAN}[P]{Colors.RESET} Mais recentes  "
+              f"{Colors.CYAN}[D]{Colors.RESET} Ir para data  {Colors.CYAN}[E]{Colors.RESET} Evento  "
+              f"{Colors.CYAN}[T]{Colors.RESET} Tipo  {Colors.CYAN}[L]{Colors.RESET} Limpar  {Colors.CYAN}[0]{Colors.RESET} Voltar")
+        comando = input(f"\n{Colors.CYAN}➤ Opção: {Colors.RESET}").strip().upper()
+
+        if comando == "0":
+            break
+        elif comando == "N" and pagina:
+            proxima = repositorio.paginar_historico(TAMANHO_PAGINA, antes_de=pagina[-1][0], **filtros)
+            if proxima:
+                pagina = proxima
+            else:
+                aviso = "Início do histórico: não há eventos mais antigos."
+        elif comando == "P" and pagina:
+            anterior = repositorio.paginar_historico(TAMANHO_PAGINA, depois_de=pagina[0][0], **filtros)
+            if anterior:
+                pagina = anterior
+            else:
+                aviso = "Você já está nos eventos mais recentes."
+        elif comando == "D":
+            data_iso, _ = get_valid_input("Data (DD/MM/AAAA): ", validate_data)
+            dia_seguinte = date.fromisoformat(data_iso) + timedelta(days=1)
+            ultimo_id = repositorio.localizar_id_por_data(dia_seguinte)
+            if ultimo_id is None:
+                aviso = "Não há eventos até esta data."
+            else:
+                # Página que termina no último evento do dia escolhido
+                pagina = repositorio.paginar_historico(TAMANHO_PAGINA, antes_de=ultimo_id + 1, **filtros)
+        elif comando in ("E", "T", "L"):
+            if comando == "E":
+                filtros["tipo_evento"] = _escolher("Evento (ENTRADA/SAIDA): ", ("ENTRADA", "SAIDA"))
+            elif comando == "T":
+                filtros["tipo_veiculo"] = _escolher("Tipo (MORADOR/VISITANTE/FUNCIONARIO): ",
+                                                    ("MORADOR", "VISITANTE", "FUNCIONARIO"))
+            else:
+                filtros.update(tipo_evento=None, tipo_veiculo=None)
+            pagina = repositorio.paginar_historico(TAMANHO_PAGINA, **filtros)
+        else:
+            aviso = "Opção inválida."
 
 def relatorio_geral(repositorio):
     """Mostra as últimas 25 movimentações do estacionamento."""
@@ -66,17 +147,142 @@ def relatorio_por_placa(repositorio):
     placa, _ = get_valid_input("Digite a Placa: ", validate_placa)
     
     try:
-        dados = repositorio.buscar_historico_por_placa(placa)
-        _renderizar_tabela_historico(dados, titulo=f"EXTRATO: {placa}")
+        navegar_historico(repositorio, placa=placa)
     except Exception as e:
         show_error(f"Erro ao buscar histórico: {e}")
 
+DIAS_SEMANA = ["Domingo", "Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado"]
+
+def relatorio_picos(repositorio, dias=7):
+    """
+    Movimento por dia e horário de pico por dia da semana.
+    Lê só as tabelas de resumo (nunca o histórico bruto).
+    """
+    header("RESUMO DE MOVIMENTO E HORÁRIOS DE PICO")
+    try:
+        # Soma as linhas novas do histórico antes de ler (incremental)
+        repositorio.atualizar_resumos()
+        diario = repositorio.listar_resumo_diario(dias)
+        picos = repositorio.listar_picos_por_dia_semana()
+    except Exception as e:
+        show_error(f"Erro ao buscar resumos: {e}")
+        return
+
+    if not diario and not picos:
+        show_warning("Ainda não há movimentação registrada.")
+        return
+
+    # 1. Entradas por dia (colunas por tipo de veículo) + total de saídas
+    por_dia = {}
+    for dia, tipo, evento, total in diario:
+        linha = por_dia.setdefault(dia, {"MORADOR": 0, "VISITANTE": 0, "FUNCIONARIO": 0, "ENTRADAS": 0, "SAIDAS": 0})
+        if evento == "ENTRADA":
+            linha["ENTRADAS"] += total
+            if tipo in linha:
+                linha[tipo] += total
+        elif evento == "SAIDA":
+            linha["SAIDAS"] += total
+
+    linhas_dia = []
+    for dia, c in por_dia.items():
+        dia_fmt = formatar_data_hora(dia + " 00:00")[:10]
+        linhas_dia.append([dia_fmt, str(c["MORADOR"]), str(c["VISITANTE"]), str(c["FUNCIONARIO"]),
+                           f"[green]{c['ENTRADAS']}[/green]", f"[red]{c['SAIDAS']}[/red]"])
+
+    criar_tabela(
+        titulo=f"ENTRADAS POR DIA (ÚLTIMOS {dias} DIAS)",
+        colunas=["Dia", "Moradores", "Visitantes", "Funcionários", "Entradas", "Saídas"],
+        linhas=linhas_dia
+    )
+    input(f"\n{Colors.DIM}Pressione Enter para ver os horários de pico...{Colors.RESET}")
+
+    # 2. Pico de entradas por dia da semana (média de todo o histórico)
+    linhas_pico = [
+        [DIAS_SEMANA[dia_semana], f"{hora:02d}:00 - {hora:02d}:59", f"{media:.1f}"]
+        for dia_semana, (hora, media) in sorted(picos.items())
+    ]
+    criar_tabela(
+        titulo="HORÁRIO DE PICO POR DIA DA SEMANA",
+        colunas=["Dia da Semana", "Faixa de Horário", "Média de Entradas"],
+        linhas=linhas_pico
+    )
+    input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+
+def relatorio_permanencia(repositorio):
+    """Distribuição do tempo de permanência e taxa de excesso dos visitantes (sessões encerradas)."""
+    header("PERMANÊNCIA DE VISITANTES")
+    try:
+        analise = analisar_permanencia(repositorio)
+    except Exception as e:
+        show_error(f"Erro ao analisar permanência: {e}")
+        return
+
+    if not analise["sessoes"]:
+        show_warning("Nenhuma sessão de visitante encerrada ainda.")
+        return
+
+    total = analise["sessoes"]
+    linhas = [
+        ["Sessões encerradas", f"{total}"],
+        ["Média", f"{analise['media_minutos']:.0f} min"],
+    ]
+    for p in PERCENTIS:
+        linhas.append([f"Percentil {p}", f"{analise['percentis'][p]:.0f} min"])
+    linhas.append(["Máximo", f"{analise['maximo_minutos']:.0f} min"])
+    linhas.append(["[red]Excederam o limite[/red]",
+                   f"[red]{analise['taxa_excesso']:.1%}[/red] (média de {analise['excesso_medio_minutos']:.0f} min a mais)"])
+    for grupo, (qtd, taxa) in analise["por_grupo"].items():
+        linhas.append([f"Excesso - {grupo.title()}", f"{taxa:.1%} de {qtd}"])
+    for rotulo, qtd in zip(analise["rotulos_faixas"], analise["faixas"]):
+        linhas.append([f"Faixa {rotulo}", f"{qtd} ({qtd / total:.1%})"])
+
+    criar_tabela(
+        titulo=f"PERMANÊNCIA ({analise['motor']}, {analise['segundos']}s)",
+        colunas=["Indicador", "Valor"],
+        linhas=linhas
+    )
+    input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+
+def relatorio_desempenho_banco(repositorio):
+    """Consultas e chamadas que mais custam (instrumentação), com liga/desliga e exportação."""
+    while True:
+        header("DESEMPENHO DO BANCO (CONSULTAS)")
+        print(repositorio.relatorio_consultas())
+        print("-" * 30)
+        acao = "Desligar" if repositorio.instrumentacao.ativa else "Ligar"
+        menu_option("1", f"{acao} instrumentação")
+        menu_option("2", "Exportar métricas (Prometheus)")
+        menu_option("0", "Voltar")
+
+        opcao = input(f"\n{Colors.CYAN}➤ Opção: {Colors.RESET}").strip()
+        if opcao == '1':
+            if repositorio.instrumentacao.ativa:
+                repositorio.desligar_instrumentacao()
+            else:
+                repositorio.ligar_instrumentacao()
+        elif opcao == '2':
+            padrao = repositorio.arquivo_metricas or "metricas.prom"
+            caminho = input(f"Arquivo de saída [{padrao}]: ").strip() or padrao
+            try:
+                show_success(f"Métricas gravadas em {repositorio.exportar_metricas(caminho)}")
+            except OSError as e:
+                show_error(f"Erro ao exportar métricas: {e}")
+            input(f"\n{Colors.DIM}Pressione Enter para voltar...{Colors.RESET}")
+        elif opcao == '0':
+            break
+        else:
+            show_warning("Opção inválida.")
+
 def menu_relatorios(repositorio):
     """Sub-menu de relatórios padronizado."""
     while True:
         header("RELATÓRIOS E AUDITORIA 📋")
         menu_option("1", "Histórico Geral (Últimos 25)")
         menu_option("2", "Filtrar por Placa")
+        menu_option("3", "Resumo e Horários de Pico")
+        menu_option("4", "Permanência de Visitantes")
+        menu_option("5", "Navegar Histórico Completo")
+        menu_option("6", "Desempenho do Banco (Consultas)")
         print("-" * 30)
         menu_option("0", "Voltar")
         
@@ -86,6 +292,17 @@ def menu_relatorios(repositorio):
             relatorio_geral(repositorio)
         elif opcao == '2':
             relatorio_por_placa(repositorio)
+        elif opcao == '3':
+            relatorio_picos(repositorio)
+        elif opcao == '4':
+            relatorio_permanencia(repositorio)
+        elif opcao == '5':
+            try:
+                navegar_historico(repositorio)
+            except Exception as e:
+                show_error(f"Erro ao buscar histórico: {e}")
+        elif opcao == '6':
+            relatorio_desempenho_banco(repositorio)
         elif opcao == '0':
             break
         else:
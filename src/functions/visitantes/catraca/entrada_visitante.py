@@ -4,94 +4,91 @@ Fluxo:
 1. Verifica Vagas (Via Classe Estacionamento).
 2. Identifica Veículo (cadastrado ou rotativo).
 3. Gera Ticket.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/visitantes/catraca/entrada_visitante.py
 """
-from src.classes.Visitante.TicketVisitante import TicketVisitante
 from src.classes.Visitante.Visitante import Visitante
 from src.classes.Veiculo import Veiculo
+from src.classes.Estacionamento import ZONA_VISITANTES
+from src.classes.DecisaoCatraca import ENTRADA, BLOQUEADO
+from src.functions.catraca.motor_catraca import GateEngine
 
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa, validate_names, validate_yes_no, validate_cnh
 from src.ui.components import header, show_success, show_error, show_warning, Colors
 
-def registrar_entrada_visitante(repositorio, estacionamento, placa_pre_validada=None):
+def registrar_entrada_visitante(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
+    """
+    Registra a entrada de um visitante (cadastrado ou rotativo).
+    Se o wrapper já decidiu, recebe a DecisaoCatraca e não consulta o banco de novo.
+    """
     header("REGISTRAR ENTRADA (VISITANTE)")
-    
+    motor = GateEngine(repositorio, estacionamento)
+
     # =========================================================================
-    # 1. GESTÃO DE VAGAS (Delegada para a Classe Estacionamento)
+    # 1. IDENTIFICAÇÃO (Fluxo Inteligente)
     # =========================================================================
-    tickets_ativos = repositorio.listar_tickets_ativos()
-    
-    # Converte para set de strings, pois o método da classe espera comparar strings/ints de forma robusta
-    vagas_ocupadas = {str(t.numero_vaga) for t in tickets_ativos}
-    
-    # A classe Estacionamento decide qual vaga dar (respeitando o limite do .env)
-    vaga_livre = estacionamento.alocar_vaga_livre(estacionamento.capacidade_visitantes, vagas_ocupadas)
+    if decisao:
+        placa = decisao.placa
+    elif placa_pre_validada:
+        placa = placa_pre_validada
+        # print(f"Placa já cadastrada: {placa}")
+    else:
+        placa, _ = get_valid_input("\nDigite a PLACA do veículo: ", validate_placa)
 
-    if vaga_livre is None:
-        show_error("O estacionamento está LOTADO para visitantes!")
+    # O motor escolhe a vaga pelo índice de ocupação (em memória), sem consultar o banco
+    if decisao is None:
+        decisao = motor.avaliar(placa)
+
+    if decisao.tipo is None:
+        show_error(f"BLOQUEADO: {decisao.motivo}")
         return
 
-    # Feedback visual usando dados da Classe
-    livres = estacionamento.capacidade_visitantes - len(vagas_ocupadas)
-    print(f"ℹ Vagas Livres: {livres} | Dirija-se a {Colors.BOLD}{Colors.GREEN}Vaga {vaga_livre}{Colors.RESET}")
-    print("-" * 50)
+    if decisao.tipo not in ("VISITANTE", "ROTATIVO"):
+        show_warning(f"Este veículo pertence a um {decisao.tipo}.")
+        print("Use o menu de Entrada correspondente.")
+        return
 
     # =========================================================================
-    # 2. IDENTIFICAÇÃO (Fluxo Inteligente)
+    # 2. GESTÃO DE VAGAS (Decidida pelo motor)
     # =========================================================================
-    if placa_pre_validada:
-        placa = placa_pre_validada
-        # print(f"Placa já cadastrada: {placa}")
-    else:
-        placa, _ = get_valid_input("\nDigite a PLACA do veículo: ", validate_placa)
+    if decisao.acao == BLOQUEADO:
+        show_error("O estacionamento está LOTADO para visitantes!")
+        return
 
-    veiculo = repositorio.buscar_veiculo_por_placa(placa)
-    
-    id_visitante_vinculado = None
-    nome_motorista = "rotativo"
-    
-    # --- CENÁRIO A: CARRO JÁ CADASTRADO ---
-    if veiculo:
-        if veiculo.morador_id:
-            show_warning("Este veículo pertence a um MORADOR.")
-            print("Use o menu de Entrada de Moradores.")
-            return
+    if decisao.acao != ENTRADA:
+        show_warning(f"Já existe um ticket aberto para a placa {placa}.")
+        return
 
-        if veiculo.visitante_id:
-            visitante = repositorio.buscar_visitante_por_id(veiculo.visitante_id)
-            if visitante:   
-                id_visitante_vinculado = visitante.id
-                nome_motorista = visitante.nome
+    # Feedback visual usando dados da Classe
+    livres = estacionamento.vagas_livres(ZONA_VISITANTES)
+    print(f"ℹ Vagas Livres: {livres} | Dirija-se a {Colors.BOLD}{Colors.GREEN}Vaga {decisao.vaga}{Colors.RESET}")
+    print("-" * 50)
 
-    # --- CENÁRIO B: CARRO DESCONHECIDO (ROTATIVO) ---
-    else:
+    nome_motorista = decisao.nome
+
+    # --- CARRO DESCONHECIDO (ROTATIVO) ---
+    if decisao.tipo == "ROTATIVO":
         print(f"\n{Colors.YELLOW}ℹ Visitante Rotativo (Não cadastrado).{Colors.RESET}")
         print("Preencha dados básicos para o Ticket:")
         nome_motorista, _ = get_valid_input("Nome do Motorista: ", validate_names)
 
     # =========================================================================
-    # 3. GERAÇÃO DO TICKET
+    # 3. GERAÇÃO DO TICKET (ticket + histórico numa única transação)
     # =========================================================================
     try:
-        novo_ticket = TicketVisitante(
-            placa=placa,
-            numero_vaga=vaga_livre,
-            id_visitante=id_visitante_vinculado
-        )
-        repositorio.criar_ticket(novo_ticket)
-        repositorio.registrar_log_visitante(placa, "ENTRADA")
+        motor.efetivar(decisao)
         
         msg = (
             f"Entrada Autorizada!\n"
             f"   👤 {nome_motorista}\n"
             f"   🚘 {placa}\n"
-            f"   📍 VAGA: {vaga_livre}"
+            f"   📍 VAGA: {decisao.vaga}"
         )
         show_success(msg)
 
         # 4. UPSELL -- 
-        if not veiculo:
+        if decisao.tipo == "ROTATIVO":
             print("\n" + Colors.CYAN + "-"*50 + Colors.RESET)
             print(f"Deseja salvar {nome_motorista} no {Colors.BOLD}CADASTRO DOS VISITANTES{Colors.RESET}?")
             salvar, _ = get_valid_input("Salvar cadastro para a próxima vez? (s/n): ", validate_yes_no)
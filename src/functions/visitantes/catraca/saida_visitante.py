@@ -4,64 +4,60 @@ Fluxo:
 1. Busca Ticket pela Placa.
 2. Verifica Tempo e Regras (Via Classe Estacionamento).
 3. Baixa o Ticket.
+A regra e a gravação ficam no motor da catraca (GateEngine); aqui só há exibição.
 Localização: src/functions/visitantes/catraca/saida_visitante.py
 """
-from datetime import datetime
 from src.utils.input_handler import get_valid_input
 from src.utils.validations import validate_placa, validate_yes_no
 from src.ui.components import header, show_success, show_error, show_warning, Colors
+from src.classes.Estacionamento import ZONA_VISITANTES
+from src.classes.DecisaoCatraca import SAIDA
+from src.functions.catraca.motor_catraca import GateEngine
 
-def registrar_saida_visitante(repositorio, estacionamento, placa_pre_validada=None):
+def registrar_saida_visitante(repositorio, estacionamento, placa_pre_validada=None, decisao=None):
     """
     Registra a saída de um veículo visitante.
+    Se o wrapper já decidiu, recebe a DecisaoCatraca e não consulta o banco de novo.
     """
     header("REGISTRAR SAÍDA (VISITANTE)")
+    motor = GateEngine(repositorio, estacionamento)
 
     # 1. IDENTIFICAÇÃO DO VEÍCULO
-    if placa_pre_validada:
+    if decisao:
+        placa = decisao.placa
+    elif placa_pre_validada:
         placa = placa_pre_validada
     else:
         placa, _ = get_valid_input("Digite a PLACA do veículo: ", validate_placa)
 
-    # 2. BUSCA DO TICKET ATIVO
-    ticket = repositorio.buscar_ticket_ativo(placa)
+    # 2. BUSCA DO TICKET ATIVO (com o nome do visitante, numa consulta só)
+    if decisao is None:
+        decisao = motor.avaliar(placa)
     
-    if not ticket:
+    if decisao.acao != SAIDA or decisao.zona != ZONA_VISITANTES:
         show_warning(f"Não há ticket aberto para a placa {placa}.")
         return
 
-    # 3. CÁLCULOS (Usando Classe Estacionamento)
-    agora = datetime.now()
-    entrada = ticket.entrada
-    
-    # Cálculo apenas para exibição
-    permanencia = agora - entrada
-    total_minutos = int(permanencia.total_seconds() / 60)
-    horas = total_minutos // 60
-    minutos = total_minutos % 60
-    
-    # Regra de Negócio Centralizada
+    # 3. CÁLCULOS (feitos pelo motor com a regra da Classe Estacionamento)
     # (Se o tempo limite mudar no .env, isso aqui atualiza sozinho)
-    venceu = estacionamento.verificar_ticket_vencido(entrada)
+    entrada = decisao.entrada
+    horas = decisao.permanencia_minutos // 60
+    minutos = decisao.permanencia_minutos % 60
     
-    if venceu:
+    if decisao.excedeu:
         status_txt = f"{Colors.RED}VENCIDO (Cobrar Excesso) 🚨{Colors.RESET}"
     else:
         status_txt = f"{Colors.GREEN}Dentro do limite{Colors.RESET}"
 
     # 4. RECUPERAÇÃO DE NOME
-    nome_visitante = "Rotativo"
-    if ticket.id_visitante:
-        visitante_obj = repositorio.buscar_visitante_por_id(ticket.id_visitante)
-        if visitante_obj:
-            nome_visitante = visitante_obj.nome
+    nome_visitante = decisao.nome
 
     # 5. RESUMO VISUAL
     print("\n" + Colors.CYAN + "="*40 + Colors.RESET)
     print(f"{Colors.BOLD}RESUMO DA ESTADIA (Checkout){Colors.RESET}")
     print(f"👤 Visitante: {nome_visitante}")
-    print(f"🚘 Placa:     {ticket.placa}")
-    print(f"📍 Vaga Lib.: {ticket.numero_vaga}")
+    print(f"🚘 Placa:     {decisao.placa}")
+    print(f"📍 Vaga Lib.: {decisao.vaga}")
     print(f"🕒 Entrada:   {entrada.strftime('%d/%m %H:%M')}")
     print(f"⏱️  Tempo:     {horas}h {minutos}min")
     print(f"🏷️  Status:    {status_txt}")
@@ -72,9 +68,9 @@ def registrar_saida_visitante(repositorio, estacionamento, placa_pre_validada=No
 
     if confirmar == 's':
         try:
-            repositorio.remover_ticket(ticket.id)
-            repositorio.registrar_log_visitante(ticket.placa, "SAIDA")
-            show_success(f"Saída registrada! Vaga {ticket.numero_vaga} liberada.")
+            # Baixa do ticket + histórico numa única transação
+            motor.efetivar(decisao)
+            show_success(f"Saída registrada! Vaga {decisao.vaga} liberada.")
             print(f"👋 Volte sempre, {nome_visitante}!")
             
         except Exception as e:
@@ -25,15 +25,13 @@ def cadastrar_visitante_form(repositorio):
     # =========================================================================
     print(f"\n{Colors.BOLD}1. Dados Pessoais{Colors.RESET}")
     
-    # Validação de CNH Duplicada (Regra de Negócio)
-    cnhs_existentes = repositorio.listar_todas_cnhs()
-    
     nome, _ = get_valid_input("Nome Completo: ", validate_names)
     
     def validador_cnh_unica(valor):
         val, erro = validate_cnh(valor)
         if erro: return None, erro
-        if val in cnhs_existentes: return None, "CNH já cadastrada no sistema."
+        # Validação de CNH Duplicada (Regra de Negócio)
+        if repositorio.cnh_existe(val): return None, "CNH já cadastrada no sistema."
         return val, None
 
     cnh, _ = get_valid_input("CNH: ", validador_cnh_unica)
@@ -48,12 +46,10 @@ def cadastrar_visitante_form(repositorio):
     placa, modelo, cor = None, None, None
     
     if tem_carro == 's':
-        placas_existentes = repositorio.listar_todas_placas()
-        
         def validador_placa_unica(valor):
             val, erro = validate_placa(valor)
             if erro: return None, erro
-            if val in placas_existentes: return None, "Placa já cadastrada no sistema."
+            if repositorio.placa_existe(val): return None, "Placa já cadastrada no sistema."
             return val, None
 
         placa, _ = get_valid_input("Placa: ", validador_placa_unica)
@@ -78,11 +78,10 @@ def _alterar_nome(repositorio, visitante):
     show_success("Nome atualizado!")
 
 def _alterar_cnh(repositorio, visitante):
-    cnhs = repositorio.listar_todas_cnhs()
     def validador_cnh_edit(valor):
         val, erro = validate_cnh(valor)
         if erro: return None, erro
-        if val in cnhs and val != visitante.cnh: return None, "CNH já existente."
+        if val != visitante.cnh and repositorio.cnh_existe(val): return None, "CNH já existente."
         return val, None
     
     nova_cnh, _ = get_valid_input(f"Nova CNH ({visitante.cnh}): ", validador_cnh_edit)
@@ -93,12 +92,10 @@ def _alterar_cnh(repositorio, visitante):
 def _adicionar_veiculo_visitante(repositorio, visitante):
     print(f"\n{Colors.BOLD}--- ADICIONAR VEÍCULO ---{Colors.RESET}")
     
-    placas_existentes = repositorio.listar_todas_placas()
-    
     def validador_placa(valor):
         val, erro = validate_placa(valor)
         if erro: return None, erro
-        if val in placas_existentes: return None, "Placa já cadastrada."
+        if repositorio.placa_existe(val): return None, "Placa já cadastrada."
         return val, None
 
     placa, _ = get_valid_input("Placa: ", validador_placa)
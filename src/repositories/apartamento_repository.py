@@ -4,6 +4,7 @@ Responsabilidade: Gerenciar a tabela 'apartamentos' e garantir unicidade das uni
 Localização: src/repositories/apartamento_repository.py
 """
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
 from src.classes.Apartamento import Apartamento
 
@@ -27,16 +28,14 @@ class ApartamentoRepository(BaseRepository):
             print(f"⚠️ Erro ao criar apartamento {apto.numero}-{apto.bloco}: {e}")
             return None
 
+    def iterar(self):
+        """Cursor (preguiçoso) de objetos Apartamento, ordenados por número."""
+        return self._consultar(queries.SELECT_ALL_APARTAMENTOS, mapeador=mapeadores.APARTAMENTO)
+
     def listar(self):
         """Retorna todos os apartamentos cadastrados, ordenados por número."""
-        cursor = self._get_cursor()
-        lista = []
         try:
-            cursor.execute(queries.SELECT_ALL_APARTAMENTOS)
-            for row in cursor.fetchall():
-                # Row: id, numero, bloco, vagas
-                lista.append(Apartamento(id=row[0], numero=row[1], bloco=row[2], vagas=row[3]))
-            return lista
+            return list(self.iterar())
         except Exception as e:
             print(f"Erro ao listar apartamentos: {e}")
             return []
@@ -46,27 +45,15 @@ class ApartamentoRepository(BaseRepository):
         Busca um apartamento pela sua identificação visual (Número + Bloco).
         Essencial para o cadastro de moradores: "Se já existe, usa esse ID".
         """
-        cursor = self._get_cursor()
-        
         # Garante que None vire string vazia para bater com o banco
         b = bloco if bloco else ""
         
-        cursor.execute(queries.SELECT_APARTAMENTO_BY_NUM_BLOCO, (str(numero), str(b)))
-        row = cursor.fetchone()
-        
-        if row:
-            return Apartamento(id=row[0], numero=row[1], bloco=row[2], vagas=row[3])
-        return None
+        return self._consultar(queries.SELECT_APARTAMENTO_BY_NUM_BLOCO, (str(numero), str(b)),
+                               mapeadores.APARTAMENTO).fetchone()
         
     def buscar_por_id(self, id_apto):
         """Busca pelo ID interno (FK)."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_APARTAMENTO_BY_ID, (id_apto,))
-        row = cursor.fetchone()
-        
-        if row:
-            return Apartamento(id=row[0], numero=row[1], bloco=row[2], vagas=row[3])
-        return None
+        return self._consultar(queries.SELECT_APARTAMENTO_BY_ID, (id_apto,), mapeadores.APARTAMENTO).fetchone()
 
 
     def contar_vagas_ocupadas(self, id_apartamento):
@@ -81,4 +68,34 @@ class ApartamentoRepository(BaseRepository):
             return row[0] if row else 0
         except Exception as e:
             print(f"Erro ao contar vagas do apto {id_apartamento}: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+    # --- IMPORTAÇÃO EM LOTE ---
+
+    def mapear_por_rotulo(self):
+        """
+        Retorna: dict {(numero, bloco): (id, vagas)} com todas as unidades.
+        Usado pela importação em lote para resolver apartamentos sem uma consulta por linha.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_APARTAMENTOS_CHAVES)
+        return {(row[1], row[2] or ""): (row[0], row[3]) for row in cursor.fetchall()}
+
+    def adicionar_em_lote(self, linhas):
+        """
+        Cria vários apartamentos com um único executemany.
+        linhas: [(numero, bloco, vagas), ...] (duplicados são ignorados pelo UNIQUE).
+        Retorna: dict {(numero, bloco): (id, vagas)} só com os criados agora.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_MAX_ID_APARTAMENTOS)
+        ultimo_id = cursor.fetchone()[0]
+        cursor.executemany(queries.INSERT_APARTAMENTO_IGNORE, linhas)
+        cursor.execute(queries.SELECT_APARTAMENTOS_APOS_ID, (ultimo_id,))
+        return {(row[1], row[2] or ""): (row[0], row[3]) for row in cursor.fetchall()}
+
+    def contar_veiculos_por_apartamento(self):
+        """Retorna: dict {id_apartamento: total de veículos} (GROUP BY, uma consulta)."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_COUNT_VEICULOS_POR_APTO)
+        return dict(cursor.fetchall())
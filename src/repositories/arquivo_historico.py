@@ -0,0 +1,136 @@
+"""
+Arquivo Frio do Histórico (historico_movimentacao).
+Responsabilidade: Mover os eventos mais antigos que o horizonte configurado
+para arquivos SQLite mensais (<pasta>/historico_AAAA_MM.db) e anexá-los
+(ATTACH) só quando uma consulta precisa daquele período.
+Rotação (arquivar): para cada mês vencido, copia as linhas para o arquivo
+do mês (INSERT OR IGNORE), confirma, apaga do banco quente e atualiza o
+catálogo 'historico_arquivos'. Com WAL, transações entre bancos anexados
+não são atômicas em conjunto; por isso a ordem copiar -> confirmar -> apagar:
+uma falha no meio deixa no máximo linhas repetidas, e a próxima rotação
+completa o serviço sem duplicar.
+Localização: src/repositories/arquivo_historico.py
+"""
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+import time
+
+from src.db import queries
+
+_MES = re.compile(r"^\d{4}-\d{2}$")
+
+def _inicio_do_mes(ano, mes):
+    return int(datetime(ano, mes, 1).timestamp())
+
+def limites_do_mes(mes):
+    """'AAAA-MM' -> (epoch do início do mês, epoch do início do mês seguinte)."""
+    ano, numero = int(mes[:4]), int(mes[5:7])
+    proximo = (ano + 1, 1) if numero == 12 else (ano, numero + 1)
+    return _inicio_do_mes(ano, numero), _inicio_do_mes(*proximo)
+
+class ArquivoHistorico:
+    def __init__(self, pasta, horizonte_dias=180):
+        self.pasta = pasta
+        self.horizonte_dias = int(horizonte_dias)
+
+    def caminho(self, mes):
+        return os.path.join(self.pasta, f"historico_{mes.replace('-', '_')}.db")
+
+    @staticmethod
+    def esquema(mes):
+        """Apelido do ATTACH. Validado: vai direto no SQL (não aceita parâmetro)."""
+        if not _MES.match(mes):
+            raise ValueError(f"Mês inválido para o arquivo: {mes}")
+        return "arq_" + mes.replace("-", "_")
+
+    def corte(self, agora=None):
+        """Epoch antes do qual os eventos vão para o arquivo frio."""
+        agora = time.time() if agora is None else agora
+        return int(agora) - self.horizonte_dias * 86400
+
+    # --- ANEXAR / DESANEXAR ---
+
+    @contextmanager
+    def anexar(self, conn, meses):
+        """
+        Anexa os arquivos dos meses pedidos (os que existirem em disco).
+        Gera: lista de (mes, esquema) anexados.
+        """
+        anexados = []
+        # Sobra de uma consulta anterior dentro de transação (DETACH recusado)
+        ja_anexados = {row[1] for row in conn.execute(queries.SELECT_BANCOS_ANEXADOS)}
+        try:
+            for mes in meses:
+                caminho = self.caminho(mes)
+                if not os.path.exists(caminho):
+                    continue
+                esquema = self.esquema(mes)
+                if esquema not in ja_anexados:
+                    conn.execute(queries.ATTACH_ARQUIVO.format(esquema=esquema), (caminho,))
+                anexados.append((mes, esquema))
+            yield anexados
+        finally:
+            for _, esquema in anexados:
+                try:
+                    conn.execute(queries.DETACH_ARQUIVO.format(esquema=esquema))
+                except sqlite3.OperationalError:
+                    # Ainda preso a uma transação aberta: sai no commit + próximo DETACH
+                    pass
+
+    # --- ROTAÇÃO ---
+
+    def _meses_vencidos(self, conn, corte):
+        """Meses com eventos antes do corte; os meses vazios no meio são pulados (nada a arquivar)."""
+        meses = []
+        desde = 0
+        while True:
+            mais_antigo = conn.execute(queries.SELECT_HISTORICO_MAIS_ANTIGO_ENTRE, (desde, corte)).fetchone()[0]
+            if mais_antigo is None:
+                return meses
+            atual = datetime.fromtimestamp(mais_antigo).strftime("%Y-%m")
+            inicio, fim = limites_do_mes(atual)
+            meses.append((atual, inicio, min(fim, corte)))
+            desde = fim
+
+    def arquivar(self, conn, agora=None):
+        """
+        Move para o arquivo frio tudo o que for mais antigo que o horizonte.
+        Confirma a transação pendente antes de começar (ATTACH/DETACH e a
+        ordem copiar -> apagar dependem de fronteiras de commit).
+        Retorna: dict {mes: linhas movidas}.
+        """
+        conn.commit()
+        movidos = {}
+        meses = self._meses_vencidos(conn, self.corte(agora))
+        if meses:
+            os.makedirs(self.pasta, exist_ok=True)
+
+        for mes, inicio, fim in meses:
+            esquema = self.esquema(mes)
+            conn.execute(queries.ATTACH_ARQUIVO.format(esquema=esquema), (self.caminho(mes),))
+            try:
+                conn.execute(queries.CREATE_TABLE_ARQUIVO_HISTORICO.format(esquema=esquema))
+                conn.execute(queries.CREATE_INDEX_ARQUIVO_PLACA.format(esquema=esquema))
+                conn.execute(queries.CREATE_INDEX_ARQUIVO_EPOCH.format(esquema=esquema))
+                conn.execute(queries.COPIAR_HISTORICO_PARA_ARQUIVO.format(esquema=esquema), (inicio, fim))
+                conn.commit()  # 1. O arquivo do mês está gravado em disco
+
+                apagadas = conn.execute(queries.DELETE_HISTORICO_INTERVALO, (inicio, fim)).rowcount
+                primeiro, ultimo, linhas = conn.execute(
+                    queries.SELECT_RESUMO_ARQUIVO.format(esquema=esquema)).fetchone()
+                conn.execute(queries.UPSERT_HISTORICO_ARQUIVO, (mes, primeiro, ultimo, linhas))
+                conn.commit()  # 2. Só então sai do banco quente (+ catálogo)
+                movidos[mes] = apagadas
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.execute(queries.DETACH_ARQUIVO.format(esquema=esquema))
+        return movidos
+
+    def meses_no_intervalo(self, conn, inicio, fim):
+        """Meses do catálogo com eventos em [inicio, fim) (epoch)."""
+        return [r[0] for r in conn.execute(queries.SELECT_ARQUIVOS_NO_INTERVALO, (inicio, fim))]
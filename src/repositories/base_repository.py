@@ -5,8 +5,15 @@ Nota: Não contém lógica de negócio (Logs movidos para VeiculoRepository).
 Localização: src/repositories/base_repository.py
 """
 from src.utils.db_connection import DatabaseManager
+from src.db.registro import CursorRegistrado
+from src.db.instrumentacao import CursorInstrumentado
 
 class BaseRepository:
+    # ContadoresConsultas (injetado pelo Facade) ou None = cursor comum, sem contagem
+    contadores = None
+    # Instrumentacao (injetada pelo Facade): histogramas e log de lentas, só quando ligada
+    instrumentacao = None
+
     def __init__(self, db_manager: DatabaseManager):
         """
         Recebe o gerenciador de banco.
@@ -22,11 +29,34 @@ class BaseRepository:
     def _get_cursor(self):
         """
         Retorna o cursor da conexão ativa.
+        Com contadores: CursorRegistrado (execuções e tempo por consulta nomeada).
+        Com a instrumentação ligada: CursorInstrumentado (também latência e linhas).
         """
         if self.conn:
-            return self.conn.cursor()
+            if self.instrumentacao is not None and self.instrumentacao.ativa:
+                cursor = self.conn.cursor(CursorInstrumentado)
+                cursor.contadores = self.contadores
+                cursor.instrumentacao = self.instrumentacao
+                return cursor
+            if self.contadores is None:
+                return self.conn.cursor()
+            cursor = self.conn.cursor(CursorRegistrado)
+            cursor.contadores = self.contadores
+            return cursor
         
         # Alteração de Segurança: 
         # Removemos a criação automática de conexão "fantasma" para forçar 
         # o uso correto do padrão Facade (with repository:).
-        raise RuntimeError("Erro Crítico: Tentativa de acessar o banco sem conexão ativa. Envolva a chamada em um bloco 'with repository:'.")
\ No newline at end of file
+        raise RuntimeError("Erro Crítico: Tentativa de acessar o banco sem conexão ativa. Envolva a chamada em um bloco 'with repository:'.")
+
+    def _consultar(self, sql, parametros=(), mapeador=None):
+        """
+        Executa um SELECT e devolve o cursor, já com o mapeador de linhas
+        (row_factory, ver src/repositories/mapeadores.py) só neste cursor.
+        O cursor é preguiçoso: iterar sobre ele busca e mapeia uma linha por vez.
+        Deve ser consumido dentro do mesmo 'with repository:'.
+        """
+        cursor = self._get_cursor()
+        cursor.row_factory = mapeador
+        cursor.execute(sql, parametros)
+        return cursor
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Buffer de Auditoria (historico_movimentacao).
+Responsabilidade: Acumular em memória as linhas de histórico e gravá-las em
+lote (executemany) em vez de um INSERT por evento.
+Modos:
+- ESTRITO (padrão, sem buffer): cada evento é gravado na hora, dentro da
+  transação do próprio evento. Nada se perde num crash.
+- VAZAO: as linhas ficam na memória e só vão para o banco numa fronteira de
+  commit, quando o lote enche ou o intervalo vence (e sempre no encerramento).
+A descarga só acontece logo antes de um commit: as linhas entram na mesma
+transação que está sendo confirmada, nunca numa que ainda pode sofrer rollback.
+Não há descarga por relógio: o intervalo só é conferido no commit. Com o
+sistema parado, as linhas esperam até o próximo commit (ou o encerramento);
+num crash perde-se tudo o que estiver na fila desde a última descarga.
+Localização: src/repositories/buffer_historico.py
+"""
+import threading
+import time
+from src.db import queries
+
+MODO_ESTRITO = "ESTRITO"
+MODO_VAZAO = "VAZAO"
+
+class BufferHistorico:
+    def __init__(self, tamanho_lote=200, intervalo_segundos=1.0):
+        self.tamanho_lote = int(tamanho_lote)
+        self.intervalo_segundos = float(intervalo_segundos)
+
+        # Linhas da transação em andamento (descartadas se houver rollback)
+        self._pendentes = []
+        # Linhas de transações já confirmadas, aguardando o próximo lote
+        self._fila = []
+        self._ultima_descarga = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Estatísticas
+        self.linhas_gravadas = 0
+        self.descargas = 0
+
+    def adicionar(self, data_hora, placa, tipo_veiculo, evento):
+        with self._lock:
+            self._pendentes.append((data_hora, placa, tipo_veiculo, evento))
+
+    @property
+    def tamanho(self):
+        """Linhas ainda não gravadas no banco."""
+        return len(self._pendentes) + len(self._fila)
+
+    @property
+    def vencido(self):
+        """True se o lote encheu ou o intervalo passou desde a última descarga (conferido só no commit)."""
+        if not self._fila:
+            return False
+        decorrido = time.monotonic() - self._ultima_descarga
+        return len(self._fila) >= self.tamanho_lote or decorrido >= self.intervalo_segundos
+
+    def antes_do_commit(self, conn, forcar=False):
+        """
+        Fronteira de commit: a transação atual vai ser confirmada.
+        As linhas dela passam para a fila; se o lote/intervalo venceu
+        (ou forcar=True, no encerramento), grava tudo.
+        """
+        with self._lock:
+            self._fila.extend(self._pendentes)
+            self._pendentes.clear()
+        if forcar or self.vencido:
+            self.descarregar(conn)
+
+    def apos_rollback(self):
+        """Os eventos da transação desfeita não aconteceram: descarta suas linhas."""
+        with self._lock:
+            self._pendentes.clear()
+
+    def descarregar(self, conn):
+        """Grava a fila inteira com um único executemany (o commit é do chamador)."""
+        with self._lock:
+            linhas = self._fila
+            self._fila = []
+        if linhas:
+            try:
+                conn.executemany(queries.INSERT_HISTORICO, linhas)
+            except Exception:
+                # Devolve à fila para a próxima tentativa
+                with self._lock:
+                    self._fila[:0] = linhas
+                raise
+            self.linhas_gravadas += len(linhas)
+            self.descargas += 1
+        self._ultima_descarga = time.monotonic()
+        return len(linhas)
+
+    def estatisticas(self):
+        return {
+            "pendentes": self.tamanho,
+            "linhas_gravadas": self.linhas_gravadas,
+            "descargas": self.descargas,
+            "media_por_lote": round(self.linhas_gravadas / self.descargas, 1) if self.descargas else 0,
+        }
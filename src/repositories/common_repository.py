@@ -3,83 +3,164 @@ Repositório Comum (Setup e Relatórios Globais).
 Responsabilidade: Criar TODAS as tabelas do sistema, inclusive a nova 'apartamentos'.
 Localização: src/repositories/common_repository.py
 """
-import sqlite3
+from contextlib import closing
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
+from src.db import migracoes
+from src.db import registro
+from src.classes.Veiculo import Veiculo
+from src.classes.Apartamento import Apartamento
+from src.classes.ContextoCatraca import ContextoCatraca
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.utils.tempo import para_epoch
+
+# Limite superior "sem fim" dos intervalos em epoch
+FIM_DOS_TEMPOS = 2 ** 62
 
 class CommonRepository(BaseRepository):
+    # ArquivoHistorico (meses antigos em arquivos à parte) ou None (tudo no banco quente)
+    arquivo_historico = None
     
     def criar_tabelas(self):
-        """Inicializa o esquema do banco de dados (DDL)."""
-        try:
-            # Se já temos conexão ativa, usa ela. Senão, cria uma temporária.
-            manager = self.conn if self.conn else self.db_manager.__enter__()
-            
-            # 1. Tabelas Independentes (Ordem Importa!)
-            manager.execute(queries.CREATE_TABLE_APARTAMENTOS)
-            manager.execute(queries.CREATE_TABLE_VISITANTES_CADASTRO)
-            
-            # 2. Tabelas Dependentes (Com Foreign Keys)
-            manager.execute(queries.CREATE_TABLE_MORADORES) # Depende de Apartamentos
-            manager.execute(queries.CREATE_TABLE_VEICULOS)  # Depende de Moradores
-            manager.execute(queries.CREATE_TABLE_FUNCIONARIOS) # Depende de Moradores
-            
-            
-            #  manager.execute(queries .CREATE_TABLE_CONTROLE_VAGAS_MORADORES) PENSAR EM COMO RESOLVER O CODESMELL DE .vaga_atual = None PARA MORADOR, RESPEITANDO A REGRA DE NEGOCIO DE 2 VAGAS POR APTO - VER 
+        """
+        Inicializa / atualiza o esquema do banco de dados (DDL).
+        Versionado por PRAGMA user_version (ver src/db/migracoes.py):
+        banco em dia = uma leitura do cabeçalho e nenhuma DDL.
+        Retorna: lista das versões aplicadas agora.
+        Lança: o erro da migração (a partida não segue com esquema pela metade).
+        """
+        # Se já temos conexão ativa, usa ela
+        if self.conn:
+            return migracoes.migrar(self.conn)
 
-            manager.execute(queries .CREATE_TABLE_CONTROLE_VAGAS_FUNCIONARIOS) 
-            manager.execute(queries.CREATE_TABLE_TICKETS)
-            manager.execute(queries.CREATE_TABLE_HISTORICO)
-            
-            # 3. Tabela de Usuários (Independente)
-            manager.execute(queries.CREATE_TABLE_USUARIOS)
+        # Caminho rápido: arquivo já na versão atual -> nem abre conexão
+        if migracoes.esquema_em_dia(self.db_manager.db_path):
+            return []
 
-            if not self.conn:
-                self.db_manager.__exit__(None, None, None)
-                
-        except sqlite3.Error as e:
-            print(f"❌ Erro fatal ao criar tabelas: {e}")
+        # Conexão temporária: o 'with' desfaz o passo que falhou e sempre devolve a conexão (pool)
+        with self.db_manager as conn:
+            return migracoes.migrar(conn)
 
     def listar_ocupacao_completa(self):
         """
         Gera os dados para o Mapa do Estacionamento.
-        Retorna uma lista de Dicionários com as chaves exatas da Query.
+        Retorna uma lista de OcupacaoLinha (tupla nomeada: tipo, apto_num,
+        apto_bloco, vaga_atual, proprietario, placa, modelo, cor).
+        Para percorrer sem montar a lista, use iterar_ocupacao().
         """
-        cursor = self._get_cursor()
-        lista = []
         try:
-            cursor.execute(queries.SELECT_OCUPACAO_COMPLETA)
-            
-            # A query retorna Tuplas. Vamos converter para Dicionário
-            # para facilitar o uso no front-end (mapa.py)
-            for row in cursor.fetchall():
-                # Ordem definida no SELECT do queries.py:
-                # 0:tipo, 1:apto_num, 2:apto_bloco, 3:vaga_atual, 
-                # 4:proprietario, 5:placa, 6:modelo, 7:cor
-                
-                item = {
-                    "tipo": row[0],            # 'MORADOR' ou 'VISITANTE' ou 'FUNCIONARIO'
-                    "apto_num": row[1],
-                    "apto_bloco": row[2],
-                    "vaga_atual": row[3],      # <--- ATUALIZADO AQUI
-                    "proprietario": row[4],    # Nome do dono
-                    "placa": row[5],
-                    "modelo": row[6],
-                    "cor": row[7]
-                }
-                lista.append(item)
-                
-            return lista
+            return list(self.iterar_ocupacao())
         except Exception as e: 
             print(f"Erro ao gerar mapa: {e}") 
             return []
 
-    def buscar_historico_por_placa(self, placa):
-        """Filtra logs por placa."""
+    def resolver_placa(self, placa):
+        """
+        Resolve uma placa para a catraca com UMA consulta (JOIN).
+        Retorna: ContextoCatraca (sempre; tipo_dono=None se a placa é desconhecida).
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_CONTEXTO_CATRACA, (placa,))
+        row = cursor.fetchone()
+
+        veiculo = None
+        if row[1] is not None:
+            veiculo = Veiculo.do_banco(
+                id=row[1],
+                placa=row[0],
+                modelo=row[2],
+                cor=row[3],
+                estacionado=row[4],
+                morador_id=row[5],
+                visitante_id=row[6],
+                funcionario_id=row[7]
+            )
+
+        ticket = None
+        if row[12] is not None:
+            ticket = TicketVisitante.do_banco(
+                id=row[12],
+                placa=row[0],
+                numero_vaga=row[13],
+                entrada_epoch=row[14],
+                id_visitante=row[15]
+            )
+
+        # Quem é o dono? (Carro sem cadastro com ticket = visitante rotativo)
+        if veiculo and veiculo.morador_id:
+            tipo = "MORADOR"
+        elif veiculo and veiculo.funcionario_id:
+            tipo = "FUNCIONARIO"
+        elif (veiculo and veiculo.visitante_id) or ticket:
+            tipo = "VISITANTE"
+        else:
+            tipo = None
+
+        rotulo = Apartamento.do_banco(None, row[10], row[11], None).rotulo if row[10] is not None else None
+
+        return ContextoCatraca(
+            placa=row[0],
+            veiculo=veiculo,
+            tipo_dono=tipo,
+            nome_dono=row[8],
+            cargo=row[9],
+            rotulo_apto=rotulo,
+            ticket=ticket,
+            vaga_funcionario=row[16]
+        )
+
+    def _segmentos_historico(self, inicio=0, fim=FIM_DOS_TEMPOS, recentes_primeiro=False):
+        """
+        Onde procurar eventos em [inicio, fim) (epoch): os meses arquivados que
+        cruzam o intervalo, anexados um por vez (o SQLite limita os ATTACH), e o
+        banco quente. Sem arquivo frio, só o banco quente.
+        Gera: None (banco quente) ou o esquema do mês anexado, do mais antigo ao
+        mais recente (ou o inverso). A consulta de um segmento deve ser consumida
+        antes de pedir o próximo: o DETACH acontece logo em seguida.
+        """
+        meses = []
+        if self.arquivo_historico is not None:
+            meses = self.arquivo_historico.meses_no_intervalo(self.conn, inicio, fim)
+        if recentes_primeiro:
+            yield None
+            meses.reverse()
+        for mes in meses:
+            with self.arquivo_historico.anexar(self.conn, [mes]) as anexados:
+                for _, esquema in anexados:
+                    yield esquema
+        if not recentes_primeiro:
+            yield None
+
+    @staticmethod
+    def _sql_historico(nome, esquema, **partes):
+        """A consulta do banco quente ou, num mês anexado, a sua variante _ARQUIVO."""
+        if esquema is not None:
+            nome += "_ARQUIVO"
+        return registro.nomear(nome, getattr(queries, nome).format(esquema=esquema, **partes))
+
+    def buscar_historico_por_placa(self, placa, inicio=None, fim=None):
+        """
+        Filtra logs por placa, opcionalmente em [inicio, fim) (epoch, datetime, date ou texto ISO).
+        Com o arquivo frio ativo, inclui os meses arquivados que cruzam o
+        intervalo (mais recente primeiro).
+        """
         cursor = self._get_cursor()
         try:
-            cursor.execute(queries.SELECT_HISTORICO_BY_PLACA, (placa,))
-            return cursor.fetchall()
+            limites = (para_epoch(inicio) if inicio is not None else 0,
+                       para_epoch(fim) if fim is not None else FIM_DOS_TEMPOS)
+            intervalo = queries.FILTRO_INTERVALO_EPOCH if (inicio, fim) != (None, None) else ""
+            parametros = (placa, *limites) if intervalo else (placa,)
+
+            linhas = []
+            for esquema in self._segmentos_historico(*limites, recentes_primeiro=True):
+                if esquema is None and not intervalo:
+                    cursor.execute(queries.SELECT_HISTORICO_BY_PLACA, parametros)
+                else:
+                    sql = queries.SELECT_HISTORICO_PLACA_TRECHO.format(esquema=esquema or "main", intervalo=intervalo)
+                    cursor.execute(registro.nomear("SELECT_HISTORICO_PLACA_TRECHO", sql), parametros)
+                linhas.extend(cursor.fetchall())
+            return linhas
         except Exception as e:
             print(f"Erro ao buscar histórico da placa: {e}")
             return []
@@ -94,28 +175,138 @@ class CommonRepository(BaseRepository):
             print(f"❌ Erro ao buscar histórico: {e}")
             return []
 
- # IMPLEMENTAR A FUNCAO DE CONTROLE DE CPF       
-    def listar_todos_cpfs(self):
-        """Busca CPFs em Moradores, Visitantes e Funcionários para evitar duplicidade."""
-        cursor = self._get_cursor
-        cpfs = set()
+    def paginar_historico(self, limite=20, antes_de=None, depois_de=None, **filtros):
+        """
+        Página do histórico por keyset no id (custo O(limite), sem OFFSET).
+        Com o arquivo frio ativo, a página continua nos meses arquivados.
+        antes_de: id -> eventos mais antigos que ele (próxima página).
+        depois_de: id -> eventos mais recentes que ele (página anterior).
+        filtros: placa, tipo_veiculo e/ou tipo_evento (None = sem filtro).
+        Retorna: lista de (id, data_hora, placa, tipo_veiculo, tipo_evento), do mais recente ao mais antigo.
+        """
+        condicoes, parametros = [], []
+        for campo, valor in filtros.items():
+            if valor is not None:
+                condicoes.append(queries.FILTROS_HISTORICO[campo])
+                parametros.append(valor)
+
+        ordem = "DESC"
+        for nome, valor in (("antes_de", antes_de), ("depois_de", depois_de)):
+            if valor is not None:
+                condicao, ordem = queries.CURSORES_HISTORICO[nome]
+                condicoes.append(condicao)
+                parametros.append(valor)
 
-        return cpfs
+        filtros_sql = " AND ".join(condicoes) or "1"
+        cursor = self._get_cursor()
+        linhas = []
+        # Ids crescem com o tempo: do banco quente para os meses mais antigos (ou o inverso)
+        with closing(self._segmentos_historico(recentes_primeiro=ordem == "DESC")) as segmentos:
+            for esquema in segmentos:
+                faltam = limite - len(linhas)
+                if faltam <= 0:
+                    break
+                sql = self._sql_historico("SELECT_HISTORICO_PAGINA", esquema, filtros=filtros_sql, ordem=ordem)
+                cursor.execute(sql, parametros + [faltam])
+                linhas.extend(cursor.fetchall())
+        # A página anterior é lida em ordem crescente; exibimos sempre a mais recente primeiro
+        return linhas[::-1] if ordem == "ASC" else linhas
+
+    def localizar_id_por_data(self, limite):
+        """
+        Id do último evento antes de 'limite' (epoch, datetime, date ou texto ISO),
+        numa busca no idx_historico_epoch (banco quente, depois os meses arquivados).
+        Retorna: o id ou None (nenhum evento antes da data).
+        """
+        limite = para_epoch(limite)
+        cursor = self._get_cursor()
+        with closing(self._segmentos_historico(0, limite, recentes_primeiro=True)) as segmentos:
+            for esquema in segmentos:
+                row = cursor.execute(self._sql_historico("SELECT_HISTORICO_ULTIMO_ID_ANTES", esquema),
+                                     (limite,)).fetchone()
+                if row:
+                    return row[0]
+        return None
+
+    def listar_historico_entre(self, inicio, fim, limite=1000):
+        """
+        Eventos com instante em [inicio, fim), em ordem cronológica, pelo índice epoch
+        (meses arquivados inclusive).
+        inicio/fim: epoch, datetime, date ou texto ISO (hora local).
+        Retorna: lista de (id, data_hora, placa, tipo_veiculo, tipo_evento).
+        """
+        inicio, fim = para_epoch(inicio), para_epoch(fim)
+        cursor = self._get_cursor()
+        linhas = []
+        with closing(self._segmentos_historico(inicio, fim)) as segmentos:
+            for esquema in segmentos:
+                faltam = limite - len(linhas)
+                if faltam <= 0:
+                    break
+                cursor.execute(self._sql_historico("SELECT_HISTORICO_ENTRE", esquema), (inicio, fim, faltam))
+                linhas.extend(cursor.fetchall())
+        return linhas
+
+    def contar_historico_entre(self, inicio, fim):
+        """Total de eventos em [inicio, fim), meses arquivados inclusive (COUNT só no índice)."""
+        inicio, fim = para_epoch(inicio), para_epoch(fim)
+        cursor = self._get_cursor()
+        total = 0
+        for esquema in self._segmentos_historico(inicio, fim):
+            cursor.execute(self._sql_historico("SELECT_COUNT_HISTORICO_ENTRE", esquema), (inicio, fim))
+            total += cursor.fetchone()[0]
+        return total
+
+    def iterar_historico_intervalo(self, inicio, fim):
+        """
+        Cursores (preguiçosos) do histórico com instante em [inicio, fim) (epoch),
+        um por segmento: meses arquivados do mais antigo ao mais recente, depois o
+        banco quente. O chamador consome cada um com fetchmany antes do próximo:
+        nada é carregado inteiro na memória.
+        """
+        inicio, fim = para_epoch(inicio), para_epoch(fim)
+        for esquema in self._segmentos_historico(inicio, fim):
+            cursor = self._get_cursor()
+            cursor.execute(self._sql_historico("SELECT_HISTORICO_INTERVALO", esquema), (inicio, fim))
+            yield cursor
+
+    def iterar_ocupacao(self):
+        """
+        Cursor (preguiçoso) da ocupação atual (mesma consulta do Mapa).
+        Cada linha é uma OcupacaoLinha (continua sendo tupla para a exportação).
+        """
+        return self._consultar(queries.SELECT_OCUPACAO_COMPLETA, mapeador=mapeadores.OCUPACAO)
+
+    # --- REGISTRO DE DOCUMENTOS (Unicidade entre tabelas) ---
+
+    def _documento_existe(self, tipo, valor):
+        """Busca pontual na chave (tipo, valor) da tabela 'documentos'."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_DOCUMENTO_EXISTE, (tipo, valor))
+        return bool(cursor.fetchone()[0])
+
+    def cnh_existe(self, cnh):
+        """True se a CNH já pertence a um morador, visitante ou funcionário."""
+        return self._documento_existe("CNH", cnh)
+
+    def cpf_existe(self, cpf):
+        """True se o CPF já está cadastrado."""
+        return self._documento_existe("CPF", cpf)
+
+    def placa_existe(self, placa):
+        """True se a placa já pertence a algum veículo cadastrado."""
+        return self._documento_existe("PLACA", placa)
+
+    def _listar_documentos(self, tipo):
+        # Sem try/except: erro de banco aqui não pode virar "nenhum documento" (nenhuma duplicata)
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_DOCUMENTOS_POR_TIPO, (tipo,))
+        return {r[0] for r in cursor.fetchall()}
+
+    def listar_todos_cpfs(self):
+        """CPFs cadastrados (set). Para checar UM CPF, prefira cpf_existe()."""
+        return self._listar_documentos("CPF")
         
     def listar_todas_cnhs(self):
-        """Busca CNHs em Moradores, Visitantes e Funcionários para evitar duplicidade."""
-        cursor = self._get_cursor()
-        cnhs = set()
-        try:
-            cursor.execute("SELECT cnh FROM moradores")
-            cnhs.update([r[0] for r in cursor.fetchall()])
-            
-            cursor.execute("SELECT cnh FROM visitantes_cadastrados")
-            cnhs.update([r[0] for r in cursor.fetchall()])
-            
-            cursor.execute("SELECT cnh FROM funcionarios WHERE cnh IS NOT NULL")
-            cnhs.update([r[0] for r in cursor.fetchall()])
-            
-            return cnhs
-        except Exception: 
-            return set()
\ No newline at end of file
+        """CNHs de Moradores, Visitantes e Funcionários (set). Para checar UMA CNH, prefira cnh_existe()."""
+        return self._listar_documentos("CNH")
\ No newline at end of file
@@ -4,7 +4,11 @@ Responsabilidade: Ponto único de acesso ao Banco de Dados.
 Inicializa os sub-repositórios especializados e gerencia a transação.
 Localização: src/repositories/estacionamento_repository.py
 """
-from src.utils.db_connection import DatabaseManager
+from contextlib import contextmanager, nullcontext
+from src.utils.db_connection import DatabaseManager, CheckpointScheduler
+from src.utils.senhas import ServicoSenhas, TokensSessao
+from src.db.registro import ContadoresConsultas, TAMANHO_CACHE_STATEMENTS
+from src.db.instrumentacao import Instrumentacao
 
 # Importa os Repositórios Especializados
 from src.repositories.common_repository import CommonRepository
@@ -15,11 +19,23 @@ from src.repositories.visitante_repository import VisitanteRepository
 from src.repositories.veiculo_repository import VeiculoRepository
 from src.repositories.ticket_repository import TicketRepository
 from src.repositories.usuario_repository import UsuarioRepository 
+from src.repositories.resumo_repository import ResumoRepository
+from src.repositories.buffer_historico import BufferHistorico
+from src.classes.Usuario import Usuario
+from src.repositories.arquivo_historico import ArquivoHistorico
 
 class EstacionamentoRepository:
-    def __init__(self, db_path: str):
-        self.db_manager = DatabaseManager(db_path)
+    def __init__(self, db_path: str, pool_size: int = 4, pragmas: dict = None):
+        # pool_size > 0: conexões persistentes reaproveitadas entre blocos 'with'
+        # pool_size = 0: modo antigo (uma conexão nova por bloco)
+        # pragmas: perfil de desempenho (WAL, cache...) aplicado a cada conexão nova
+        # cached_statements > catálogo de queries.py: cada consulta é preparada uma vez por conexão
+        self.db_manager = DatabaseManager(db_path, pool_size=pool_size, pragmas=pragmas,
+                                          cached_statements=TAMANHO_CACHE_STATEMENTS)
         self.conn = None
+        self.checkpointer = None
+        self.historico = None  # BufferHistorico (modo VAZAO) ou None (modo ESTRITO)
+        self.arquivo_metricas = None  # Métricas Prometheus gravadas ao fechar (None = não grava)
         
         # --- Inicializa os Especialistas ---
         self.common = CommonRepository(self.db_manager)
@@ -30,12 +46,24 @@ class EstacionamentoRepository:
         self.veiculos = VeiculoRepository(self.db_manager)
         self.tickets = TicketRepository(self.db_manager)
         self.usuarios = UsuarioRepository(self.db_manager)
+        self.resumos = ResumoRepository(self.db_manager)
+
+        # bcrypt fora da conexão (pool criado só no primeiro login) + tokens de sessão
+        self.senhas = ServicoSenhas()
+        self.tokens = TokensSessao()
+        self.usuarios.senhas = self.senhas
+
+        # Execuções e tempo acumulado por consulta nomeada (src/db/registro.py)
+        # + instrumentação detalhada, desligada até ligar_instrumentacao()
+        self.consultas = ContadoresConsultas()
+        self.instrumentacao = Instrumentacao()
+        self._injetar_medicoes()
         
         # Garante que as tabelas existam (DDL)
         self.common.criar_tabelas()
 
     def __enter__(self):
-        """Abre a conexão e distribui para todos os filhos."""
+        """Pega uma conexão (do pool, se ativo) e distribui para todos os filhos."""
         self.conn = self.db_manager.__enter__()
         
         # Injeta a conexão ativa em todos
@@ -47,12 +75,24 @@ class EstacionamentoRepository:
         self.veiculos.set_connection(self.conn)
         self.tickets.set_connection(self.conn)
         self.usuarios.set_connection(self.conn)
+        self.resumos.set_connection(self.conn)
         
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Fecha a conexão e limpa os filhos."""
-        self.db_manager.__exit__(exc_type, exc_val, exc_tb)
+        """Finaliza a transação, devolve/fecha a conexão e limpa os filhos."""
+        try:
+            # Fim de transação = fronteira de commit do buffer de histórico
+            if self.historico is not None:
+                if exc_type is None:
+                    self.historico.antes_do_commit(self.conn)
+                else:
+                    self.historico.apos_rollback()
+        except Exception as e:
+            exc_type, exc_val, exc_tb = type(e), e, e.__traceback__
+            raise
+        finally:
+            self.db_manager.__exit__(exc_type, exc_val, exc_tb)
         self.conn = None
         
         self.common.set_connection(None)
@@ -63,6 +103,184 @@ class EstacionamentoRepository:
         self.veiculos.set_connection(None)
         self.tickets.set_connection(None)
         self.usuarios.set_connection(None)
+        self.resumos.set_connection(None)
+
+    def iniciar_checkpoints(self, intervalo=30.0, paginas_passive=1000, paginas_truncate=10000):
+        """
+        Liga o agendador de checkpoint do WAL em segundo plano.
+        Só faz sentido com journal_mode=WAL em banco de arquivo.
+        """
+        if self.db_manager.db_path == ":memory:":
+            return None
+        busy_timeout = (self.db_manager.pragmas or {}).get("busy_timeout", 5000)
+        self.checkpointer = CheckpointScheduler(
+            self.db_manager.db_path, intervalo, paginas_passive, paginas_truncate, busy_timeout
+        )
+        self.checkpointer.start()
+        return self.checkpointer
+
+    def ativar_buffer_historico(self, tamanho_lote=200, intervalo_segundos=1.0):
+        """
+        Modo VAZAO: o histórico passa a ser gravado em lote (executemany)
+        nas fronteiras de commit, em vez de um INSERT por evento.
+        """
+        self.historico = BufferHistorico(tamanho_lote, intervalo_segundos)
+        self.veiculos.buffer_historico = self.historico
+        return self.historico
+
+    def configurar_arquivo_historico(self, pasta, horizonte_dias=180):
+        """
+        Liga o arquivo frio: eventos mais antigos que 'horizonte_dias' vão para
+        arquivos mensais em 'pasta' (ver arquivar_historico).
+        """
+        self.common.arquivo_historico = ArquivoHistorico(pasta, horizonte_dias)
+        return self.common.arquivo_historico
+
+    def arquivar_historico(self, agora=None):
+        """
+        Move os meses vencidos para o arquivo frio.
+        Os resumos por hora/dia são atualizados ANTES, para não perder as linhas que saem.
+        Retorna: dict {mes: linhas movidas} (vazio se nada venceu ou se o arquivo está desligado).
+        """
+        if self.common.arquivo_historico is None:
+            return {}
+        with self:
+            self.resumos.atualizar()
+            return self.common.arquivo_historico.arquivar(self.conn, agora)
+
+    def atualizar_resumos(self):
+        """
+        Soma nos resumos as linhas novas do histórico e confirma na hora:
+        a leitura de um relatório não pode deixar a trava de escrita presa.
+        Retorna: quantidade de linhas novas somadas.
+        """
+        # Dentro de um 'with repository:' vira uma operação própria (commit ao final)
+        with self.operacao() if self.conn else self:
+            return self.resumos.atualizar()
+
+    def configurar_senhas(self, custo=12, trabalhadores=2, segredo=None, validade_minutos=480):
+        """
+        Custo do bcrypt (hashes antigos são refeitos no próximo login), threads
+        do pool de hash e segredo/validade dos tokens de sessão.
+        segredo None: um segredo aleatório por processo.
+        """
+        self.senhas.fechar()
+        self.senhas = ServicoSenhas(custo, trabalhadores)
+        self.tokens = TokensSessao(segredo, validade_minutos)
+        self.usuarios.senhas = self.senhas
+
+    def autenticar_usuario(self, username, senha_plana):
+        """
+        Login sem segurar conexão durante o bcrypt:
+        1. lê as credenciais (leitura curta); 2. verifica no pool de senhas;
+        3. se o custo mudou, grava o novo hash (escrita curta).
+        Retorna: Usuario ou None.
+        """
+        # Já dentro de um 'with repository:'? Usa a conexão ativa (pool de 1 não aninha)
+        with nullcontext() if self.conn else self:
+            row = self.usuarios.buscar_credenciais(username)
+
+        senha_hash = row[2] if row else None
+        if not self.senhas.verificar(senha_plana, senha_hash):
+            return None
+
+        if self.senhas.precisa_rehash(senha_hash):
+            novo_hash = self.senhas.gerar_hash(senha_plana)
+            with nullcontext() if self.conn else self:
+                self.usuarios.atualizar_hash(row[0], novo_hash)
+        return Usuario(id=row[0], username=row[1], perfil=row[3], senha_hash=senha_hash)
+
+    def emitir_token_sessao(self, usuario):
+        """Token assinado (HMAC) para reautenticar no turno sem pagar bcrypt."""
+        return self.tokens.emitir(usuario)
+
+    def validar_token_sessao(self, token):
+        """Retorna: Usuario (sem tocar no banco) ou None se inválido/vencido."""
+        dados = self.tokens.validar(token)
+        if dados is None:
+            return None
+        return Usuario(id=dados["id"], username=dados["u"], perfil=dados["p"])
+
+    def confirmar(self):
+        """Commit da transação atual, levando junto o histórico que estiver vencido."""
+        if self.historico is not None:
+            self.historico.antes_do_commit(self.conn)
+        self.conn.commit()
+
+    def desfazer(self):
+        """Rollback da transação atual (e das linhas de histórico dela)."""
+        if self.historico is not None:
+            self.historico.apos_rollback()
+        self.conn.rollback()
+
+    @contextmanager
+    def operacao(self):
+        """
+        Fronteira de transação dentro de uma sessão longa (um 'with repo:' para o menu todo):
+        confirma ao sair do bloco, ou desfaz se ele lançar exceção.
+        """
+        try:
+            yield self
+        except BaseException:
+            self.desfazer()
+            raise
+        self.confirmar()
+
+    def fechar(self):
+        """Grava o histórico pendente, para o checkpoint e fecha as conexões do pool (chamar ao encerrar o sistema)."""
+        if self.historico is not None and self.historico.tamanho:
+            if self.conn is not None:
+                self.historico.antes_do_commit(self.conn, forcar=True)
+                self.conn.commit()
+            else:
+                with self:
+                    self.historico.antes_do_commit(self.conn, forcar=True)
+        if self.checkpointer:
+            self.checkpointer.stop()
+            self.checkpointer = None
+        self.senhas.fechar()
+        if self.arquivo_metricas:
+            self.exportar_metricas()
+        self.db_manager.close()
+
+    def estatisticas_pool(self):
+        """Contadores do pool (hits/misses/waits) para dimensionar o tamanho."""
+        return self.db_manager.pool_stats()
+
+    def estatisticas_consultas(self):
+        """Execuções e tempo acumulado por consulta de queries.py (mais custosa primeiro)."""
+        return self.consultas.estatisticas()
+
+    # --- Instrumentação de consultas (src/db/instrumentacao.py) ---
+
+    def _injetar_medicoes(self):
+        for repositorio in (self.common, self.apartamentos, self.moradores, self.funcionarios, self.visitantes,
+                            self.veiculos, self.tickets, self.usuarios, self.resumos):
+            repositorio.contadores = self.consultas
+            repositorio.instrumentacao = self.instrumentacao
+
+    def compartilhar_medicoes(self, outro):
+        """Passa a somar nos contadores/instrumentação de outra fachada (ex.: threads leitoras da API)."""
+        self.consultas = outro.consultas
+        self.instrumentacao = outro.instrumentacao
+        self._injetar_medicoes()
+
+    def configurar_instrumentacao(self, ativa=False, limite_lento_ms=None, arquivo_lento=None, arquivo_metricas=None):
+        """Ajusta a instrumentação (ligada ou não), o log de lentas e o arquivo de métricas gravado no fechar()."""
+        self.arquivo_metricas = arquivo_metricas or None
+        self.instrumentacao.arquivo_lento = arquivo_lento or None
+        if limite_lento_ms is not None:
+            self.instrumentacao.limite_lento_ms = limite_lento_ms
+        self.instrumentacao.ativa = ativa
+        return self.instrumentacao
+
+    def ligar_instrumentacao(self, limite_lento_ms=None): self.instrumentacao.ligar(limite_lento_ms)
+    def desligar_instrumentacao(self): self.instrumentacao.desligar()
+    def relatorio_consultas(self, limite=15): return self.instrumentacao.relatorio(limite)
+
+    def exportar_metricas(self, caminho=None):
+        """Grava as métricas no formato do Prometheus (padrão: o arquivo configurado)."""
+        return self.instrumentacao.exportar_prometheus(caminho or self.arquivo_metricas)
 
     # =========================================================================
     # ÁREA DE DELEGAÇÃO (Fachada)
@@ -71,20 +289,37 @@ class EstacionamentoRepository:
     # --- 1. COMUM ---
     def listar_ocupacao_completa(self): return self.common.listar_ocupacao_completa()
     def listar_historico_recente(self): return self.common.listar_historico_recente()
+    def iterar_historico_intervalo(self, inicio, fim): return self.common.iterar_historico_intervalo(inicio, fim)
+    def paginar_historico(self, limite=20, antes_de=None, depois_de=None, **filtros): return self.common.paginar_historico(limite, antes_de, depois_de, **filtros)
+    def localizar_id_por_data(self, limite): return self.common.localizar_id_por_data(limite)
+    def listar_historico_entre(self, inicio, fim, limite=1000): return self.common.listar_historico_entre(inicio, fim, limite)
+    def contar_historico_entre(self, inicio, fim): return self.common.contar_historico_entre(inicio, fim)
+    def iterar_ocupacao(self): return self.common.iterar_ocupacao()
     def listar_todas_cnhs(self): return self.common.listar_todas_cnhs()
+    def resolver_placa(self, placa): return self.common.resolver_placa(placa)
+    def listar_todos_cpfs(self): return self.common.listar_todos_cpfs()
+    def cnh_existe(self, cnh): return self.common.cnh_existe(cnh)
+    def cpf_existe(self, cpf): return self.common.cpf_existe(cpf)
+    def placa_existe(self, placa): return self.common.placa_existe(placa)
 
     # --- 2. APARTAMENTOS ---
     def criar_apartamento(self, apto): return self.apartamentos.adicionar(apto)
     def listar_apartamentos(self): return self.apartamentos.listar()
+    def iterar_apartamentos(self): return self.apartamentos.iterar()
     def buscar_apartamento_por_rotulo(self, num, bloco=""): return self.apartamentos.buscar_por_rotulo(num, bloco)
     def buscar_apartamento_por_id(self, id): return self.apartamentos.buscar_por_id(id)
+    def mapear_apartamentos_por_rotulo(self): return self.apartamentos.mapear_por_rotulo()
+    def adicionar_apartamentos_em_lote(self, linhas): return self.apartamentos.adicionar_em_lote(linhas)
+    def contar_veiculos_por_apartamento(self): return self.apartamentos.contar_veiculos_por_apartamento()
 
     # --- 3. MORADORES ---
     def adicionar_morador(self, m): return self.moradores.adicionar(m)
     def listar_moradores(self): return self.moradores.listar()
+    def iterar_moradores(self): return self.moradores.iterar()
     def buscar_morador_por_id(self, id): return self.moradores.buscar_por_id(id)
     def atualizar_morador(self, m): return self.moradores.atualizar(m)
     def remover_morador(self, id): return self.moradores.remover(id)
+    def adicionar_moradores_em_lote(self, linhas): return self.moradores.adicionar_em_lote(linhas)
     
     # Buscas Relacionadas a Apto
     def buscar_moradores_por_id_apartamento(self, id_apto): 
@@ -97,6 +332,7 @@ class EstacionamentoRepository:
     # --- 4. RH (FUNCIONÁRIOS) ---
     def adicionar_funcionario(self, f): return self.funcionarios.adicionar(f)
     def listar_funcionarios(self): return self.funcionarios.listar()
+    def iterar_funcionarios(self): return self.funcionarios.iterar()
     def buscar_funcionario_por_id(self, id): return self.funcionarios.buscar_por_id(id)
     def buscar_funcionario_por_cpf(self, cpf): return self.funcionarios.buscar_por_cpf(cpf)
     def atualizar_funcionario(self, f): return self.funcionarios.atualizar(f)
@@ -106,18 +342,20 @@ class EstacionamentoRepository:
     # --- 5. VISITANTES ---
     def adicionar_visitante_cadastro(self, v): return self.visitantes.adicionar(v)
     def listar_visitantes_cadastrados(self): return self.visitantes.listar()
+    def iterar_visitantes_cadastrados(self): return self.visitantes.iterar()
     def buscar_visitante_por_id(self, id): return self.visitantes.buscar_por_id(id)
     def atualizar_visitante_cadastro(self, v): return self.visitantes.atualizar(v)
     def remover_visitante_cadastro(self, id): return self.visitantes.remover(id)
 
     # --- 6. VEÍCULOS E ZONA C ---
     def adicionar_veiculo(self, v): return self.veiculos.adicionar(v)
+    def adicionar_veiculos_em_lote(self, linhas): return self.veiculos.adicionar_em_lote(linhas)
     def listar_veiculos_por_morador(self, id_morador): return self.veiculos.listar_por_morador(id_morador)
     def listar_veiculos_por_visitante(self, id_visitante): return self.veiculos.listar_por_visitante(id_visitante)
     def listar_veiculos_por_funcionario(self, id_funcionario): return self.veiculos.listar_por_funcionario(id_funcionario)
     def listar_todas_placas(self): return self.veiculos.listar_todas_placas()
     def buscar_veiculo_por_placa(self, placa): return self.veiculos.buscar_por_placa(placa)
-    def buscar_historico_por_placa(self, placa):return self.common.buscar_historico_por_placa(placa)
+    def buscar_historico_por_placa(self, placa, inicio=None, fim=None): return self.common.buscar_historico_por_placa(placa, inicio, fim)
     def contar_carros_do_apartamento(self, id_apartamento):return self.apartamentos.contar_vagas_ocupadas(id_apartamento)
     def atualizar_veiculo(self, v): return self.veiculos.atualizar(v)
     def remover_veiculo(self, placa): return self.veiculos.remover(placa)
@@ -128,12 +366,24 @@ class EstacionamentoRepository:
     def registrar_vaga_funcionario(self, placa, numero_vaga, id_funcionario): return self.veiculos.registrar_vaga_funcionario(placa, numero_vaga, id_funcionario)
     def liberar_vaga_funcionario(self, placa): return self.veiculos.liberar_vaga_funcionario(placa)
     def listar_vagas_ocupadas_funcionarios(self): return self.veiculos.listar_vagas_ocupadas_funcionarios()
+    def contar_vagas_ocupadas_funcionarios(self): return self.veiculos.contar_vagas_ocupadas_funcionarios()
 
     # --- 7. TICKETS ---
     def criar_ticket(self, t): return self.tickets.criar_ticket(t)
-    def vincular_cadastro_a_ticket(self, placa, id_visitante): self.tickets.vincular_cadastro_a_ticket(placa, id_visitante)
+    def vincular_cadastro_a_ticket(self, placa, id_visitante):
+        # Confirma cadastro + vínculo juntos (o repositório não faz mais commit por conta própria)
+        self.tickets.vincular_cadastro_a_ticket(placa, id_visitante)
+        self.confirmar()
     def buscar_ticket_ativo(self, placa): return self.tickets.buscar_ticket_ativo(placa)
     def listar_tickets_ativos(self): return self.tickets.listar_tickets_ativos()
+    def iterar_tickets_ativos(self): return self.tickets.iterar_tickets_ativos()
+    def contar_tickets_ativos(self): return self.tickets.contar_tickets_ativos()
     def remover_ticket(self, id): return self.tickets.remover_ticket(id)
+    def encerrar_ticket(self, ticket, limite_minutos, saida=None): return self.tickets.encerrar_ticket(ticket, limite_minutos, saida)
+    def contar_sessoes_visitantes(self, desde_epoch=0): return self.tickets.contar_sessoes(desde_epoch)
+    def iterar_sessoes_visitantes(self, desde_epoch=0): return self.tickets.iterar_sessoes(desde_epoch)
     def registrar_log_visitante(self, placa, evento): self.veiculos.registrar_log_visitante(placa, evento)
-    def listar_vagas_ocupadas_tickets(self): return self.tickets.listar_vagas_ocupadas()
\ No newline at end of file
+    def listar_vagas_ocupadas_tickets(self): return self.tickets.listar_vagas_ocupadas()
+    # --- 8. RESUMOS DO HISTÓRICO ---
+    def listar_resumo_diario(self, dias=7): return self.resumos.totais_diarios(dias)
+    def listar_picos_por_dia_semana(self): return self.resumos.pico_por_dia_semana()
@@ -5,6 +5,7 @@ Localização: src/repositories/funcionario_repository.py
 """
 import sqlite3
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.classes.Funcionario import Funcionario
 from src.db import queries
 
@@ -32,38 +33,25 @@ class FuncionarioRepository(BaseRepository):
             print(f"Erro ao adicionar funcionário: {e}")
             return None
 
+    def iterar(self):
+        """Cursor (preguiçoso) de objetos Funcionario, um por vez."""
+        return self._consultar(queries.SELECT_ALL_FUNCIONARIOS, mapeador=mapeadores.FUNCIONARIO)
+
     def listar(self) -> list[Funcionario]:
         """Retorna todos os funcionários do sistema."""
-        cursor = self._get_cursor()
-        lista = []
         try:
-            cursor.execute(queries.SELECT_ALL_FUNCIONARIOS)
-            for row in cursor.fetchall():
-                lista.append(self._montar_objeto(row))
-            return lista
+            return list(self.iterar())
         except Exception as e:
             print(f"Erro ao listar funcionários: {e}")
             return []
 
     def buscar_por_id(self, id_func: int) -> Funcionario:
         """Busca funcionário pelo ID."""
-        cursor = self._get_cursor()
-        cursor.execute("SELECT * FROM funcionarios WHERE id = ?", (id_func,))
-        row = cursor.fetchone()
-        
-        if row:
-            return self._montar_objeto(row)
-        return None
+        return self._consultar(queries.SELECT_FUNCIONARIO_BY_ID, (id_func,), mapeadores.FUNCIONARIO).fetchone()
 
     def buscar_por_cpf(self, cpf: str) -> Funcionario:
         """Busca funcionário pelo CPF exato."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_FUNCIONARIO_BY_CPF, (cpf,))
-        row = cursor.fetchone()
-        
-        if row:
-            return self._montar_objeto(row)
-        return None
+        return self._consultar(queries.SELECT_FUNCIONARIO_BY_CPF, (cpf,), mapeadores.FUNCIONARIO).fetchone()
 
     def atualizar(self, funcionario: Funcionario):
         """Atualiza dados cadastrais (CPF e CNH são imutáveis no banco)."""
@@ -82,15 +70,3 @@ class FuncionarioRepository(BaseRepository):
         """
         cursor = self._get_cursor()
         cursor.execute(queries.DELETE_FUNCIONARIO, (id_func,))
-
-    def _montar_objeto(self, row) -> Funcionario:
-        """Helper para converter tupla do banco em Objeto."""
-        # Colunas SQL V3: id, nome, cpf, cargo, cnh, id_usuario
-        return Funcionario(
-            id=row[0],
-            nome=row[1],
-            cpf=row[2],
-            cargo=row[3],
-            cnh=row[4],
-            id_usuario=row[5]
-        )
\ No newline at end of file
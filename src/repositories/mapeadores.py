@@ -0,0 +1,40 @@
+"""
+Mapeadores de Linhas (row factories do sqlite3).
+Responsabilidade: Transformar cada linha do SELECT direto em objeto de domínio
+(Classe.do_banco) ou em tupla nomeada, dentro do próprio cursor.
+- Cada mapeador casa com uma lista EXPLÍCITA de colunas de queries.py
+  (COLUNAS_*): a ordem das colunas é a ordem dos argumentos de do_banco.
+- O mapeador é ligado só no cursor da consulta (BaseRepository._consultar);
+  a conexão continua devolvendo tuplas para os demais consumidores.
+- Como o cursor mapeia linha a linha, iterar sobre ele não monta lista nenhuma.
+Localização: src/repositories/mapeadores.py
+"""
+from collections import namedtuple
+from src.classes.Veiculo import Veiculo
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Apartamento import Apartamento
+from src.classes.Visitante.Visitante import Visitante
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+
+def _objeto(construtor):
+    """row_factory que repassa a linha inteira, na ordem, para o construtor."""
+    def fabrica(cursor, row):
+        return construtor(*row)
+    return fabrica
+
+def _visitante(id, nome, cnh, data_cadastro):
+    # Visitante não tem hidratação confiável: passa pelos setters
+    return Visitante(id=id, nome=nome, cnh=cnh, data_cadastro=data_cadastro)
+
+# Linha do Mapa / exportação da ocupação (aliases de SELECT_OCUPACAO_COMPLETA)
+OcupacaoLinha = namedtuple("OcupacaoLinha", "tipo apto_num apto_bloco vaga_atual proprietario placa modelo cor")
+
+# --- Mapeadores (COLUNAS_* de queries.py -> objeto) ---
+VEICULO = _objeto(Veiculo.do_banco)
+MORADOR = _objeto(Morador.do_banco)
+APARTAMENTO = _objeto(Apartamento.do_banco)
+FUNCIONARIO = _objeto(Funcionario.do_banco)
+TICKET = _objeto(TicketVisitante.do_banco)
+VISITANTE = _objeto(_visitante)
+OCUPACAO = _objeto(OcupacaoLinha)
@@ -4,6 +4,7 @@ Lida apenas com a tabela 'moradores' (Dados Pessoais).
 Localização: src/repositories/morador_repository.py
 """
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
 from src.classes.Morador import Morador
 
@@ -23,59 +24,28 @@ class MoradorRepository(BaseRepository):
         # Importante: Retornamos o ID para vincular o veículo em seguida
         return cursor.lastrowid
 
+    def iterar(self):
+        """Cursor (preguiçoso) de objetos Morador: um por vez, sem montar lista."""
+        return self._consultar(queries.SELECT_ALL_MORADORES, mapeador=mapeadores.MORADOR)
+
     def listar(self):
         """Retorna lista de objetos Morador."""
-        cursor = self._get_cursor()
-        lista = []
         try:
-            cursor.execute(queries.SELECT_ALL_MORADORES)
-            for row in cursor.fetchall():
-                # Row: (id, nome, cnh, id_apartamento)
-                m = Morador(
-                    id=row[0], 
-                    nome=row[1], 
-                    cnh=row[2], 
-                    id_apartamento=row[3] # Mapeando a FK
-                )
-                lista.append(m)
-            return lista
+            return list(self.iterar())
         except Exception as e:
             print(f"Erro ao listar moradores: {e}")
             return []
 
     def buscar_por_id(self, id_morador):
         """Busca um morador específico pelo ID."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_MORADOR_BY_ID, (id_morador,))
-        row = cursor.fetchone()
-        
-        if row:
-            return Morador(
-                id=row[0], 
-                nome=row[1], 
-                cnh=row[2], 
-                id_apartamento=row[3]
-            )
-        return None
+        return self._consultar(queries.SELECT_MORADOR_BY_ID, (id_morador,), mapeadores.MORADOR).fetchone()
 
     def buscar_por_id_apartamento(self, id_apartamento):
         """
         Retorna uma lista de Moradores vinculados a um ID de Apartamento.
         Nota: Recebe o ID do banco (ex: 5), não o número (ex: 101).
         """
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_MORADORES_BY_APTO_ID, (id_apartamento,))
-        
-        lista = []
-        for row in cursor.fetchall():
-            m = Morador(
-                id=row[0], 
-                nome=row[1], 
-                cnh=row[2], 
-                id_apartamento=row[3]
-            )
-            lista.append(m)
-        return lista
+        return list(self._consultar(queries.SELECT_MORADORES_BY_APTO_ID, (id_apartamento,), mapeadores.MORADOR))
 
     def listar_ids_apartamentos_ocupados(self):
         """
@@ -84,7 +54,7 @@ class MoradorRepository(BaseRepository):
         """
         cursor = self._get_cursor()
         try:
-            cursor.execute("SELECT DISTINCT id_apartamento FROM moradores")
+            cursor.execute(queries.SELECT_IDS_APARTAMENTOS_OCUPADOS)
             return {row[0] for row in cursor.fetchall()}
         except Exception:
             return set()
@@ -102,4 +72,17 @@ class MoradorRepository(BaseRepository):
     def remover(self, id):
         """Remove o morador (Cascade apaga veículos)."""
         cursor = self._get_cursor()
-        cursor.execute(queries.DELETE_MORADOR, (id,))
\ No newline at end of file
+        cursor.execute(queries.DELETE_MORADOR, (id,))
+
+    def adicionar_em_lote(self, linhas):
+        """
+        Salva vários moradores com um único executemany.
+        linhas: [(nome, cnh, id_apartamento), ...]
+        Retorna: dict {cnh: id} dos moradores criados (para vincular os veículos).
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_MAX_ID_MORADORES)
+        ultimo_id = cursor.fetchone()[0]
+        cursor.executemany(queries.INSERT_MORADOR, linhas)
+        cursor.execute(queries.SELECT_MORADORES_APOS_ID, (ultimo_id,))
+        return {cnh: id_morador for id_morador, cnh in cursor.fetchall()}
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Repositório Especializado: Resumos do Histórico.
+Responsabilidade: Manter as tabelas 'historico_resumo_hora' e
+'historico_resumo_dia' (contagens por tipo_veiculo e tipo_evento) e servir
+os relatórios de pico, que nunca tocam o log bruto.
+Atualização: recuperação incremental pela marca d'água (último id do
+histórico já somado). Cada execução lê só as linhas novas pelo PK.
+Localização: src/repositories/resumo_repository.py
+"""
+from datetime import date, timedelta
+from src.repositories.base_repository import BaseRepository
+from src.db import queries
+
+class ResumoRepository(BaseRepository):
+
+    def atualizar(self):
+        """
+        Soma aos resumos as linhas do histórico ainda não processadas.
+        Roda na transação do chamador (o commit é do 'with repository:').
+        Retorna: quanto a marca d'água avançou (0 = nada novo).
+        """
+        cursor = self._get_cursor()
+        row = cursor.execute(queries.SELECT_RESUMO_ULTIMO_ID).fetchone()
+        ultimo_id = row[0] if row else 0
+        max_id = cursor.execute(queries.SELECT_MAX_ID_HISTORICO).fetchone()[0]
+
+        if max_id <= ultimo_id:
+            return 0
+
+        # Mesmo intervalo nas duas tabelas + marca d'água, na mesma transação
+        cursor.execute(queries.ACUMULAR_RESUMO_HORA, (ultimo_id, max_id))
+        cursor.execute(queries.ACUMULAR_RESUMO_DIA, (ultimo_id, max_id))
+        cursor.execute(queries.UPSERT_RESUMO_ULTIMO_ID, (max_id,))
+        return max_id - ultimo_id
+
+    def totais_diarios(self, dias=7):
+        """
+        Retorna: lista de (dia, tipo_veiculo, tipo_evento, total) dos últimos 'dias' dias.
+        """
+        inicio = (date.today() - timedelta(days=dias - 1)).isoformat()
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_RESUMO_DIARIO, (inicio,))
+        return cursor.fetchall()
+
+    def pico_por_dia_semana(self):
+        """
+        Horário de pico (média de ENTRADAS) de cada dia da semana.
+        Retorna: dict {dia_semana (0 = domingo): (hora, media)}.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_RESUMO_PICO_SEMANAL)
+        picos = {}
+        for dia_semana, hora, media in cursor.fetchall():
+            # Ordenado por média DESC dentro de cada dia: a primeira é o pico
+            if dia_semana not in picos:
+                picos[dia_semana] = (hora, media)
+        return picos
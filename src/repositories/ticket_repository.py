@@ -6,6 +6,7 @@ Localização: src/repositories/ticket_repository.py
 """
 from datetime import datetime
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
 from src.classes.Visitante.TicketVisitante import TicketVisitante
 
@@ -33,50 +34,27 @@ class TicketRepository(BaseRepository):
         """
         Atualiza tickets ativos desta placa, vinculando-os ao visitante recém-criado.
         Usado quando um visitante se cadastra após entrar com veículo.
+        O commit fica com o Facade (confirmar), como nos demais repositórios.
         """
         cursor = self._get_cursor()
-        sql = "UPDATE tickets_visitantes SET id_visitante = ? WHERE placa = ?"
-        cursor.execute(sql, (id_visitante, placa))
-        self.conn.commit()
+        cursor.execute(queries.UPDATE_TICKET_VINCULAR_VISITANTE, (id_visitante, placa))
 
     def buscar_ticket_ativo(self, placa):
         """
         Verifica se existe um ticket ABERTO para esta placa.
         Usado na saída para calcular o tempo.
         """
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_TICKET_ATIVO, (placa,))
-        row = cursor.fetchone()
-        
-        if row:
-            # Row: id, placa, numero_vaga, entrada, id_visitante
-            return TicketVisitante(
-                id=row[0],
-                placa=row[1],
-                numero_vaga=row[2],
-                entrada=row[3], # A classe já trata a conversão de str->datetime
-                id_visitante=row[4]
-            )
-        return None
+        return self._consultar(queries.SELECT_TICKET_ATIVO, (placa,), mapeadores.TICKET).fetchone()
+
+    def iterar_tickets_ativos(self):
+        """Cursor (preguiçoso) dos tickets abertos, do mais antigo ao mais novo."""
+        return self._consultar(queries.SELECT_ALL_TICKETS, mapeador=mapeadores.TICKET)
 
     def listar_tickets_ativos(self):
         """
         Retorna todos os carros que estão ocupando vagas rotativas agora.
         """
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_ALL_TICKETS)
-        lista = []
-        
-        for row in cursor.fetchall():
-            t = TicketVisitante(
-                id=row[0],
-                placa=row[1],
-                numero_vaga=row[2],
-                entrada=row[3],
-                id_visitante=row[4]
-            )
-            lista.append(t)
-        return lista
+        return list(self.iterar_tickets_ativos())
 
     def listar_vagas_ocupadas(self):
         """
@@ -89,6 +67,12 @@ class TicketRepository(BaseRepository):
         # Retorna lista de strings para facilitar a comparação no Estacionamento
         return {str(row[0]) for row in cursor.fetchall()}
 
+    def contar_tickets_ativos(self):
+        """Total de vagas rotativas ocupadas (COUNT no banco, sem montar objetos)."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_COUNT_TICKETS_ATIVOS)
+        return cursor.fetchone()[0]
+
     def remover_ticket(self, id_ticket):
         """
         Remove o ticket (Processo de Saída).
@@ -96,4 +80,37 @@ class TicketRepository(BaseRepository):
         pelo VeiculoRepository, chamado pelo Controller.
         """
         cursor = self._get_cursor()
-        cursor.execute(queries.DELETE_TICKET, (id_ticket,))
\ No newline at end of file
+        cursor.execute(queries.DELETE_TICKET, (id_ticket,))
+
+    def encerrar_ticket(self, ticket: TicketVisitante, limite_minutos, saida=None):
+        """
+        Saída do visitante: guarda a sessão (duração) em 'sessoes_visitantes'
+        e remove o ticket, na mesma transação.
+        Retorna: a duração em segundos.
+        """
+        saida = saida or datetime.now()
+        duracao = max(0, int((saida - ticket.entrada).total_seconds()))
+        cursor = self._get_cursor()
+        cursor.execute(queries.INSERT_SESSAO_VISITANTE, (
+            int(ticket.entrada.timestamp()),
+            duracao,
+            int(limite_minutos),
+            1 if ticket.id_visitante else 0
+        ))
+        cursor.execute(queries.DELETE_TICKET, (ticket.id,))
+        return duracao
+
+    def contar_sessoes(self, desde_epoch=0):
+        """Total de sessões encerradas com entrada a partir de 'desde_epoch'."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_COUNT_SESSOES, (desde_epoch,))
+        return cursor.fetchone()[0]
+
+    def iterar_sessoes(self, desde_epoch=0):
+        """
+        Cursor (preguiçoso) de (entrada, duracao, limite, cadastrado).
+        Não monta lista: a análise consome direto em colunas.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_COLUNAS_SESSOES, (desde_epoch,))
+        return cursor
\ No newline at end of file
@@ -1,16 +1,18 @@
 """
 Repositório de Usuários.
 Responsabilidade: Gerenciar contas e Autenticação (Login).
-Usa BCrypt para hashing de senhas.
+O bcrypt roda no ServicoSenhas (pool de threads, src/utils/senhas.py),
+injetado pelo Facade: nenhuma escrita fica aberta enquanto o hash é calculado.
 Localização: src/repositories/usuario_repository.py
 """
-import bcrypt
 import sqlite3
 from src.repositories.base_repository import BaseRepository
 from src.db import queries
 from src.classes.Usuario import Usuario
 
 class UsuarioRepository(BaseRepository):
+    # ServicoSenhas (injetado pelo Facade)
+    senhas = None
     
     def criar_usuario(self, usuario: Usuario):
         """
@@ -19,10 +21,8 @@ class UsuarioRepository(BaseRepository):
         if not usuario.senha_plana:
             raise ValueError("Senha é obrigatória para criação de usuário.")
             
-        # 1. Criptografa a senha (Gera o Hash)
-        # encode() converte string para bytes, necessário para o bcrypt
-        salt = bcrypt.gensalt()
-        hash_bytes = bcrypt.hashpw(usuario.senha_plana.encode('utf-8'), salt)
+        # 1. Criptografa a senha (Gera o Hash) antes do INSERT abrir a transação
+        hash_bytes = self.senhas.gerar_hash(usuario.senha_plana)
         
         # 2. Salva no Banco
         cursor = self._get_cursor()
@@ -41,25 +41,29 @@ class UsuarioRepository(BaseRepository):
 
     def autenticar(self, username, senha_plana):
         """
-        Verifica se o usuário e senha existem e batem.
+        Verifica se o usuário e senha existem e batem (na conexão do chamador).
+        Prefira EstacionamentoRepository.autenticar_usuario, que não segura
+        a conexão durante o bcrypt.
         Retorna o objeto Usuario se OK, ou None se falhar.
         """
+        row = self.buscar_credenciais(username)
+        senha_hash = row[2] if row else None
+        if not self.senhas.verificar(senha_plana, senha_hash):
+            return None
+        if self.senhas.precisa_rehash(senha_hash):
+            self.atualizar_hash(row[0], self.senhas.gerar_hash(senha_plana))
+        return Usuario(id=row[0], username=row[1], perfil=row[3], senha_hash=senha_hash)
+
+    def buscar_credenciais(self, username):
+        """Row: (id, username, senha_hash, perfil) ou None."""
         cursor = self._get_cursor()
         cursor.execute(queries.SELECT_USUARIO_BY_USERNAME, (username,))
-        row = cursor.fetchone()
-        
-        if not row:
-            return None # Usuário não encontrado
-            
-        # Row: id, username, senha_hash, perfil
-        id_db, user_db, hash_db, perfil_db = row
-        
-        # Verifica a senha usando bcrypt
-        # checkpw compara a senha digitada (em bytes) com o hash do banco
-        if bcrypt.checkpw(senha_plana.encode('utf-8'), hash_db):
-            return Usuario(id=id_db, username=user_db, perfil=perfil_db, senha_hash=hash_db)
-            
-        return None # Senha incorreta
+        return cursor.fetchone()
+
+    def atualizar_hash(self, id_usuario, senha_hash):
+        """Troca o hash (ex.: rehash com o novo custo do bcrypt)."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.UPDATE_SENHA_USUARIO, (senha_hash, id_usuario))
 
     def listar_todos(self):
         """Retorna lista de usuários (sem a senha/hash para segurança)."""
@@ -4,12 +4,28 @@ Responsabilidade: CRUD de carros e Execução de Movimentação (Entrada/Saída)
 Lida com a tabela 'veiculos' e registra logs em 'historico_movimentacao'.
 Localização: src/repositories/veiculo_repository.py
 """
+import time
 from datetime import datetime
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
 from src.classes.Veiculo import Veiculo
 
+# Cache do carimbo de data/hora: na hora do rush vários eventos caem no mesmo segundo
+_carimbo = (None, "")
+
+def _carimbo_agora():
+    """Data/hora atual no formato do histórico, formatada no máximo uma vez por segundo."""
+    global _carimbo
+    segundo = int(time.time())
+    if _carimbo[0] != segundo:
+        _carimbo = (segundo, datetime.fromtimestamp(segundo).strftime("%Y-%m-%d %H:%M:%S"))
+    return _carimbo[1]
+
 class VeiculoRepository(BaseRepository):
+
+    # BufferHistorico (modo VAZAO) injetado pelo Facade; None = grava evento a evento
+    buffer_historico = None
     
     def adicionar(self, veiculo: Veiculo):
         """
@@ -31,84 +47,30 @@ class VeiculoRepository(BaseRepository):
         Busca veiculo pela placa.
         Retorna: Objeto Veiculo (se cadastrado) ou None (se não existir).
         """
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_VEICULO_BY_PLACA, (placa,))
-        row = cursor.fetchone()
-        
-        if row:
-            # Mapeamento do banco para o objeto
-            return Veiculo(
-                id=row[0],
-                placa=row[1],
-                modelo=row[2],
-                cor=row[3],
-                estacionado=bool(row[4]),
-                morador_id=row[5],
-                visitante_id=row[6],
-                funcionario_id=row[7]
-            )
-        return None
+        # O mapeador monta o Veiculo no cursor (hidratação confiável, sem revalidar a placa)
+        return self._consultar(queries.SELECT_VEICULO_BY_PLACA, (placa,), mapeadores.VEICULO).fetchone()
 
     def listar_por_morador(self, id_morador):
         """Retorna lista de veículos de um morador específico."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_VEICULOS_BY_MORADOR_ID, (id_morador,))
-        lista = []
-        for row in cursor.fetchall():
-            v = Veiculo(
-                id=row[0],
-                placa=row[1],
-                modelo=row[2],
-                cor=row[3],
-                estacionado=bool(row[4]),
-                morador_id=row[5], 
-                visitante_id=row[6],
-                funcionario_id=row[7]
-            )
-            lista.append(v)
-        return lista
+        return list(self._consultar(queries.SELECT_VEICULOS_BY_MORADOR_ID, (id_morador,), mapeadores.VEICULO))
 
     def listar_por_visitante(self, id_visitante):
         """Retorna lista de veículos de um visitante específico."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_VEICULOS_BY_VISITANTE_ID, (id_visitante,))
-        lista = []
-        for row in cursor.fetchall():
-            v = Veiculo(
-                id=row[0], 
-                placa=row[1], 
-                modelo=row[2], 
-                cor=row[3],
-                estacionado=bool(row[4]), 
-                morador_id=row[5], 
-                visitante_id=row[6],
-                funcionario_id=row[7]
-            )
-            lista.append(v)
-        return lista
+        return list(self._consultar(queries.SELECT_VEICULOS_BY_VISITANTE_ID, (id_visitante,), mapeadores.VEICULO))
 
     def listar_por_funcionario(self, funcionario_id: int) -> list[Veiculo]:
-        cursor = self._get_cursor()
-        query = "SELECT * FROM veiculos WHERE funcionario_id = ?"
-        cursor.execute(query, (funcionario_id,))
-        rows = cursor.fetchall()
-        
-        lista = []
-        for row in rows:
-            # Mapeamento IDÊNTICO aos demais, mantendo o seu padrão!
-            v = Veiculo(
-                id=row[0], 
-                placa=row[1], 
-                modelo=row[2], 
-                cor=row[3],
-                estacionado=bool(row[4]), 
-                morador_id=row[5], 
-                visitante_id=row[6],
-                funcionario_id=row[7]
-            )
-            lista.append(v)
-        return lista
+        return list(self._consultar(queries.SELECT_VEICULOS_BY_FUNCIONARIO_ID, (funcionario_id,), mapeadores.VEICULO))
     
+    def adicionar_em_lote(self, linhas):
+        """
+        Salva vários veículos de moradores com um único executemany.
+        linhas: [(placa, modelo, cor, morador_id), ...] (entram como 'Fora' do pátio).
+        """
+        cursor = self._get_cursor()
+        cursor.executemany(queries.INSERT_VEICULO, (
+            (placa, modelo, cor, morador_id, None, None, 0) for placa, modelo, cor, morador_id in linhas
+        ))
+
     def listar_todas_placas(self):
         """Retorna lista de placas (strings) para validação de unicidade."""
         cursor = self._get_cursor()
@@ -159,6 +121,41 @@ class VeiculoRepository(BaseRepository):
         # 2. Grava Log na tabela Histórico
         self._registrar_log(placa, tipo_dono, "SAIDA")
 
+    # --- CONTROLE DE VAGAS (ZONA C) ---
+
+    def registrar_vaga_funcionario(self, placa, numero_vaga, id_funcionario):
+        """Grava a ocupação de uma vaga da Zona C."""
+        cursor = self._get_cursor()
+        agora = datetime.now().isoformat()
+        cursor.execute(queries.INSERT_VAGA_FUNCIONARIO, (placa, numero_vaga, agora, id_funcionario))
+        return cursor.lastrowid
+
+    def liberar_vaga_funcionario(self, placa):
+        """
+        Remove a ocupação da Zona C desta placa.
+        Retorna: o número da vaga liberada (int) ou None se não havia ocupação.
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_VAGA_FUNCIONARIO_ATIVA, (placa,))
+        row = cursor.fetchone()
+        cursor.execute(queries.DELETE_VAGA_FUNCIONARIO, (placa,))
+        return row[0] if row else None
+
+    def listar_vagas_ocupadas_funcionarios(self):
+        """
+        Retorna um set de strings com as vagas ocupadas da Zona C.
+        Mesmo formato de TicketRepository.listar_vagas_ocupadas (Ex: {'1', '3'}).
+        """
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_VAGAS_OCUPADAS_FUNCIONARIOS)
+        return {str(row[0]) for row in cursor.fetchall()}
+
+    def contar_vagas_ocupadas_funcionarios(self):
+        """Total de vagas ocupadas na Zona C (COUNT no banco)."""
+        cursor = self._get_cursor()
+        cursor.execute(queries.SELECT_COUNT_VAGAS_FUNCIONARIOS)
+        return cursor.fetchone()[0]
+
     # --- MÉTODO PRIVADO AUXILIAR ---
 
     def registrar_log_visitante(self, placa, evento):
@@ -172,10 +169,13 @@ class VeiculoRepository(BaseRepository):
         self._registrar_log(placa, tipo, evento)
     
     def _registrar_log(self, placa, tipo_veiculo, evento):
-        """Insere registro na tabela de auditoria."""
+        """Insere registro na tabela de auditoria (ou no buffer, no modo VAZAO)."""
+        agora = _carimbo_agora()
+        if self.buffer_historico is not None:
+            self.buffer_historico.adicionar(agora, placa, tipo_veiculo, evento)
+            return
         try:
             cursor = self._get_cursor()
-            agora = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             cursor.execute(queries.INSERT_HISTORICO, (
                 agora, 
                 placa, 
@@ -5,6 +5,7 @@ Não lida com veículos ou tickets de catraca.
 Localização: src/repositories/visitante_repository.py
 """
 from src.repositories.base_repository import BaseRepository
+from src.repositories import mapeadores
 from src.db import queries
 from src.classes.Visitante.Visitante import Visitante
 
@@ -26,40 +27,21 @@ class VisitanteRepository(BaseRepository):
         ))
         return cursor.lastrowid
 
+    def iterar(self):
+        """Cursor (preguiçoso) de objetos Visitante, em ordem de nome."""
+        return self._consultar(queries.SELECT_ALL_VISITANTES, mapeador=mapeadores.VISITANTE)
+
     def listar(self):
         """Retorna lista de todos os visitantes cadastrados."""
-        cursor = self._get_cursor()
-        lista = []
         try:
-            cursor.execute(queries.SELECT_ALL_VISITANTES)
-            for row in cursor.fetchall():
-                # Row: id, nome, cnh, data_cadastro
-                v = Visitante(
-                    id=row[0],
-                    nome=row[1],
-                    cnh=row[2],
-                    data_cadastro=row[3]
-                )
-                lista.append(v)
-            return lista
+            return list(self.iterar())
         except Exception as e:
             print(f"Erro ao listar visitantes: {e}")
             return []
 
     def buscar_por_id(self, id_visitante):
         """Busca um visitante específico pelo ID."""
-        cursor = self._get_cursor()
-        cursor.execute(queries.SELECT_VISITANTE_BY_ID, (id_visitante,))
-        row = cursor.fetchone()
-        
-        if row:
-            return Visitante(
-                id=row[0],
-                nome=row[1],
-                cnh=row[2],
-                data_cadastro=row[3]
-            )
-        return None
+        return self._consultar(queries.SELECT_VISITANTE_BY_ID, (id_visitante,), mapeadores.VISITANTE).fetchone()
 
     def atualizar(self, visitante: Visitante):
         """Atualiza dados pessoais (Nome, CNH)."""
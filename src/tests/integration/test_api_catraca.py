@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import Estacionamento
+from src.api.servidor_http import ServidorCatraca
+from src.db import queries
+
+async def _chamar(porta, metodo, caminho, payload=None, cabecalhos=None):
+    """Cliente HTTP mínimo (uma requisição por conexão)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    corpo = json.dumps(payload).encode() if payload is not None else b""
+    extras = "".join(f"{nome}: {valor}\r\n" for nome, valor in (cabecalhos or {}).items())
+    writer.write(
+        f"{metodo} {caminho} HTTP/1.1\r\nHost: teste\r\nConnection: close\r\n{extras}"
+        f"Content-Length: {len(corpo)}\r\n\r\n".encode() + corpo
+    )
+    await writer.drain()
+    resposta = await reader.read()
+    writer.close()
+    cabecalho, _, corpo_resposta = resposta.partition(b"\r\n\r\n")
+    return int(cabecalho.split()[1]), json.loads(corpo_resposta)
+
+async def _chamar_bruto(porta, dados):
+    """Envia bytes crus e devolve o status da resposta (None se a conexão fechou sem resposta)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    writer.write(dados)
+    await writer.drain()
+    resposta = await reader.read()
+    writer.close()
+    return int(resposta.split()[1]) if resposta else None
+
+class TestApiCatraca:
+    """
+    Testa a API HTTP: várias catracas ao mesmo tempo passando pelo
+    escritor único, sem 'database is locked' nem vaga duplicada.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "api.db"), pragmas={"journal_mode": "WAL"})
+        yield repositorio
+        repositorio.fechar()
+
+    @pytest.fixture
+    def estacionamento(self):
+        return Estacionamento(
+            nome="Teste",
+            capacidade_visitantes=10,
+            capacidade_moradores=10,
+            tempo_limite_minutos=120,
+            capacidade_funcionarios=2,
+        )
+
+    def _rodar(self, repo, estacionamento, cenario):
+        async def principal():
+            servidor = ServidorCatraca(repo, estacionamento, leitores=2)
+            await servidor.iniciar("127.0.0.1", 0)
+            try:
+                return await cenario(servidor.porta)
+            finally:
+                await servidor.parar()
+        return asyncio.run(principal())
+
+    def test_entradas_simultaneas_recebem_vagas_distintas(self, repo, estacionamento):
+        async def cenario(porta):
+            return await asyncio.gather(*(
+                _chamar(porta, "POST", "/catraca/entrada", {"placa": f"ROT{i:04d}"}) for i in range(8)
+            ))
+
+        respostas = self._rodar(repo, estacionamento, cenario)
+
+        assert all(status == 200 for status, _ in respostas)
+        assert sorted(corpo["vaga"] for _, corpo in respostas) == list(range(1, 9))
+        assert estacionamento.vagas_livres("A") == 2
+
+    def test_sentido_divergente_nao_grava(self, repo, estacionamento):
+        async def cenario(porta):
+            return await _chamar(porta, "POST", "/catraca/saida", {"placa": "ABC1234"})
+
+        status, corpo = self._rodar(repo, estacionamento, cenario)
+
+        assert status == 409
+        assert corpo["acao"] == "ENTRADA" and corpo["efetivada"] is False
+
+    def test_ocupacao_e_historico(self, repo, estacionamento):
+        async def cenario(porta):
+            await _chamar(porta, "POST", "/catraca", {"placa": "ABC1234"})
+            await _chamar(porta, "POST", "/catraca", {"placa": "ABC1234"})
+            ocupacao = await _chamar(porta, "GET", "/ocupacao")
+            historico = await _chamar(porta, "GET", "/historico/abc1234")
+            return ocupacao, historico
+
+        (_, ocupacao), (status, historico) = self._rodar(repo, estacionamento, cenario)
+
+        assert ocupacao["zonas"]["A"]["livres"] == 10
+        assert status == 200
+        assert [e["tipo_evento"] for e in historico["eventos"]] == ["SAIDA", "ENTRADA"]
+
+    def test_historico_inclui_meses_arquivados(self, repo, estacionamento, tmp_path):
+        """As threads leitoras usam o mesmo arquivo frio do escritor."""
+        repo.configurar_arquivo_historico(str(tmp_path / "arquivo"), horizonte_dias=60)
+        with repo:
+            repo.common.criar_tabelas()
+            repo.conn.execute(queries.INSERT_HISTORICO, ("2024-01-10 08:00:00", "ABC1234", "MORADOR", "ENTRADA"))
+        assert repo.arquivar_historico() == {"2024-01": 1}
+
+        async def cenario(porta):
+            await _chamar(porta, "POST", "/catraca", {"placa": "ABC1234"})
+            return await _chamar(porta, "GET", "/historico/ABC1234")
+
+        status, historico = self._rodar(repo, estacionamento, cenario)
+
+        assert status == 200
+        assert [e["data_hora"][:10] for e in historico["eventos"]][1:] == ["2024-01-10"]
+
+    def test_ocupacao_durante_entradas_e_saidas(self, repo, estacionamento, monkeypatch):
+        """GET /ocupacao concorrendo com o escritor: lido na thread dele, sem corromper o índice."""
+        threads = []
+        original = ServidorCatraca._ocupacao
+
+        def registrar_thread(servidor):
+            threads.append(threading.current_thread().name)
+            return original(servidor)
+        monkeypatch.setattr(ServidorCatraca, "_ocupacao", registrar_thread)
+
+        async def cenario(porta):
+            placas = [f"ROT{i:04d}" for i in range(10)]
+            for rodada in ("entrada", "saida"):
+                respostas = await asyncio.gather(
+                    *(_chamar(porta, "POST", f"/catraca/{rodada}", {"placa": p}) for p in placas),
+                    *(_chamar(porta, "GET", "/ocupacao") for _ in range(20)),
+                )
+                assert all(status == 200 for status, _ in respostas)
+                for _, corpo in respostas[len(placas):]:
+                    assert 0 <= corpo["zonas"]["A"]["livres"] <= 10
+            return await _chamar(porta, "GET", "/ocupacao")
+
+        _, ocupacao = self._rodar(repo, estacionamento, cenario)
+
+        assert ocupacao["zonas"]["A"] == {"capacidade": 10, "livres": 10, "proxima_vaga": 1}
+        assert threads and all(nome.startswith("catraca-escrita") for nome in threads)
+
+    def test_requisicoes_invalidas(self, repo, estacionamento):
+        async def cenario(porta):
+            return (
+                await _chamar(porta, "POST", "/catraca", {"sem_placa": 1}),
+                await _chamar(porta, "GET", "/catraca"),
+                await _chamar(porta, "GET", "/nada"),
+            )
+
+        (s1, _), (s2, _), (s3, _) = self._rodar(repo, estacionamento, cenario)
+        assert (s1, s2, s3) == (400, 405, 404)
+
+    def test_requisicoes_malformadas(self, repo, estacionamento):
+        async def cenario(porta):
+            return (
+                await _chamar_bruto(porta, b"LIXO\r\n\r\n"),
+                await _chamar_bruto(porta, b"POST /catraca HTTP/1.1\r\nContent-Length: abc\r\n\r\n"),
+                await _chamar_bruto(porta, b"POST /catraca HTTP/1.1\r\nContent-Length: 999999999\r\n\r\n"),
+            )
+
+        assert self._rodar(repo, estacionamento, cenario) == (400, 400, 413)
@@ -0,0 +1,92 @@
+import csv
+import os
+from datetime import datetime
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import queries
+from src.functions.exportacao.exportacao import exportar_historico
+
+class TestArquivoHistorico:
+    """
+    Testa o arquivo frio do histórico: meses vencidos saem do banco quente
+    para arquivos mensais, as buscas (placa, intervalos, navegador e
+    exportação) juntam os dois lados e a rotação pode ser repetida sem
+    duplicar nada.
+    """
+
+    AGORA = datetime(2024, 6, 15, 12).timestamp()
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "quente.db"))
+        repositorio.configurar_arquivo_historico(str(tmp_path / "arquivo"), horizonte_dias=60)
+        with repositorio:
+            # Jan a Jun/2024, dia 10 de cada mês, 08h (entrada) e 18h (saída)
+            repositorio.conn.executemany(queries.INSERT_HISTORICO, [
+                (f"2024-{mes:02d}-10 {hora}:00:00", "ABC1234", "MORADOR", evento)
+                for mes in range(1, 7) for hora, evento in (("08", "ENTRADA"), ("18", "SAIDA"))
+            ])
+        yield repositorio
+        repositorio.fechar()
+
+    def test_move_meses_vencidos(self, repo, tmp_path):
+        # Corte = 16/04 -> jan, fev, mar e abr (dia 10) vão para o arquivo
+        movidos = repo.arquivar_historico(agora=self.AGORA)
+        assert movidos == {"2024-01": 2, "2024-02": 2, "2024-03": 2, "2024-04": 2}
+        assert sorted(os.listdir(tmp_path / "arquivo")) == [
+            "historico_2024_01.db", "historico_2024_02.db", "historico_2024_03.db", "historico_2024_04.db"
+        ]
+
+        with repo:
+            assert repo.conn.execute("SELECT COUNT(*) FROM historico_movimentacao").fetchone()[0] == 4
+            # Os resumos foram atualizados antes da saída das linhas
+            assert repo.conn.execute("SELECT SUM(total) FROM historico_resumo_dia").fetchone()[0] == 12
+
+        # Repetir não move nada nem duplica
+        assert repo.arquivar_historico(agora=self.AGORA) == {}
+
+    def test_busca_por_placa_junta_arquivo(self, repo):
+        repo.arquivar_historico(agora=self.AGORA)
+        with repo:
+            completo = repo.buscar_historico_por_placa("ABC1234")
+            assert len(completo) == 12
+            assert completo[0][0] == "2024-06-10 18:00:00"
+            assert completo[-1][0] == "2024-01-10 08:00:00"
+
+            # Só fevereiro: um único mês anexado, nada do banco quente
+            fevereiro = repo.buscar_historico_por_placa("ABC1234", "2024-02-01", "2024-03-01")
+            assert [l[0] for l in fevereiro] == ["2024-02-10 18:00:00", "2024-02-10 08:00:00"]
+
+            # Intervalo recente: nenhum arquivo aberto
+            assert len(repo.buscar_historico_por_placa("ABC1234", "2024-05-01")) == 4
+            assert [r[1] for r in repo.conn.execute("PRAGMA database_list;")] == ["main"]
+
+    def test_intervalos_e_exportacao_incluem_arquivo(self, repo, tmp_path):
+        """Eventos entre T1 e T2, contagem e exportação de auditoria não perdem os meses arquivados."""
+        repo.arquivar_historico(agora=self.AGORA)
+        with repo:
+            eventos = repo.listar_historico_entre("2024-02-01", "2024-06-01")
+            assert [e[1] for e in eventos][:2] == ["2024-02-10 08:00:00", "2024-02-10 18:00:00"]
+            assert len(eventos) == 8
+            assert len(repo.listar_historico_entre("2024-01-01", "2024-07-01", limite=3)) == 3
+            assert repo.contar_historico_entre("2024-01-01", "2024-07-01") == 12
+            assert [r[1] for r in repo.conn.execute("PRAGMA database_list;")] == ["main"]
+
+        resumo = exportar_historico(repo, str(tmp_path / "auditoria.csv"), inicio="2024-03-01", fim="2024-05-31")
+        assert resumo["linhas"] == 6  # março e abril (arquivados) + maio (quente)
+        with open(resumo["caminho"], encoding="utf-8") as arquivo:
+            datas = [linha["data_hora"] for linha in csv.DictReader(arquivo)]
+        assert datas[0] == "2024-03-10 08:00:00" and datas[-1] == "2024-05-10 18:00:00"
+
+    def test_navegador_pagina_ate_o_arquivo(self, repo):
+        repo.arquivar_historico(agora=self.AGORA)
+        with repo:
+            primeira = repo.paginar_historico(5)
+            segunda = repo.paginar_historico(5, antes_de=primeira[-1][0])
+            terceira = repo.paginar_historico(5, antes_de=segunda[-1][0])
+            ids = [l[0] for l in primeira + segunda + terceira]
+            assert ids == list(range(12, 0, -1))
+            assert repo.paginar_historico(5, depois_de=segunda[0][0]) == primeira
+
+            # Ir para data: o último evento antes de 01/03 já está no arquivo
+            assert repo.localizar_id_por_data("2024-03-01") == 4
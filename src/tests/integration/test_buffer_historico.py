@@ -0,0 +1,60 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+
+class TestBufferHistorico:
+    """
+    Testa o modo VAZAO do histórico: linhas acumuladas em memória e
+    gravadas em lote só nas fronteiras de commit.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "historico.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def _contar(self, repo):
+        with repo:
+            return repo.conn.execute("SELECT COUNT(*) FROM historico_movimentacao").fetchone()[0]
+
+    def test_modo_estrito_grava_na_hora(self, repo):
+        with repo:
+            repo.registrar_log_visitante("ABC1234", "ENTRADA")
+        assert self._contar(repo) == 1
+
+    def test_lote_so_grava_quando_enche(self, repo):
+        buffer = repo.ativar_buffer_historico(tamanho_lote=3, intervalo_segundos=3600)
+
+        for evento in ("ENTRADA", "SAIDA"):
+            with repo:
+                repo.registrar_log_visitante("ABC1234", evento)
+        assert self._contar(repo) == 0
+        assert buffer.tamanho == 2
+
+        with repo:
+            repo.registrar_log_visitante("ABC1234", "ENTRADA")
+        assert self._contar(repo) == 3
+        assert buffer.estatisticas()["descargas"] == 1
+
+    def test_rollback_descarta_linhas_da_transacao(self, repo):
+        buffer = repo.ativar_buffer_historico(tamanho_lote=1)
+
+        with pytest.raises(RuntimeError):
+            with repo:
+                repo.registrar_log_visitante("ABC1234", "ENTRADA")
+                raise RuntimeError("falha no meio da transação")
+
+        assert buffer.tamanho == 0
+        assert self._contar(repo) == 0
+
+    def test_encerramento_grava_o_que_restou(self, tmp_path):
+        caminho = str(tmp_path / "encerramento.db")
+        repo = EstacionamentoRepository(caminho)
+        repo.ativar_buffer_historico(tamanho_lote=100, intervalo_segundos=3600)
+        with repo:
+            repo.registrar_log_visitante("ABC1234", "ENTRADA")
+        repo.fechar()
+
+        reaberto = EstacionamentoRepository(caminho)
+        assert self._contar(reaberto) == 1
+        reaberto.fechar()
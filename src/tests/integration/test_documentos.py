@@ -0,0 +1,87 @@
+import sqlite3
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Apartamento import Apartamento
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Veiculo import Veiculo
+from src.classes.Visitante.Visitante import Visitante
+
+class TestRegistroDocumentos:
+    """
+    Testa o registro 'documentos': unicidade de CNH/CPF/Placa entre
+    moradores, visitantes e funcionários, mantida por triggers.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "documentos.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def _morador_com_carro(self, repo, cnh="11111111111", placa="ABC1234"):
+        repo.criar_apartamento(Apartamento(numero="101", bloco="A"))
+        apto = repo.buscar_apartamento_por_rotulo("101", "A")
+        id_morador = repo.adicionar_morador(Morador(nome="Ana Lima", cnh=cnh, id_apartamento=apto.id))
+        repo.adicionar_veiculo(Veiculo(placa=placa, modelo="GOL", cor="PRATA", morador_id=id_morador))
+        return id_morador
+
+    def test_buscas_pontuais(self, repo):
+        with repo:
+            self._morador_com_carro(repo)
+            repo.funcionarios.adicionar(Funcionario(nome="Rui Porto", cpf="12345678909", cargo="Porteiro"))
+
+        with repo:
+            assert repo.cnh_existe("11111111111")
+            assert repo.placa_existe("ABC1234")
+            assert repo.cpf_existe("12345678909")
+            assert not repo.cnh_existe("99999999999")
+            assert repo.listar_todos_cpfs() == {"12345678909"}
+
+    def test_erro_de_banco_nao_vira_lista_vazia(self, repo):
+        """Falha na leitura do registro propaga: 'nenhuma CNH' liberaria duplicatas na importação."""
+        with pytest.raises(sqlite3.OperationalError):
+            with repo:
+                repo.conn.execute("ALTER TABLE documentos RENAME TO documentos_fora;")
+                repo.listar_todas_cnhs()
+
+    def test_cnh_duplicada_entre_tabelas_e_recusada(self, repo):
+        with repo:
+            self._morador_com_carro(repo)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with repo:
+                repo.adicionar_visitante_cadastro(Visitante(nome="Bia Reis", cnh="11111111111"))
+
+    def test_edicao_e_exclusao_em_cascata_atualizam_registro(self, repo):
+        with repo:
+            id_morador = self._morador_com_carro(repo)
+            morador = repo.buscar_morador_por_id(id_morador)
+            morador.cnh = "22222222222"
+            repo.moradores.atualizar(morador)
+
+        with repo:
+            assert repo.cnh_existe("22222222222")
+            assert not repo.cnh_existe("11111111111")
+
+        with repo:
+            repo.remover_morador(id_morador)
+
+        with repo:
+            assert not repo.cnh_existe("22222222222")
+            assert not repo.placa_existe("ABC1234")
+
+    def test_banco_antigo_e_preenchido_na_abertura(self, tmp_path):
+        caminho = str(tmp_path / "legado.db")
+        repo = EstacionamentoRepository(caminho)
+        with repo:
+            self._morador_com_carro(repo)
+            repo.conn.execute("DELETE FROM documentos")
+            repo.conn.execute("PRAGMA user_version = 0")  # Banco de antes das migrações versionadas
+        repo.fechar()
+
+        reaberto = EstacionamentoRepository(caminho)
+        with reaberto:
+            assert reaberto.cnh_existe("11111111111")
+            assert reaberto.placa_existe("ABC1234")
+        reaberto.fechar()
@@ -0,0 +1,54 @@
+import csv
+import json
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.functions.exportacao.exportacao import exportar_historico, exportar_ocupacao, ler_colunar
+from src.db import queries
+
+class TestExportacao:
+    """
+    Testa a exportação do histórico em lotes (fetchmany): filtro de datas
+    e os três formatos (CSV, JSONL e colunar).
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "exportacao.db"))
+        with repositorio:
+            repositorio.conn.executemany(queries.INSERT_HISTORICO, [
+                (f"2024-03-{dia:02d} 08:00:00", f"ABC{i:04d}", "VISITANTE", "ENTRADA" if i % 2 else "SAIDA")
+                for dia in range(1, 11) for i in range(7)
+            ])
+        yield repositorio
+        repositorio.fechar()
+
+    @pytest.mark.parametrize("extensao", ["csv", "jsonl", "hcol"])
+    def test_exporta_intervalo_em_lotes(self, repo, tmp_path, extensao):
+        caminho = str(tmp_path / f"historico.{extensao}")
+
+        resumo = exportar_historico(repo, caminho, inicio="2024-03-03", fim="2024-03-05", tamanho_lote=4)
+
+        assert resumo["linhas"] == 21  # 3 dias x 7 eventos, fim inclusivo
+        assert resumo["linhas_por_segundo"] > 0
+
+        if extensao == "csv":
+            with open(caminho, encoding="utf-8") as arquivo:
+                linhas = list(csv.DictReader(arquivo))
+        elif extensao == "jsonl":
+            with open(caminho, encoding="utf-8") as arquivo:
+                linhas = [json.loads(l) for l in arquivo]
+        else:
+            linhas = list(ler_colunar(caminho))
+
+        assert len(linhas) == 21
+        assert linhas[0]["data_hora"] == "2024-03-03 08:00:00"
+        assert linhas[-1]["data_hora"] == "2024-03-05 08:00:00"
+        assert [l["placa"] for l in linhas[:2]] == ["ABC0000", "ABC0001"]
+
+    def test_ocupacao_e_formato_invalido(self, repo, tmp_path):
+        with repo:
+            repo.registrar_log_visitante("ROT0001", "ENTRADA")  # histórico não conta como ocupação
+        assert exportar_ocupacao(repo, str(tmp_path / "ocupacao.csv"))["linhas"] == 0
+
+        with pytest.raises(ValueError):
+            exportar_historico(repo, str(tmp_path / "historico.xlsx"))
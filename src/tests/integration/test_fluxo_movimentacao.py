@@ -61,4 +61,32 @@ class TestFluxoMovimentacao:
         assert logs[0][3] == "SAIDA"   # Último evento (Ordem decrescente)
         assert logs[1][3] == "ENTRADA" # Penúltimo evento
         
-        print("\n✅ Fluxo de Movimentação e Histórico validado com sucesso!")
\ No newline at end of file
+        print("\n✅ Fluxo de Movimentação e Histórico validado com sucesso!")
+
+    def test_resolver_placa_em_uma_consulta(self, repo):
+        """
+        Cenário: A catraca resolve a placa (dono, unidade, status) numa consulta só.
+        """
+        apto = Apartamento(numero="102", bloco="B")
+        repo.apartamentos.adicionar(apto)
+        apto_db = repo.apartamentos.buscar_por_rotulo("102", "B")
+
+        mor = Morador(nome="Maria Souza", cnh="22222222222", id_apartamento=apto_db.id)
+        id_mor = repo.moradores.adicionar(mor)
+        repo.veiculos.adicionar(Veiculo(placa="CTX-1234", modelo="Gol", cor="Azul", morador_id=id_mor))
+
+        contexto = repo.resolver_placa("CTX1234")
+
+        assert contexto.tipo_dono == "MORADOR"
+        assert contexto.nome_dono == "Maria Souza"
+        assert contexto.rotulo_apto == "102-B"
+        assert contexto.veiculo.modelo == "GOL"
+        assert contexto.dentro is False
+
+        repo.veiculos.registrar_entrada("CTX1234", tipo_dono="MORADOR")
+        assert repo.resolver_placa("CTX1234").dentro is True
+
+        # Placa nunca vista: contexto vazio, mas válido
+        desconhecida = repo.resolver_placa("ZZZ9999")
+        assert desconhecida.tipo_dono is None
+        assert desconhecida.cadastrado is False
@@ -0,0 +1,52 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Veiculo import Veiculo
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Apartamento import Apartamento
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+
+class TestHidratacao:
+    """
+    Testa a hidratação confiável (do_banco): objetos lidos do banco são
+    iguais aos montados pelo construtor, não têm __dict__ e os setters
+    continuam validando as alterações feitas depois da leitura.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "hidratacao.db"))
+        with repositorio:
+            yield repositorio
+        repositorio.fechar()
+
+    def test_objetos_do_banco_iguais_aos_do_construtor(self, repo):
+        repo.apartamentos.adicionar(Apartamento(numero="102", bloco="a"))
+        apto = repo.apartamentos.buscar_por_rotulo("102", "A")
+        morador = Morador(nome="Maria Souza", cnh="12345678901", id_apartamento=apto.id)
+        repo.moradores.adicionar(morador)
+        morador_banco = repo.moradores.buscar_por_id_apartamento(apto.id)[0]
+        repo.veiculos.adicionar(Veiculo(placa="abc1d23", modelo="gol", cor="prata", morador_id=morador_banco.id))
+        id_func = repo.funcionarios.adicionar(Funcionario(nome="Joao Lima", cpf="529.982.247-25", cargo="Porteiro"))
+        repo.tickets.criar_ticket(TicketVisitante(placa="XYZ9A87", numero_vaga=3))
+
+        veiculo = repo.veiculos.buscar_por_placa("ABC1D23")
+        assert veiculo.to_dict() == Veiculo(id=veiculo.id, placa="ABC1D23", modelo="GOL", cor="PRATA",
+                                            morador_id=morador_banco.id).to_dict()
+        assert morador_banco.to_dict() == Morador(id=morador_banco.id, nome="Maria Souza", cnh="12345678901",
+                                                  id_apartamento=apto.id).to_dict()
+        assert repo.funcionarios.buscar_por_id(id_func).to_dict() == Funcionario(
+            id=id_func, nome="Joao Lima", cpf="52998224725", cargo="Porteiro").to_dict()
+        assert apto.to_dict() == Apartamento(id=apto.id, numero="102", bloco="A").to_dict()
+
+        ticket = repo.tickets.buscar_ticket_ativo("XYZ9A87")
+        assert (ticket.placa, ticket.numero_vaga) == ("XYZ9A87", 3)
+
+        for objeto in (veiculo, morador_banco, apto, ticket, repo.funcionarios.buscar_por_id(id_func)):
+            assert not hasattr(objeto, "__dict__")
+
+    def test_setters_seguem_validando_apos_leitura(self, repo):
+        repo.veiculos.adicionar(Veiculo(placa="ABC1D23"))
+        veiculo = repo.veiculos.buscar_por_placa("ABC1D23")
+        with pytest.raises(ValueError):
+            veiculo.placa = "INVALIDA"
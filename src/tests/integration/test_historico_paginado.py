@@ -0,0 +1,57 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import queries
+
+class TestHistoricoPaginado:
+    """
+    Testa a paginação por keyset do histórico: próxima/anterior,
+    filtros e o salto para uma data por busca binária no id.
+    """
+
+    @pytest.fixture
+    def repo(self):
+        repositorio = EstacionamentoRepository(":memory:")
+        repositorio.__enter__()
+        repositorio.common.criar_tabelas()
+        # 50 eventos, um por hora a partir de 01/03 00h (ids 1..50)
+        repositorio.conn.executemany(queries.INSERT_HISTORICO, [
+            (f"2024-03-{1 + i // 24:02d} {i % 24:02d}:00:00", "ABC1234" if i % 5 == 0 else "XYZ9876",
+             "MORADOR" if i % 2 else "VISITANTE", "ENTRADA" if i % 2 else "SAIDA")
+            for i in range(50)
+        ])
+        yield repositorio
+        repositorio.__exit__(None, None, None)
+
+    def _ids(self, pagina):
+        return [linha[0] for linha in pagina]
+
+    def test_proxima_e_anterior(self, repo):
+        primeira = repo.paginar_historico(10)
+        assert self._ids(primeira) == list(range(50, 40, -1))
+
+        segunda = repo.paginar_historico(10, antes_de=primeira[-1][0])
+        assert self._ids(segunda) == list(range(40, 30, -1))
+
+        # Voltar devolve exatamente a primeira página, ainda do mais recente ao mais antigo
+        assert repo.paginar_historico(10, depois_de=segunda[0][0]) == primeira
+        assert repo.paginar_historico(10, depois_de=50) == []
+
+    def test_filtros_combinados(self, repo):
+        pagina = repo.paginar_historico(3, placa="ABC1234", tipo_evento="ENTRADA")
+        assert self._ids(pagina) == [46, 36, 26]  # i = 45, 35, 25 (ímpares = ENTRADA)
+        assert all(l[2] == "ABC1234" and l[4] == "ENTRADA" for l in pagina)
+
+        pagina = repo.paginar_historico(5, antes_de=10, tipo_veiculo="VISITANTE")
+        assert self._ids(pagina) == [9, 7, 5, 3, 1]
+
+    def test_ir_para_data(self, repo):
+        # Último evento antes de 02/03 é 01/03 23h (i = 23 -> id 24)
+        assert repo.localizar_id_por_data("2024-03-02") == 24
+        assert repo.localizar_id_por_data("2024-03-01") is None
+        assert repo.localizar_id_por_data("2099-01-01") == 50
+
+    def test_pagina_por_placa_usa_indice(self, repo):
+        sql = queries.SELECT_HISTORICO_PAGINA.format(filtros="placa = ? AND id < ?", ordem="DESC")
+        plano = " ".join(r[3] for r in repo.conn.execute("EXPLAIN QUERY PLAN " + sql, ("ABC1234", 40, 10)))
+        assert "idx_historico_placa" in plano
+        assert "TEMP B-TREE" not in plano
@@ -0,0 +1,74 @@
+import json
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Apartamento import Apartamento
+from src.functions.importacao.importacao_lote import importar_cadastros
+
+CSV_EXEMPLO = """numero;bloco;vagas;nome;cnh;placa;modelo;cor
+101;A;1;Ana Lima;11111111111;AAA1111;Gol;Prata
+101;A;1;Bruno Lima;22222222222;BBB2222;Uno;Branco
+102;;2;Carla Dias;33333333333;CCC3333;Ka;Preto
+102;;2;Carla Dias;33333333333;CCC3B33;Onix;Azul
+103;B;2;Davi 007;44444444444;DDD4444;;
+104;B;2;Eva Reis;555;EEE5555;;
+105;B;2;Fabio Sa;66666666666;AAA1111;;
+106;B;2;Gil Melo;77777777777;;;
+"""
+
+class TestImportacaoLote:
+    """
+    Testa a importação em lote: validação por linha, cota de vagas,
+    duplicidade (banco e arquivo) e o arquivo lateral de rejeitados.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "importacao.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def test_importa_csv_e_rejeita_linhas_invalidas(self, repo, tmp_path):
+        arquivo = tmp_path / "moradores.csv"
+        arquivo.write_text(CSV_EXEMPLO, encoding="utf-8")
+
+        resumo = importar_cadastros(repo, str(arquivo), tamanho_lote=2)
+
+        assert resumo["lidas"] == 8
+        assert resumo["apartamentos"] == 3      # 101-A, 102 e 106-B
+        assert resumo["moradores"] == 3         # Ana, Carla (2 carros) e Gil
+        assert resumo["veiculos"] == 3
+        assert resumo["rejeitadas"] == 4
+
+        rejeitados = (tmp_path / "moradores.rejeitados.csv").read_text(encoding="utf-8")
+        assert "limite de 1 veículos" in rejeitados   # Bruno: apto 101-A só tem 1 vaga
+        assert "Nome:" in rejeitados and "CNH:" in rejeitados
+        assert "AAA1111 já pertence" in rejeitados
+
+        with repo:
+            apto = repo.buscar_apartamento_por_rotulo("102", "")
+            assert repo.contar_carros_do_apartamento(apto.id) == 2
+
+    def test_respeita_o_que_ja_existe_no_banco(self, repo, tmp_path):
+        with repo:
+            repo.criar_apartamento(Apartamento(numero="201", bloco="C", vagas=1))
+
+        arquivo = tmp_path / "moradores.jsonl"
+        linhas = [
+            {"numero": "201", "bloco": "C", "nome": "Hugo Alves", "cnh": "88888888888", "placa": "HHH8888"},
+            {"numero": "201", "bloco": "C", "nome": "Iris Alves", "cnh": "99999999999", "placa": "III9999"},
+        ]
+        linhas.append({"numero": "202", "bloco": "C", "vagas": 0, "nome": "Joao Reis", "cnh": "12121212121"})
+        invalidas = "{quebrado\n[1, 2]\nnull\n\"x\"\n"
+        arquivo.write_text("\n".join(json.dumps(l) for l in linhas) + "\n" + invalidas, encoding="utf-8")
+
+        resumo = importar_cadastros(repo, str(arquivo))
+
+        assert (resumo["apartamentos"], resumo["moradores"], resumo["veiculos"]) == (0, 1, 1)
+        assert resumo["rejeitadas"] == 6
+        with open(resumo["arquivo_rejeitados"], encoding="utf-8") as arquivo_rejeitados:
+            motivos = [json.loads(l)["motivo"] for l in arquivo_rejeitados]
+        assert motivos.count("JSON inválido.") == 4 and "Vagas deve ser pelo menos 1." in motivos
+        assert resumo["arquivo_rejeitados"].endswith(".rejeitados.jsonl")
+
+        # Reimportar não duplica: todas as CNHs já existem
+        assert importar_cadastros(repo, str(arquivo))["moradores"] == 0
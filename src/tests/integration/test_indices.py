@@ -0,0 +1,55 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import queries
+
+# Consultas quentes da catraca: (query, parâmetros de exemplo)
+CONSULTAS_QUENTES = {
+    "SELECT_TICKET_ATIVO": (queries.SELECT_TICKET_ATIVO, ("ABC1234",)),
+    "SELECT_HISTORICO_BY_PLACA": (queries.SELECT_HISTORICO_BY_PLACA, ("ABC1234",)),
+    "SELECT_VEICULO_BY_PLACA": (queries.SELECT_VEICULO_BY_PLACA, ("ABC1234",)),
+    "SELECT_VEICULOS_BY_MORADOR_ID": (queries.SELECT_VEICULOS_BY_MORADOR_ID, (1,)),
+    "SELECT_VEICULOS_BY_VISITANTE_ID": (queries.SELECT_VEICULOS_BY_VISITANTE_ID, (1,)),
+    "SELECT_VEICULOS_BY_FUNCIONARIO_ID": (queries.SELECT_VEICULOS_BY_FUNCIONARIO_ID, (1,)),
+    "SELECT_MORADORES_BY_APTO_ID": (queries.SELECT_MORADORES_BY_APTO_ID, (1,)),
+    "SELECT_COUNT_VEICULOS_BY_APTO_ID": (queries.SELECT_COUNT_VEICULOS_BY_APTO_ID, (1,)),
+    "SELECT_VAGA_FUNCIONARIO_ATIVA": (queries.SELECT_VAGA_FUNCIONARIO_ATIVA, ("ABC1234",)),
+    "SELECT_CONTEXTO_CATRACA": (queries.SELECT_CONTEXTO_CATRACA, ("ABC1234",)),
+}
+
+# SCANs de uma linha só (a placa de entrada do SELECT_CONTEXTO_CATRACA) não contam
+SCANS_PERMITIDOS = ("SCAN CONSTANT ROW", "SCAN p")
+
+class TestIndices:
+    """
+    Garante via EXPLAIN QUERY PLAN que nenhuma consulta quente cai em SCAN
+    (varredura da tabela inteira).
+    """
+
+    @pytest.fixture
+    def repo(self):
+        repositorio = EstacionamentoRepository(":memory:")
+        repositorio.__enter__()
+        repositorio.common.criar_tabelas()
+        yield repositorio
+        repositorio.__exit__(None, None, None)
+
+    def _plano(self, repo, sql, params):
+        linhas = repo.conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        # Cada linha: (id, parent, notused, detail)
+        return [row[3] for row in linhas]
+
+    @pytest.mark.parametrize("nome", sorted(CONSULTAS_QUENTES))
+    def test_consulta_quente_usa_indice(self, repo, nome):
+        sql, params = CONSULTAS_QUENTES[nome]
+        plano = self._plano(repo, sql, params)
+
+        scans = [passo for passo in plano if passo.startswith("SCAN") and passo not in SCANS_PERMITIDOS]
+        assert not scans, f"{nome} faz varredura completa: {plano}"
+
+    def test_historico_por_placa_usa_indice_cobrindo(self, repo):
+        """O histórico cresce sem limite: a busca não deve nem tocar a tabela."""
+        sql, params = CONSULTAS_QUENTES["SELECT_HISTORICO_BY_PLACA"]
+        plano = self._plano(repo, sql, params)
+
+        assert any("COVERING INDEX" in passo for passo in plano), plano
+        assert not any("TEMP B-TREE" in passo for passo in plano), plano
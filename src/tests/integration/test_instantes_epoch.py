@@ -0,0 +1,66 @@
+import sqlite3
+from datetime import datetime
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.db import queries
+
+class TestInstantesEpoch:
+    """
+    Testa as colunas epoch (histórico e tickets): migração de bancos
+    antigos, consultas por intervalo pelo índice e leitura sem parse.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "epoch.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def test_intervalo_usa_indice(self, repo):
+        with repo:
+            repo.conn.executemany(queries.INSERT_HISTORICO, [
+                (f"2024-03-04 {h:02d}:00:00", "ABC1234", "MORADOR", "ENTRADA") for h in range(24)
+            ])
+
+        with repo:
+            eventos = repo.listar_historico_entre("2024-03-04 08:00:00", datetime(2024, 3, 4, 11))
+            assert [e[1][11:13] for e in eventos] == ["08", "09", "10"]
+            assert repo.contar_historico_entre("2024-03-04", "2024-03-05") == 24
+
+            plano = " ".join(r[3] for r in repo.conn.execute(
+                "EXPLAIN QUERY PLAN " + queries.SELECT_HISTORICO_ENTRE, (0, 1, 10)))
+            assert "idx_historico_epoch" in plano
+
+    def test_ticket_le_entrada_como_epoch(self, repo):
+        entrada = datetime(2024, 3, 4, 8, 30, 15)
+        with repo:
+            repo.criar_ticket(TicketVisitante(placa="ROT1234", numero_vaga=1, entrada=entrada))
+            armazenado = repo.conn.execute("SELECT entrada_epoch FROM tickets_visitantes").fetchone()[0]
+            ticket = repo.buscar_ticket_ativo("ROT1234")
+
+        assert armazenado == int(entrada.timestamp())
+        assert ticket.entrada == entrada
+
+    def test_migra_banco_antigo(self, tmp_path):
+        caminho = str(tmp_path / "antigo.db")
+        conn = sqlite3.connect(caminho)
+        conn.execute("CREATE TABLE historico_movimentacao (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "data_hora TEXT NOT NULL, placa TEXT NOT NULL, tipo_veiculo TEXT, tipo_evento TEXT);")
+        conn.execute("CREATE TABLE tickets_visitantes (id INTEGER PRIMARY KEY AUTOINCREMENT, placa TEXT NOT NULL, "
+                     "numero_vaga INTEGER, entrada TEXT NOT NULL, id_visitante INTEGER);")
+        conn.execute("INSERT INTO historico_movimentacao (data_hora, placa, tipo_veiculo, tipo_evento) "
+                     "VALUES ('2024-03-04 08:00:00', 'ABC1234', 'MORADOR', 'ENTRADA');")
+        conn.execute("INSERT INTO tickets_visitantes (placa, numero_vaga, entrada) "
+                     "VALUES ('ROT1234', 1, '2024-03-04T09:15:00.123456');")
+        conn.commit()
+        conn.close()
+
+        repo = EstacionamentoRepository(caminho)
+        with repo:
+            historico = repo.conn.execute("SELECT data_hora_epoch FROM historico_movimentacao").fetchone()[0]
+            ticket = repo.buscar_ticket_ativo("ROT1234")
+        repo.fechar()
+
+        assert historico == int(datetime(2024, 3, 4, 8).timestamp())
+        assert ticket.entrada == datetime(2024, 3, 4, 9, 15)
@@ -0,0 +1,66 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db.instrumentacao import CursorInstrumentado, BALDES_SEGUNDOS
+from src.db.registro import CursorRegistrado
+from src.classes.Apartamento import Apartamento
+from src.classes.Morador import Morador
+
+class TestInstrumentacao:
+    """
+    Testa a instrumentação das consultas: liga/desliga em tempo de execução,
+    histograma e linhas por consulta, atribuição à chamada da Fachada,
+    log de consultas lentas e exportação (texto e Prometheus).
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "instrumentacao.db"))
+        with repositorio:
+            id_apto = repositorio.criar_apartamento(Apartamento(numero="101", bloco="A"))
+            for nome, cnh in (("Ana Lima", "11111111111"), ("Bia Reis", "22222222222")):
+                repositorio.adicionar_morador(Morador(nome=nome, cnh=cnh, id_apartamento=id_apto))
+        yield repositorio
+        repositorio.fechar()
+
+    def test_liga_e_desliga_em_tempo_de_execucao(self, repo):
+        with repo:
+            assert type(repo.moradores._get_cursor()) is CursorRegistrado
+            repo.listar_moradores()
+            assert repo.instrumentacao.estatisticas()["consultas"] == {}
+
+            repo.ligar_instrumentacao()
+            assert type(repo.moradores._get_cursor()) is CursorInstrumentado
+            repo.listar_moradores()
+            list(repo.iterar_moradores())
+            repo.desligar_instrumentacao()
+            repo.listar_moradores()
+
+        dados = repo.instrumentacao.estatisticas()
+        consulta = dados["consultas"]["SELECT_ALL_MORADORES"]
+        assert consulta["execucoes"] == 2
+        assert consulta["linhas"] == 4
+        assert sum(consulta["baldes"]) == 2 and len(consulta["baldes"]) == len(BALDES_SEGUNDOS) + 1
+        # Atribuído ao método da Fachada que pediu a consulta
+        assert dados["fachada"]["listar_moradores"]["consultas"] == 1
+        assert dados["fachada"]["iterar_moradores"]["consultas"] == 1
+        # Os contadores do registro seguem contando com a instrumentação ligada ou não
+        assert repo.estatisticas_consultas()["SELECT_ALL_MORADORES"]["execucoes"] == 4
+
+    def test_log_de_lentas_e_exportacao(self, repo, tmp_path):
+        log = tmp_path / "lentas.log"
+        metricas = tmp_path / "metricas.prom"
+        repo.configurar_instrumentacao(ativa=True, limite_lento_ms=0, arquivo_lento=str(log),
+                                       arquivo_metricas=str(metricas))
+        with repo:
+            repo.buscar_morador_por_id(1)
+
+        assert repo.instrumentacao.total_lentas == 1
+        assert "SELECT_MORADOR_BY_ID via buscar_morador_por_id" in log.read_text(encoding="utf-8")
+        assert "SELECT_MORADOR_BY_ID" in repo.relatorio_consultas()
+
+        repo.fechar()  # Grava o arquivo de métricas configurado
+        texto = metricas.read_text(encoding="utf-8")
+        assert 'estacionamento_consulta_segundos_bucket{consulta="SELECT_MORADOR_BY_ID",le="+Inf"} 1' in texto
+        assert 'estacionamento_consulta_linhas_total{consulta="SELECT_MORADOR_BY_ID"} 1' in texto
+        assert 'estacionamento_fachada_segundos_total{chamada="buscar_morador_por_id"}' in texto
+        assert "estacionamento_consultas_lentas_total 1" in texto
@@ -0,0 +1,55 @@
+import inspect
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.repositories.mapeadores import OcupacaoLinha
+from src.db import queries
+from src.classes.Veiculo import Veiculo
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Apartamento import Apartamento
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+
+class TestMapeadores:
+    """
+    Testa os mapeadores de linhas: colunas explícitas na ordem de do_banco,
+    listagens preguiçosas (cursor que monta um objeto por vez) e a conexão
+    intacta (demais cursores seguem devolvendo tuplas).
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "mapeadores.db"))
+        with repositorio:
+            yield repositorio
+        repositorio.fechar()
+
+    @pytest.mark.parametrize("colunas, classe", [
+        (queries.COLUNAS_VEICULO, Veiculo),
+        (queries.COLUNAS_MORADOR, Morador),
+        (queries.COLUNAS_FUNCIONARIO, Funcionario),
+        (queries.COLUNAS_APARTAMENTO, Apartamento),
+        (queries.COLUNAS_TICKET, TicketVisitante),
+    ])
+    def test_colunas_na_ordem_de_do_banco(self, colunas, classe):
+        parametros = list(inspect.signature(classe.do_banco).parameters)
+        assert [c.strip() for c in colunas.split(",")] == parametros
+
+    def test_listagem_preguicosa(self, repo):
+        id_apto = repo.criar_apartamento(Apartamento(numero="101", bloco="A"))
+        for nome, cnh in (("Ana Lima", "11111111111"), ("Bia Reis", "22222222222"), ("Caio Melo", "33333333333")):
+            repo.adicionar_morador(Morador(nome=nome, cnh=cnh, id_apartamento=id_apto))
+
+        cursor = repo.iterar_moradores()
+        assert not isinstance(cursor, list)
+        primeiro = next(cursor)
+        assert isinstance(primeiro, Morador) and primeiro.nome == "Ana Lima"
+        assert [m.nome for m in cursor] == ["Bia Reis", "Caio Melo"]
+
+        # O mapeador é do cursor, não da conexão
+        assert repo.conn.execute(queries.SELECT_MORADOR_BY_ID, (primeiro.id,)).fetchone()[1] == "Ana Lima"
+
+    def test_ocupacao_em_tuplas_nomeadas(self, repo):
+        repo.criar_ticket(TicketVisitante(placa="XYZ9A87", numero_vaga=2))
+        linhas = repo.listar_ocupacao_completa()
+        assert linhas == [OcupacaoLinha("VISITANTE", None, None, 2, "ROTATIVO", "XYZ9A87", "---", "---")]
+        assert linhas[0].vaga_atual == 2
@@ -0,0 +1,87 @@
+import sqlite3
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import migracoes, queries
+
+class TestMigracoes:
+    """
+    Testa as migrações versionadas: banco novo e banco antigo chegam à
+    mesma versão, o preenchimento roda em lotes retomáveis e um banco
+    em dia não executa DDL nenhuma (na partida, nem abre conexão).
+    """
+
+    def _banco_antigo(self, caminho, eventos=25):
+        """Banco de antes das colunas epoch e das migrações (user_version = 0)."""
+        conn = sqlite3.connect(caminho)
+        conn.execute("CREATE TABLE historico_movimentacao (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                     "data_hora TEXT NOT NULL, placa TEXT NOT NULL, tipo_veiculo TEXT, tipo_evento TEXT);")
+        conn.executemany("INSERT INTO historico_movimentacao (data_hora, placa, tipo_veiculo, tipo_evento) "
+                         "VALUES (?, 'ABC1234', 'MORADOR', 'ENTRADA');",
+                         [(f"2024-03-04 {h % 24:02d}:00:00",) for h in range(eventos)])
+        conn.commit()
+        return conn
+
+    def test_banco_novo_nasce_na_versao_atual(self, tmp_path):
+        repo = EstacionamentoRepository(str(tmp_path / "novo.db"))
+        with repo:
+            assert migracoes.versao_do_banco(repo.conn) == migracoes.VERSAO_ATUAL
+            colunas = {row[1] for row in repo.conn.execute("PRAGMA table_info(funcionarios);")}
+            assert "ativo" in colunas
+        repo.fechar()
+
+    def test_preenchimento_em_lotes_retomavel(self, tmp_path):
+        conn = self._banco_antigo(str(tmp_path / "antigo.db"))
+
+        # Queda no meio da v2: só o primeiro lote foi confirmado
+        migracoes._esquema_base(conn)
+        conn.execute(queries.DEFINIR_VERSAO_ESQUEMA.format(versao=1))
+        update = queries.MIGRACOES_EPOCH[0][3]
+        conn.execute(update, (0, 10))
+        conn.commit()
+
+        lotes = []
+        conn.set_trace_callback(lambda sql: lotes.append(sql) if sql.startswith("UPDATE historico") else None)
+        assert migracoes.migrar(conn, tamanho_lote=10) == [2, 3, 4]
+        conn.set_trace_callback(None)
+
+        assert len(lotes) == 3  # ids 1-10, 11-20, 21-25
+        assert conn.execute("SELECT COUNT(*) FROM historico_movimentacao WHERE data_hora_epoch IS NULL").fetchone()[0] == 0
+        conn.close()
+
+    def test_banco_em_dia_nao_executa_ddl(self, tmp_path):
+        caminho = str(tmp_path / "em_dia.db")
+        EstacionamentoRepository(caminho).fechar()
+
+        conn = sqlite3.connect(caminho)
+        executadas = []
+        conn.set_trace_callback(executadas.append)
+        assert migracoes.migrar(conn) == []
+        assert executadas == [queries.SELECT_VERSAO_ESQUEMA]
+        conn.close()
+
+    def test_partida_com_banco_em_dia_nao_abre_conexao(self, tmp_path):
+        caminho = str(tmp_path / "partida.db")
+        EstacionamentoRepository(caminho).fechar()
+        assert migracoes.versao_no_arquivo(caminho) == migracoes.VERSAO_ATUAL
+
+        repo = EstacionamentoRepository(caminho)
+        assert repo.estatisticas_pool()["misses"] == 0
+        repo.fechar()
+
+    def test_falha_na_migracao_propaga_e_devolve_conexao(self, tmp_path):
+        """Passo que falha: erro sobe, versão não avança e a conexão volta ao pool."""
+        caminho = str(tmp_path / "falha.db")
+        repo = EstacionamentoRepository(caminho, pool_size=1)
+        with repo:
+            repo.conn.execute("DROP INDEX ux_tickets_vaga;")
+            repo.conn.executemany("INSERT INTO tickets_visitantes (placa, numero_vaga, entrada) VALUES (?, 1, '2024-03-04 08:00:00');",
+                                  [("AAA1111",), ("BBB2222",)])
+            repo.conn.execute(queries.DEFINIR_VERSAO_ESQUEMA.format(versao=3))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.common.criar_tabelas()
+
+        assert repo.estatisticas_pool()["idle"] == 1
+        with repo:
+            assert migracoes.versao_do_banco(repo.conn) == 3
+        repo.fechar()
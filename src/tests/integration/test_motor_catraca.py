@@ -0,0 +1,148 @@
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import Estacionamento, ZONA_VISITANTES, ZONA_FUNCIONARIOS
+from src.classes.DecisaoCatraca import ENTRADA, SAIDA, BLOQUEADO
+from src.classes.Apartamento import Apartamento
+from src.classes.Morador import Morador
+from src.classes.Funcionario import Funcionario
+from src.classes.Veiculo import Veiculo
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.functions.catraca.motor_catraca import GateEngine
+
+class TestMotorCatraca:
+    """
+    Testa o motor headless da catraca: placa entra, decisão sai,
+    sem input()/print e com as gravações numa única transação.
+    """
+
+    @pytest.fixture
+    def repo(self):
+        repositorio = EstacionamentoRepository(":memory:")
+        repositorio.__enter__()
+        repositorio.common.criar_tabelas()
+        yield repositorio
+        repositorio.__exit__(None, None, None)
+
+    @pytest.fixture
+    def motor(self, repo):
+        estacionamento = Estacionamento(
+            nome="Teste",
+            capacidade_visitantes=1,
+            capacidade_moradores=10,
+            tempo_limite_minutos=120,
+            capacidade_funcionarios=1,
+        )
+        return GateEngine(repo, estacionamento)
+
+    def test_rotativo_entra_e_sai(self, motor, repo):
+        entrada = motor.processar("ROT1234")
+        assert (entrada.acao, entrada.tipo, entrada.zona, entrada.vaga) == (ENTRADA, "ROTATIVO", ZONA_VISITANTES, 1)
+        assert entrada.efetivada
+        assert repo.buscar_ticket_ativo("ROT1234") is not None
+
+        saida = motor.processar("ROT1234")
+        assert (saida.acao, saida.vaga, saida.excedeu) == (SAIDA, 1, False)
+        assert saida.permanencia_minutos == 0
+        assert repo.buscar_ticket_ativo("ROT1234") is None
+
+        eventos = [log[3] for log in repo.buscar_historico_por_placa("ROT1234")]
+        assert eventos == ["SAIDA", "ENTRADA"]
+
+    def test_zona_lotada_bloqueia_sem_gravar(self, motor, repo):
+        motor.processar("AAA1111")
+        decisao = motor.processar("BBB2222")
+
+        assert decisao.acao == BLOQUEADO
+        assert not decisao.efetivada
+        assert repo.buscar_ticket_ativo("BBB2222") is None
+
+    def test_morador_alterna_status(self, motor, repo):
+        repo.apartamentos.adicionar(Apartamento(numero="101", bloco="A"))
+        apto = repo.apartamentos.buscar_por_rotulo("101", "A")
+        id_mor = repo.moradores.adicionar(Morador(nome="Ana Lima", cnh="11111111111", id_apartamento=apto.id))
+        repo.veiculos.adicionar(Veiculo(placa="MOR1234", modelo="GOL", cor="PRATA", morador_id=id_mor))
+        repo.confirmar()
+
+        assert motor.processar("MOR1234").acao == ENTRADA
+        assert repo.buscar_veiculo_por_placa("MOR1234").estacionado
+        assert motor.processar("MOR1234").acao == SAIDA
+        assert not repo.buscar_veiculo_por_placa("MOR1234").estacionado
+
+    def test_funcionario_ocupa_e_libera_zona_c(self, motor, repo):
+        id_func = repo.funcionarios.adicionar(Funcionario(nome="Joao Silva", cpf="52998224725", cargo="Porteiro"))
+        repo.veiculos.adicionar(Veiculo(placa="FUN1234", modelo="UNO", cor="BRANCO", funcionario_id=id_func))
+        repo.confirmar()
+
+        entrada = motor.processar("FUN1234")
+        assert (entrada.acao, entrada.zona, entrada.vaga) == (ENTRADA, ZONA_FUNCIONARIOS, 1)
+        assert motor.estacionamento.consultar_vaga_livre(ZONA_FUNCIONARIOS) is None
+
+        saida = motor.processar("FUN1234")
+        assert (saida.acao, saida.vaga) == (SAIDA, 1)
+        assert repo.listar_vagas_ocupadas_funcionarios() == set()
+        assert motor.estacionamento.consultar_vaga_livre(ZONA_FUNCIONARIOS) == 1
+
+    def test_falha_na_gravacao_desfaz_tudo(self, motor, repo, monkeypatch):
+        """Se o log falhar depois do ticket, nem o ticket nem a vaga ficam ocupados."""
+        def falha(*args):
+            raise RuntimeError("disco cheio")
+        monkeypatch.setattr(repo, "registrar_log_visitante", falha)
+
+        with pytest.raises(RuntimeError):
+            motor.processar("ERR1234")
+
+        assert repo.buscar_ticket_ativo("ERR1234") is None
+        assert motor.estacionamento.consultar_vaga_livre(ZONA_VISITANTES) == 1
+
+    def test_recusa_transacao_aberta_do_chamador(self, motor, repo):
+        """O motor não confirma escritas alheias: com transação aberta, recusa e o chamador ainda pode desfazer."""
+        repo.apartamentos.adicionar(Apartamento(numero="900", bloco="Z"))
+        decisao = motor.avaliar("ROT1234")
+
+        with pytest.raises(RuntimeError):
+            motor.efetivar(decisao)
+        assert not decisao.efetivada
+
+        repo.desfazer()
+        assert repo.apartamentos.buscar_por_rotulo("900", "Z") is None
+        assert repo.buscar_ticket_ativo("ROT1234") is None
+        assert motor.efetivar(decisao).efetivada
+
+    def test_cadastro_e_catraca_na_mesma_sessao(self, motor, repo):
+        """Como no menu: cada opção é uma operação, então o cadastro é confirmado e a catraca segue funcionando."""
+        with repo.operacao():
+            repo.apartamentos.adicionar(Apartamento(numero="900", bloco="Z"))
+        with repo.operacao():
+            assert motor.processar("ROT1234").efetivada
+
+        with pytest.raises(ValueError):
+            with repo.operacao():
+                repo.apartamentos.adicionar(Apartamento(numero="901", bloco="Z"))
+                raise ValueError("opção abortada")
+        assert repo.apartamentos.buscar_por_rotulo("900", "Z") is not None
+        assert repo.apartamentos.buscar_por_rotulo("901", "Z") is None
+        assert motor.processar("ROT1234").acao == SAIDA
+
+    def test_vaga_tomada_por_outro_processo(self, repo):
+        """O índice acha a vaga 1 livre, mas outro processo já gravou: o banco barra e o motor realoca."""
+        motor = GateEngine(repo, Estacionamento(nome="Teste", capacidade_visitantes=2, capacidade_moradores=10,
+                                                tempo_limite_minutos=120, capacidade_funcionarios=1))
+        repo.criar_ticket(TicketVisitante(placa="OUT1234", numero_vaga=1))
+        repo.confirmar()
+
+        decisao = motor.processar("NEW1234")
+        assert (decisao.acao, decisao.vaga, decisao.efetivada) == (ENTRADA, 2, True)
+        assert repo.listar_vagas_ocupadas_tickets() == {"1", "2"}
+
+    def test_vaga_tomada_e_zona_lotada_bloqueia(self, motor, repo):
+        repo.criar_ticket(TicketVisitante(placa="OUT1234", numero_vaga=1))
+        repo.confirmar()
+
+        decisao = motor.processar("NEW1234")
+        assert (decisao.acao, decisao.motivo, decisao.efetivada) == (BLOQUEADO, "Zona A (Visitantes) LOTADA.", False)
+        assert repo.buscar_ticket_ativo("NEW1234") is None
+
+    def test_placa_invalida_bloqueia(self, motor):
+        decisao = motor.avaliar("???")
+        assert decisao.acao == BLOQUEADO
+        assert decisao.motivo
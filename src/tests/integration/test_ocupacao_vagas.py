@@ -0,0 +1,122 @@
+import pytest
+from datetime import datetime
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Estacionamento import Estacionamento, ZONA_VISITANTES, ZONA_FUNCIONARIOS
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.functions.catraca.ocupacao import (
+    sincronizar_ocupacao, buscar_vaga_livre, reconciliar_ocupacao, reconciliar_se_vencido
+)
+
+class TestOcupacaoVagas:
+    """
+    Testa o índice de ocupação em memória das Zonas A e C
+    e a ressincronização com o banco quando há deriva.
+    """
+
+    @pytest.fixture
+    def repo(self):
+        repositorio = EstacionamentoRepository(":memory:")
+        repositorio.__enter__()
+        repositorio.common.criar_tabelas()
+        yield repositorio
+        repositorio.__exit__(None, None, None)
+
+    @pytest.fixture
+    def estacionamento(self):
+        return Estacionamento(
+            nome="Teste",
+            capacidade_visitantes=3,
+            capacidade_moradores=10,
+            tempo_limite_minutos=120,
+            capacidade_funcionarios=2,
+        )
+
+    def _criar_ticket(self, repo, placa, vaga):
+        repo.criar_ticket(TicketVisitante(placa=placa, numero_vaga=vaga, entrada=datetime.now()))
+
+    def test_carrega_do_banco_e_aloca_menor_vaga(self, repo, estacionamento):
+        """Startup: vagas 1 e 3 ocupadas no banco -> a próxima é a 2."""
+        self._criar_ticket(repo, "AAA1111", 1)
+        self._criar_ticket(repo, "BBB2222", 3)
+
+        sincronizar_ocupacao(repo, estacionamento)
+
+        assert estacionamento.consultar_vaga_livre(ZONA_VISITANTES) == 2
+        assert estacionamento.vagas_livres(ZONA_VISITANTES) == 1
+
+    def test_entrada_e_saida_atualizam_indice(self, estacionamento):
+        """Ocupar/liberar mantém o heap: a vaga liberada volta a ser a menor."""
+        assert estacionamento.consultar_vaga_livre(ZONA_FUNCIONARIOS) == 1
+        estacionamento.ocupar_vaga(ZONA_FUNCIONARIOS, 1)
+        estacionamento.ocupar_vaga(ZONA_FUNCIONARIOS, 2)
+
+        assert estacionamento.consultar_vaga_livre(ZONA_FUNCIONARIOS) is None
+        assert estacionamento.vagas_livres(ZONA_FUNCIONARIOS) == 0
+
+        estacionamento.liberar_vaga(ZONA_FUNCIONARIOS, 1)
+        assert estacionamento.consultar_vaga_livre(ZONA_FUNCIONARIOS) == 1
+        assert not estacionamento.precisa_sincronizar
+
+    def test_saida_de_vaga_livre_marca_deriva(self, estacionamento):
+        """Liberar uma vaga que o índice não tinha como ocupada = índice desatualizado."""
+        estacionamento.liberar_vaga(ZONA_VISITANTES, 2)
+        assert estacionamento.precisa_sincronizar
+
+    def test_lotado_no_indice_confere_no_banco(self, repo, estacionamento):
+        """Se o índice diz LOTADO mas o banco discorda, ressincroniza em vez de barrar."""
+        for vaga in (1, 2, 3):
+            estacionamento.ocupar_vaga(ZONA_VISITANTES, vaga)
+
+        # Banco só tem a vaga 1 ocupada (ex: tickets removidos por outro processo)
+        self._criar_ticket(repo, "CCC3333", 1)
+
+        assert buscar_vaga_livre(repo, estacionamento, ZONA_VISITANTES) == 2
+
+    def test_zona_c_persiste_e_libera_vaga(self, repo, estacionamento):
+        """registrar/liberar_vaga_funcionario devolvem o número para o índice."""
+        repo.registrar_vaga_funcionario("FUN1234", 2, None)
+        assert repo.listar_vagas_ocupadas_funcionarios() == {"2"}
+
+        assert repo.liberar_vaga_funcionario("FUN1234") == 2
+        assert repo.liberar_vaga_funcionario("FUN1234") is None
+        assert repo.listar_vagas_ocupadas_funcionarios() == set()
+
+    def test_contadores_acompanham_entradas_e_saidas(self, estacionamento):
+        """_ocupacao_visitantes/_ocupacao_funcionarios deixam de ser sempre zero."""
+        estacionamento.ocupar_vaga(ZONA_VISITANTES, 1)
+        estacionamento.ocupar_vaga(ZONA_VISITANTES, 2)
+        estacionamento.ocupar_vaga(ZONA_FUNCIONARIOS, 1)
+
+        assert estacionamento.vagas_visitantes_disponiveis == 1
+        assert estacionamento.vagas_funcionarios_disponiveis == 1
+
+        estacionamento.ocupar_vaga(ZONA_VISITANTES, 3)
+        assert estacionamento.visitante_esta_lotado
+
+        estacionamento.liberar_vaga(ZONA_VISITANTES, 3)
+        assert not estacionamento.visitante_esta_lotado
+
+    def test_reconciliacao_com_count(self, repo, estacionamento):
+        """A conferência periódica corrige os contadores quando o banco mudou por fora."""
+        sincronizar_ocupacao(repo, estacionamento)
+        assert reconciliar_ocupacao(repo, estacionamento) is False
+
+        # Outro processo registrou uma entrada direto no banco
+        self._criar_ticket(repo, "DDD4444", 2)
+
+        assert reconciliar_ocupacao(repo, estacionamento) is True
+        assert estacionamento.vagas_visitantes_disponiveis == 2
+        assert estacionamento.consultar_vaga_livre(ZONA_VISITANTES) == 1
+
+    def test_reconciliacao_respeita_intervalo(self, repo, estacionamento):
+        """Dentro do intervalo o dashboard não consulta o banco."""
+        sincronizar_ocupacao(repo, estacionamento)
+        self._criar_ticket(repo, "EEE5555", 1)
+
+        estacionamento.intervalo_reconciliacao_segundos = 3600
+        assert reconciliar_se_vencido(repo, estacionamento) is False
+        assert estacionamento.vagas_visitantes_disponiveis == 3
+
+        estacionamento.intervalo_reconciliacao_segundos = 0
+        assert reconciliar_se_vencido(repo, estacionamento) is True
+        assert estacionamento.vagas_visitantes_disponiveis == 2
@@ -0,0 +1,90 @@
+import sqlite3
+import pytest
+from src.utils.db_connection import CheckpointScheduler, apply_pragmas
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Apartamento import Apartamento
+
+PERFIL = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -8000,
+    "mmap_size": 0,
+    "temp_store": "MEMORY",
+}
+
+class TestPerfilWal:
+    """
+    Testa o perfil de desempenho (PRAGMAs) e o checkpoint do WAL.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "wal.db"), pool_size=2, pragmas=PERFIL)
+        yield repositorio
+        repositorio.fechar()
+
+    def test_perfil_aplicado_na_conexao(self, repo):
+        """Cada conexão nova sai configurada com o perfil do .env."""
+        with repo:
+            assert repo.conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+            assert repo.conn.execute("PRAGMA synchronous;").fetchone()[0] == 1   # NORMAL
+            assert repo.conn.execute("PRAGMA cache_size;").fetchone()[0] == -8000
+            assert repo.conn.execute("PRAGMA temp_store;").fetchone()[0] == 2    # MEMORY
+            assert repo.conn.execute("PRAGMA foreign_keys;").fetchone()[0] == 1
+
+    def test_leitura_nao_bloqueia_escrita(self, repo, tmp_path):
+        """Com WAL, um leitor com transação aberta não trava o escritor da catraca."""
+        leitor = sqlite3.connect(str(tmp_path / "wal.db"))
+        leitor.execute("BEGIN;")
+        leitor.execute("SELECT COUNT(*) FROM historico_movimentacao;").fetchone()
+
+        with repo:
+            repo.veiculos.registrar_log_visitante("ABC1234", "ENTRADA")
+
+        leitor.rollback()
+        leitor.close()
+
+    def test_pragma_invalido_rejeitado(self):
+        """Valores do .env não podem virar SQL arbitrário."""
+        conn = sqlite3.connect(":memory:")
+        with pytest.raises(ValueError):
+            apply_pragmas(conn, {"journal_mode": "WAL; DROP TABLE x"})
+        with pytest.raises(ValueError):
+            apply_pragmas(conn, {"locking_mode": "EXCLUSIVE"})
+        conn.close()
+
+    def test_checkpoint_por_limite(self, repo, tmp_path):
+        """Acima do limite de páginas o agendador roda o checkpoint (TRUNCATE zera o WAL)."""
+        with repo:
+            for i in range(200):
+                repo.apartamentos.adicionar(Apartamento(numero=str(i), bloco="W"))
+
+        db_path = str(tmp_path / "wal.db")
+        agendador = CheckpointScheduler(db_path, passive_pages=1, truncate_pages=2)
+        conn = sqlite3.connect(db_path)
+        assert agendador.wal_pages(conn) >= 2
+
+        assert agendador.run_once(conn) == "TRUNCATE"
+        assert agendador.wal_pages(conn) == 0
+        assert agendador.run_once(conn) is None
+        conn.close()
+
+    def test_checkpoint_nao_repete_sem_escritas(self, repo, tmp_path):
+        """O WAL rebobina mas não encolhe: sem escritas novas, o próximo ciclo não faz nada."""
+        with repo:
+            for i in range(200):
+                repo.apartamentos.adicionar(Apartamento(numero=str(i), bloco="P"))
+
+        db_path = str(tmp_path / "wal.db")
+        agendador = CheckpointScheduler(db_path, passive_pages=1, truncate_pages=1_000_000)
+        conn = sqlite3.connect(db_path)
+
+        assert agendador.run_once(conn) == "PASSIVE"
+        assert agendador.wal_pages(conn) >= 1   # O arquivo continua do mesmo tamanho
+        assert agendador.run_once(conn) is None
+        assert agendador.passive_runs == 1
+
+        with repo:
+            repo.apartamentos.adicionar(Apartamento(numero="999", bloco="P"))
+        assert agendador.run_once(conn) == "PASSIVE"
+        conn.close()
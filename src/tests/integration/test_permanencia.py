@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Visitante.TicketVisitante import TicketVisitante
+from src.functions.relatorios import analise_permanencia
+from src.functions.relatorios.analise_permanencia import analisar_permanencia
+
+class TestPermanencia:
+    """
+    Testa as sessões encerradas de visitantes e a análise de permanência
+    (percentis, faixas e taxa de excesso), com e sem NumPy.
+    """
+
+    @pytest.fixture
+    def repo(self):
+        repositorio = EstacionamentoRepository(":memory:")
+        repositorio.__enter__()
+        repositorio.common.criar_tabelas()
+        yield repositorio
+        repositorio.__exit__(None, None, None)
+
+    def _encerrar(self, repo, placa, minutos, cadastrado=False, limite=120):
+        entrada = datetime(2024, 3, 4, 8, 0)
+        repo.criar_ticket(TicketVisitante(placa=placa, numero_vaga=1, entrada=entrada,
+                                          id_visitante=None))
+        ticket = repo.buscar_ticket_ativo(placa)
+        ticket.id_visitante = 1 if cadastrado else None
+        return repo.encerrar_ticket(ticket, limite, saida=entrada + timedelta(minutes=minutos))
+
+    def test_saida_grava_sessao_e_apaga_ticket(self, repo):
+        assert self._encerrar(repo, "ABC1234", 45) == 45 * 60
+        assert repo.buscar_ticket_ativo("ABC1234") is None
+        assert list(repo.iterar_sessoes_visitantes()) == [
+            (int(datetime(2024, 3, 4, 8, 0).timestamp()), 2700, 120, 0)
+        ]
+
+    @pytest.mark.parametrize("usar_numpy", [False, True])
+    def test_percentis_e_excesso(self, repo, usar_numpy):
+        if usar_numpy and analise_permanencia.np is None:
+            pytest.skip("NumPy não instalado")
+
+        for i, minutos in enumerate([10, 20, 30, 40, 200]):
+            self._encerrar(repo, f"AAA{i:04d}", minutos, cadastrado=(i % 2 == 0))
+
+        analise = analisar_permanencia(repo, usar_numpy=usar_numpy)
+
+        assert analise["motor"] == ("numpy" if usar_numpy else "python")
+        assert analise["sessoes"] == 5
+        assert analise["percentis"][50] == pytest.approx(30)
+        assert analise["percentis"][90] == pytest.approx(136)   # 40 + 0.6 * (200 - 40)
+        assert analise["taxa_excesso"] == pytest.approx(0.2)    # só a de 200 min (limite 120)
+        assert analise["excesso_medio_minutos"] == pytest.approx(80)
+        assert analise["faixas"] == [3, 1, 0, 1, 0, 0, 0]       # até 30m, 30m-1h, ..., 2h-4h
+        assert analise["por_grupo"]["CADASTRADO"] == (3, pytest.approx(1 / 3))
+
+    def test_sem_sessoes(self, repo):
+        assert analisar_permanencia(repo)["sessoes"] == 0
@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+from src.utils.db_connection import ConnectionPool
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Apartamento import Apartamento
+
+class TestPoolConexoes:
+    """
+    Testa o modo pool: conexões persistentes reaproveitadas entre blocos 'with'.
+    """
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Banco em arquivo (o pool só faz sentido com mais de uma conexão)."""
+        return str(tmp_path / "pool.db")
+
+    def test_reaproveita_conexao_entre_blocos(self, db_path):
+        """Cenário: Dois 'with repo:' seguidos usam a MESMA conexão física."""
+        repo = EstacionamentoRepository(db_path, pool_size=2)
+
+        with repo:
+            conn_1 = repo.conn
+            repo.apartamentos.adicionar(Apartamento(numero="101", bloco="A"))
+
+        with repo:
+            conn_2 = repo.conn
+            assert repo.apartamentos.buscar_por_rotulo("101", "A") is not None
+
+        assert conn_1 is conn_2
+
+        stats = repo.estatisticas_pool()
+        assert stats["misses"] == 1   # Só a primeira conexão foi aberta
+        assert stats["hits"] >= 2
+        repo.fechar()
+
+    def test_foreign_keys_ativas_na_conexao_do_pool(self, db_path):
+        """O PRAGMA de FK é aplicado uma vez na criação e continua valendo."""
+        repo = EstacionamentoRepository(db_path, pool_size=1)
+        with repo:
+            ativo = repo.conn.execute("PRAGMA foreign_keys;").fetchone()[0]
+        assert ativo == 1
+        repo.fechar()
+
+    def test_rollback_devolve_conexao_limpa(self, db_path):
+        """Erro dentro do bloco: desfaz a transação e a conexão volta ao pool."""
+        repo = EstacionamentoRepository(db_path, pool_size=1)
+
+        with pytest.raises(ValueError):
+            with repo:
+                repo.apartamentos.adicionar(Apartamento(numero="300", bloco="C"))
+                raise ValueError("Falha simulada")
+
+        with repo:
+            assert repo.apartamentos.buscar_por_rotulo("300", "C") is None
+        repo.fechar()
+
+    def test_pool_esgotado_espera_e_conta(self, db_path):
+        """Com o pool cheio, o próximo checkout espera (waits) até alguém devolver."""
+        pool = ConnectionPool(db_path, size=1, timeout=2.0)
+        conn = pool.checkout()
+
+        resultado = {}
+
+        def pegar():
+            c = pool.checkout()
+            resultado["conn"] = c
+            pool.checkin(c)
+
+        t = threading.Thread(target=pegar)
+        t.start()
+        # Só devolve depois que a thread já está bloqueada esperando
+        limite = time.monotonic() + 2.0
+        while pool.stats()["waits"] == 0 and time.monotonic() < limite:
+            time.sleep(0.001)
+        time.sleep(0.01)
+        pool.checkin(conn)
+        t.join()
+
+        stats = pool.stats()
+        assert resultado["conn"] is conn
+        assert stats["open"] == 1
+        assert stats["waits"] == 1
+        assert stats["wait_time"] > 0
+        pool.close()
+
+    def test_pool_esgotado_estoura_timeout(self, db_path):
+        """Se ninguém devolver a conexão, o checkout falha após o timeout."""
+        pool = ConnectionPool(db_path, size=1, timeout=0.05)
+        pool.checkout()
+
+        with pytest.raises(RuntimeError):
+            pool.checkout()
+
+        assert pool.stats()["waits"] == 1
@@ -0,0 +1,55 @@
+import os
+import re
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import registro
+from src.classes.Apartamento import Apartamento
+from src.classes.Morador import Morador
+from src.classes.Veiculo import Veiculo
+
+PASTA_REPOSITORIOS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "repositories")
+
+class TestRegistroConsultas:
+    """
+    Testa o catálogo nomeado de consultas: nenhum SQL avulso nos
+    repositórios, contadores de execução/tempo por nome (inclusive das
+    variantes de modelo) e o cache de statements dimensionado pelo catálogo.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "registro.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def test_repositorios_sem_sql_avulso(self):
+        literal = re.compile(r"""\.execute(many)?\(\s*f?["']""")
+        for arquivo in os.listdir(PASTA_REPOSITORIOS):
+            if arquivo.endswith(".py"):
+                with open(os.path.join(PASTA_REPOSITORIOS, arquivo), encoding="utf-8") as f:
+                    assert not literal.search(f.read()), f"SQL fora de queries.py em {arquivo}"
+
+    def test_contadores_por_consulta(self, repo):
+        with repo:
+            id_apto = repo.criar_apartamento(Apartamento(numero="101", bloco="A"))
+            id_morador = repo.adicionar_morador(Morador(nome="Ana Lima", cnh="11111111111", id_apartamento=id_apto))
+            repo.adicionar_veiculo(Veiculo(placa="ABC1D23", morador_id=id_morador))
+            for _ in range(3):
+                repo.buscar_veiculo_por_placa("ABC1D23")
+            repo.paginar_historico(placa="ABC1D23")
+            repo.paginar_historico(antes_de=10, tipo_evento="ENTRADA")
+
+        estatisticas = repo.estatisticas_consultas()
+        assert estatisticas["SELECT_VEICULO_BY_PLACA"]["execucoes"] == 3
+        assert estatisticas["SELECT_HISTORICO_PAGINA"]["execucoes"] == 2
+        assert estatisticas["INSERT_MORADOR"]["segundos"] >= 0
+        assert registro.NAO_REGISTRADA not in estatisticas
+
+        repo.consultas.zerar()
+        assert repo.estatisticas_consultas() == {}
+
+    def test_cache_de_statements_cobre_o_catalogo(self, repo):
+        assert repo.db_manager.pool.cached_statements == registro.TAMANHO_CACHE_STATEMENTS
+        assert registro.TAMANHO_CACHE_STATEMENTS > len(registro.CONSULTAS)
+        with pytest.raises(KeyError):
+            registro.nomear("NAO_EXISTE", "SELECT 1;")
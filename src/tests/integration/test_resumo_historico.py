@@ -0,0 +1,75 @@
+from datetime import date
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.db import queries
+
+class TestResumoHistorico:
+    """
+    Testa os resumos por hora/dia do histórico: recuperação incremental
+    pela marca d'água e o relatório de pico lido só dos resumos.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "resumo.db"))
+        yield repositorio
+        repositorio.fechar()
+
+    def _gravar(self, repo, linhas):
+        with repo:
+            repo.conn.executemany(queries.INSERT_HISTORICO, linhas)
+
+    def test_acumula_apenas_linhas_novas(self, repo):
+        self._gravar(repo, [
+            ("2024-03-04 08:10:00", "AAA1111", "MORADOR", "ENTRADA"),    # segunda
+            ("2024-03-04 08:40:00", "BBB2222", "VISITANTE", "ENTRADA"),
+            ("2024-03-04 18:00:00", "AAA1111", "MORADOR", "SAIDA"),
+        ])
+        with repo:
+            assert repo.atualizar_resumos() == 3
+            assert repo.atualizar_resumos() == 0  # nada novo
+
+        self._gravar(repo, [("2024-03-04 08:50:00", "CCC3333", "MORADOR", "ENTRADA")])
+        with repo:
+            repo.atualizar_resumos()
+            horas = repo.conn.execute(
+                "SELECT tipo_veiculo, total FROM historico_resumo_hora "
+                "WHERE dia = '2024-03-04' AND hora = 8 AND tipo_evento = 'ENTRADA' ORDER BY tipo_veiculo"
+            ).fetchall()
+            dia = repo.conn.execute(
+                "SELECT SUM(total) FROM historico_resumo_dia WHERE dia = '2024-03-04'"
+            ).fetchone()[0]
+
+        assert horas == [("MORADOR", 2), ("VISITANTE", 1)]
+        assert dia == 4
+
+    def test_pico_por_dia_semana_e_resumo_diario(self, repo):
+        hoje = date.today().isoformat()
+        self._gravar(repo, [
+            ("2024-03-04 08:00:00", "AAA1111", "MORADOR", "ENTRADA"),   # segunda, 8h
+            ("2024-03-04 08:30:00", "BBB2222", "MORADOR", "ENTRADA"),
+            ("2024-03-11 08:15:00", "AAA1111", "MORADOR", "ENTRADA"),   # segunda seguinte
+            ("2024-03-11 19:00:00", "CCC3333", "VISITANTE", "ENTRADA"),
+            (f"{hoje} 10:00:00", "DDD4444", "FUNCIONARIO", "ENTRADA"),
+        ])
+
+        with repo:
+            repo.atualizar_resumos()
+            picos = repo.listar_picos_por_dia_semana()
+            diario = repo.listar_resumo_diario(dias=1)
+
+        # Segunda (1): 3 entradas às 8h em 2 segundas = média 1.5
+        assert picos[1] == (8, 1.5)
+        assert diario == [(hoje, "FUNCIONARIO", "ENTRADA", 1)]
+
+    def test_atualizar_resumos_nao_segura_trava_de_escrita(self, repo):
+        self._gravar(repo, [("2024-03-04 08:10:00", "AAA1111", "MORADOR", "ENTRADA")])
+
+        with repo:
+            assert repo.atualizar_resumos() == 1
+            assert not repo.conn.in_transaction
+            # Outra conexão (ex.: api.py) consegue escrever durante a sessão
+            outro = EstacionamentoRepository(repo.db_manager.db_path, pragmas={"busy_timeout": 0})
+            with outro:
+                outro.conn.execute(queries.INSERT_HISTORICO, ("2024-03-04 09:00:00", "BBB2222", "MORADOR", "ENTRADA"))
+            outro.fechar()
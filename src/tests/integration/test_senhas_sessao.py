@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.classes.Usuario import Usuario
+from src.classes.Estacionamento import Estacionamento
+from src.api.servidor_http import ServidorCatraca
+from src.tests.integration.test_api_catraca import _chamar
+
+class TestSenhasSessao:
+    """
+    Testa o login com bcrypt no pool de senhas: rehash quando o custo
+    muda, tokens de sessão assinados e a exigência de token na API.
+    """
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repositorio = EstacionamentoRepository(str(tmp_path / "senhas.db"))
+        repositorio.configurar_senhas(custo=4, segredo="segredo-de-teste", validade_minutos=10)
+        with repositorio:
+            repositorio.usuarios.criar_usuario(Usuario(username="porteiro", senha_plana="1234", perfil="portaria"))
+        yield repositorio
+        repositorio.fechar()
+
+    def _custo_gravado(self, repo):
+        with repo:
+            return int(repo.usuarios.buscar_credenciais("porteiro")[2][4:6])
+
+    def test_login_e_rehash_com_novo_custo(self, repo):
+        assert repo.autenticar_usuario("porteiro", "errada") is None
+        assert repo.autenticar_usuario("ninguem", "1234") is None
+        assert repo.autenticar_usuario("porteiro", "1234").perfil == "portaria"
+        assert self._custo_gravado(repo) == 4
+
+        repo.configurar_senhas(custo=5)
+        assert repo.autenticar_usuario("porteiro", "1234") is not None
+        assert self._custo_gravado(repo) == 5
+
+    def test_token_assinado_e_de_vida_curta(self, repo):
+        usuario = repo.autenticar_usuario("porteiro", "1234")
+        token = repo.emitir_token_sessao(usuario)
+
+        assert repo.validar_token_sessao(token).username == "porteiro"
+        corpo, assinatura = token.split(".")
+        assert repo.validar_token_sessao(corpo + "x." + assinatura) is None
+        assert repo.validar_token_sessao("lixo") is None
+        assert repo.tokens.validar(token, agora=repo.tokens.validade_segundos * 2 + 2 ** 31) is None
+
+    def test_api_exige_token(self, repo):
+        estacionamento = Estacionamento(nome="Teste", capacidade_visitantes=5, capacidade_moradores=5,
+                                        tempo_limite_minutos=120, capacidade_funcionarios=1)
+
+        async def principal():
+            servidor = ServidorCatraca(repo, estacionamento, leitores=1, exigir_token=True)
+            await servidor.iniciar("127.0.0.1", 0)
+            try:
+                sem_token = await _chamar(servidor.porta, "POST", "/catraca", {"placa": "ROT0001"})
+                negado = await _chamar(servidor.porta, "POST", "/sessao", {"usuario": "porteiro", "senha": "x"})
+                sessao = await _chamar(servidor.porta, "POST", "/sessao", {"usuario": "porteiro", "senha": "1234"})
+                com_token = await _chamar(servidor.porta, "POST", "/catraca", {"placa": "ROT0001"},
+                                          {"Authorization": f"Bearer {sessao[1]['token']}"})
+                return sem_token, negado, sessao, com_token
+            finally:
+                await servidor.parar()
+
+        sem_token, negado, sessao, com_token = asyncio.run(principal())
+        assert sem_token[0] == 401
+        assert negado[0] == 401
+        assert sessao[0] == 200
+        assert com_token[0] == 200 and com_token[1]["placa"] == "ROT0001"
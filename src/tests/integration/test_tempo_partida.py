@@ -0,0 +1,55 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Tempo de import de 'index' (tudo o que roda antes do prompt de login), em ms.
+# Folga ampla para máquinas lentas / CI; ajustável pelo ambiente.
+ORCAMENTO_MS = int(os.getenv("PARTIDA_ORCAMENTO_MS", 300))
+
+# Módulos que só podem ser carregados depois do login, pela opção do menu
+PROIBIDOS_NA_PARTIDA = (
+    "rich",
+    "bcrypt",
+    "src.ui.mapa",
+    "src.functions.catraca.controle_acesso",
+    "src.functions.catraca.motor_catraca",
+    "src.functions.visitantes.menu_visitante",
+    "src.functions.moradores.menu_morador",
+    "src.functions.funcionarios.menu_funcionario",
+    "src.functions.relatorios.exibir_relatorios",
+)
+
+@pytest.fixture(scope="module")
+def importacoes():
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", "import index"],
+                           cwd=RAIZ, capture_output=True, text=True, check=True).stderr
+    # Linha: "import time: <próprio> | <acumulado> | <espaços de nível><módulo>"
+    modulos = {}
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, acumulado, nome = linha[len("import time:"):].split("|")
+        modulos[nome.strip()] = (int(acumulado), len(nome) - len(nome.lstrip()) == 1)
+    return modulos
+
+@pytest.mark.skipif(importlib.util.find_spec("src.ui") is None,
+                    reason="src/UI não é importável como src.ui neste sistema de arquivos (sensível a maiúsculas).")
+class TestTempoPartida:
+    """
+    Regressão de partida via 'python -X importtime': até o prompt de login
+    nenhum módulo de funcionalidade (nem rich/bcrypt) é importado e o
+    tempo total de import fica dentro do orçamento.
+    """
+
+    def test_modulos_pesados_ficam_para_depois_do_login(self, importacoes):
+        carregados = [m for m in importacoes
+                      if any(m == p or m.startswith(p + ".") for p in PROIBIDOS_NA_PARTIDA)]
+        assert not carregados, f"Importados antes do login: {carregados}"
+
+    def test_import_dentro_do_orcamento(self, importacoes):
+        total_ms = sum(us for us, raiz in importacoes.values() if raiz) / 1000
+        assert total_ms < ORCAMENTO_MS, f"Partida levou {total_ms:.0f} ms (orçamento {ORCAMENTO_MS} ms)"
@@ -4,9 +4,218 @@ Database Context Manager.
 This module provides the DatabaseManager class for handling
 safe and automatic SQLite connection management (commit, rollback, close)
 using a 'with' statement.
+
+It also provides ConnectionPool, a bounded set of long-lived connections
+that DatabaseManager can check out and check in instead of opening a new
+connection on every 'with' block, the PRAGMA performance profile applied
+to every new connection, and CheckpointScheduler, a background thread
+that keeps the WAL file from growing without bound.
 """
 
+import os
+import re
 import sqlite3
+import threading
+import time
+
+
+# PRAGMAs accepted in a performance profile (values cannot be bound as
+# parameters, so names and values are validated before being executed).
+ALLOWED_PRAGMAS = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+    "cache_size": int,
+    "mmap_size": int,
+    "busy_timeout": int,
+    "wal_autocheckpoint": int,
+}
+
+_INT_VALUE = re.compile(r"^-?\d+$")
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: dict | None):
+    """
+    Enables foreign keys and applies a performance profile to a connection.
+
+    Args:
+        conn (sqlite3.Connection): The connection to configure.
+        pragmas (dict | None): Ordered mapping of PRAGMA name -> value
+                               (e.g. {"journal_mode": "WAL"}).
+
+    Raises:
+        ValueError: If a PRAGMA or its value is not allowed.
+    """
+    conn.execute("PRAGMA foreign_keys = ON;")
+
+    for name, value in (pragmas or {}).items():
+        allowed = ALLOWED_PRAGMAS.get(name)
+        if allowed is None:
+            raise ValueError(f"PRAGMA not allowed in profile: {name}")
+
+        value = str(value).strip().upper()
+        if allowed is int:
+            if not _INT_VALUE.match(value):
+                raise ValueError(f"PRAGMA {name} expects an integer, got '{value}'.")
+        elif value not in allowed:
+            raise ValueError(f"Invalid value for PRAGMA {name}: '{value}'.")
+
+        conn.execute(f"PRAGMA {name} = {value};")
+
+
+class ConnectionPool:
+    """
+    A bounded pool of long-lived SQLite connections.
+
+    Connections are created lazily (up to 'size'), configured once
+    (PRAGMAs) and reused across checkouts. When every connection is
+    in use, callers block until one is checked back in or the timeout
+    expires.
+    """
+
+    def __init__(self, db_path: str, size: int = 4, timeout: float = 5.0, pragmas: dict | None = None,
+                 cached_statements: int = 128):
+        """
+        Initializes an empty pool.
+
+        Args:
+            db_path (str): The file path to the SQLite database.
+            size (int): Maximum number of open connections.
+            timeout (float): Seconds to wait for a free connection.
+            pragmas (dict | None): Performance profile applied to each new connection.
+            cached_statements (int): Size of each connection's prepared statement cache.
+                                     Large enough for every query = each one is
+                                     prepared once per connection.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+
+        # Each ':memory:' connection is a separate database,
+        # so a pool larger than one would split the data.
+        if db_path == ":memory:":
+            size = 1
+
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.pragmas = pragmas
+        self.cached_statements = cached_statements
+
+        self._idle = []        # LIFO: the hottest connection is reused first
+        self._open = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Counters used to size the pool
+        self.hits = 0          # Checkout served by an idle connection
+        self.misses = 0        # Checkout had to open a new connection
+        self.waits = 0         # Checkout had to block (pool exhausted)
+        self.wait_time = 0.0   # Cumulative seconds spent blocked
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens and configures a new connection (PRAGMAs run only once here).
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=self.cached_statements)
+        try:
+            apply_pragmas(conn, self.pragmas)
+        except (sqlite3.Error, ValueError):
+            conn.close()
+            raise
+        return conn
+
+    def checkout(self) -> sqlite3.Connection:
+        """
+        Takes a connection from the pool, opening one if below the limit.
+
+        Returns:
+            sqlite3.Connection: A ready-to-use connection.
+
+        Raises:
+            RuntimeError: If the pool is closed or the timeout expires.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed.")
+
+            if self._idle:
+                self.hits += 1
+                return self._idle.pop()
+
+            if self._open < self.size:
+                self.misses += 1
+                self._open += 1
+            else:
+                self.waits += 1
+                start = time.perf_counter()
+                ok = self._cond.wait_for(lambda: self._idle or self._closed, self.timeout)
+                self.wait_time += time.perf_counter() - start
+
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                if not ok:
+                    raise RuntimeError(f"Connection pool exhausted ({self.size} in use) after {self.timeout}s.")
+                return self._idle.pop()
+
+        # Opening the connection happens outside the lock
+        try:
+            return self._connect()
+        except (sqlite3.Error, ValueError):
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, conn: sqlite3.Connection):
+        """
+        Returns a connection to the pool.
+        Any transaction left open is rolled back so the next user starts clean.
+        """
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            # Broken connection: discard it and free its slot
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            conn.close()
+            return
+
+        with self._cond:
+            if self._closed:
+                self._open -= 1
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self):
+        """
+        Closes every idle connection and rejects new checkouts.
+        Connections still checked out are closed when they come back.
+        """
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._idle.pop().close()
+                self._open -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """
+        Returns the pool counters (hits, misses, waits, wait time, usage).
+        """
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "wait_time": round(self.wait_time, 6),
+            }
 
 
 class DatabaseManager:
@@ -16,17 +225,30 @@ class DatabaseManager:
     Ensures that connections are opened, foreign keys are enabled,
     transactions are committed or rolled back, and connections
     are closed automatically.
+
+    When pool_size > 0 the connections come from a ConnectionPool and are
+    returned to it (instead of closed) at the end of the block.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool_size: int = 0, pragmas: dict | None = None,
+                 cached_statements: int = 128):
         """
         Initializes the manager with the path to the database.
 
         Args:
             db_path (str): The file path to the SQLite database.
+            pool_size (int): Size of the connection pool. 0 disables pooling
+                             (one new connection per 'with' block).
+            pragmas (dict | None): Performance profile (journal_mode, synchronous,
+                                   cache_size, mmap_size, temp_store...).
+            cached_statements (int): Prepared statement cache size per connection.
         """
         self.db_path = db_path
         self.conn = None
+        self.pragmas = pragmas
+        self.cached_statements = cached_statements
+        self.pool = (ConnectionPool(db_path, pool_size, pragmas=pragmas, cached_statements=cached_statements)
+                     if pool_size > 0 else None)
 
     def __enter__(self) -> sqlite3.Connection:
         """
@@ -36,8 +258,11 @@ class DatabaseManager:
             sqlite3.Connection: The active database connection.
         """
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.execute("PRAGMA foreign_keys = ON;")
+            if self.pool:
+                self.conn = self.pool.checkout()
+            else:
+                self.conn = sqlite3.connect(self.db_path, cached_statements=self.cached_statements)
+                apply_pragmas(self.conn, self.pragmas)
             return self.conn
         except sqlite3.Error as e:
             print(f"Error connecting to database: {e}")
@@ -57,4 +282,143 @@ class DatabaseManager:
             except sqlite3.Error as e:
                 print(f"Error during __exit__: {e}")
             finally:
-                self.conn.close()
\ No newline at end of file
+                if self.pool:
+                    self.pool.checkin(self.conn)
+                else:
+                    self.conn.close()
+                self.conn = None
+
+    def pool_stats(self) -> dict:
+        """
+        Returns the pool counters, or an empty dict when pooling is off.
+        """
+        return self.pool.stats() if self.pool else {}
+
+    def close(self):
+        """
+        Closes the pooled connections (no-op when pooling is off).
+        """
+        if self.pool:
+            self.pool.close()
+
+
+class CheckpointScheduler:
+    """
+    Background WAL checkpointer.
+
+    Periodically measures the WAL file and runs a PASSIVE checkpoint
+    (never blocks readers or the writer) once it passes 'passive_pages',
+    or a TRUNCATE checkpoint (shrinks the file back to zero) once it
+    passes 'truncate_pages'. Uses its own connection so it never takes
+    a slot from the pool.
+
+    SQLite rewinds the WAL after a checkpoint but does not shrink the
+    file, so its size alone cannot tell whether there is work left. The
+    (busy, log, checkpointed) row of the last checkpoint plus
+    PRAGMA data_version (changes when another connection commits) are
+    used to skip the checkpoint when nothing was written since a
+    complete one.
+    """
+
+    def __init__(self, db_path: str, interval: float = 30.0,
+                 passive_pages: int = 1000, truncate_pages: int = 10000,
+                 busy_timeout: int = 5000):
+        """
+        Args:
+            db_path (str): The file path to the SQLite database.
+            interval (float): Seconds between WAL size checks.
+            passive_pages (int): WAL size (pages) that triggers a PASSIVE checkpoint.
+            truncate_pages (int): WAL size (pages) that triggers a TRUNCATE checkpoint.
+            busy_timeout (int): Milliseconds the scheduler's connection waits on a lock.
+        """
+        self.db_path = db_path
+        self.interval = interval
+        self.passive_pages = passive_pages
+        self.truncate_pages = truncate_pages
+        self.busy_timeout = busy_timeout
+
+        self.passive_runs = 0
+        self.truncate_runs = 0
+
+        # State of the last checkpoint: data_version seen before it and
+        # whether it copied every frame of the WAL back into the database
+        self._last_version = None
+        self._complete = False
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def wal_pages(self, conn: sqlite3.Connection) -> int:
+        """
+        Returns the current WAL size in pages (0 if there is no WAL file).
+        """
+        try:
+            wal_bytes = os.path.getsize(self.db_path + "-wal")
+        except OSError:
+            return 0
+        page_size = conn.execute("PRAGMA page_size;").fetchone()[0]
+        # Each WAL frame = 24-byte header + one page (plus a 32-byte file header)
+        return max(0, wal_bytes - 32) // (page_size + 24)
+
+    def run_once(self, conn: sqlite3.Connection) -> str | None:
+        """
+        Checks the WAL size and checkpoints if a threshold was reached
+        and something was written since the last complete checkpoint.
+
+        Returns:
+            str | None: The checkpoint mode executed, or None.
+        """
+        pages = self.wal_pages(conn)
+
+        if pages >= self.truncate_pages:
+            mode = "TRUNCATE"
+        elif pages >= self.passive_pages:
+            mode = "PASSIVE"
+        else:
+            return None
+
+        # The file keeps its size after a rewind: skip if no new commits
+        version = conn.execute("PRAGMA data_version;").fetchone()[0]
+        if self._complete and version == self._last_version:
+            return None
+
+        if mode == "TRUNCATE":
+            self.truncate_runs += 1
+        else:
+            self.passive_runs += 1
+
+        busy, log, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode});").fetchone()
+        self._last_version = version
+        self._complete = busy == 0 and checkpointed == log
+        return mode
+
+    def _loop(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)};")
+            while not self._stop.wait(self.interval):
+                try:
+                    self.run_once(conn)
+                except sqlite3.Error as e:
+                    print(f"WAL checkpoint failed: {e}")
+        finally:
+            conn.close()
+
+    def start(self):
+        """
+        Starts the daemon thread (no-op if already running).
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="wal-checkpoint", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the thread and waits for it to finish.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
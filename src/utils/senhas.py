@@ -0,0 +1,138 @@
+"""
+Módulo de Senhas e Sessões.
+Responsabilidade:
+- ServicoSenhas: bcrypt (hash e verificação) num pool de threads próprio,
+  fora da conexão/transação do banco. O bcrypt libera o GIL, então vários
+  logins simultâneos (troca de turno) rodam em paralelo de verdade.
+  O custo é configurável; hashes com custo diferente do atual são
+  refeitos no próximo login que acertar a senha (precisa_rehash).
+- TokensSessao: tokens curtos assinados com HMAC-SHA256. Validar um token
+  custa microssegundos e não toca o banco: quem já logou no turno não paga
+  o bcrypt de novo (ex.: a API HTTP da catraca).
+O bcrypt só é importado no primeiro uso (fora do caminho até o login).
+Localização: src/utils/senhas.py
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+CUSTO_PADRAO = 12
+VALIDADE_SESSAO_MINUTOS = 480  # Um turno de portaria
+
+def _custo_do_hash(senha_hash):
+    """'$2b$12$...' -> 12 (None se não for um hash bcrypt)."""
+    try:
+        return int(bytes(senha_hash)[4:6])
+    except (TypeError, ValueError):
+        return None
+
+class ServicoSenhas:
+    def __init__(self, custo=CUSTO_PADRAO, trabalhadores=2):
+        if not 4 <= custo <= 31:
+            raise ValueError("Custo do bcrypt deve estar entre 4 e 31.")
+        self.custo = custo
+        self.trabalhadores = trabalhadores
+        self._executor = None
+        self._trava = threading.Lock()
+        self._hash_ficticio = None
+        self._trava_ficticio = threading.Lock()
+
+    def _pool(self):
+        """Cria as threads só no primeiro uso (partida do sistema não paga por elas)."""
+        with self._trava:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="bcrypt")
+            return self._executor
+
+    # --- Trabalho no pool (Futures) ---
+
+    def gerar_hash_async(self, senha_plana):
+        """Future -> bytes do hash com o custo atual."""
+        return self._pool().submit(_gerar_hash, senha_plana, self.custo)
+
+    def verificar_async(self, senha_plana, senha_hash):
+        """
+        Future -> bool.
+        senha_hash None (usuário inexistente): compara com um hash fictício do
+        mesmo custo, para a resposta não denunciar quais usuários existem.
+        """
+        if senha_hash is None:
+            return self._pool().submit(self._verificar_ficticio, senha_plana)
+        return self._pool().submit(_verificar, senha_plana, senha_hash, True)
+
+    def _verificar_ficticio(self, senha_plana):
+        with self._trava_ficticio:
+            if self._hash_ficticio is None:
+                self._hash_ficticio = _gerar_hash(os.urandom(16).hex(), self.custo)
+        return _verificar(senha_plana, self._hash_ficticio, False)
+
+    # --- Atalhos síncronos (a thread chamadora espera, mas sem conexão aberta) ---
+
+    def gerar_hash(self, senha_plana):
+        return self.gerar_hash_async(senha_plana).result()
+
+    def verificar(self, senha_plana, senha_hash):
+        return self.verificar_async(senha_plana, senha_hash).result()
+
+    def precisa_rehash(self, senha_hash):
+        """True se o hash foi gerado com um custo diferente do configurado."""
+        return _custo_do_hash(senha_hash) != self.custo
+
+    def fechar(self):
+        with self._trava:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+def _gerar_hash(senha_plana, custo):
+    import bcrypt
+    return bcrypt.hashpw(senha_plana.encode("utf-8"), bcrypt.gensalt(custo))
+
+def _verificar(senha_plana, senha_hash, valido):
+    import bcrypt
+    return bcrypt.checkpw(senha_plana.encode("utf-8"), bytes(senha_hash)) and valido
+
+# --- TOKENS DE SESSÃO ---
+
+def _b64(dados):
+    return base64.urlsafe_b64encode(dados).rstrip(b"=").decode("ascii")
+
+def _de_b64(texto):
+    return base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+
+class TokensSessao:
+    def __init__(self, segredo=None, validade_minutos=VALIDADE_SESSAO_MINUTOS):
+        # Sem segredo configurado: um por processo (tokens morrem no restart)
+        self._segredo = segredo.encode("utf-8") if segredo else os.urandom(32)
+        self.validade_segundos = int(validade_minutos * 60)
+
+    def _assinar(self, corpo):
+        return _b64(hmac.new(self._segredo, corpo.encode("ascii"), hashlib.sha256).digest())
+
+    def emitir(self, usuario, agora=None):
+        """Token 'corpo.assinatura' com id, username, perfil e expiração (epoch)."""
+        agora = time.time() if agora is None else agora
+        dados = {"id": usuario.id, "u": usuario.username, "p": usuario.perfil,
+                 "exp": int(agora) + self.validade_segundos}
+        corpo = _b64(json.dumps(dados, separators=(",", ":")).encode("utf-8"))
+        return f"{corpo}.{self._assinar(corpo)}"
+
+    def validar(self, token, agora=None):
+        """
+        Retorna: dict com id, u, p e exp se a assinatura confere e o token
+        não venceu; None caso contrário.
+        """
+        try:
+            corpo, assinatura = token.split(".")
+            if not hmac.compare_digest(assinatura, self._assinar(corpo)):
+                return None
+            dados = json.loads(_de_b64(corpo))
+        except (AttributeError, TypeError, ValueError, UnicodeError):
+            return None
+        agora = time.time() if agora is None else agora
+        return dados if dados.get("exp", 0) > agora else None
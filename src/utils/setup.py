@@ -7,11 +7,30 @@ import os
 import sys
 from dotenv import load_dotenv 
 from src.repositories.estacionamento_repository import EstacionamentoRepository
+from src.repositories.buffer_historico import MODO_ESTRITO, MODO_VAZAO
 from src.classes.Estacionamento import Estacionamento
+from src.functions.catraca.ocupacao import sincronizar_ocupacao
 from src.ui.components import show_error
 
 load_dotenv()
 
+def carregar_perfil_banco():
+    """
+    Lê do .env o perfil de desempenho do SQLite.
+    Retorna: dict de PRAGMAs (aplicado em cada conexão nova).
+    Padrão: WAL + synchronous NORMAL, para leituras longas (relatórios/mapa)
+    não travarem a escrita da catraca e vice-versa.
+    """
+    return {
+        "journal_mode": os.getenv("DB_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("DB_SYNCHRONOUS", "NORMAL"),
+        "cache_size": int(os.getenv("DB_CACHE_SIZE", -16000)),      # negativo = KiB (16 MB)
+        "mmap_size": int(os.getenv("DB_MMAP_SIZE", 134217728)),     # 128 MB
+        "temp_store": os.getenv("DB_TEMP_STORE", "MEMORY"),
+        "busy_timeout": int(os.getenv("DB_BUSY_TIMEOUT_MS", 5000)),
+        "wal_autocheckpoint": int(os.getenv("DB_WAL_AUTOCHECKPOINT", 1000)),
+    }
+
 def inicializar_sistema():
     """
     Configura o ambiente.
@@ -23,7 +42,47 @@ def inicializar_sistema():
     db_path = os.path.join("src", "db", db_filename)
     
     try:
-        repo = EstacionamentoRepository(db_path)
+        pool_size = int(os.getenv("DB_POOL_SIZE", 4))
+        perfil = carregar_perfil_banco()
+        repo = EstacionamentoRepository(db_path, pool_size=pool_size, pragmas=perfil)
+
+        # Checkpoint do WAL em segundo plano (evita o arquivo -wal crescer sem limite)
+        if perfil["journal_mode"].upper() == "WAL":
+            repo.iniciar_checkpoints(
+                intervalo=float(os.getenv("DB_CHECKPOINT_INTERVALO", 30)),
+                paginas_passive=int(os.getenv("DB_CHECKPOINT_PAGINAS", 1000)),
+                paginas_truncate=int(os.getenv("DB_CHECKPOINT_PAGINAS_TRUNCATE", 10000)),
+            )
+
+        # Histórico: ESTRITO (um INSERT por evento) ou VAZAO (lote nas fronteiras de commit)
+        if os.getenv("HISTORICO_MODO", MODO_ESTRITO).upper() == MODO_VAZAO:
+            repo.ativar_buffer_historico(
+                tamanho_lote=int(os.getenv("HISTORICO_LOTE", 200)),
+                intervalo_segundos=float(os.getenv("HISTORICO_INTERVALO_SEGUNDOS", 1)),
+            )
+
+        # Senhas (custo do bcrypt) e tokens de sessão (reautenticação sem bcrypt)
+        repo.configurar_senhas(
+            custo=int(os.getenv("BCRYPT_CUSTO", 12)),
+            trabalhadores=int(os.getenv("BCRYPT_TRABALHADORES", 2)),
+            segredo=os.getenv("SESSAO_SEGREDO") or None,
+            validade_minutos=int(os.getenv("SESSAO_VALIDADE_MINUTOS", 480)),
+        )
+
+        # Arquivo frio: meses além do horizonte saem do banco quente (0 = desligado)
+        horizonte = int(os.getenv("HISTORICO_ARQUIVO_DIAS", 0))
+        if horizonte > 0:
+            pasta = os.getenv("HISTORICO_ARQUIVO_PASTA", os.path.join("src", "db", "arquivo"))
+            repo.configurar_arquivo_historico(pasta, horizonte)
+            repo.arquivar_historico()
+
+        # Instrumentação das consultas (histogramas, lentas); ligável também em tempo de execução
+        repo.configurar_instrumentacao(
+            ativa=os.getenv("INSTRUMENTACAO_ATIVA", "0") == "1",
+            limite_lento_ms=float(os.getenv("CONSULTA_LENTA_MS", 50)),
+            arquivo_lento=os.getenv("CONSULTA_LENTA_ARQUIVO") or None,
+            arquivo_metricas=os.getenv("METRICAS_ARQUIVO") or None,
+        )
     except Exception as e:
         show_error(f"Falha crítica ao conectar no Banco: {e}")
         sys.exit(1)
@@ -34,6 +93,7 @@ def inicializar_sistema():
         cap_vis = int(os.getenv("CAPACIDADE_VISITANTES", 20))
         cap_func = int(os.getenv("CAPACIDADE_FUNCIONARIOS", 10))
         tempo = int(os.getenv("TIME_LIMIT_MINUTES", 120))
+        reconciliar = int(os.getenv("OCUPACAO_RECONCILIAR_SEGUNDOS", 60))
         nome = os.getenv("PARKING_NAME", "Condomínio Solar")
     except ValueError:
         show_error("Erro no .env: Valores numéricos inválidos.")
@@ -46,7 +106,12 @@ def inicializar_sistema():
         capacidade_funcionarios=cap_func,
         capacidade_visitantes=cap_vis,
         
-        tempo_limite_minutos=tempo
+        tempo_limite_minutos=tempo,
+        intervalo_reconciliacao_segundos=reconciliar
     )
+
+    # 3. Índice de ocupação das Zonas A e C (carregado uma única vez do banco)
+    with repo:
+        sincronizar_ocupacao(repo, estacionamento)
     
     return repo, estacionamento
\ No newline at end of file
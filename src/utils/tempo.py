@@ -0,0 +1,32 @@
+"""
+Módulo de utilitários de tempo.
+O banco guarda os instantes como epoch (segundos, INTEGER indexado);
+aqui ficam as conversões dos LIMITES de uma consulta (nunca linha a linha).
+Localização: src/utils/tempo.py
+"""
+from datetime import datetime, date
+
+def para_epoch(valor):
+    """
+    Converte um limite de consulta para epoch (int).
+    Aceita: int/float (já é epoch), datetime, date (meia-noite local)
+    ou texto ISO ('AAAA-MM-DD' ou 'AAAA-MM-DD HH:MM:SS'), em hora local.
+    """
+    if isinstance(valor, (int, float)):
+        return int(valor)
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor)
+    if isinstance(valor, datetime):
+        return int(valor.timestamp())
+    if isinstance(valor, date):
+        return int(datetime(valor.year, valor.month, valor.day).timestamp())
+    raise TypeError(f"Não sei converter {type(valor).__name__} para epoch.")
+
+def formatar_data_hora(texto):
+    """
+    'AAAA-MM-DD HH:MM:SS' -> 'DD/MM/AAAA HH:MM' por fatiamento (sem parse).
+    Texto fora do padrão volta como veio.
+    """
+    if len(texto) >= 16 and texto[4] == "-" and texto[7] == "-":
+        return f"{texto[8:10]}/{texto[5:7]}/{texto[0:4]} {texto[11:16]}"
+    return texto
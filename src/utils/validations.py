@@ -4,6 +4,7 @@ Centraliza regras de formato e unicidade para inputs do sistema.
 Localização: src/utils/validations.py
 """
 import re
+from datetime import datetime
 
 # Padrão compilado para placas (Antiga e Mercosul)
 # Aceita: AAA1234 ou AAA1B23
@@ -51,6 +52,19 @@ def validate_apartamento(apto_input):
         return None, "Máximo de 6 caracteres (ex: 102, 12-B)."
     return cleaned, None
 
+def validate_data(data_input):
+    """
+    Valida uma data em DD/MM/AAAA ou AAAA-MM-DD.
+    Retorna: a data em ISO (AAAA-MM-DD), comparável com o histórico.
+    """
+    cleaned = data_input.strip()
+    for formato in ("%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(cleaned, formato).date().isoformat(), None
+        except ValueError:
+            continue
+    return None, "Data inválida. Use DD/MM/AAAA."
+
 # --- VALIDAÇÕES DE VEÍCULO (PLACA) ---
 
 def validate_placa(placa_input):